@@ -144,21 +144,23 @@ def get_info(
         # ]
 
         # get sample-level advanced features
-        prefix_name = ""
+        processed_funcs, prefix_names = [], []
         for processed_func, processed_field in processed_list:
             if processed_field is not None:
                 processed_func.processed_fields[0] = processed_field
-                prefix_name = processed_field
+                prefix_names.append(processed_field)
             else:
-                prefix_name = ""
-
-            dataset[split_name] = dataset[split_name].apply(
-                processed_func,
-                num_proc=multiprocessing.cpu_count(),
-                mode="memory",
-                prefix=prefix_name,
-            )
-            print(dataset[split_name])
+                prefix_names.append("")
+            processed_funcs.append(processed_func)
+
+        # all the operations are applied in a single pass over the split
+        dataset[split_name] = dataset[split_name].apply_pipeline(
+            processed_funcs,
+            num_proc=multiprocessing.cpu_count(),
+            mode="memory",
+            prefix=prefix_names,
+        )
+        print(dataset[split_name])
 
         # dataset[split_name] = dataset[split_name].apply(
         #     feature_func, num_proc=multiprocessing.cpu_count(), mode="memory"
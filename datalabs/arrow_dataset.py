@@ -23,12 +23,13 @@ import copy
 from copy import deepcopy
 from dataclasses import asdict
 from functools import partial, wraps
+import glob
+import inspect
 from io import BytesIO
 import json
 from math import ceil, floor
 import os
 from pathlib import Path
-import re
 import shutil
 import tempfile
 from typing import (
@@ -56,7 +57,11 @@ from requests import HTTPError
 from tqdm.auto import tqdm
 
 from datalabs import config, utils
-from datalabs.arrow_reader import ArrowReader
+from datalabs.arrow_reader import (
+    ArrowReader,
+    read_sidecar_manifest,
+    write_sidecar_manifest,
+)
 from datalabs.arrow_writer import ArrowWriter, OptimizedTypedSequence
 from datalabs.features import _ArrayXD, ClassLabel, Features, Sequence, Value
 from datalabs.filesystems import extract_path_from_uri, is_remote_filesystem
@@ -65,6 +70,7 @@ from datalabs.fingerprint import (
     generate_fingerprint,
     generate_random_fingerprint,
     get_temporary_cache_files_directory,
+    Hasher,
     is_caching_enabled,
     maybe_register_dataset_for_temp_dir_deletion,
     update_fingerprint,
@@ -73,10 +79,18 @@ from datalabs.formatting import (
     format_table,
     get_format_type_from_alias,
     get_formatter,
+    PythonFormatter,
     query_table,
 )
 from datalabs.info import DatasetInfo, MongoDBClient
 from datalabs.operations.data import TextData
+from datalabs.operations.resource_registry import resource_registry
+from datalabs.operations.tokenizer import (
+    token_column_name,
+    tokenization,
+    tokenizer_registry,
+)
+from datalabs.prompt import compile_template
 from datalabs.search import IndexableMixin
 from datalabs.splits import NamedSplit, Split
 from datalabs.table import (
@@ -703,6 +717,140 @@ def _check_table(table) -> Table:
         )
 
 
+# operations that are called on a single field of each sample, and can
+# therefore be fed with whole columns by ``Dataset.apply(..., batched=True)``
+BATCHABLE_OPERATION_TYPES = [
+    "Editing",
+    "Featurizing",
+    "OperationFunction",
+    "Preprocessing",
+]
+
+
+# prompting operations called with the answers of the labels of the dataset
+LABELED_PROMPTING_TYPES = [
+    "TopicClassificationPrompting",
+    "SentimentClassificationPrompting",
+    "NLIPrompting",
+]
+
+
+# prompting operations, always batched if they have a columnar implementation
+PROMPTING_OPERATION_TYPES = LABELED_PROMPTING_TYPES + ["SummarizationPrompting"]
+
+
+# operations that aren't run once per sample, and can't be fused in a pipeline
+UNFUSABLE_OPERATION_TYPES = [
+    "Aggregating",
+    "AutoEval",
+    "Inference",
+] + LABELED_PROMPTING_TYPES
+
+
+def _rows_to_columns(rows: List[dict]) -> Dict[str, list]:
+    if len(rows) == 0:
+        return {}
+    return {attr_name: [row[attr_name] for row in rows] for attr_name in rows[0]}
+
+
+def _chunks_to_table(chunks: Dict[str, list]) -> InMemoryTable:
+    """Build a table from the output columns of consecutive batches, each
+    batch being an Arrow array or a list of values."""
+    return InMemoryTable.from_pydict(
+        {
+            attr_name: pa.chunked_array(column_chunks)
+            if isinstance(column_chunks[0], (pa.Array, pa.ChunkedArray))
+            else [value for chunk in column_chunks for value in chunk]
+            for attr_name, column_chunks in chunks.items()
+        }
+    )
+
+
+def _is_fusable(func) -> bool:
+    return not isinstance(func, str) and not any(
+        func._type.find(op_type) != -1 for op_type in UNFUSABLE_OPERATION_TYPES
+    )
+
+
+class _FusedOperations:
+    """Consecutive per-sample operations of ``Dataset.apply_pipeline``, run
+    together in a single scan over the dataset. Each operation comes with the
+    prefix of the columns it generates."""
+
+    _type = "FusedOperations"
+
+    def __init__(self, operations: List, prefixes: List[str]):
+        self.operations = operations
+        self.prefixes = prefixes
+        self.name = "+".join(func.name for func in operations)
+        self.resources = {}
+        self.processed_fields = [
+            field for func in operations for field in func.processed_fields
+        ]
+
+    @property
+    def shared_resources(self) -> List[str]:
+        return [name for func in self.operations for name in func.shared_resources]
+
+
+def _apply_shard(shard_args) -> str:
+    """Worker of ``Dataset._apply_columns_multiprocess``: runs an operation over
+    one shard of a dataset and writes the outputs to a shard-local Arrow file."""
+    shard, func, batched, batch_size, cache_file_name = shard_args
+    column_table = shard._apply_columns(func, batched=batched, batch_size=batch_size)
+    writer = ArrowWriter(path=cache_file_name)
+    writer.write_table(column_table.table)
+    writer.finalize()
+    return cache_file_name
+
+
+def _apply_shard_file_names(cache_file_name: str, num_shards: int) -> List[str]:
+    """Files of the outputs of the shards of a multiprocess apply, named after
+    the cache file of the whole outputs, e.g.
+    ``cache-apply-<fingerprint>_00000_of_00004.arrow``."""
+    stem = os.path.splitext(cache_file_name)[0]
+    return [
+        f"{stem}_{index:05d}_of_{num_shards:05d}.arrow" for index in range(num_shards)
+    ]
+
+
+def _remove_apply_shard_files(cache_file_name: str):
+    """Removes the shard files of the outputs cached in ``cache_file_name``."""
+    stem = os.path.splitext(cache_file_name)[0]
+    for path in glob.glob(f"{glob.escape(stem)}_[0-9]*_of_[0-9]*.arrow"):
+        try:
+            os.remove(path)
+        except FileNotFoundError:  # removed by another process
+            pass
+
+
+def _evict_apply_cache(cache_directory: str, max_size: int, keep: List[str]):
+    """Removes the least recently used ``Dataset.apply`` cache files of
+    ``cache_directory`` until they take at most ``max_size`` bytes. Cache
+    files are marked as used by updating their modification time."""
+    cache_files = []
+    for f_name in os.listdir(cache_directory):
+        if f_name.startswith("cache-apply-") and f_name.endswith(".arrow"):
+            path = os.path.join(cache_directory, f_name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:  # removed by another process
+                continue
+            cache_files.append((stat.st_mtime, stat.st_size, path))
+    total_size = sum(size for _, size, _ in cache_files)
+    for _, size, path in sorted(cache_files):
+        if total_size <= max_size:
+            break
+        if path in keep:
+            continue
+        logger.info(f"Evicting apply cache file {path}")
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total_size -= size
+
+
 class NonExistentDatasetError(Exception):
     """Used when we expect the existence of a dataset"""
 
@@ -724,6 +872,8 @@ class Dataset(DatasetInfoMixin, IndexableMixin, TensorflowDatasetMixin, TextData
                 return json.loads(cont)
 
     def __schema_load(self):
+        if len(self.cache_files) == 0:
+            return
         filename = self.cache_files[0]["filename"]
         (filepath, filename) = os.path.split(filename)
         (filename, extent) = os.path.splitext(filename)
@@ -821,7 +971,130 @@ class Dataset(DatasetInfoMixin, IndexableMixin, TensorflowDatasetMixin, TextData
         self._data = update_metadata_with_features(self._data, self.features)
         self.__load_stat()
 
-    def apply_basic(self, func, prefix="", num_proc=1):
+    def _labels_to_answers(self) -> Dict[int, str]:
+        """The answers of the labels of a classification dataset, e.g.
+        ``{0: "negative", 1: "positive"}``, used by the prompting operations."""
+        labels = self._info.task_templates[0].labels
+        return dict(zip(range(len(labels)), labels))
+
+    def apply_batched(self, func, batch_size=1000):
+        """Run ``func`` over consecutive Arrow batches of its processed field.
+
+        Only the processed column is read for each batch, the rest of the row is
+        never decoded. Operations that registered a columnar implementation
+        (see :meth:`OperationFunction.batched`) process the whole batch at once;
+        the others are called once per value of the column. The columnar
+        implementation of an operation on whole samples (e.g. a summarization
+        featurizing or a prompting) receives the processed fields of the batch
+        as a ``pyarrow.StructArray``, and the answers of the labels for the
+        prompting operations of classification tasks.
+
+        Yields:
+            :obj:`dict`: the output columns of each batch.
+        """
+        if func._type not in BATCHABLE_OPERATION_TYPES:
+            if not getattr(func, "supports_batch", False):
+                raise ValueError(
+                    f"{func.name} ({func._type}) does not support batched execution"
+                )
+            fields = func.processed_fields or self._data.column_names
+            args = (
+                (self._labels_to_answers(),)
+                if func._type in LABELED_PROMPTING_TYPES
+                else ()
+            )
+            for start in range(0, self.num_rows, batch_size):
+                pa_subtable = query_table(
+                    self._data,
+                    range(start, min(start + batch_size, self.num_rows)),
+                    indices=self._indices,
+                )
+                samples = pa.StructArray.from_arrays(
+                    [pa_subtable.column(field).combine_chunks() for field in fields],
+                    fields,
+                )
+                yield func.apply_batch(samples, *args)
+            return
+        if func._type == "Preprocessing":
+            task = self._info.task_templates[0].task
+            language = self._info.languages[0]
+            func.resources = {"task_type": task, "language": language}
+
+        field = func.input_column(self._data.column_names)
+        for start in range(0, self.num_rows, batch_size):
+            pa_subtable = query_table(
+                self._data,
+                range(start, min(start + batch_size, self.num_rows)),
+                indices=self._indices,
+            )
+            yield func.apply_batch(pa_subtable.column(field).combine_chunks())
+
+    def apply_prompt_batched(self, name: str, batch_size=1000):
+        """Render the prompt ``name`` of ``info.prompts`` over consecutive Arrow
+        batches of the dataset.
+
+        The template of the prompt, e.g. ``"{{text}} Which section of a
+        newspaper would this article appear in? ||| {{answers[label]}}"``, is
+        parsed once; the prompts of a batch are then rendered at once by
+        concatenating the literals of the template with the columns of its
+        slots, ``answers[label]`` being looked up from the label column.
+
+        Yields:
+            :obj:`dict`: the ``prompted_text`` and ``prompted_answer`` columns of
+            each batch, as Arrow arrays.
+        """
+        prompt = self._info.prompts[name]
+        template_text, template_answer = prompt["template"].split("|||")[:2]
+        template_text = compile_template(template_text, syntax="jinja")
+        template_answer = compile_template(template_answer, syntax="jinja")
+        if "answers[label]" in template_answer.slots:
+            labels = self._info.task_templates[0].labels
+            # {'World': ['World News'], 'Sports': ['Sports'], ...}
+            label_answers = pa.array(
+                [prompt["answers"][label][0] for label in labels], pa.string()
+            )
+        fields = [
+            slot
+            for slot in dict.fromkeys(template_text.slots + template_answer.slots)
+            if slot != "answers[label]"
+        ]
+        for slot in template_answer.slots:
+            if slot != "answers[label]" and slot not in self.column_names:
+                raise ValueError("answer can not be found")
+
+        for start in range(0, self.num_rows, batch_size):
+            pa_subtable = query_table(
+                self._data,
+                range(start, min(start + batch_size, self.num_rows)),
+                indices=self._indices,
+            )
+            columns = {field: pa_subtable.column(field) for field in fields}
+            if "answers[label]" in template_answer.slots:
+                columns["answers[label]"] = label_answers.take(
+                    pa_subtable.column("label")
+                )
+            yield {
+                "prompted_text": template_text.render_columns(
+                    columns, pa_subtable.num_rows
+                ),
+                "prompted_answer": template_answer.render_columns(
+                    columns, pa_subtable.num_rows
+                ),
+            }
+
+    def apply_basic(self, func, prefix="", num_proc=1, batched=False, batch_size=1000):
+        if batched:
+            for columns in self.apply_batched(func, batch_size=batch_size):
+                columns = {
+                    attr_name: column.to_pylist()
+                    if isinstance(column, (pa.Array, pa.ChunkedArray))
+                    else column
+                    for attr_name, column in columns.items()
+                }
+                for values in zip(*columns.values()):
+                    yield dict(zip(columns.keys(), values))
+            return
+
         # if isinstance(func, str):
         #     if self._info.task_templates[0].task_category == "text-classification":
         #
@@ -834,57 +1107,22 @@ class Dataset(DatasetInfoMixin, IndexableMixin, TensorflowDatasetMixin, TextData
 
         # Prompting
         if isinstance(func, str):
-            for sample in self.__iter__():
-                # prompt could be : '{{text}} \n\nWhich section
-                # of a newspaper would this article likely appear
-                # in? ||| \n{{answers[label] }}'
-                template = self._info.prompts[func]["template"]
-                template_text = template.split("|||")[0]
-                template_text_slots = re.findall("\{\{(.*?)\}\}", template_text)  # noqa
-                for slot_key in template_text_slots:
-                    slot_value = sample[slot_key]
-                    template_text = template_text.replace(
-                        "{{" + slot_key + "}}", slot_value
-                    )
-                prompted_text = template_text
-
-                template_answer = template.split("|||")[1].replace(
-                    "{{answers[label] }}", "{{answers[label]}}"
-                )
-                template_answer_slots = re.findall(
-                    "\{\{(.*?)\}\}", template_answer  # noqa
-                )  # noqa
-                for slot_key in template_answer_slots:
-                    if slot_key == "answers[label]":
-                        labels = self._info.task_templates[0].labels
-                        # labels_to_answers = dict(zip(range(len(labels)), labels))
-                        slot_values = self._info.prompts[func]["answers"][
-                            labels[sample["label"]]
-                        ]
-                        # {'World': ['World News'], 'Sports': ['Sports'],
-                        # 'Business': ['Business'], 'Science and Technology':
-                        # ['Science and Technology']}
-                        template_answer = template_answer.replace(
-                            "{{" + slot_key + "}}", slot_values[0]
-                        )
-                    elif slot_key in sample.keys():
-                        slot_value = sample[slot_key]
-                        template_answer = template_answer.replace(
-                            "{{" + slot_key + "}}", slot_value
-                        )
-                    else:
-                        raise ValueError("answer can not be found")
-
-                prompted_answer = template_answer
-                yield {
-                    "prompted_text": prompted_text,
-                    "prompted_answer": prompted_answer,
+            for columns in self.apply_prompt_batched(func, batch_size=batch_size):
+                columns = {
+                    attr_name: column.to_pylist()
+                    for attr_name, column in columns.items()
                 }
+                for values in zip(*columns.values()):
+                    yield dict(zip(columns.keys(), values))
         # elif func._type == 'Aggregating':
         #     yield func(self[func.processed_fields[0]])
 
         elif func._type.find("Aggregating") != -1:
-            yield func(self)
+            if num_proc > 1 and "num_proc" in inspect.signature(func.func).parameters:
+                # aggregations over shards of the dataset, merged
+                yield func.func(self, num_proc=num_proc, **func.load_resources())
+            else:
+                yield func(self)
 
         elif func._type.find("AutoEval") != -1:
             func.resources = {"dataset_info": self._info}
@@ -897,25 +1135,57 @@ class Dataset(DatasetInfoMixin, IndexableMixin, TensorflowDatasetMixin, TextData
             task = self._info.task_templates[0].task
             language = self._info.languages[0]
             func.resources = {"task_type": task, "language": language}
+            field = func.input_column(self._data.column_names)
             for sample in self.__iter__():
-                yield func(sample[func.processed_fields[0]])
+                yield func(sample[field])
         elif func._type in ["Editing", "Featurizing", "OperationFunction"]:
+            field = func.input_column(self._data.column_names)
             for sample in self.__iter__():
-                yield func(sample[func.processed_fields[0]])
-        elif func._type in [
-            "TopicClassificationPrompting",
-            "SentimentClassificationPrompting",
-            "NLIPrompting",
-        ]:
+                yield func(sample[field])
+        elif func._type in LABELED_PROMPTING_TYPES:
+            labels_to_answers = self._labels_to_answers()
             for sample in self.__iter__():
-                labels = self._info.task_templates[0].labels
-                labels_to_answers = dict(zip(range(len(labels)), labels))
                 yield func(sample, labels_to_answers)
         else:
             for sample in self.__iter__():
                 yield func(sample)
 
-    def apply(self, func, mode="realtime", prefix="", num_proc=1):
+    def apply(
+        self,
+        func,
+        mode="realtime",
+        prefix="",
+        num_proc=1,
+        batched=False,
+        batch_size=1000,
+        load_from_cache_file: Optional[bool] = None,
+    ):
+        """Apply an operation (or a prompt name) to the dataset.
+
+        Args:
+            func: the operation to apply, or the name of a prompt in ``info.prompts``
+            mode (:obj:`str`): ``"realtime"`` returns a generator of results,
+                ``"memory"`` returns a new dataset with the results as extra
+                columns and ``"local"`` also writes these columns to disk
+            prefix (:obj:`str`): prefix of the names of the generated columns
+            num_proc (:obj:`int`): number of processes used to run ``func``,
+                also passed to the aggregating operations taking a ``num_proc``
+                argument (e.g. ``get_statistics``)
+            batched (:obj:`bool`): feed ``func`` with Arrow batches of its
+                processed field instead of one decoded sample at a time
+            batch_size (:obj:`int`): number of rows per batch if ``batched``
+            load_from_cache_file (:obj:`bool`, default `True` if caching is enabled):
+                in ``"memory"`` and ``"local"`` modes, the outputs of ``func`` are
+                cached in the cache directory of the dataset, keyed by the
+                fingerprint of the dataset, ``func`` and ``prefix``. If a cache
+                file for this computation exists, it's loaded instead of
+                recomputing the outputs.
+
+        Operations based on a spacy model are always batched, so that the texts
+        are parsed in a streaming fashion with ``nlp.pipe``, and so are the
+        prompting operations with a columnar implementation, whose prompts are
+        rendered a column at a time.
+        """
 
         if isinstance(func, str):
             map = {
@@ -926,7 +1196,7 @@ class Dataset(DatasetInfoMixin, IndexableMixin, TensorflowDatasetMixin, TextData
             return map[mode](func, prefix=prefix, num_proc=num_proc)
         elif func._type.find("Aggregating") != -1 or func._type.find("AutoEval") != -1:
 
-            result = next(self.apply_basic(func))
+            result = next(self.apply_basic(func, num_proc=num_proc))
 
             result_new = {}
             for attr_name, value in result.items():
@@ -938,157 +1208,582 @@ class Dataset(DatasetInfoMixin, IndexableMixin, TensorflowDatasetMixin, TextData
                 self.__write_stat()
             return self
         else:
+            if (
+                func.spacy_resource is not None
+                and func._type in BATCHABLE_OPERATION_TYPES
+            ) or (func._type in PROMPTING_OPERATION_TYPES and func.supports_batch):
+                batched = True
+            if mode == "realtime":
+                return self.apply_basic(
+                    func,
+                    prefix=prefix,
+                    num_proc=num_proc,
+                    batched=batched,
+                    batch_size=batch_size,
+                )
             map = {
-                "realtime": self.apply_basic,
                 "memory": self.apply_memory,
                 "local": self.apply_local,
             }
-            return map[mode](func, prefix=prefix, num_proc=num_proc)
+            return map[mode](
+                func,
+                prefix=prefix,
+                num_proc=num_proc,
+                batched=batched,
+                batch_size=batch_size,
+                load_from_cache_file=load_from_cache_file,
+            )
 
-    def apply_memory(self, func, prefix="", num_proc=1):
-        result = self
-        attr_columns = []
-        if func._type.find("Inference") != -1:
-            attr_columns = next(self.apply_basic(func))
+    def tokenize(
+        self,
+        field: str = "text",
+        tokenizer_name: str = "SingleSpaceTokenizer",
+        mode="memory",
+        num_proc=1,
+        batch_size=1000,
+        load_from_cache_file: Optional[bool] = None,
+    ):
+        """Add the tokens of ``field`` to the dataset, as a ``list<string>``
+        column named ``{field}_{tokenizer_name}_tokens``.
 
-        else:
+        Operations declaring that they take the tokens of their processed field
+        (see :func:`datalabs.operations.tokenizer.consumes_tokens`) then read
+        this column instead of tokenizing the texts again. Like the outputs of
+        :meth:`apply`, the tokens are cached in the cache directory of the
+        dataset.
 
-            if num_proc == 1:
-                attr_columns = [item for item in self.apply_basic(func)]
-            elif num_proc > 1:
-
-                def process_each(index):
-                    sample = self._getitem(index, decoded=False)
-                    if func._type in ["Editing", "Featurizing", "OperationFunction"]:
-                        return func(sample[func.processed_fields[0]])
-                    elif func._type == "Preprocessing":
-                        # print(func.processed_fields[0])
-                        task = self._info.task_templates[0].task
-                        language = self._info.languages[0]
-                        func.resources = {"task_type": task, "language": language}
-                        return func(sample[func.processed_fields[0]])
-                    elif func._type in [
-                        "TopicClassificationPrompting",
-                        "SentimentClassificationPrompting",
-                        "NLIPrompting",
-                    ]:
-                        labels = self._info.task_templates[0].labels
-                        labels_to_answers = dict(zip(range(len(labels)), labels))
-                        return func(sample, labels_to_answers)
-                    else:
-                        return func(sample)
+        Args:
+            field (:obj:`str`): the text column to tokenize
+            tokenizer_name (:obj:`str`): a tokenizer of
+                ``datalabs.operations.tokenizer.tokenizer_registry``
+            mode, num_proc, batch_size, load_from_cache_file: see :meth:`apply`
+        """
+        if token_column_name(field, tokenizer_name) in self.column_names:
+            return self
+        if mode not in ["memory", "local"]:
+            raise ValueError(
+                f"tokenize supports the memory and local modes, got {mode}"
+            )
+        apply_mode = {"memory": self.apply_memory, "local": self.apply_local}
+        # the output of the operation is named "tokens"
+        return apply_mode[mode](
+            tokenization(field, tokenizer_name),
+            prefix=f"{field}_{tokenizer_name}",
+            num_proc=num_proc,
+            batched=True,
+            batch_size=batch_size,
+            load_from_cache_file=load_from_cache_file,
+        )
 
-                print("Calculating features ... ")
-                with Pool(processes=num_proc) as pool:
-                    attr_columns = pool.map(process_each, range(self.num_rows))
+    def apply_pipeline(
+        self,
+        operations: List,
+        mode="memory",
+        prefix: Union[str, List[str]] = "",
+        num_proc=1,
+        batched=False,
+        batch_size=1000,
+        load_from_cache_file: Optional[bool] = None,
+    ):
+        """Apply several operations to the dataset, as successive calls to
+        :meth:`apply` would, but in a single pass over the data.
 
-        attr_names = attr_columns[0].keys()
-        for attr_name in attr_names:
-            if prefix == "":
-                result = result.add_column(
-                    attr_name, [item[attr_name] for item in attr_columns]
-                )
-            else:
-                result = result.add_column(
-                    prefix + "_" + attr_name, [item[attr_name] for item in attr_columns]
-                )
-        return result
+        Consecutive per-sample operations (featurizing, editing,
+        preprocessing, ...) are fused: the dataset is scanned once for all of
+        them, each column is decoded at most once per batch and shared by the
+        operations (spacy-based operations also share their parsed documents),
+        and all the generated columns are appended in one table construction.
+        Other operations (aggregating, auto-evaluation, ...) are applied on
+        their own, between the fused ones.
 
-    def apply_local(self, func, prefix="", num_proc=1):
-        # result = self
+        Args:
+            operations (:obj:`List`): the operations to apply, in order
+            mode (:obj:`str`): ``"memory"`` or ``"local"``, see :meth:`apply`
+            prefix (:obj:`str` or :obj:`List[str]`): prefix of the names of the
+                generated columns, or one prefix per operation
+            num_proc, batched, batch_size, load_from_cache_file: see :meth:`apply`
+        """
+        if mode not in ["memory", "local"]:
+            raise ValueError(
+                f"apply_pipeline supports the memory and local modes, got {mode}"
+            )
+        prefixes = [prefix] * len(operations) if isinstance(prefix, str) else prefix
+        if len(prefixes) != len(operations):
+            raise ValueError(
+                f"Got {len(prefixes)} prefixes for {len(operations)} operations"
+            )
 
-        attr_columns = []
+        def apply_fused(dataset, stage):
+            fused = _FusedOperations(
+                [func for func, _ in stage], [prefix for _, prefix in stage]
+            )
+            apply_mode = {"memory": dataset.apply_memory, "local": dataset.apply_local}
+            return apply_mode[mode](
+                fused,
+                num_proc=num_proc,
+                batched=batched,
+                batch_size=batch_size,
+                load_from_cache_file=load_from_cache_file,
+            )
 
+        dataset = self
+        stage = []
+        for func, func_prefix in zip(operations, prefixes):
+            if _is_fusable(func):
+                stage.append((func, func_prefix))
+                continue
+            if len(stage) > 0:
+                dataset = apply_fused(dataset, stage)
+                stage = []
+            dataset = dataset.apply(
+                func,
+                mode=mode,
+                prefix=func_prefix,
+                num_proc=num_proc,
+                batched=batched,
+                batch_size=batch_size,
+                load_from_cache_file=load_from_cache_file,
+            )
+        if len(stage) > 0:
+            dataset = apply_fused(dataset, stage)
+        return dataset
+
+    def _apply_columns(
+        self,
+        func,
+        num_proc=1,
+        batched=False,
+        batch_size=1000,
+        cache_file_name: Optional[str] = None,
+    ):
+        """Run ``func`` over the dataset and return its outputs as a table
+        with one row per sample. With ``num_proc`` > 1, the shard files of the
+        outputs are named after ``cache_file_name`` if provided (see
+        ``_apply_columns_multiprocess``)."""
+        if isinstance(func, str):
+            columns = {}
+            for batch_columns in self.apply_prompt_batched(func, batch_size=batch_size):
+                for attr_name, column in batch_columns.items():
+                    columns.setdefault(attr_name, []).append(column)
+            return _chunks_to_table(columns)
         if func._type.find("Inference") != -1:
-            attr_columns = next(self.apply_basic(func))
-        else:
-            if num_proc == 1:
-                attr_columns = [item for item in self.apply_basic(func)]
-            elif num_proc > 1:
-                batch_count = ceil(self.num_rows / num_proc)
-
-                def process_batch(index):
-                    range_limit = range(
-                        index * batch_count,
-                        min((index + 1) * batch_count, self.num_rows),
+            return InMemoryTable.from_pydict(
+                _rows_to_columns(next(self.apply_basic(func)))
+            )
+        if num_proc > 1 and self.num_rows > 1:
+            return self._apply_columns_multiprocess(
+                func,
+                num_proc=num_proc,
+                batched=batched,
+                batch_size=batch_size,
+                cache_file_name=cache_file_name,
+            )
+        if isinstance(func, _FusedOperations):
+            return self._apply_fused_columns(
+                func, batched=batched, batch_size=batch_size
+            )
+        if batched:
+            columns = {}
+            for batch_columns in self.apply_batched(func, batch_size=batch_size):
+                for attr_name, column in batch_columns.items():
+                    columns.setdefault(attr_name, []).append(column)
+            return _chunks_to_table(columns)
+        return InMemoryTable.from_pydict(_rows_to_columns(list(self.apply_basic(func))))
+
+    def _apply_fused_columns(self, fused, batched=False, batch_size=1000):
+        """Run the operations of a ``_FusedOperations`` in a single scan over
+        the dataset.
+
+        Each batch of rows is read once; its columns are decoded lazily, at
+        most once, and shared by the operations. An operation sees the columns
+        generated by the previous ones, as if they were applied one after the
+        other.
+        """
+        for func in fused.operations:
+            if func._type == "Preprocessing":
+                task = self._info.task_templates[0].task
+                language = self._info.languages[0]
+                func.resources = {"task_type": task, "language": language}
+        formatter = PythonFormatter(features=self.features)
+
+        chunks = {}
+        for start in range(0, self.num_rows, batch_size):
+            pa_subtable = query_table(
+                self._data,
+                range(start, min(start + batch_size, self.num_rows)),
+                indices=self._indices,
+            )
+            # columns of the batch, as Arrow arrays and/or decoded lists
+            arrays = dict(zip(pa_subtable.column_names, pa_subtable.columns))
+            decoded = {}
+
+            # tokens of the batch, shared by the operations taking the same
+            # tokens of a field, unless the dataset has them (Dataset.tokenize)
+            tokens, decoded_tokens = {}, {}
+
+            def decode(attr_name):
+                if attr_name in tokens:
+                    if attr_name not in decoded_tokens:
+                        decoded_tokens[attr_name] = tokens[attr_name].to_pylist()
+                    return decoded_tokens[attr_name]
+                if attr_name not in decoded:
+                    if attr_name in pa_subtable.column_names:
+                        decoded[attr_name] = formatter.format_column(
+                            pa_subtable.select([attr_name])
+                        )
+                    else:
+                        decoded[attr_name] = arrays[attr_name].to_pylist()
+                return decoded[attr_name]
+
+            def tokenize(func):
+                field = func.processed_fields[0]
+                token_column = token_column_name(field, func.tokenizer_name)
+                if token_column not in arrays and token_column not in tokens:
+                    texts = (
+                        arrays[field] if field in arrays else pa.array(decode(field))
+                    )
+                    if isinstance(texts, pa.ChunkedArray):
+                        texts = texts.combine_chunks()
+                    tokens[token_column] = func.tokenize_batch(texts)
+                return token_column
+
+            for func, prefix in zip(fused.operations, fused.prefixes):
+                if func._type in BATCHABLE_OPERATION_TYPES:
+                    field = (
+                        tokenize(func)
+                        if func.tokenizer_name is not None
+                        else func.processed_fields[0]
+                    )
+                    if batched or func.spacy_resource is not None:
+                        texts = (
+                            arrays[field]
+                            if field in arrays
+                            else tokens[field]
+                            if field in tokens
+                            else pa.array(decoded[field])
+                        )
+                        if isinstance(texts, pa.ChunkedArray):
+                            texts = texts.combine_chunks()
+                        outputs = func.apply_batch(texts)
+                    else:
+                        outputs = _rows_to_columns(
+                            [func(value) for value in decode(field)]
+                        )
+                else:
+                    attr_names = list(dict.fromkeys([*arrays, *decoded]))
+                    rows = zip(*[decode(attr_name) for attr_name in attr_names])
+                    outputs = _rows_to_columns(
+                        [func(dict(zip(attr_names, row))) for row in rows]
                     )
 
-                    if func._type in ["Editing", "Featurizing", "OperationFunction"]:
-                        return [
-                            func(
-                                self._getitem(index, decoded=False)[
-                                    func.processed_fields[0]
-                                ]
-                            )
-                            for index in range_limit
-                        ]
-                    elif func._type == "Preprocessing":
-                        task = self._info.task_templates[0].task
-                        language = self._info.languages[0]
-                        func.resources = {"task_type": task, "language": language}
-                        return [
-                            func(
-                                self._getitem(index, decoded=False)[
-                                    func.processed_fields[0]
-                                ]
-                            )
-                            for index in range_limit
-                        ]
-                    elif func._type in [
-                        "TopicClassificationPrompting",
-                        "SentimentClassificationPrompting",
-                        "NLIPrompting",
-                    ]:
-                        labels = self._info.task_templates[0].labels
-                        labels_to_answers = dict(zip(range(len(labels)), labels))
-                        return [
-                            func(self._getitem(index, decoded=False), labels_to_answers)
-                            for index in range_limit
-                        ]
+                for attr_name, column in outputs.items():
+                    attr_name = prefix + "_" + attr_name if prefix != "" else attr_name
+                    arrays.pop(attr_name, None)
+                    decoded.pop(attr_name, None)
+                    # the tokens of an overwritten field are outdated
+                    for tokenizer_name in tokenizer_registry:
+                        token_column = token_column_name(attr_name, tokenizer_name)
+                        tokens.pop(token_column, None)
+                        decoded_tokens.pop(token_column, None)
+                    if isinstance(column, (pa.Array, pa.ChunkedArray)):
+                        arrays[attr_name] = column
                     else:
-                        return [
-                            func(self._getitem(index, decoded=False))
-                            for index in range_limit
-                        ]
-
-                with Pool(processes=num_proc) as pool:
-                    attr_columns = []
-                    temp_columns = pool.map(
-                        process_batch, range(num_proc)
-                    )  # TODO(Pengfei): this is a little strange
-                    for items in temp_columns:
-                        attr_columns += items
-
-        attr_names = attr_columns[0].keys()
-        pa_table = self.__load_disk()
-        column_dict = {}
-
-        for attr_name in attr_names:
-            attr_name_origin = attr_name
-            attr_name = prefix + "_" + attr_name if prefix != "" else attr_name
-            if attr_name in pa_table.column_names:
-                pa_table = pa_table.drop([attr_name])
-            items = [item[attr_name_origin] for item in attr_columns]
-            pa_table = pa_table.append_column(attr_name, pa.array(items))
-            column_dict[attr_name] = items
-        self.__write_disk(pa_table)
-
-        column_table = InMemoryTable.from_pydict(column_dict)
+                        decoded[attr_name] = column
+                    chunks.setdefault(attr_name, []).append(column)
+
+        return _chunks_to_table(chunks)
+
+    def _apply_columns_multiprocess(
+        self,
+        func,
+        num_proc,
+        batched=False,
+        batch_size=1000,
+        cache_file_name: Optional[str] = None,
+    ):
+        """Split the dataset into ``num_proc`` contiguous row ranges and run
+        ``func`` over each of them in a separate process.
+
+        Only the shard (a memory-mapped table is pickled as its path plus the
+        slice to replay) and the operation are sent to the workers. Each
+        worker writes its outputs to a shard file, and the shard files are
+        memory-mapped and concatenated without copying.
+
+        The shard files are named after ``cache_file_name``, the apply cache
+        file of the outputs, so that they're counted by ``_evict_apply_cache``
+        and removed once the outputs are cached (see ``_apply_columns_cached``).
+        Without cache file, they're written to the temporary cache directory,
+        removed when the session ends.
+        """
+        num_shards = min(num_proc, self.num_rows)
+        if cache_file_name is None:
+            cache_file_name = os.path.join(
+                get_temporary_cache_files_directory(),
+                f"cache-{generate_random_fingerprint()}.arrow",
+            )
+        shard_file_names = _apply_shard_file_names(cache_file_name, num_shards)
+
+        shards = []
+        for index, shard_file_name in enumerate(shard_file_names):
+            start = index * self.num_rows // num_shards
+            end = (index + 1) * self.num_rows // num_shards
+            if self._indices is None:
+                data, indices = self._data.slice(start, end - start), None
+            else:
+                data, indices = self._data, self._indices.slice(start, end - start)
+            shard = Dataset(
+                data,
+                info=self.info,
+                split=self.split,
+                indices_table=indices,
+                fingerprint=self._fingerprint,
+            )
+            shards.append((shard, func, batched, batch_size, shard_file_name))
+
+        logger.info(f"Applying {func.name} with {num_shards} processes")
+        with Pool(
+            processes=num_shards,
+            initializer=resource_registry.warm_up,
+            initargs=(func.shared_resources,),
+        ) as pool:
+            shard_file_names = pool.map(_apply_shard, shards)
+
+        return concat_tables(
+            [
+                MemoryMappedTable.from_file(shard_file_name)
+                for shard_file_name in shard_file_names
+            ]
+        )
+
+    def _get_apply_cache_file_path(self, func, prefix) -> Optional[str]:
+        """Path of the cache file of the outputs of ``func`` on this dataset,
+        or None if they can't be cached."""
+        if isinstance(func, str) or not (is_caching_enabled() and self.cache_files):
+            return None
+        hasher = Hasher()
+        try:
+            hasher.update(self._fingerprint)
+            hasher.update(func.name)
+            hasher.update(func)
+            hasher.update(func.resources)
+            hasher.update(getattr(func, "processed_fields", None))
+            hasher.update(prefix)
+        except:  # noqa various errors might raise here from pickle or dill
+            logger.info(f"Operation {func} couldn't be hashed, it won't be cached.")
+            return None
+        cache_directory = os.path.dirname(self.cache_files[0]["filename"])
+        return os.path.join(cache_directory, f"cache-apply-{hasher.hexdigest()}.arrow")
+
+    def _apply_columns_cached(
+        self,
+        func,
+        prefix="",
+        num_proc=1,
+        batched=False,
+        batch_size=1000,
+        load_from_cache_file: Optional[bool] = None,
+    ) -> Table:
+        """``_apply_columns`` with the generated columns renamed with ``prefix``,
+        and the outputs cached on disk."""
+        load_from_cache_file = (
+            load_from_cache_file
+            if load_from_cache_file is not None
+            else is_caching_enabled()
+        )
+        cache_file_name = self._get_apply_cache_file_path(func, prefix)
+        if (
+            cache_file_name is not None
+            and load_from_cache_file
+            and os.path.exists(cache_file_name)
+        ):
+            logger.warning(f"Loading cached apply outputs at {cache_file_name}")
+            # mark the cache file as recently used
+            os.utime(cache_file_name)
+            return MemoryMappedTable.from_file(cache_file_name)
+
+        column_table = self._apply_columns(
+            func,
+            num_proc=num_proc,
+            batched=batched,
+            batch_size=batch_size,
+            cache_file_name=cache_file_name,
+        )
+        if column_table.num_columns == 0:
+            if cache_file_name is not None:
+                _remove_apply_shard_files(cache_file_name)
+            return column_table
+        if prefix != "":
+            column_table = column_table.rename_columns(
+                [prefix + "_" + attr_name for attr_name in column_table.column_names]
+            )
+
+        if cache_file_name is not None:
+            tmp_file_name = cache_file_name + "." + generate_random_fingerprint()
+            writer = ArrowWriter(path=tmp_file_name)
+            writer.write_table(column_table.table)
+            writer.finalize()
+            os.replace(tmp_file_name, cache_file_name)
+            column_table = MemoryMappedTable.from_file(cache_file_name)
+            # the outputs of the shards of a multiprocess apply are now cached
+            _remove_apply_shard_files(cache_file_name)
+            _evict_apply_cache(
+                os.path.dirname(cache_file_name),
+                config.APPLY_CACHE_MAX_SIZE,
+                keep=[cache_file_name],
+            )
+        return column_table
+
+    def _add_column_table(self, column_table: Table, new_fingerprint: str):
+        """Append all the columns of ``column_table`` in a single table
+        construction."""
+        dataset = self.flatten_indices() if self._indices is not None else self
+        table = ConcatenationTable.from_tables([dataset._data, column_table], axis=1)
+        info = dataset.info.copy()
+        info.features.update(Features.from_arrow_schema(column_table.schema))
+        table = update_metadata_with_features(table, info.features)
+        return Dataset(
+            table,
+            info=info,
+            split=self.split,
+            fingerprint=new_fingerprint,
+        )
+
+    def apply_memory(
+        self,
+        func,
+        prefix="",
+        num_proc=1,
+        batched=False,
+        batch_size=1000,
+        load_from_cache_file: Optional[bool] = None,
+    ):
+        column_table = self._apply_columns_cached(
+            func,
+            prefix=prefix,
+            num_proc=num_proc,
+            batched=batched,
+            batch_size=batch_size,
+            load_from_cache_file=load_from_cache_file,
+        )
+        if column_table.num_columns == 0:
+            return self
+        new_fingerprint = update_fingerprint(
+            self._fingerprint, func, {"prefix": prefix, "mode": "memory"}
+        )
+        return self._add_column_table(column_table, new_fingerprint)
+
+    def apply_local(
+        self,
+        func,
+        prefix="",
+        num_proc=1,
+        batched=False,
+        batch_size=1000,
+        load_from_cache_file: Optional[bool] = None,
+    ):
+        """Like ``apply_memory``, but the generated columns are also written to
+        disk. Each column is stored in its own sidecar file next to the Arrow
+        file of the dataset, so that adding a column only costs the size of
+        that column; the sidecar columns are joined to the table of the
+        dataset when it is loaded again."""
+        table_path = self.__table_path()
+        if table_path is None:
+            raise ValueError(
+                "apply(mode='local') requires a dataset backed by an Arrow file, "
+                "use apply(mode='memory') for in-memory datasets"
+            )
+        if len(self._data) != MemoryMappedTable.from_file(table_path).num_rows:
+            raise ValueError(
+                f"apply(mode='local') requires a dataset covering all the rows of "
+                f"{table_path}, use apply(mode='memory') for slices of a dataset"
+            )
+
+        # sidecar columns follow the row order of the Arrow file
+        dataset = (
+            self
+            if self._indices is None
+            else Dataset(
+                self._data,
+                info=self.info,
+                split=self.split,
+                fingerprint=generate_random_fingerprint(),
+            )
+        )
+        column_table = dataset._apply_columns_cached(
+            func,
+            prefix=prefix,
+            num_proc=num_proc,
+            batched=batched,
+            batch_size=batch_size,
+            load_from_cache_file=load_from_cache_file,
+        )
+        if column_table.num_columns == 0:
+            return self
+        new_fingerprint = update_fingerprint(
+            self._fingerprint, func, {"prefix": prefix, "mode": "local"}
+        )
+
+        dirname, basename = os.path.split(table_path)
+        stem, _ = os.path.splitext(basename)
+        sidecar_columns = read_sidecar_manifest(table_path)
+        sidecar_tables = []
+        replaced_filenames = []
+        for index, attr_name in enumerate(column_table.column_names):
+            sidecar_filename = f"{stem}-{new_fingerprint}_{index:05d}.arrow"
+            if os.path.exists(os.path.join(dirname, sidecar_filename)):
+                # e.g. the same operation applied again: the existing file may
+                # still be used (and memory-mapped) by other datasets
+                sidecar_filename = (
+                    f"{stem}-{new_fingerprint}-{generate_random_fingerprint()}"
+                    f"_{index:05d}.arrow"
+                )
+            writer = ArrowWriter(path=os.path.join(dirname, sidecar_filename))
+            writer.write_table(column_table.table.select([attr_name]))
+            writer.finalize()
+
+            replaced_filename = sidecar_columns.pop(attr_name, None)
+            if replaced_filename is not None:
+                replaced_filenames.append(replaced_filename)
+            sidecar_columns[attr_name] = sidecar_filename
+            sidecar_tables.append(
+                MemoryMappedTable.from_file(os.path.join(dirname, sidecar_filename))
+            )
+        write_sidecar_manifest(table_path, sidecar_columns)
+        # the replaced files are only removed once the manifest doesn't list them
+        for replaced_filename in replaced_filenames:
+            if replaced_filename not in sidecar_columns.values():
+                os.remove(os.path.join(dirname, replaced_filename))
+
+        table = self._data
+        overridden = [
+            attr_name
+            for attr_name in column_table.column_names
+            if attr_name in table.column_names
+        ]
+        if len(overridden) > 0:
+            table = table.drop(overridden)
+        table = ConcatenationTable.from_tables([table] + sidecar_tables, axis=1)
+
         inferred_feature = Features.from_arrow_schema(column_table.schema)
-        table = MemoryMappedTable(pa_table, self.__table_path())
         info = self.info.copy()
         info.features.update(inferred_feature)
-        for attr_name in attr_names:
+        for attr_name in column_table.column_names:
             self.__schema_backup(attr_name, inferred_feature[attr_name].dtype)
 
-        return Dataset(table, info=info, split=self.split, indices_table=self._indices)
+        return Dataset(
+            table,
+            info=info,
+            split=self.split,
+            indices_table=self._indices,
+            fingerprint=new_fingerprint,
+        )
 
     def __table_path(self):
         return None if len(self.cache_files) == 0 else self.cache_files[0]["filename"]
 
     def __load_stat(self):
         table_path_name = self.__table_path()
-        if table_path_name is None:
+        if table_path_name is None or self.split is None:
             self._stat = {}
         else:
             dirname = os.path.dirname(table_path_name)
@@ -1102,29 +1797,6 @@ class Dataset(DatasetInfoMixin, IndexableMixin, TensorflowDatasetMixin, TextData
         with open(path, "w") as obj_file:
             json.dump(self._stat, obj_file)
 
-    def __load_disk(self):
-        filename = self.__table_path()
-        mapfile = pa.memory_map(filename, "r")
-        return pa.ipc.open_stream(mapfile).read_all()
-
-    def __write_disk(self, pa_table):
-        filename = self.__table_path()
-        schema = pa_table.schema.serialize()
-        batches = list(map(lambda batch: batch.serialize(), pa_table.to_batches()))
-        eof = b"\xFF\xFF\xFF\xFF\x00\x00\x00\x00"
-
-        total = schema.size + len(eof)
-        for batch in batches:
-            total += batch.size
-        mapfile = pa.memory_map(filename, "r+")
-        mapfile.resize(total)
-        mapfile.seek(0)
-
-        mapfile.write(schema)
-        for batch in batches:
-            mapfile.write(batch)
-        mapfile.write(eof)
-
     def __schema_backup(self, field, dtype=None):
         filename = self.__table_path()
         (filepath, filename) = os.path.split(filename)
@@ -1666,20 +2338,34 @@ class Dataset(DatasetInfoMixin, IndexableMixin, TensorflowDatasetMixin, TextData
         ) as dataset_info_file:
             dataset_info = DatasetInfo.from_dict(json.load(dataset_info_file))
 
-        dataset_size = estimate_dataset_size(
-            Path(dataset_path, data_file["filename"])
+        data_files = [
+            Path(dataset_path, data_file["filename"]).as_posix()
             for data_file in state["_data_files"]
+        ]
+        # the sidecar columns added with `apply(mode="local")`
+        sidecar_columns = {
+            attr_name: Path(os.path.dirname(data_file), sidecar_filename)
+            for data_file in data_files
+            for attr_name, sidecar_filename in read_sidecar_manifest(data_file).items()
+        }
+        dataset_size = estimate_dataset_size(
+            [Path(data_file) for data_file in data_files]
+            + list(sidecar_columns.values())
         )
         keep_in_memory = (
             keep_in_memory
             if keep_in_memory is not None
             else is_small_dataset(dataset_size)
         )
-        table_cls = InMemoryTable if keep_in_memory else MemoryMappedTable
         arrow_table = concat_tables(
-            table_cls.from_file(Path(dataset_path, data_file["filename"]).as_posix())
-            for data_file in state["_data_files"]
+            ArrowReader.read_table(data_file, in_memory=keep_in_memory)
+            for data_file in data_files
         )
+        if len(sidecar_columns) > 0 and dataset_info.features is not None:
+            features = Features.from_arrow_schema(arrow_table.schema)
+            dataset_info.features.update(
+                {attr_name: features[attr_name] for attr_name in sidecar_columns}
+            )
 
         split = state["_split"]
         split = Split(split) if split is not None else split
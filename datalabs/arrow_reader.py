@@ -19,17 +19,24 @@
 
 import copy
 from dataclasses import dataclass
+import json
 import math
 import os
 import re
 import shutil
-from typing import List, Optional, TYPE_CHECKING, Union
+from typing import Dict, List, Optional, TYPE_CHECKING, Union
 
 import pyarrow as pa
 import pyarrow.parquet as pq
 
 from datalabs.naming import _split_re, filename_for_dataset_split
-from datalabs.table import concat_tables, InMemoryTable, MemoryMappedTable, Table
+from datalabs.table import (
+    concat_tables,
+    ConcatenationTable,
+    InMemoryTable,
+    MemoryMappedTable,
+    Table,
+)
 from datalabs.utils import cached_path, logging
 from datalabs.utils.file_utils import DownloadConfig
 
@@ -61,6 +68,32 @@ $
 _ADDITION_SEP_RE = re.compile(r"\s*\+\s*")
 
 
+def sidecar_manifest_path(filename: str) -> str:
+    """Path of the manifest listing the sidecar column files of an Arrow file."""
+    stem, _ = os.path.splitext(filename)
+    return stem + ".columns.json"
+
+
+def read_sidecar_manifest(filename: str) -> Dict[str, str]:
+    """Returns the sidecar column files of an Arrow file, as an ordered mapping
+    from column name to file name (relative to the directory of the file)."""
+    path = sidecar_manifest_path(filename)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as manifest_file:
+        return json.load(manifest_file)
+
+
+def write_sidecar_manifest(filename: str, columns: Dict[str, str]):
+    path = sidecar_manifest_path(filename)
+    # written in a temporary file first, so that the manifest is never left
+    # partially written
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as manifest_file:
+        json.dump(columns, manifest_file)
+    os.replace(tmp_path, path)
+
+
 class DatasetNotOnHfGcsError(ConnectionError):
     """When you can't get the dataset from the Hf google cloud storage"""
 
@@ -356,9 +389,25 @@ class ArrowReader(BaseReader):
 
         Returns:
             pyarrow.Table
+
+        Columns added with ``Dataset.apply(mode="local")`` are stored in sidecar
+        files next to ``filename`` and are joined horizontally to its table.
         """
         table_cls = InMemoryTable if in_memory else MemoryMappedTable
-        return table_cls.from_file(filename)
+        table = table_cls.from_file(filename)
+        sidecar_columns = read_sidecar_manifest(filename)
+        if len(sidecar_columns) == 0:
+            return table
+
+        dirname = os.path.dirname(filename)
+        overridden = [name for name in sidecar_columns if name in table.column_names]
+        if len(overridden) > 0:
+            table = table.drop(overridden)
+        sidecar_tables = [
+            table_cls.from_file(os.path.join(dirname, sidecar_filename))
+            for sidecar_filename in sidecar_columns.values()
+        ]
+        return ConcatenationTable.from_tables([table] + sidecar_tables, axis=1)
 
 
 class ParquetReader(BaseReader):
@@ -26,11 +26,15 @@ import inspect
 import os
 import shutil
 import textwrap
-from typing import Dict, Mapping, Optional, Tuple, Union
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 import urllib
 
+from multiprocess import Pool
+import numpy as np
+import pyarrow as pa
+
 from datalabs import config, utils
-from datalabs.arrow_dataset import Dataset
+from datalabs.arrow_dataset import BATCHABLE_OPERATION_TYPES, Dataset
 from datalabs.arrow_reader import (
     ArrowReader,
     DatasetNotOnHfGcsError,
@@ -45,10 +49,11 @@ from datalabs.features import Features
 from datalabs.fingerprint import Hasher
 from datalabs.info import DatasetInfo, DatasetInfosDict, PostProcessedInfo
 from datalabs.iterable_dataset import (
-    _generate_examples_from_tables_wrapper,
+    ArrowExamplesIterable,
     ExamplesIterable,
     IterableDataset,
 )
+from datalabs.keyhash import DuplicatedKeysError, KeyHasher
 from datalabs.naming import camelcase_to_snakecase, filename_prefix_for_split
 from datalabs.splits import Split, SplitDict, SplitGenerator
 from datalabs.utils import logging
@@ -61,6 +66,7 @@ from datalabs.utils.info_utils import (
     verify_splits,
 )
 from datalabs.utils.mock_download_manager import MockDownloadManager
+from datalabs.utils.sharding import _split_gen_kwargs
 from datalabs.utils.streaming_download_manager import StreamingDownloadManager
 
 logger = logging.get_logger(__name__)
@@ -279,6 +285,8 @@ class DatasetBuilder:
             data_dir: `str`, for builders that require manual download. It must be
              the path to the local directory containing
                 the manually downloaded data.
+            num_proc: `int`, number of processes generating the shards of each
+             split (see `GeneratorBasedBuilder._shard_gen_kwargs`).
             config_kwargs: will override the defaults kwargs in config
 
         """
@@ -1009,6 +1017,8 @@ class DatasetBuilder:
             in_memory=in_memory,
             dataset_class=dataset_class,
         )
+        if self.feature_expanding:
+            ds = self._expand_features(ds)
         if run_post_process:
             for resource_file_name in self._post_processing_resources(split).values():
                 if os.sep in resource_file_name:
@@ -1166,6 +1176,32 @@ class DatasetBuilder:
         ex_iterable = self._get_examples_iterable_for_split(splits_generator)
         return IterableDataset(ex_iterable, info=self.info, split=splits_generator.name)
 
+    def _feature_expanding_operation(self):
+        """The operation computing the additional features of each sample
+        (e.g. `get_features_sample_level`) when the builder is created with
+        `feature_expanding=True`, or None."""
+        return None
+
+    def _expand_features(self, dataset: Dataset) -> Dataset:
+        """Add the features of `_feature_expanding_operation` to a prepared
+        split, as a post-processing stage.
+
+        The features are computed by `num_proc` processes, in batches when the
+        operation supports it, and cached next to the Arrow file of the split
+        (see `Dataset.apply`): the prepared split doesn't depend on
+        `feature_expanding`, and the features are only recomputed when the
+        cache is cleared, without downloading and preparing the dataset again.
+        """
+        func = self._feature_expanding_operation()
+        if func is None or len(dataset) == 0:
+            return dataset
+        return dataset.apply(
+            func,
+            mode="memory",
+            num_proc=self.num_proc,
+            batched=func._type in BATCHABLE_OPERATION_TYPES or func.supports_batch,
+        )
+
     def _post_process(
         self, dataset: Dataset, resources_paths: Mapping[str, str]
     ) -> Optional[Dataset]:
@@ -1311,34 +1347,136 @@ class GeneratorBasedBuilder(DatasetBuilder):
     def _sample_feature_expanding(self, sample):
         raise NotImplementedError()
 
-    def _prepare_split(self, split_generator):
-        split_info = split_generator.split_info
-
-        fname = f"{self.name}-{split_generator.name}.arrow"
-        fpath = os.path.join(self._cache_dir, fname)
+    def _shard_gen_kwargs(self, split_generator: SplitGenerator) -> List[dict]:
+        """The `gen_kwargs` of the shards of a split, generated in parallel when
+        `num_proc > 1`. By default, the lists of `gen_kwargs` (e.g. the list of
+        the files of the split) are split into at most `num_proc` groups of
+        contiguous shards, and the split is generated by a single process if
+        they have different lengths. Dataset scripts can override it to declare
+        their own shards.
+        """
+        return _split_gen_kwargs(split_generator.gen_kwargs, self.num_proc)
 
-        generator = self._generate_examples(**split_generator.gen_kwargs)
+    def _prepare_split_single(
+        self,
+        gen_kwargs: dict,
+        fpath: str,
+        split_name: str,
+        total: Optional[int] = None,
+        return_key_hashes: bool = False,
+    ):
+        """Generate and encode the examples of `gen_kwargs` into the arrow file
+        `fpath`. Returns the number of examples, the number of bytes and,
+        optionally, the 64 lower bits of the hashes of the keys."""
+        generator = self._generate_examples(**gen_kwargs)
+        hasher = KeyHasher(split_name)
+        key_hashes = []
 
         with ArrowWriter(
             features=self.info.features,
             path=fpath,
             writer_batch_size=self._writer_batch_size,
-            hash_salt=split_info.name,
+            hash_salt=split_name,
             check_duplicates=True,
         ) as writer:
             try:
                 for key, record in utils.tqdm(
                     generator,
                     unit=" examples",
-                    total=split_info.num_examples,
+                    total=total,
                     leave=False,
                     disable=bool(logging.get_verbosity() >= logging.WARNING),
                 ):
                     example = self.info.features.encode_example(record)
                     writer.write(example, key)
+                    if return_key_hashes:
+                        key_hashes.append(hasher.hash(key) & 0xFFFFFFFFFFFFFFFF)
             finally:
                 num_examples, num_bytes = writer.finalize()
 
+        if return_key_hashes:
+            return num_examples, num_bytes, np.array(key_hashes, dtype=np.uint64)
+        return num_examples, num_bytes
+
+    def _prepare_split_sharded(
+        self, shards: List[dict], fpath: str, split_name: str
+    ) -> Tuple[int, int]:
+        """Generate the shards of a split in parallel, each process writing its
+        own arrow file, then concatenate the shard files into `fpath`."""
+        shard_paths = [
+            f"{fpath}-{job_id:05d}-of-{len(shards):05d}"
+            for job_id in range(len(shards))
+        ]
+        logger.info(f"Generating {len(shards)} shards with {self.num_proc} processes")
+        with Pool(min(self.num_proc, len(shards))) as pool:
+            results = pool.starmap(
+                partial(self._prepare_split_single, return_key_hashes=True),
+                [
+                    (gen_kwargs, shard_path, split_name)
+                    for gen_kwargs, shard_path in zip(shards, shard_paths)
+                ],
+            )
+
+        # keys must be unique across the shards too
+        key_hashes = np.concatenate([result[2] for result in results])
+        unique_hashes, counts = np.unique(key_hashes, return_counts=True)
+        if (counts > 1).any():
+            for path in shard_paths:
+                os.remove(path)
+            duplicated = unique_hashes[np.argmax(counts > 1)]
+            shard_ids = [
+                job_id
+                for job_id, result in enumerate(results)
+                if (result[2] == duplicated).any()
+            ]
+            raise DuplicatedKeysError(
+                f"with hash {duplicated:016x} (generated by the shards {shard_ids})"
+            )
+
+        with ArrowWriter(
+            features=self.info.features,
+            path=fpath,
+            writer_batch_size=self._writer_batch_size,
+        ) as writer:
+            try:
+                for shard_path in shard_paths:
+                    with pa.memory_map(shard_path) as source:
+                        for batch in pa.ipc.open_stream(source):
+                            writer.write_table(pa.Table.from_batches([batch]))
+                    os.remove(shard_path)
+            finally:
+                num_examples, num_bytes = writer.finalize()
+
+        assert num_examples == sum(result[0] for result in results)
+        return num_examples, num_bytes
+
+    def _prepare_split(self, split_generator):
+        split_info = split_generator.split_info
+
+        fname = f"{self.name}-{split_generator.name}.arrow"
+        fpath = os.path.join(self._cache_dir, fname)
+
+        shards = []
+        if self.num_proc > 1:
+            try:
+                shards = self._shard_gen_kwargs(split_generator)
+            except RuntimeError as e:
+                # e.g. gen_kwargs with unrelated lists of different lengths
+                logger.warning(
+                    f"{e}. Generating the {split_info.name} split in a single process."
+                )
+        if len(shards) > 1:
+            num_examples, num_bytes = self._prepare_split_sharded(
+                shards, fpath, split_info.name
+            )
+        else:
+            num_examples, num_bytes = self._prepare_split_single(
+                split_generator.gen_kwargs,
+                fpath,
+                split_info.name,
+                total=split_info.num_examples,
+            )
+
         split_generator.split_info.num_examples = num_examples
         split_generator.split_info.num_bytes = num_bytes
 
@@ -1407,9 +1545,8 @@ class ArrowBasedBuilder(DatasetBuilder):
     def _get_examples_iterable_for_split(
         self, split_generator: SplitGenerator
     ) -> ExamplesIterable:
-        return ExamplesIterable(
-            _generate_examples_from_tables_wrapper(self._generate_tables),
-            kwargs=split_generator.gen_kwargs,
+        return ArrowExamplesIterable(
+            self._generate_tables, kwargs=split_generator.gen_kwargs
         )
 
 
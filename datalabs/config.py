@@ -228,6 +228,30 @@ MAX_DATASET_CONFIG_ID_READABLE_LENGTH = 255
 STREAMING_READ_MAX_RETRIES = 20
 STREAMING_READ_RETRY_INTERVAL = 5
 
+# Operations
+
+# Number of documents parsed by spacy-based operations that are kept in memory,
+# to be reused by other spacy-based operations applied to the same texts
+SPACY_DOC_CACHE_SIZE = int(os.environ.get("DATALAB_SPACY_DOC_CACHE_SIZE", 10_000))
+
+# Number of digests of arrow chunks kept in memory to fingerprint tables derived
+# from other tables without hashing their shared chunks again. The digests are
+# dropped when their tables are freed, 0 disables the cache
+FINGERPRINT_CHUNK_CACHE_SIZE = int(
+    os.environ.get("DATALAB_FINGERPRINT_CHUNK_CACHE_SIZE", 4096)
+)
+
+# Directory of the compiled grammars of the grammaire rule engine (e.g. used by
+# insert_abbreviation), shared by the processes applying the operations. An
+# empty value only caches them in memory
+GRAMMAR_CACHE_DIR = os.path.expanduser(
+    os.environ.get("DATALAB_GRAMMAR_CACHE_DIR", os.path.join(HF_CACHE_HOME, "grammars"))
+)
+
+# Maximum size in bytes of the outputs of Dataset.apply cached in the cache
+# directory of a dataset, the least recently used ones are evicted first
+APPLY_CACHE_MAX_SIZE = int(os.environ.get("DATALAB_APPLY_CACHE_MAX_SIZE", 10 * 2**30))
+
 
 """
 For explainaboard
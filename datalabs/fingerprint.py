@@ -11,6 +11,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import OrderedDict
 from dataclasses import asdict
 from functools import wraps
 import inspect
@@ -20,13 +21,14 @@ from pathlib import Path
 import random
 import shutil
 import tempfile
-from typing import Any, Dict, List, Optional, TYPE_CHECKING, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, TYPE_CHECKING, Union
 import weakref
 
 import numpy as np
 import pyarrow as pa
 import xxhash
 
+from datalabs import config
 from datalabs.info import DatasetInfo
 from datalabs.table import ConcatenationTable, InMemoryTable, MemoryMappedTable, Table
 from datalabs.utils.logging import get_logger
@@ -245,15 +247,118 @@ class Hasher:
 # 2 - take advantage of a custom serialization method (e.g. DatasetInfo)
 
 
+# digests of the chunks of arrow arrays already hashed, keyed by the addresses of
+# their buffers, with the ids of the hashed tables (owners) holding the chunks.
+# An entry is only valid while one of its owners is alive: the buffers of the
+# chunk can't be freed and their addresses can't be reused by other chunks
+_CHUNK_DIGESTS: "OrderedDict[tuple, Tuple[bytes, Set[int]]]" = OrderedDict()
+# keys of the cached digests of each owner
+_OWNED_CHUNKS: Dict[int, Set[tuple]] = {}
+# owners freed since the last hash, appended by their finalizers
+_RELEASED_OWNERS: List[int] = []
+
+
+def _release_owner(owner_id: int):
+    _RELEASED_OWNERS.append(owner_id)
+
+
+def _forget_owner(owner_id: int):
+    for key in _OWNED_CHUNKS.pop(owner_id, ()):
+        entry = _CHUNK_DIGESTS.get(key)
+        if entry is not None:
+            entry[1].discard(owner_id)
+            if not entry[1]:
+                del _CHUNK_DIGESTS[key]
+
+
+def _purge_released_owners():
+    while _RELEASED_OWNERS:
+        _forget_owner(_RELEASED_OWNERS.pop())
+
+
+def _register_owner(owner) -> Optional[int]:
+    """Track the chunks of ``owner`` until it's freed, None if it can't be tracked."""
+    owner_id = id(owner)
+    if owner_id not in _OWNED_CHUNKS:
+        try:
+            weakref.finalize(owner, _release_owner, owner_id)
+        except TypeError:
+            return None
+        _OWNED_CHUNKS[owner_id] = set()
+    return owner_id
+
+
+def _has_buffers_outside_array(array: pa.Array) -> bool:
+    # e.g. dictionaries, which aren't part of `buffers()`
+    def _has_outside_buffers(pa_type) -> bool:
+        return isinstance(pa_type, (pa.DictionaryType, pa.BaseExtensionType)) or any(
+            _has_outside_buffers(pa_type.field(i).type)
+            for i in range(pa_type.num_fields)
+        )
+
+    return _has_outside_buffers(array.type)
+
+
+def _hash_pa_chunk(array: pa.Array, owner_id: Optional[int] = None) -> bytes:
+    """
+    Digest of a chunk of an arrow array, computed from its raw buffers
+    (validity bitmaps, offsets and data). The digests are cached by buffer
+    addresses while the table ``owner_id`` holding the chunk is alive, so that
+    the chunks shared by several tables (e.g. the columns kept by
+    `Dataset.add_column`) are only hashed once.
+    """
+    if _has_buffers_outside_array(array):
+        # serialized with the dictionaries/extension metadata
+        batch = pa.RecordBatch.from_arrays([array], ["_"])
+        return xxhash.xxh3_128_digest(batch.serialize())
+
+    buffers = array.buffers()
+    key = (
+        str(array.type),
+        array.offset,
+        len(array),
+        tuple((buf.address, buf.size) if buf is not None else None for buf in buffers),
+    )
+    entry = _CHUNK_DIGESTS.get(key)
+    if entry is not None:
+        _CHUNK_DIGESTS.move_to_end(key)
+        if owner_id is not None:
+            entry[1].add(owner_id)
+            _OWNED_CHUNKS[owner_id].add(key)
+        return entry[0]
+
+    if array.get_total_buffer_size() > 2 * array.nbytes + 64 * len(buffers):
+        # small slice of large buffers: only hash the sliced data
+        array = pa.concat_arrays([array])
+    m = xxhash.xxh3_128()
+    header = f"{array.type}-{array.offset}-{len(array)}-{array.null_count}"
+    m.update(header.encode("utf-8"))
+    for buf in array.buffers():
+        if buf is None:
+            m.update(b"-")
+        else:
+            m.update(f"-{buf.size}-".encode("utf-8"))
+            m.update(buf)
+    digest = m.digest()
+
+    if owner_id is not None and config.FINGERPRINT_CHUNK_CACHE_SIZE > 0:
+        _CHUNK_DIGESTS[key] = (digest, {owner_id})
+        _OWNED_CHUNKS[owner_id].add(key)
+        while len(_CHUNK_DIGESTS) > config.FINGERPRINT_CHUNK_CACHE_SIZE:
+            evicted, (_, owners) = _CHUNK_DIGESTS.popitem(last=False)
+            for evicted_owner in owners:
+                _OWNED_CHUNKS.get(evicted_owner, set()).discard(evicted)
+    return digest
+
+
 @hashregister(pa.Table, Table, InMemoryTable, MemoryMappedTable, ConcatenationTable)
 def _hash_pa_table(hasher, value):
+    _purge_released_owners()
+    owner_id = _register_owner(value)
+
     def _hash_pa_array(value):
-        if isinstance(value, pa.ChunkedArray):
-            return hasher.hash_bytes(
-                c.to_string().encode("utf-8") for c in value.chunks
-            )
-        else:
-            return hasher.hash_bytes(value.to_string().encode("utf-8"))
+        chunks = value.chunks if isinstance(value, pa.ChunkedArray) else [value]
+        return hasher.hash_bytes([_hash_pa_chunk(chunk, owner_id) for chunk in chunks])
 
     value = "-".join(
         col + "-" + _hash_pa_array(value[col]) for col in sorted(value.column_names)
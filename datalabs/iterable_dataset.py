@@ -11,11 +11,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 import copy
 from dataclasses import dataclass
 from itertools import cycle, islice, repeat
-from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+from multiprocess import Pool
 import numpy as np
 import pyarrow as pa
 
@@ -53,9 +56,90 @@ def _batch_to_examples(batch: Dict[str, list]) -> List[Dict[str, Any]]:
         yield {col: array[i] for col, array in batch.items()}
 
 
+def _table_to_batch(pa_table: pa.Table) -> Dict[str, list]:
+    """Convert a table to a batch, column by column, with the columns sorted as
+    by `_examples_to_batch`"""
+    batch = PythonFormatter().format_batch(pa_table)
+    return {col: batch[col] for col in sorted(batch)}
+
+
+def _iter_arrow_batches(
+    tables: Iterator[Tuple[str, pa.Table]], batch_size: int
+) -> Iterator[Tuple[List[str], Union[pa.Table, List[Dict[str, Any]]]]]:
+    """
+    Split and regroup the tables yielded by `tables` into batches of
+    `batch_size` rows (the last batch may have less), without converting them
+    to examples. Yields the keys of the rows of each batch, as in
+    `_generate_examples_from_tables_wrapper`, and the batch.
+    """
+    slices, keys = [], []
+    for key, table in tables:
+        offset = 0
+        while offset < len(table):
+            length = min(batch_size - len(keys), len(table) - offset)
+            slices.append(table.slice(offset, length))
+            keys.extend(f"{key}_{i}" for i in range(offset, offset + length))
+            offset += length
+            if len(keys) == batch_size:
+                yield keys, _concat_tables(slices)
+                slices, keys = [], []
+    if keys:
+        yield keys, _concat_tables(slices)
+
+
+def _concat_tables(tables: List[pa.Table]) -> Union[pa.Table, List[Dict[str, Any]]]:
+    try:
+        return pa.concat_tables(tables)
+    except pa.ArrowInvalid:
+        # tables with different schemas, the batch is built from their examples
+        python_formatter = PythonFormatter()
+        return [
+            example
+            for table in tables
+            for example in _batch_to_examples(python_formatter.format_batch(table))
+        ]
+
+
+def _map_batch(
+    function: Callable, batch: Union[pa.Table, List[Dict[str, Any]]]
+) -> Dict[str, list]:
+    if isinstance(batch, pa.Table):
+        return function(_table_to_batch(batch))
+    return function(_examples_to_batch(batch))
+
+
+def _map_examples(
+    function: Callable, examples: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    return [function(example) for example in examples]
+
+
+# function mapped by the processes of the pool of a MappedExamplesIterable,
+# sent once to each process instead of with each batch
+_worker_function = None
+
+
+def _init_worker(function: Callable):
+    global _worker_function
+    _worker_function = function
+
+
+def _map_in_worker(map_fn: Callable, inputs: Any) -> Any:
+    return map_fn(_worker_function, inputs)
+
+
+def _get_output(output) -> Any:
+    # a future of a thread pool, or an async result of a process pool
+    return output.result() if isinstance(output, Future) else output.get()
+
+
 class _BaseExamplesIterable:
     """Base class for the examples iterable used by an IterableDataset"""
 
+    # examples iterables backed by arrow tables define `iter_arrow`, which
+    # yields tuples (key, pa.Table)
+    iter_arrow: Optional[Callable[[], Iterator[Tuple[str, pa.Table]]]] = None
+
     def __iter__(self):
         """An examples iterable should yield tuples (example_key, example) of
         type (int/str, dict)"""
@@ -125,6 +209,43 @@ class ShardShuffledExamplesIterable(ExamplesIterable):
             yield key, example
 
 
+class ArrowExamplesIterable(ExamplesIterable):
+    """Examples iterable of the tables yielded by `generate_tables_fn`, which
+    can also be iterated by tables (see `iter_arrow`)"""
+
+    def __init__(self, generate_tables_fn: Callable, kwargs: dict):
+        super().__init__(
+            _generate_examples_from_tables_wrapper(generate_tables_fn), kwargs
+        )
+        self.generate_tables_fn = generate_tables_fn
+
+    def iter_arrow(self) -> Iterator[Tuple[str, pa.Table]]:
+        yield from self.generate_tables_fn(**self.kwargs)
+
+    def shuffle_data_sources(self, seed: Optional[int]) -> "ArrowExamplesIterable":
+        return ShardShuffledArrowExamplesIterable(
+            self.generate_tables_fn, self.kwargs, seed
+        )
+
+
+class ShardShuffledArrowExamplesIterable(ArrowExamplesIterable):
+    def __init__(self, generate_tables_fn: Callable, kwargs: dict, seed: Optional[int]):
+        super().__init__(generate_tables_fn, kwargs)
+        self.seed = seed
+
+    def __iter__(self):
+        """Shuffle the kwargs order to shuffle shards"""
+        rng = np.random.default_rng(self.seed)
+        kwargs_with_shuffled_shards = _shuffle_kwargs(rng, self.kwargs)
+        for key, example in self.generate_examples_fn(**kwargs_with_shuffled_shards):
+            yield key, example
+
+    def iter_arrow(self) -> Iterator[Tuple[str, pa.Table]]:
+        rng = np.random.default_rng(self.seed)
+        kwargs_with_shuffled_shards = _shuffle_kwargs(rng, self.kwargs)
+        yield from self.generate_tables_fn(**kwargs_with_shuffled_shards)
+
+
 class CyclingMultiSourcesExamplesIterable(_BaseExamplesIterable):
     def __init__(self, ex_iterables: List[_BaseExamplesIterable]):
         self.ex_iterables = ex_iterables
@@ -220,32 +341,112 @@ class MappedExamplesIterable(_BaseExamplesIterable):
         function: Callable,
         batched: bool = False,
         batch_size: int = 1000,
+        num_workers: int = 0,
+        prefetch: Optional[int] = None,
+        worker_type: str = "thread",
     ):
+        if worker_type not in ("thread", "process"):
+            raise ValueError(
+                f"worker_type should be 'thread' or 'process', got {worker_type!r}"
+            )
         self.ex_iterable = ex_iterable
         self.function = function
         self.batched = batched
         self.batch_size = batch_size
+        self.num_workers = num_workers
+        self.prefetch = prefetch
+        self.worker_type = worker_type
 
-    def __iter__(self):
+    def _iter_inputs(self) -> Iterator[Tuple[Any, Callable, Any]]:
+        """
+        The inputs of the calls of `function`, as (key, map_fn, inputs) where
+        `map_fn(function, inputs)` maps them:
+        - batched: a batch, either a table if the wrapped iterable yields arrow
+          tables or a list of examples, and its key
+        - otherwise: a list of examples (of `batch_size` examples to limit the
+          overhead of the workers), and their keys
+        """
+        if self.batched and self.ex_iterable.iter_arrow is not None:
+            for keys, batch in _iter_arrow_batches(
+                self.ex_iterable.iter_arrow(), self.batch_size
+            ):
+                # the new key is the concatenation of the examples keys from
+                # the batch
+                yield "_".join(str(key) for key in keys), _map_batch, batch
+            return
         iterator = iter(self.ex_iterable)
         for key, example in iterator:
+            key_examples_list = [(key, example)] + [
+                (key, example) for key, example in islice(iterator, self.batch_size - 1)
+            ]
+            keys, examples = zip(*key_examples_list)
             if self.batched:
-                # If batched, first build the batch
-                key_examples_list = [(key, example)] + [
-                    (key, example)
-                    for key, example in islice(iterator, self.batch_size - 1)
-                ]
-                keys, examples = zip(*key_examples_list)
-                batch = _examples_to_batch(examples)
-                # then apply the transform
-                transformed_batch = self.function(batch)
-                # the new key is the concatenation of the examples keys from the batch
-                new_key = "_".join(str(key) for key in keys)
-                # yield one example at a time from the transformed batch
-                yield from zip(repeat(new_key), _batch_to_examples(transformed_batch))
+                yield "_".join(str(key) for key in keys), _map_batch, list(examples)
             else:
-                # If not batched, apply the transform and yield the example directly
-                yield key, self.function(example)
+                yield keys, _map_examples, list(examples)
+
+    def _iter_outputs(self) -> Iterator[Tuple[Any, Any]]:
+        """
+        The outputs of `function` on the inputs of `_iter_inputs`, in order,
+        computed by `num_workers` threads or processes with at most `prefetch`
+        inputs being mapped at once
+        """
+        if self.num_workers == 0:
+            for key, map_fn, inputs in self._iter_inputs():
+                yield key, map_fn(self.function, inputs)
+            return
+
+        if self.worker_type == "process":
+            pool = Pool(
+                self.num_workers, initializer=_init_worker, initargs=(self.function,)
+            )
+
+            def submit(map_fn, inputs):
+                return pool.apply_async(_map_in_worker, (map_fn, inputs))
+
+            def shutdown():
+                pool.terminate()
+                pool.join()
+
+        else:
+            executor = ThreadPoolExecutor(max_workers=self.num_workers)
+
+            def submit(map_fn, inputs):
+                return executor.submit(map_fn, self.function, inputs)
+
+            def shutdown():
+                # when the iteration is interrupted
+                for _, future in pending:
+                    future.cancel()
+                executor.shutdown(wait=True)
+
+        prefetch = max(1, self.prefetch or 2 * self.num_workers)
+        # (key, future or async result) of the inputs being mapped
+        pending = deque()
+        try:
+            for key, map_fn, inputs in self._iter_inputs():
+                pending.append((key, submit(map_fn, inputs)))
+                if len(pending) >= prefetch:
+                    key, output = pending.popleft()
+                    yield key, _get_output(output)
+            while pending:
+                key, output = pending.popleft()
+                yield key, _get_output(output)
+        finally:
+            shutdown()
+
+    def __iter__(self):
+        if self.batched or self.num_workers > 0:
+            for key, outputs in self._iter_outputs():
+                if self.batched:
+                    # yield one example at a time from the transformed batch
+                    yield from zip(repeat(key), _batch_to_examples(outputs))
+                else:
+                    yield from zip(key, outputs)
+            return
+        for key, example in self.ex_iterable:
+            # If not batched, apply the transform and yield the example directly
+            yield key, self.function(example)
 
     def shuffle_data_sources(self, seed: Optional[int]) -> "MappedExamplesIterable":
         """Shuffle the wrapped examples iterable."""
@@ -254,6 +455,9 @@ class MappedExamplesIterable(_BaseExamplesIterable):
             function=self.function,
             batched=self.batched,
             batch_size=self.batch_size,
+            num_workers=self.num_workers,
+            prefetch=self.prefetch,
+            worker_type=self.worker_type,
         )
 
     @property
@@ -450,7 +654,15 @@ class IterableDataset(DatasetInfoMixin):
             shuffling=copy.deepcopy(self._shuffling),
         )
 
-    def map(self, function: Callable, batched: bool = False, batch_size: int = 1000):
+    def map(
+        self,
+        function: Callable,
+        batched: bool = False,
+        batch_size: int = 1000,
+        num_workers: int = 0,
+        prefetch: Optional[int] = None,
+        worker_type: str = "thread",
+    ):
         """
         Return a dataset with the specified map function. The function is
         applied on-the-fly on the examples when iterating over the dataset.
@@ -480,12 +692,31 @@ class IterableDataset(DatasetInfoMixin):
             `function`.
             batch_size (:obj:`int`, optional, default ``1000``): Number of examples
             per batch provided to `function` if `batched=True`.
-
+            num_workers (:obj:`int`, default ``0``): Number of workers applying
+            `function` to the next batches (or to the next chunks of `batch_size`
+                examples if `batched=False`) while the examples are iterated, 0
+                to apply it in the iterating thread. The examples are yielded in
+                their order.
+            prefetch (:obj:`int`, optional, default ``2 * num_workers``): Maximum
+            number of batches being mapped at once, ahead of the iteration.
+            worker_type (:obj:`str`, default ``"thread"``): "thread" for a pool
+            of threads, for functions releasing the GIL (arrow or numpy
+                computations, I/O), or "process" for a pool of processes.
+
+        If the dataset is read from arrow tables (e.g. parquet or csv files),
+        the batches are slices of the tables, converted to a batch column by
+        column by the workers.
         """
         info = copy.deepcopy(self._info)
         info.features = None
         ex_iterable = MappedExamplesIterable(
-            self._ex_iterable, function=function, batched=batched, batch_size=batch_size
+            self._ex_iterable,
+            function=function,
+            batched=batched,
+            batch_size=batch_size,
+            num_workers=num_workers,
+            prefetch=prefetch,
+            worker_type=worker_type,
         )
         return iterable_dataset(
             ex_iterable=ex_iterable,
@@ -1,9 +1,23 @@
-from random import choices
-
 import numpy as np
-import scipy
-import sklearn.metrics
-from sklearn.metrics import accuracy_score
+
+from datalabs.utils.bootstrap import (
+    bootstrap_mean,
+    bootstrap_metric,
+    confidence_interval,
+)
+
+
+# sklearn is only imported when a metric is computed
+def accuracy_score(*args, **kwargs):
+    import sklearn.metrics
+
+    return sklearn.metrics.accuracy_score(*args, **kwargs)
+
+
+def f1_score(*args, **kwargs):
+    import sklearn.metrics
+
+    return sklearn.metrics.f1_score(*args, **kwargs)
 
 
 class Metric:
@@ -15,40 +29,36 @@ class Metric:
         self._sampling_rate = 0.8
         self._results = None
         self._is_print_confidence_interval = False
+        # per-example scores whose mean is the metric, if any
+        self._sample_score_function = None
+        # seed of the bootstrap resampling, and its number of processes
+        self._seed = None
+        self._num_proc = 1
 
     def get_confidence_interval(self, *args, **kwargs):
-        def mean_confidence_interval(data, confidence=0.95):
-            a = 1.0 * np.array(data)
-            n = len(a)
-            m, se = np.mean(a), scipy.stats.sem(a)
-            h = se * scipy.stats.t.ppf((1 + confidence) / 2.0, n - 1)
-            return m - h, m + h
-
         n_sampling = int(self._n_samples * self._sampling_rate)
         if n_sampling == 0:
             n_sampling = 1
 
-        # print(f"n_sampling: {n_sampling}\n"
-        #       f"self._n_samples {self._n_samples}\n")
-
-        performance_list = []
-        confidence_low, confidence_up = 0, 0
-        for i in range(self._n_times):
-            sample_index_list = choices(range(self._n_samples), k=n_sampling)
-            performance = self._eval_function(
-                np.array(args[0])[sample_index_list],
-                np.array(args[1])[sample_index_list],
-                **kwargs
+        if self._sample_score_function is not None:
+            # the metric is the mean of per-example scores
+            performances = bootstrap_mean(
+                self._sample_score_function(*args),
+                n_sampling,
+                self._n_times,
+                seed=self._seed,
             )
-            performance_list.append(performance)
-
-        if self._n_times != 1000:
-            confidence_low, confidence_up = mean_confidence_interval(performance_list)
         else:
-            performance_list.sort()
-            confidence_low = performance_list[24]
-            confidence_up = performance_list[974]
-        return confidence_low, confidence_up
+            performances = bootstrap_metric(
+                self._eval_function,
+                args,
+                n_sampling,
+                self._n_times,
+                seed=self._seed,
+                num_proc=self._num_proc,
+                **kwargs
+            )
+        return confidence_interval(performances)
 
     def _evaluate(self, *args, **kwargs):
 
@@ -71,7 +81,12 @@ class Metric:
 
 class Accuracy(Metric):
     def __init__(
-        self, true_labels, predicted_labels, is_print_confidence_interval=False
+        self,
+        true_labels,
+        predicted_labels,
+        is_print_confidence_interval=False,
+        seed=None,
+        num_proc=1,
     ):
         super(Accuracy, self).__init__()
         # Metric.__init__(self)
@@ -81,6 +96,9 @@ class Accuracy(Metric):
         self._eval_function = accuracy_score
         self._is_print_confidence_interval = is_print_confidence_interval
         self._n_samples = len(self._true_labels)
+        self._sample_score_function = accuracy_sample_scores
+        self._seed = seed
+        self._num_proc = num_proc
 
     def evaluate(self):
 
@@ -89,16 +107,23 @@ class Accuracy(Metric):
 
 class F1score(Metric):
     def __init__(
-        self, true_labels, predicted_labels, is_print_confidence_interval=False
+        self,
+        true_labels,
+        predicted_labels,
+        is_print_confidence_interval=False,
+        seed=None,
+        num_proc=1,
     ):
         super(F1score, self).__init__()
         # Metric.__init__(self)
         self._name = self.__class__.__name__
         self._true_labels = true_labels
         self._predicted_labels = predicted_labels
-        self._eval_function = sklearn.metrics.f1_score
+        self._eval_function = f1_score
         self._is_print_confidence_interval = is_print_confidence_interval
         self._n_samples = len(self._true_labels)
+        self._seed = seed
+        self._num_proc = num_proc
 
     def evaluate(self):
         # print(self._true_labels[0:10])
@@ -111,6 +136,20 @@ class F1score(Metric):
         )
 
 
+def accuracy_sample_scores(true_labels, predicted_labels):
+    correct = np.asarray(true_labels) == np.asarray(predicted_labels)
+    if correct.ndim > 1:
+        correct = correct.all(axis=tuple(range(1, correct.ndim)))
+    return correct
+
+
+def hits_sample_scores(true_labels, predicted_labels):
+    return np.array(
+        [i_true in i_preds for i_true, i_preds in zip(true_labels, predicted_labels)],
+        dtype=bool,
+    )
+
+
 def hits(true_labels, predicted_labels):
     num_hits = 0
     for i in range(len(true_labels)):
@@ -123,7 +162,12 @@ def hits(true_labels, predicted_labels):
 
 class Hits(Metric):
     def __init__(
-        self, true_labels, predicted_labels, is_print_confidence_interval=False
+        self,
+        true_labels,
+        predicted_labels,
+        is_print_confidence_interval=False,
+        seed=None,
+        num_proc=1,
     ):
         super(Hits, self).__init__()
         # Metric.__init__(self)
@@ -133,6 +177,9 @@ class Hits(Metric):
         self._eval_function = hits
         self._is_print_confidence_interval = is_print_confidence_interval
         self._n_samples = len(self._true_labels)
+        self._sample_score_function = hits_sample_scores
+        self._seed = seed
+        self._num_proc = num_proc
 
     def evaluate(self):
 
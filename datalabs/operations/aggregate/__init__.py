@@ -1,10 +1,20 @@
-from datalabs.operations.aggregate.aggregating import aggregating  # noqa
-from datalabs.operations.aggregate.general import (  # noqa
-    get_average_length,
-    get_features_dataset_level,
-    get_tfidf,
-    get_vocabulary,
+from datalabs.operations.aggregate.aggregating import Aggregating, aggregating  # noqa
+from datalabs.operations.registry import lazy_package
+
+# the operations are imported on first access, with their dependencies
+__getattr__, __dir__, __all__ = lazy_package(
+    __name__,
+    {
+        "general": [
+            "get_average_length",
+            "get_duplicate_clusters",
+            "get_features_dataset_level",
+            "get_tfidf",
+            "get_vocabulary",
+        ],
+    },
 )
+__all__ = ["Aggregating", "aggregating", *__all__]
 
 # from .text_classification import *
 # from .sequence_labeling import *
@@ -0,0 +1,56 @@
+"""Arrow-native engine for dataset-level statistics.
+
+Aggregators dispatch to these functions when they are applied to a `Dataset`:
+the statistics are computed with `pyarrow.compute` kernels on the columns of
+the dataset, without decoding the samples into Python objects.
+"""
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+def dataset_column(samples: Any, field: str) -> Optional[pa.ChunkedArray]:
+    """
+    returns the column `field` of `samples` if it is a `Dataset` having it,
+    None otherwise (e.g. for a list of samples)
+    """
+    from datalabs.arrow_dataset import Dataset
+
+    if not isinstance(samples, Dataset) or field not in samples.column_names:
+        return None
+    column = samples.data.column(field)
+    if samples._indices is not None:
+        column = column.take(samples._indices.column(0))
+    return column
+
+
+def word_lengths(texts: pa.ChunkedArray) -> pa.ChunkedArray:
+    """
+    number of words of each text, as `len(text.split(" "))`
+    """
+    return pc.list_value_length(pc.split_pattern(texts, pattern=" "))
+
+
+def value_counts(values: pa.ChunkedArray) -> Dict[Any, int]:
+    """
+    number of occurrences of each value, in order of first occurrence
+    """
+    counts = pc.value_counts(values)
+    return dict(
+        zip(counts.field("values").to_pylist(), counts.field("counts").to_pylist())
+    )
+
+
+def word_counts(texts: pa.ChunkedArray) -> Dict[str, int]:
+    """
+    number of occurrences of each word of `texts`, by decreasing number of
+    occurrences (words with the same count are in order of first occurrence)
+    """
+    counts = pc.value_counts(pc.list_flatten(pc.split_pattern(texts, pattern=" ")))
+    order = np.argsort(-counts.field("counts").to_numpy(), kind="stable")
+    counts = counts.take(pa.array(order))
+    return dict(
+        zip(counts.field("values").to_pylist(), counts.field("counts").to_pylist())
+    )
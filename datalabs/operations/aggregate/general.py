@@ -2,11 +2,14 @@ from typing import Dict, Iterator
 
 # nltk package for
 import numpy as np
-
-# sklearn is used for tfidf
-from sklearn.feature_extraction.text import TfidfVectorizer
+import pyarrow.compute as pc
 
 from datalabs.operations.aggregate.aggregating import aggregating
+from datalabs.operations.aggregate.columnar import (
+    dataset_column,
+    word_counts,
+    word_lengths,
+)
 
 
 @aggregating(
@@ -44,6 +47,10 @@ def get_average_length(texts: Iterator) -> int:
     Output:
         int
     """
+    column = dataset_column(texts, "text")
+    if column is not None:
+        return {"average_length": pc.mean(word_lengths(column)).as_py()}
+
     lengths = []
     for text in texts:
         lengths.append(len(text["text"].split(" ")))
@@ -64,6 +71,10 @@ def get_vocabulary(texts: Iterator) -> Dict:
     Output:
         int
     """
+    column = dataset_column(texts, "text")
+    if column is not None:
+        return {"vocabulary": word_counts(column)}
+
     vocab = {}
     for text in texts:
         for w in text["text"].split(" "):
@@ -75,6 +86,38 @@ def get_vocabulary(texts: Iterator) -> Dict:
     return {"vocabulary": vocab_sorted}
 
 
+@aggregating(
+    name="get_duplicate_clusters",
+    contributor="datalab",
+    task="Any",
+    description="Find the clusters of near-duplicate texts with MinHash LSH",
+)
+def get_duplicate_clusters(texts: Iterator) -> Dict:
+    """
+    Package: python
+    Input:
+        texts: Iterator
+    Output:
+        Dict
+    """
+    from datalabs.search import MinHashLSHIndex
+
+    minhash_index = MinHashLSHIndex()
+    column = dataset_column(texts, "text")
+    if column is not None:
+        minhash_index.add_documents(texts, column="text")
+    else:
+        minhash_index.add_documents([text["text"] for text in texts])
+    clusters = minhash_index.duplicate_clusters()
+    n_duplicates = sum(len(cluster) - 1 for cluster in clusters)
+    return {
+        "duplicate_clusters": clusters,
+        "duplicate_ratio": n_duplicates / len(minhash_index.keys)
+        if len(minhash_index.keys) > 0
+        else 0.0,
+    }
+
+
 @aggregating(
     name="get_tfidf",
     contributor="scikit-learn",
@@ -89,6 +132,9 @@ def get_tfidf(texts: Iterator) -> int:
     Output:
         dict
     """
+    # sklearn is used for tfidf
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
     vectorizer = TfidfVectorizer()
     tfidf = vectorizer.fit_transform(texts)
     words = vectorizer.get_feature_names()
@@ -1,12 +1,17 @@
-from collections import Counter
+from functools import partial
 import json
 import os
 from typing import Any, Callable, Iterator, List, Mapping, Optional
 
-import numpy as np
-from tqdm import tqdm
-
 from datalabs.operations.aggregate.aggregating import Aggregating, aggregating
+from datalabs.operations.aggregate.streaming import (
+    aggregate,
+    AggregatorDict,
+    CountMap,
+    Head,
+    Moments,
+    Sum,
+)
 from datalabs.operations.featurize import get_gender_bias
 from datalabs.operations.operation import dataset_operation, DatasetOperation
 
@@ -84,6 +89,81 @@ class sequence_labeling_aggregating(aggregating, dataset_operation):
             return tf_cls
 
 
+def _init_statistics() -> AggregatorDict:
+    return AggregatorDict(
+        lengths=Moments(),
+        labels=CountMap(),
+        entity_lengths=Moments(),
+        entity_length_distribution=CountMap(),
+        entities_per_sentence=Moments(),
+        gender_word=CountMap(),
+        gender_single_name=CountMap(),
+        vocabulary=CountMap(),
+        number_of_tokens=Sum(),
+        spelling_errors=Sum(),
+        sample_infos=Head(10000),
+    )
+
+
+def _update_statistics(state: AggregatorDict, sample: dict, misspellings: dict):
+    tokens, tags = sample["tokens"], sample["tags"]
+    text = " ".join(tokens)
+    # grammar checker
+    state["spelling_errors"].update(
+        len([word for word in tokens if word.lower() in misspellings])
+    )
+
+    # update the number of tokens
+    state["number_of_tokens"].update(len(tokens))
+
+    # update vocabulary
+    state["vocabulary"].update_many(tokens)
+
+    # gender bias
+    """
+    result = {
+    'word': {
+        'male': one_words_results['words_m'],
+        'female': one_words_results['words_f']
+    },
+    'single_name': {
+        'male': one_words_results['single_name_m'],
+        'female': one_words_results['single_name_f']
+    },
+    }
+    """
+    gender_result = get_gender_bias.func(text)
+    for gender in ["male", "female"]:
+        gender_info = gender_result["gender_bias_info"]
+        state["gender_word"].update(gender, gender_info["word"][gender])
+        state["gender_single_name"].update(gender, gender_info["single_name"][gender])
+
+    # average length
+    text_length = len(text.split(" "))
+    state["lengths"].update(text_length)
+
+    # convert tag-id to tag-text
+    tag_ts = tag_id2text(tags)
+    chunk = get_chunks(tag_ts)
+    if len(chunk) != 0:
+        state["entities_per_sentence"].update(len(chunk))
+        for _, start, end in chunk:
+            state["entity_lengths"].update(end - start)
+            state["entity_length_distribution"].update(end - start)
+
+    # label imbalance
+    state["labels"].update_many(tag_ts)
+
+    state["sample_infos"].update(
+        {
+            "tokens": text,
+            "tags": tag_ts,
+            "text_length": text_length,
+            "gender": gender_result,
+        }
+    )
+
+
 @sequence_labeling_aggregating(
     name="get_statistics",
     contributor="datalab",
@@ -92,13 +172,15 @@ class sequence_labeling_aggregating(aggregating, dataset_operation):
     " of a given sequence labeling datasets (e.g., named "
     "entity recognition)",
 )
-def get_statistics(samples: Iterator):
+def get_statistics(samples: Iterator, num_proc: int = 1):
     """
     Input:
     samples: [{
      "tokens":
      "tags":
     }]
+    num_proc: number of processes computing the statistics of shards of the
+    dataset
     Output:dict:
 
     usage:
@@ -118,182 +200,65 @@ def get_statistics(samples: Iterator):
     ) as file:
         COMMON_MISSPELLINGS_DICT = json.loads(file.read())
 
-    # for hate speech
-    # from hatesonar import Sonar
-    # sonar = Sonar()
-
-    sample_infos = []
-    labels_to_number = {}
-    gender_results = []
-    vocab = {}
-    number_of_tokens = 0
-    # hatespeech = {
-    #     "hate_speech": {"ratio": 0, "texts": []},
-    #     "offensive_language": {"ratio": 0, "texts": []},
-    #     "neither": {"ratio": 0, "texts": []}}
-    spelling_errors = []
-
-    lengths = []
-    chunks = []
-    tag_texts = []
-    for sample in tqdm(samples):
-        tokens, tags = sample["tokens"], sample["tags"]
-        text = " ".join(tokens)
-        # grammar checker
-        for word in tokens:
-            # word_corrected = spell.correction(word)
-            if word.lower() in COMMON_MISSPELLINGS_DICT.keys():
-                spelling_errors.append((word, COMMON_MISSPELLINGS_DICT[word.lower()]))
-
-        # hataspeech
-        # results = sonar.ping(text=text)
-        # class_ = results['top_class']
-        # confidence = 0
-        # for value in results['classes']:
-        #     if value['class_name'] == class_:
-        #         confidence = value['confidence']
-        #         break
-        #
-        # hatespeech[class_]["ratio"] += 1
-        # if class_ != "neither":
-        #     hatespeech[class_]["texts"].append(text)
-
-        # update the number of tokens
-        number_of_tokens += len(tokens)
-
-        # update vocabulary
-        for w in tokens:
-
-            if w in vocab.keys():
-                vocab[w] += 1
-            else:
-                vocab[w] = 1
-
-        # gender bias
-        """
-        result = {
-        'word': {
-            'male': one_words_results['words_m'],
-            'female': one_words_results['words_f']
-        },
-        'single_name': {
-            'male': one_words_results['single_name_m'],
-            'female': one_words_results['single_name_f']
-        },
-        }
-        """
-        gender_result = get_gender_bias.func(text)
-        gender_results.append(gender_result["gender_bias_info"])
-
-        # average length
-        text_length = len(text.split(" "))
-        lengths.append(text_length)
-
-        # convert tag-id to tag-text
-        tag_ts = tag_id2text(tags)
-        tag_texts += tag_ts
-        chunk = get_chunks(tag_ts)
-        if len(chunk) != 0:
-            chunks.append(chunk)
-
-        # label imbalance
-        for label in tag_ts:
-            if label in labels_to_number.keys():
-                labels_to_number[label] += 1
-            else:
-                labels_to_number[label] = 1
-
-        sample_info = {
-            "tokens": text,
-            "tags": tag_ts,
-            "text_length": text_length,
-            "gender": gender_result,
-            # "hate_speech_class": class_,
-        }
+    # all the statistics are computed in one streaming pass
+    state = aggregate(
+        samples,
+        _init_statistics,
+        partial(_update_statistics, misspellings=COMMON_MISSPELLINGS_DICT),
+        num_proc=num_proc,
+    )
+    statistics = state.finalize()
 
-        if len(sample_infos) < 10000:
-            sample_infos.append(sample_info)
     # -------------------------- dataset-level ---------------------------
     # compute dataset-level gender_ratio
     gender_ratio = {
-        "word": {"male": 0, "female": 0},
-        "single_name": {"male": 0, "female": 0},
+        "word": statistics["gender_word"],
+        "single_name": statistics["gender_single_name"],
     }
-    for result in gender_results:
-        res_word = result["word"]  # noqa
-        gender_ratio["word"]["male"] += result["word"]["male"]
-        gender_ratio["word"]["female"] += result["word"]["female"]
-        gender_ratio["single_name"]["male"] += result["single_name"]["male"]
-        gender_ratio["single_name"]["female"] += result["single_name"]["female"]
-
-    n_gender = gender_ratio["word"]["male"] + gender_ratio["word"]["female"]
-    gender_ratio["word"]["male"] /= n_gender
-    gender_ratio["word"]["female"] /= n_gender
-
-    n_gender = (
-        gender_ratio["single_name"]["male"] + gender_ratio["single_name"]["female"]
-    )
-    gender_ratio["single_name"]["male"] /= n_gender
-    gender_ratio["single_name"]["female"] /= n_gender
+    for gender_type in ["word", "single_name"]:
+        n_gender = sum(gender_ratio[gender_type].values())
+        for gender in ["male", "female"]:
+            gender_ratio[gender_type][gender] /= n_gender
 
     # get vocabulary
-    vocab_sorted = dict(sorted(vocab.items(), key=lambda item: item[1], reverse=True))
-
-    # get ratio of hate_speech:offensive_language:neither
-    # for k, v in hatespeech.items():
-    #     hatespeech[k]["ratio"] /= len(samples)
+    vocab_sorted = dict(
+        sorted(statistics["vocabulary"].items(), key=lambda item: item[1], reverse=True)
+    )
 
     # other NER features...
 
-    label_distribution = dict(Counter(tag_texts))
-    avg_entityLen, avg_entity_nums_inSent, entity_lengths = get_avg_spanLen(chunks)
-    entity_length_distribution = dict(Counter(entity_lengths))
-
+    labels_to_number = statistics["labels"]
     res = {
         "dataset-level": {
             "entity_info": {
-                "avg_entity_length": avg_entityLen,
-                "avg_entity_on_sentence": avg_entity_nums_inSent,
-                "sentence_without_entity": len(samples) - len(chunks),
-                "entity_length_distribution": entity_length_distribution,
+                "avg_entity_length": statistics["entity_lengths"]["mean"],
+                "avg_entity_on_sentence": statistics["entities_per_sentence"]["mean"],
+                "sentence_without_entity": len(samples)
+                - statistics["entities_per_sentence"]["count"],
+                "entity_length_distribution": statistics["entity_length_distribution"],
             },
             "length_info": {
-                "max_text_length": np.max(lengths),
-                "min_text_length": np.min(lengths),
-                "average_text_length": np.average(lengths),
+                "max_text_length": statistics["lengths"]["max"],
+                "min_text_length": statistics["lengths"]["min"],
+                "average_text_length": statistics["lengths"]["mean"],
             },
             "label_info": {
                 "ratio": min(labels_to_number.values())
                 * 1.0
                 / max(labels_to_number.values()),
-                "distribution": label_distribution,  # labels_to_number,
+                "distribution": labels_to_number,
             },
             "gender_info": gender_ratio,
             "vocabulary_info": vocab_sorted,
             "number_of_samples": len(samples),
-            "number_of_tokens": number_of_tokens,
-            # "hatespeech_info": hatespeech,
+            "number_of_tokens": statistics["number_of_tokens"],
         },
-        "sample-level": sample_infos,
+        "sample-level": statistics["sample_infos"],
     }
 
     return res
 
 
-def get_avg_spanLen(chunks):
-    entity_lengths = []
-    entity_nums = []
-    for chunk in chunks:
-        entity_nums.append(len(chunk))
-        for ck in chunk:
-            tag, sid, eid = ck
-            entity_lengths.append(eid - sid)
-
-    avg_entityLen = np.mean(entity_lengths)
-    avg_entity_nums_inSent = np.mean(entity_nums)
-    return avg_entityLen, avg_entity_nums_inSent, entity_lengths
-
-
 def tag_id2text(tags):
     tag2text_dic = {
         0: "O",
@@ -0,0 +1,263 @@
+"""Streaming aggregators: dataset-level statistics computed in one pass over
+the samples with bounded memory.
+
+An aggregator is a state object that is created empty (`init`), updated with
+one value at a time (`update`), combined with the state of another shard of
+the dataset (`merge`) and turned into the final statistic (`finalize`), e.g.
+
+    lengths = Moments()
+    for sample in samples:
+        lengths.update(len(sample["text"].split(" ")))
+    lengths.finalize()  # {"count": ..., "mean": ..., "min": ..., ...}
+
+`aggregate` runs such an aggregation over a dataset, optionally in parallel
+across contiguous shards whose states are merged at the end.
+"""
+from collections import Counter
+from functools import reduce
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence
+
+from multiprocess import Pool
+from tqdm import tqdm
+
+
+class Aggregator:
+    """Base class of the streaming aggregators."""
+
+    def update(self, value: Any):
+        raise NotImplementedError
+
+    def merge(self, other: "Aggregator") -> "Aggregator":
+        """
+        adds the state of `other` to this aggregator and returns it
+        """
+        raise NotImplementedError
+
+    def finalize(self) -> Any:
+        raise NotImplementedError
+
+
+class Sum(Aggregator):
+    def __init__(self):
+        self.total = 0
+
+    def update(self, value: float):
+        self.total += value
+
+    def merge(self, other: "Sum") -> "Sum":
+        self.total += other.total
+        return self
+
+    def finalize(self) -> float:
+        return self.total
+
+
+class Moments(Aggregator):
+    """Running count, mean, variance, min and max of numeric values."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count > 0 else None
+
+    def update(self, value: float):
+        delta = value - (self.mean or 0.0)
+        self.count += 1
+        self.total += value
+        self.m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "Moments") -> "Moments":
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.__dict__.update(other.__dict__)
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def finalize(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "variance": self.m2 / self.count if self.count > 0 else None,
+            "min": self.min,
+            "max": self.max,
+        }
+
+
+class CountMap(Aggregator):
+    """Number of occurrences of each value (labels, words, ...), in order of
+    first occurrence."""
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def update(self, key: Hashable, count: int = 1):
+        self.counts[key] += count
+
+    def update_many(self, keys: Iterable[Hashable]):
+        self.counts.update(keys)
+
+    def merge(self, other: "CountMap") -> "CountMap":
+        self.counts.update(other.counts)
+        return self
+
+    def finalize(self) -> Dict[Hashable, int]:
+        return dict(self.counts)
+
+
+class Head(Aggregator):
+    """The first `size` values, e.g. a preview of the samples."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values = []
+
+    def update(self, value: Any):
+        if len(self.values) < self.size:
+            self.values.append(value)
+
+    def merge(self, other: "Head") -> "Head":
+        self.values.extend(other.values[: self.size - len(self.values)])
+        return self
+
+    def finalize(self) -> List[Any]:
+        return self.values
+
+
+class Quantiles(Aggregator):
+    """Approximate quantiles of numeric values, with a KLL-style sketch.
+
+    Values are kept in compactors of at most `capacity` items, an item of the
+    compactor of level h standing for 2 ** h values. A full compactor is
+    sorted and every other item is promoted to the next level, so the memory
+    is O(capacity * log(n / capacity)) and the rank error O(1 / capacity).
+    """
+
+    def __init__(self, quantiles: Sequence[float] = (0.5,), capacity: int = 256):
+        self.quantiles = list(quantiles)
+        self.capacity = capacity
+        self.compactors: List[List[float]] = [[]]
+        self._offset = 0
+
+    def update(self, value: float):
+        self.compactors[0].append(value)
+        if len(self.compactors[0]) >= self.capacity:
+            self._compress()
+
+    def _compress(self):
+        for level in range(len(self.compactors)):
+            items = self.compactors[level]
+            if len(items) < self.capacity:
+                continue
+            if level + 1 == len(self.compactors):
+                self.compactors.append([])
+            items.sort()
+            kept = [items.pop()] if len(items) % 2 == 1 else []
+            self.compactors[level + 1].extend(items[self._offset :: 2])
+            self.compactors[level] = kept
+            # alternate the promoted items to avoid biasing the ranks
+            self._offset = 1 - self._offset
+
+    def merge(self, other: "Quantiles") -> "Quantiles":
+        for level, items in enumerate(other.compactors):
+            if level == len(self.compactors):
+                self.compactors.append([])
+            self.compactors[level].extend(items)
+        self._compress()
+        return self
+
+    def finalize(self) -> Dict[float, Optional[float]]:
+        weighted = sorted(
+            (value, 2**level)
+            for level, items in enumerate(self.compactors)
+            for value in items
+        )
+        total = sum(weight for _, weight in weighted)
+        result = {}
+        for quantile in self.quantiles:
+            result[quantile] = None
+            rank, target = 0, quantile * total
+            for value, weight in weighted:
+                rank += weight
+                if rank >= target:
+                    result[quantile] = value
+                    break
+        return result
+
+
+class AggregatorDict(Aggregator):
+    """Named aggregators updated together, e.g. all the statistics of a
+    dataset; `update` takes a dict of values keyed by aggregator name."""
+
+    def __init__(self, **aggregators: Aggregator):
+        self.aggregators = aggregators
+
+    def __getitem__(self, name: str) -> Aggregator:
+        return self.aggregators[name]
+
+    def update(self, values: Dict[str, Any]):
+        for name, value in values.items():
+            self.aggregators[name].update(value)
+
+    def merge(self, other: "AggregatorDict") -> "AggregatorDict":
+        for name, aggregator in other.aggregators.items():
+            self.aggregators[name].merge(aggregator)
+        return self
+
+    def finalize(self) -> Dict[str, Any]:
+        return {
+            name: aggregator.finalize() for name, aggregator in self.aggregators.items()
+        }
+
+
+def _aggregate_shard(shard_args) -> Aggregator:
+    samples, init, update = shard_args
+    state = init()
+    for sample in samples:
+        update(state, sample)
+    return state
+
+
+def aggregate(
+    samples: Iterable,
+    init: Callable[[], Aggregator],
+    update: Callable[[Aggregator, Any], None],
+    num_proc: int = 1,
+) -> Aggregator:
+    """
+    runs a streaming aggregation over samples
+    Parameter:
+      - samples: a dataset or any iterable of samples
+      - init: function creating an empty state
+      - update: function adding a sample to a state
+      - num_proc: number of processes; if > 1, `samples` must be a dataset,
+        which is split in contiguous shards aggregated in parallel
+    Returns:
+      - the merged state, to be finalized by the caller
+    """
+    if num_proc <= 1:
+        return _aggregate_shard((tqdm(samples), init, update))
+
+    num_proc = min(num_proc, len(samples)) or 1
+    shards_args = [
+        (samples.shard(num_proc, index, contiguous=True), init, update)
+        for index in range(num_proc)
+    ]
+    with Pool(num_proc) as pool:
+        states = pool.map(_aggregate_shard, shards_args)
+    return reduce(lambda state, other: state.merge(other), states)
@@ -1,9 +1,12 @@
 from typing import Any, Callable, Iterator, List, Mapping, Optional
 
-import numpy as np
-from tqdm import tqdm
-
 from datalabs.operations.aggregate.aggregating import Aggregating, aggregating
+from datalabs.operations.aggregate.streaming import (
+    aggregate,
+    AggregatorDict,
+    Moments,
+    Sum,
+)
 from datalabs.operations.featurize import *  # noqa
 from datalabs.operations.operation import dataset_operation, DatasetOperation
 
@@ -79,6 +82,25 @@ class summarization_aggregating(aggregating, dataset_operation):
             return tf_cls
 
 
+def _init_statistics() -> AggregatorDict:
+    return AggregatorDict(
+        text_lengths=Moments(),
+        summary_lengths=Moments(),
+        number_of_tokens=Sum(),
+    )
+
+
+def _update_statistics(state: AggregatorDict, sample: dict):
+    text, summary = sample["text"], sample["summary"]
+    state.update(
+        {
+            "text_lengths": len(text.split(" ")),
+            "summary_lengths": len(summary.split(" ")),
+            "number_of_tokens": len(text.split()) + len(summary.split()),
+        }
+    )
+
+
 @summarization_aggregating(
     name="get_statistics",
     contributor="datalab",
@@ -86,13 +108,15 @@ class summarization_aggregating(aggregating, dataset_operation):
     description="Calculate the overall statistics (e.g., density) "
     "of a given summarization dataset",
 )
-def get_statistics(samples: Iterator):
+def get_statistics(samples: Iterator, num_proc: int = 1):
     """
         Input:
         samples: [{
          "text":
          "summary":
         }]
+        num_proc: number of processes computing the statistics of shards of
+        the dataset
         Output:dict:
 
         usage:
@@ -105,54 +129,26 @@ def get_statistics(samples: Iterator):
     print(next(res))
 
     """
-
-    summary_lengths = []
-    text_lengths = []
-    number_of_tokens = 0
-    vocab = {}
-
-    for sample in tqdm(samples):
-
-        text, summary = sample["text"], sample["summary"]
-
-        # average length of text
-        text_length = len(text.split(" "))
-        text_lengths.append(text_length)
-
-        # average length of summary
-        summary_length = len(summary.split(" "))
-        summary_lengths.append(summary_length)
-
-        # update the number of tokens
-        number_of_tokens += len(text.split())
-        number_of_tokens += len(summary.split())
-
-        # Others
-        # attr_json = get_all_features(sample)
-        # attr_jsons.append(attr_json)
-
-        # Vocabulary info
-        for w in (text + summary).split(" "):
-
-            if w in vocab.keys():
-                vocab[w] += 1
-            else:
-                vocab[w] = 1
+    # all the statistics are computed in one streaming pass
+    state = aggregate(samples, _init_statistics, _update_statistics, num_proc=num_proc)
+    statistics = state.finalize()
+    text_lengths = statistics["text_lengths"]
+    summary_lengths = statistics["summary_lengths"]
 
     res = {
         "dataset-level": {
-            "average_text_length": np.average(text_lengths),
-            "average_summary_length": np.average(summary_lengths),
+            "average_text_length": text_lengths["mean"],
+            "average_summary_length": summary_lengths["mean"],
             "length_info": {
-                "max_text_length": np.max(text_lengths),
-                "min_text_length": np.min(text_lengths),
-                "average_text_length": np.average(text_lengths),
-                "max_summary_length": np.max(summary_lengths),
-                "min_summary_length": np.min(summary_lengths),
-                "average_summary_length": np.average(summary_lengths),
+                "max_text_length": text_lengths["max"],
+                "min_text_length": text_lengths["min"],
+                "average_text_length": text_lengths["mean"],
+                "max_summary_length": summary_lengths["max"],
+                "min_summary_length": summary_lengths["min"],
+                "average_summary_length": summary_lengths["mean"],
             },
             "number_of_samples": len(samples),
-            "number_of_tokens": number_of_tokens,
+            "number_of_tokens": statistics["number_of_tokens"],
             # "vocabulary_info": vocab_sorted,
             # "gender_info": gender_ratio,
             # "hatespeech_info": hatespeech,
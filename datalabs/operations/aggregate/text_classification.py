@@ -1,11 +1,18 @@
+from functools import partial
 import json
 import os
 from typing import Any, Callable, Iterator, List, Mapping, Optional
 
-import numpy as np
-from tqdm import tqdm
-
 from datalabs.operations.aggregate.aggregating import Aggregating, aggregating
+from datalabs.operations.aggregate.columnar import dataset_column, value_counts
+from datalabs.operations.aggregate.streaming import (
+    aggregate,
+    AggregatorDict,
+    CountMap,
+    Head,
+    Moments,
+    Sum,
+)
 from datalabs.operations.featurize.general import get_gender_bias
 from datalabs.operations.operation import dataset_operation, DatasetOperation
 
@@ -134,14 +141,18 @@ def get_label_distribution(samples: Iterator):
         dict:
         "label":n_samples
     """
-    labels_to_number = {}
-    for sample in samples:
-        text, label = sample["text"], sample["label"]  # noqa
+    column = dataset_column(samples, "label")
+    if column is not None:
+        labels_to_number = value_counts(column)
+    else:
+        labels_to_number = {}
+        for sample in samples:
+            text, label = sample["text"], sample["label"]  # noqa
 
-        if label in labels_to_number.keys():
-            labels_to_number[label] += 1
-        else:
-            labels_to_number[label] = 1
+            if label in labels_to_number.keys():
+                labels_to_number[label] += 1
+            else:
+                labels_to_number[label] = 1
 
     res = {
         "imbalance_ratio": min(labels_to_number.values())
@@ -153,6 +164,69 @@ def get_label_distribution(samples: Iterator):
     return res
 
 
+def _init_statistics() -> AggregatorDict:
+    return AggregatorDict(
+        lengths=Moments(),
+        labels=CountMap(),
+        gender_word=CountMap(),
+        gender_single_name=CountMap(),
+        vocabulary=CountMap(),
+        number_of_tokens=Sum(),
+        spelling_errors=Sum(),
+        sample_infos=Head(10000),
+    )
+
+
+def _update_statistics(state: AggregatorDict, sample: dict, misspellings: dict):
+    text, label = sample["text"], sample["label"]
+
+    # grammar checker
+    state["spelling_errors"].update(
+        len([word for word in text.split(" ") if word.lower() in misspellings])
+    )
+
+    # update the number of tokens
+    state["number_of_tokens"].update(len(text.split()))
+
+    # update vocabulary
+    state["vocabulary"].update_many(text.split(" "))
+
+    # gender bias
+    """
+    result = {
+    'word': {
+        'male': one_words_results['words_m'],
+        'female': one_words_results['words_f']
+    },
+    'single_name': {
+        'male': one_words_results['single_name_m'],
+        'female': one_words_results['single_name_f']
+    },
+    }
+    """
+    gender_result = get_gender_bias.func(text)
+    for gender in ["male", "female"]:
+        gender_info = gender_result["gender_bias_info"]
+        state["gender_word"].update(gender, gender_info["word"][gender])
+        state["gender_single_name"].update(gender, gender_info["single_name"][gender])
+
+    # average length
+    text_length = len(text.split(" "))
+    state["lengths"].update(text_length)
+
+    # label imbalance
+    state["labels"].update(label)
+
+    state["sample_infos"].update(
+        {
+            "text": text,
+            "label": label,
+            "text_length": text_length,
+            "gender": gender_result,
+        }
+    )
+
+
 @text_classification_aggregating(
     name="get_statistics",
     contributor="datalab",
@@ -160,13 +234,15 @@ def get_label_distribution(samples: Iterator):
     description="Calculate the overall statistics (e.g., average length)"
     " of a given text classification dataset",
 )
-def get_statistics(samples: Iterator):
+def get_statistics(samples: Iterator, num_proc: int = 1):
     """
         Input:
         samples: [{
          "text":
          "label":
         }]
+        num_proc: number of processes computing the statistics of shards of
+        the dataset
         Output:
             dict:
             "label":n_samples
@@ -182,153 +258,47 @@ def get_statistics(samples: Iterator):
 
 
     """
-    # Grammar checker
-    # from spellchecker import SpellChecker
-    # spell = SpellChecker()
-    # spell = SpellChecker(distance=1)  # set at initialization
-
     scriptpath = os.path.dirname(__file__)
     with open(
         os.path.join(scriptpath, "../edit/resources/spell_corrections.json"), "r"
     ) as file:
         COMMON_MISSPELLINGS_DICT = json.loads(file.read())
 
-    # print(COMMON_MISSPELLINGS_DICT)
-    # exit()
-
-    # for hate speech
-    # from hatesonar import Sonar
-    # sonar = Sonar()
-
-    sample_infos = []
-
-    labels_to_number = {}
-    lengths = []
-    gender_results = []
-    vocab = {}
-    number_of_tokens = 0
-    # hatespeech = {
-    #     "hate_speech": {"ratio": 0, "texts": []},
-    #     "offensive_language": {"ratio": 0, "texts": []},
-    #     "neither": {"ratio": 0, "texts": []},
-    # }
-    spelling_errors = []
-
-    for sample in tqdm(samples):
-        text, label = sample["text"], sample["label"]
-
-        # grammar checker
-        for word in text.split(" "):
-            # word_corrected = spell.correction(word)
-            if word.lower() in COMMON_MISSPELLINGS_DICT.keys():
-                spelling_errors.append((word, COMMON_MISSPELLINGS_DICT[word.lower()]))
-
-        # hataspeech
-        # results = sonar.ping(text=text)
-        # class_ = results['top_class']
-        # confidence = 0
-        # for value in results['classes']:
-        #     if value['class_name'] == class_:
-        #         confidence = value['confidence']
-        #         break
-        #
-        # hatespeech[class_]["ratio"] += 1
-        # if class_ != "neither":
-        #     hatespeech[class_]["texts"].append(text)
-
-        # update the number of tokens
-        number_of_tokens += len(text.split())
-
-        # update vocabulary
-        for w in text.split(" "):
-
-            if w in vocab.keys():
-                vocab[w] += 1
-            else:
-                vocab[w] = 1
-
-        # gender bias
-        """
-        result = {
-        'word': {
-            'male': one_words_results['words_m'],
-            'female': one_words_results['words_f']
-        },
-        'single_name': {
-            'male': one_words_results['single_name_m'],
-            'female': one_words_results['single_name_f']
-        },
-        }
-        """
-        gender_result = get_gender_bias.func(text)
-        gender_results.append(gender_result["gender_bias_info"])
-
-        # average length
-        text_length = len(text.split(" "))
-        lengths.append(text_length)
-
-        # label imbalance
-        if label in labels_to_number.keys():
-            labels_to_number[label] += 1
-        else:
-            labels_to_number[label] = 1
-
-        sample_info = {
-            "text": text,
-            "label": label,
-            "text_length": text_length,
-            "gender": gender_result,
-            # "hate_speech_class":class_,
-        }
-
-        if len(sample_infos) < 10000:
-            sample_infos.append(sample_info)
+    # all the statistics are computed in one streaming pass
+    state = aggregate(
+        samples,
+        _init_statistics,
+        partial(_update_statistics, misspellings=COMMON_MISSPELLINGS_DICT),
+        num_proc=num_proc,
+    )
+    statistics = state.finalize()
 
     # -------------------------- dataset-level ---------------------------
     # compute dataset-level gender_ratio
     gender_ratio = {
-        "word": {"male": 0, "female": 0},
-        "single_name": {"male": 0, "female": 0},
+        "word": statistics["gender_word"],
+        "single_name": statistics["gender_single_name"],
     }
-    for result in gender_results:
-        res_word = result["word"]  # noqa
-        gender_ratio["word"]["male"] += result["word"]["male"]
-        gender_ratio["word"]["female"] += result["word"]["female"]
-        gender_ratio["single_name"]["male"] += result["single_name"]["male"]
-        gender_ratio["single_name"]["female"] += result["single_name"]["female"]
-
-    n_gender = gender_ratio["word"]["male"] + gender_ratio["word"]["female"]
-    if n_gender != 0:
-        gender_ratio["word"]["male"] /= n_gender
-        gender_ratio["word"]["female"] /= n_gender
-    else:
-        gender_ratio["word"]["male"] = 0
-        gender_ratio["word"]["female"] = 0
-
-    n_gender = (
-        gender_ratio["single_name"]["male"] + gender_ratio["single_name"]["female"]
-    )
-    if n_gender != 0:
-        gender_ratio["single_name"]["male"] /= n_gender
-        gender_ratio["single_name"]["female"] /= n_gender
-    else:
-        gender_ratio["single_name"]["male"] = 0
-        gender_ratio["single_name"]["female"] = 0
+    for gender_type in ["word", "single_name"]:
+        n_gender = sum(gender_ratio[gender_type].values())
+        for gender in ["male", "female"]:
+            if n_gender != 0:
+                gender_ratio[gender_type][gender] /= n_gender
+            else:
+                gender_ratio[gender_type][gender] = 0
 
     # get vocabulary
-    vocab_sorted = dict(sorted(vocab.items(), key=lambda item: item[1], reverse=True))
-
-    # get ratio of hate_speech:offensive_language:neither
-    # for k,v in hatespeech.items():
-    #     hatespeech[k]["ratio"] /= len(samples)
+    vocab_sorted = dict(
+        sorted(statistics["vocabulary"].items(), key=lambda item: item[1], reverse=True)
+    )
 
-    # print(hatespeech)
+    labels_to_number = statistics["labels"]
     res = {
         "dataset-level": {
             "length_info": {
-                "max_text_length": np.max(lengths),
-                "min_text_length": np.min(lengths),
-                "average_text_length": np.average(lengths),
+                "max_text_length": statistics["lengths"]["max"],
+                "min_text_length": statistics["lengths"]["min"],
+                "average_text_length": statistics["lengths"]["mean"],
             },
             "label_info": {
                 "ratio": min(labels_to_number.values())
@@ -339,11 +309,10 @@ def get_statistics(samples: Iterator):
             "gender_info": gender_ratio,
             "vocabulary_info": vocab_sorted,
             "number_of_samples": len(samples),
-            "number_of_tokens": number_of_tokens,
-            # "hatespeech_info":hatespeech,
-            "spelling_errors": len(spelling_errors),
+            "number_of_tokens": statistics["number_of_tokens"],
+            "spelling_errors": statistics["spelling_errors"],
         },
-        "sample-level": sample_infos,
+        "sample-level": statistics["sample_infos"],
     }
 
     return res
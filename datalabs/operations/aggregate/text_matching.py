@@ -1,10 +1,16 @@
 from typing import Any, Callable, Iterator, List, Mapping, Optional
 
-import numpy as np
 import sacrebleu
-from tqdm import tqdm
 
 from datalabs.operations.aggregate.aggregating import Aggregating, aggregating
+from datalabs.operations.aggregate.streaming import (
+    aggregate,
+    AggregatorDict,
+    CountMap,
+    Head,
+    Moments,
+    Sum,
+)
 from datalabs.operations.featurize import get_gender_bias
 from datalabs.operations.operation import dataset_operation, DatasetOperation
 
@@ -89,6 +95,73 @@ def get_similarity_by_sacrebleu(text1, text2):
     return score
 
 
+def _init_statistics() -> AggregatorDict:
+    return AggregatorDict(
+        text1_lengths=Moments(),
+        text2_lengths=Moments(),
+        text1_divided_text2=Moments(),
+        similarities=Moments(),
+        labels=CountMap(),
+        gender_word=CountMap(),
+        gender_single_name=CountMap(),
+        vocabulary=CountMap(),
+        number_of_tokens=Sum(),
+        sample_infos=Head(10000),
+    )
+
+
+def _update_statistics(state: AggregatorDict, sample: dict):
+    text1, text2, label = sample["text1"], sample["text2"], sample["label"]
+
+    similarity_of_text_pair = get_similarity_by_sacrebleu(text1, text2)
+    state["similarities"].update(similarity_of_text_pair)
+
+    # average length of text1
+    text1_length = len(text1.split(" "))
+    state["text1_lengths"].update(text1_length)
+
+    # average length of text2
+    text2_length = len(text2.split(" "))
+    state["text2_lengths"].update(text2_length)
+
+    # text1/text2
+    state["text1_divided_text2"].update(text1_length / text2_length)
+
+    # label info
+    state["labels"].update(label)
+
+    # update the number of tokens
+    state["number_of_tokens"].update(len(text1.split()) + len(text2.split()))
+
+    # Vocabulary info
+    state["vocabulary"].update_many((text1 + text2).split(" "))
+
+    # Gender info
+    gender_result1 = get_gender_bias.func(text1)
+    gender_result2 = get_gender_bias.func(text2)
+    for gender_result in [gender_result1, gender_result2]:
+        gender_info = gender_result["gender_bias_info"]
+        for gender in ["male", "female"]:
+            state["gender_word"].update(gender, gender_info["word"][gender])
+            state["gender_single_name"].update(
+                gender, gender_info["single_name"][gender]
+            )
+
+    state["sample_infos"].update(
+        {
+            "text1": text1,
+            "text2": text2,
+            "label": label,
+            "text1_length": text1_length,
+            "text2_length": text2_length,
+            "text1_gender": gender_result1,
+            "text2_gender": gender_result2,
+            "text1_divided_text2": text1_length / text2_length,
+            "similarity_of_text_pair": similarity_of_text_pair,
+        }
+    )
+
+
 @text_matching_aggregating(
     name="get_statistics",
     contributor="datalab",
@@ -96,13 +169,15 @@ def get_similarity_by_sacrebleu(text1, text2):
     description="Calculate the overall statistics (e.g., average length) of a given "
     "text pair classification datasets. e,g. natural language inference",
 )
-def get_statistics(samples: Iterator):
+def get_statistics(samples: Iterator, num_proc: int = 1):
     """
         Input:
         samples: [{
          "text1":
          "text2":
         }]
+        num_proc: number of processes computing the statistics of shards of
+        the dataset
         Output:
             dict:
 
@@ -116,155 +191,40 @@ def get_statistics(samples: Iterator):
     print(next(res))
 
     """
-    # for hate speech
-    # from hatesonar import Sonar
-    # sonar = Sonar()
-
-    sample_infos = []
-
-    text1_lengths = []
-    text2_lengths = []
-    labels_to_number = {}
-    vocab = {}
-    number_of_tokens = 0
-    gender_results = []
-    # hatespeech = {
-    #                  "hate_speech":{"ratio":0,"texts":[]},
-    #                     "offensive_language":{"ratio":0,"texts":[]},
-    #                     "neither":{"ratio":0,"texts":[]}}
-    text1_divided_text2 = []
-    similarities = []
-
-    for sample in tqdm(samples):
-
-        text1, text2, label = sample["text1"], sample["text2"], sample["label"]
-
-        similarity_of_text_pair = get_similarity_by_sacrebleu(text1, text2)
-        similarities.append(similarity_of_text_pair)
-
-        # average length of text1
-        text1_length = len(text1.split(" "))
-        text1_lengths.append(text1_length)
-
-        # average length of text2
-        text2_length = len(text2.split(" "))
-        text2_lengths.append(text2_length)
-
-        # text1/text2
-        text1_divided_text2.append(len(text1.split(" ")) / len(text2.split(" ")))
-
-        # label info
-        if label in labels_to_number.keys():
-            labels_to_number[label] += 1
-        else:
-            labels_to_number[label] = 1
-
-        # update the number of tokens
-        number_of_tokens += len(text1.split())
-        number_of_tokens += len(text2.split())
+    # all the statistics are computed in one streaming pass
+    state = aggregate(samples, _init_statistics, _update_statistics, num_proc=num_proc)
+    statistics = state.finalize()
 
-        # Vocabulary info
-        for w in (text1 + text2).split(" "):
-
-            if w in vocab.keys():
-                vocab[w] += 1
-            else:
-                vocab[w] = 1
-
-        # Gender info
-        gender_result1 = get_gender_bias.func(text1)
-        gender_result2 = get_gender_bias.func(text2)
-        gender_results.append(gender_result1["gender_bias_info"])
-        gender_results.append(gender_result2["gender_bias_info"])
-
-        # hataspeech
-        # results = sonar.ping(text=text1)
-        # class_1 = results['top_class']
-        # confidence = 0
-        # for value in results['classes']:
-        #     if value['class_name'] == class_1:
-        #         confidence = value['confidence']
-        #         break
-        #
-        # hatespeech[class_1]["ratio"] += 1
-        # if class_1 != "neither":
-        #     hatespeech[class_1]["texts"].append(text1)
-
-        # results = sonar.ping(text=text2)
-        # class_2 = results['top_class']
-        # confidence = 0
-        # for value in results['classes']:
-        #     if value['class_name'] == class_2:
-        #         confidence = value['confidence']
-        #         break
-        #
-        # hatespeech[class_2]["ratio"] += 1
-        # if class_2 != "neither":
-        #     hatespeech[class_2]["texts"].append(text2)
-
-        sample_info = {
-            "text1": text1,
-            "text2": text2,
-            "label": label,
-            "text1_length": text1_length,
-            "text2_length": text2_length,
-            "text1_gender": gender_result1,
-            "text2_gender": gender_result2,
-            # "text1_hate_speech_class":class_1,
-            # "text2_hate_speech_class":class_2,
-            "text1_divided_text2": len(text1.split(" ")) / len(text2.split(" ")),
-            "similarity_of_text_pair": similarity_of_text_pair,
-        }
-        if len(sample_infos) < 10000:
-            sample_infos.append(sample_info)
     # ------------------ Dataset-level ----------------
     # get vocabulary
-    vocab_sorted = dict(sorted(vocab.items(), key=lambda item: item[1], reverse=True))
+    vocab_sorted = dict(
+        sorted(statistics["vocabulary"].items(), key=lambda item: item[1], reverse=True)
+    )
 
     # compute dataset-level gender_ratio
     gender_ratio = {
-        "word": {"male": 0, "female": 0},
-        "single_name": {"male": 0, "female": 0},
+        "word": statistics["gender_word"],
+        "single_name": statistics["gender_single_name"],
     }
-    for result in gender_results:
-        res_word = result["word"]  # noqa
-        gender_ratio["word"]["male"] += result["word"]["male"]
-        gender_ratio["word"]["female"] += result["word"]["female"]
-        gender_ratio["single_name"]["male"] += result["single_name"]["male"]
-        gender_ratio["single_name"]["female"] += result["single_name"]["female"]
-
-    n_gender = gender_ratio["word"]["male"] + gender_ratio["word"]["female"]
-    if n_gender != 0:
-        gender_ratio["word"]["male"] /= n_gender
-        gender_ratio["word"]["female"] /= n_gender
-    else:
-        gender_ratio["word"]["male"] = 0
-        gender_ratio["word"]["female"] = 0
-
-    n_gender = (
-        gender_ratio["single_name"]["male"] + gender_ratio["single_name"]["female"]
-    )
-    if n_gender != 0:
-        gender_ratio["single_name"]["male"] /= n_gender
-        gender_ratio["single_name"]["female"] /= n_gender
-    else:
-        gender_ratio["single_name"]["male"] = 0
-        gender_ratio["single_name"]["female"] = 0
-
-    # get ratio of hate_speech:offensive_language:neither
-    # for k,v in hatespeech.items():
-    #     hatespeech[k]["ratio"] /= 2* len(samples)
+    for gender_type in ["word", "single_name"]:
+        n_gender = sum(gender_ratio[gender_type].values())
+        for gender in ["male", "female"]:
+            if n_gender != 0:
+                gender_ratio[gender_type][gender] /= n_gender
+            else:
+                gender_ratio[gender_type][gender] = 0
 
+    labels_to_number = statistics["labels"]
     res = {
         "dataset-level": {
             "length_info": {
-                "max_text1_length": np.max(text1_lengths),
-                "min_text1_length": np.min(text1_lengths),
-                "average_text1_length": np.average(text1_lengths),
-                "max_text2_length": np.max(text2_lengths),
-                "min_text2_length": np.min(text2_lengths),
-                "average_text2_length": np.average(text2_lengths),
-                "text1_divided_text2": np.average(text1_divided_text2),
+                "max_text1_length": statistics["text1_lengths"]["max"],
+                "min_text1_length": statistics["text1_lengths"]["min"],
+                "average_text1_length": statistics["text1_lengths"]["mean"],
+                "max_text2_length": statistics["text2_lengths"]["max"],
+                "min_text2_length": statistics["text2_lengths"]["min"],
+                "average_text2_length": statistics["text2_lengths"]["mean"],
+                "text1_divided_text2": statistics["text1_divided_text2"]["mean"],
             },
             "label_info": {
                 "ratio": min(labels_to_number.values())
@@ -274,12 +234,11 @@ def get_statistics(samples: Iterator):
             },
             "vocabulary_info": vocab_sorted,
             "number_of_samples": len(samples),
-            "number_of_tokens": number_of_tokens,
+            "number_of_tokens": statistics["number_of_tokens"],
             "gender_info": gender_ratio,
-            "average_similarity": np.average(similarities),
-            # "hatespeech_info": hatespeech,
+            "average_similarity": statistics["similarities"]["mean"],
         },
-        "sample-level": sample_infos,
+        "sample-level": statistics["sample_infos"],
     }
 
     return res
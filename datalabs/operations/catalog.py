@@ -0,0 +1,160 @@
+"""Catalog of the operations of datalabs.
+
+Every operation registers itself here when it's created by its decorator
+(see ``OperationFunction.__init__``). The catalog of all the operations is
+built once, by importing all the operation modules (``python
+get_operations.py``), and shipped with the package as
+``operations_catalog.json``: listing the operations, or finding those of a
+task, then reads this file and doesn't import any operation module.
+
+Each entry of the catalog describes an operation:
+
+    {
+        "name": "get_length",
+        "module": "datalabs.operations.featurize.general",
+        "attribute": "get_length",
+        "type": "Featurizing",
+        "task": "Any",
+        "contributor": "datalab",
+        "processed_fields": ["text"],
+        "description": "This function is used to calculate the length of a text"
+    }
+"""
+from functools import lru_cache
+import importlib
+import json
+import os
+import pkgutil
+from typing import Dict, List, Optional, Tuple
+
+CATALOG_PATH = os.path.join(os.path.dirname(__file__), "operations_catalog.json")
+
+OPERATION_PACKAGES = [
+    "datalabs.operations.aggregate",
+    "datalabs.operations.edit",
+    "datalabs.operations.featurize",
+    "datalabs.operations.infer",
+    "datalabs.operations.preprocess",
+    "datalabs.operations.prompt",
+]
+
+# "module.attribute" -> operation, in order of creation
+_OPERATIONS: Dict[str, object] = {}
+
+
+def _module_name(module: str) -> str:
+    # the operation packages are also importable as top-level packages
+    # (e.g. `featurize.general`), see datalabs/operations/__init__.py
+    package_name = f"datalabs.operations.{module.split('.')[0]}"
+    if package_name in OPERATION_PACKAGES:
+        return f"datalabs.operations.{module}"
+    return module
+
+
+def register_operation(operation):
+    """Record an operation created by a decorator. Copies of an operation
+    (e.g. with `OperationFunction.set`) keep the first record."""
+    if operation.func is None or not hasattr(operation.func, "__module__"):
+        return
+    key = f"{_module_name(operation.func.__module__)}.{operation.func.__name__}"
+    _OPERATIONS.setdefault(key, operation)
+
+
+def describe_operation(operation) -> Dict:
+    """The catalog entry of an operation"""
+    processed_fields = operation.processed_fields
+    entry = {
+        "name": operation.name,
+        "module": _module_name(operation.func.__module__),
+        "attribute": operation.func.__name__,
+        "type": operation._type,
+        "task": operation.task,
+        "contributor": operation.contributor,
+        "processed_fields": list(processed_fields)
+        if isinstance(processed_fields, (list, tuple))
+        else [processed_fields],
+        "description": operation.description,
+    }
+    # prompts
+    if getattr(operation, "template", None) is not None:
+        entry["template"] = operation.template
+    return entry
+
+
+def build_catalog(
+    packages: List[str] = OPERATION_PACKAGES,
+) -> Tuple[List[Dict], Dict[str, str]]:
+    """Import all the modules of `packages` and describe the operations they
+    register. Returns the catalog and the modules that couldn't be imported,
+    with their error."""
+    errors = {}
+    for package_name in packages:
+        package = importlib.import_module(package_name)
+        for module_info in pkgutil.walk_packages(package.__path__, f"{package_name}."):
+            try:
+                importlib.import_module(module_info.name)
+            except Exception as e:  # missing optional dependencies or data
+                errors[module_info.name] = f"{type(e).__name__}: {e}"
+    catalog = [
+        describe_operation(operation)
+        for key, operation in _OPERATIONS.items()
+        if any(key.startswith(f"{package_name}.") for package_name in packages)
+    ]
+    catalog.sort(key=lambda entry: (entry["module"], entry["attribute"]))
+    return catalog, errors
+
+
+def save_catalog(catalog: List[Dict], path: str = CATALOG_PATH):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(catalog, f, indent=4)
+        f.write("\n")
+
+
+@lru_cache(maxsize=None)
+def _load_catalog(path: str) -> Tuple[Dict, ...]:
+    with open(path, encoding="utf-8") as f:
+        return tuple(json.load(f))
+
+
+def load_catalog(path: str = CATALOG_PATH) -> List[Dict]:
+    """The catalog shipped with the package, without importing any operation"""
+    return [dict(entry) for entry in _load_catalog(path)]
+
+
+def _tasks(entry: Dict) -> List[str]:
+    # e.g. "text-matching, natural-language-inference"
+    return [task.strip() for task in (entry["task"] or "Any").split(",")]
+
+
+def list_operations(
+    task: Optional[str] = None,
+    type: Optional[str] = None,
+    path: str = CATALOG_PATH,
+) -> List[Dict]:
+    """The entries of the operations of the catalog, optionally only those of
+    a task (including the operations of any task, "Any") and/or of a type
+    (e.g. "Featurizing")."""
+    return [
+        entry
+        for entry in load_catalog(path)
+        if (task is None or task in _tasks(entry) or "Any" in _tasks(entry))
+        and (type is None or entry["type"] == type)
+    ]
+
+
+def find_operation(
+    name: str, task: Optional[str] = None, path: str = CATALOG_PATH
+) -> Dict:
+    """The entry of the operation `name`, of the task `task` if several
+    operations have the same name"""
+    entries = [
+        entry for entry in list_operations(task, path=path) if entry["name"] == name
+    ]
+    if len(entries) == 0:
+        raise KeyError(f"Operation {name} not found in the operation catalog")
+    return entries[0]
+
+
+def load_operation(entry: Dict):
+    """Import the operation of a catalog entry"""
+    return getattr(importlib.import_module(entry["module"]), entry["attribute"])
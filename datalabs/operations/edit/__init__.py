@@ -1,64 +1,36 @@
-from datalabs.operations.edit.general import (  # noqa
-    add_typos_checklist,
-    strip_punctuation_checklist,
-)
-from datalabs.operations.edit.plugins.general.abbreviate.transformation import (  # noqa; noqa
-    abbreviate,
-)
-from datalabs.operations.edit.plugins.general.abbreviate_country_state.transformation import (  # noqa; noqa
-    abbreviate_country_state,
-)
-from datalabs.operations.edit.plugins.general.abbreviate_weekday_month.transformation import (  # noqa; noqa
-    abbreviate_weekday_month,
-)
-from datalabs.operations.edit.plugins.general.add_filler_words.transformation import (  # noqa; noqa
-    add_filler_words,
-)
-from datalabs.operations.edit.plugins.general.add_typo.transformation import (  # noqa
-    add_typo,
-)
-from datalabs.operations.edit.plugins.general.britishize_americanize.transformation import (  # noqa; noqa
-    britishize_americanize,
-)
-from datalabs.operations.edit.plugins.general.change_city_name.transformation import (  # noqa; noqa
-    change_city_name,
-)
-from datalabs.operations.edit.plugins.general.change_color.transformation import (  # noqa; noqa
-    change_color,
-)
-
-# from .plugins.general.change_person_name_by_culture.transformation import *
-from datalabs.operations.edit.plugins.general.change_person_name.transformation import (  # noqa; noqa
-    change_person_name,
-)
-from datalabs.operations.edit.plugins.general.correct_typo.transformation import (  # noqa; noqa
-    correct_typo,
-)
-
-# from .plugins.general.factive_verb.transformation import *
-from datalabs.operations.edit.plugins.general.emojify.transformation import (  # noqa
-    emojify,
-)
-from datalabs.operations.edit.plugins.general.replace_acronyms.transformation import (  # noqa; noqa
-    replace_acronyms,
-)
-from datalabs.operations.edit.plugins.general.replace_greetings.transformation import (  # noqa; noqa
-    replace_greetings,
-)
-from datalabs.operations.edit.plugins.general.replace_hypernyms.transformation import (  # noqa; noqa
-    replace_hypernyms,
-)
-from datalabs.operations.edit.plugins.general.replace_hyponyms.transformation import (  # noqa; noqa
-    replace_hyponyms,
-)
-from datalabs.operations.edit.plugins.general.replace_synonym.transformation import (  # noqa; noqa
-    replace_synonym,
-)
-from datalabs.operations.edit.plugins.general.simple_cipher.transformation import (  # noqa; noqa
-    simple_cipher,
-)
+from datalabs.operations.registry import lazy_package
 
-# function from modified xl-augmenter
-from datalabs.operations.edit.plugins.general.slangificator.transformation import (  # noqa; noqa
-    slangificator,
+# the operations are imported on first access, with their dependencies
+__getattr__, __dir__, __all__ = lazy_package(
+    __name__,
+    {
+        "general": ["add_typos_checklist", "strip_punctuation_checklist"],
+        "plugins.general.abbreviate.transformation": ["abbreviate"],
+        "plugins.general.abbreviate_country_state.transformation": [
+            "abbreviate_country_state"
+        ],
+        "plugins.general.abbreviate_weekday_month.transformation": [
+            "abbreviate_weekday_month"
+        ],
+        "plugins.general.add_filler_words.transformation": ["add_filler_words"],
+        "plugins.general.add_typo.transformation": ["add_typo"],
+        "plugins.general.britishize_americanize.transformation": [
+            "britishize_americanize"
+        ],
+        "plugins.general.change_city_name.transformation": ["change_city_name"],
+        "plugins.general.change_color.transformation": ["change_color"],
+        # from .plugins.general.change_person_name_by_culture.transformation import *
+        "plugins.general.change_person_name.transformation": ["change_person_name"],
+        "plugins.general.correct_typo.transformation": ["correct_typo"],
+        # from .plugins.general.factive_verb.transformation import *
+        "plugins.general.emojify.transformation": ["emojify"],
+        "plugins.general.replace_acronyms.transformation": ["replace_acronyms"],
+        "plugins.general.replace_greetings.transformation": ["replace_greetings"],
+        "plugins.general.replace_hypernyms.transformation": ["replace_hypernyms"],
+        "plugins.general.replace_hyponyms.transformation": ["replace_hyponyms"],
+        "plugins.general.replace_synonym.transformation": ["replace_synonym"],
+        "plugins.general.simple_cipher.transformation": ["simple_cipher"],
+        # function from modified xl-augmenter
+        "plugins.general.slangificator.transformation": ["slangificator"],
+    },
 )
@@ -1,10 +1,8 @@
-# checklist package for editing
-from checklist.perturb import Perturb
-
 # spacy package for editing
-import spacy
+from spacy.language import Language
 
 from datalabs.operations.edit.editing import editing
+from datalabs.operations.resource_registry import spacy_model
 
 
 @editing(
@@ -13,10 +11,14 @@ from datalabs.operations.edit.editing import editing
     task="Any",
     description="strip the punctuation of a given text. For example, "
     "Input: I love this movie. How about you? Output: I love this movie. How about you",
+    resources={
+        "nlp": spacy_model("en_core_web_sm", disable=["parser", "ner", "lemmatizer"])
+    },
 )
-def strip_punctuation_checklist(text: str):
+def strip_punctuation_checklist(text: str, nlp: Language = None):
+    # checklist loads wordnet when imported
+    from checklist.perturb import Perturb
 
-    nlp = spacy.load("en_core_web_sm")
     pdata = nlp(text)
     return {"text_strip_punctuation": Perturb.strip_punctuation(pdata)}
 
@@ -30,4 +32,6 @@ def strip_punctuation_checklist(text: str):
     " How about yuo?",
 )
 def add_typos_checklist(text: str):
+    from checklist.perturb import Perturb
+
     return {"text_add_typos": Perturb.add_typos(text)}
@@ -0,0 +1,165 @@
+"""Multi-pattern matching for the dictionary-based edit operations.
+
+Instead of looking for each key of a dictionary in a text (``for key in
+dictionary: if key in text``), which takes O(|dictionary| x |text|), the keys
+are compiled once into an Aho-Corasick automaton that finds all of them in a
+single linear scan of the text:
+
+    matcher = PatternMatcher({"European Union": "EU", "United States": "US"})
+    matcher.replace("The European Union and the United States")
+    # "The EU and the US"
+
+Overlapping matches are resolved leftmost-longest: the match starting first
+wins, and among the matches starting at the same position the longest one,
+as when the keys are replaced from the longest to the shortest.
+
+A matcher should be built once per resource file and shared, e.g. with a
+`SharedResource` of the operation, see replace_acronyms.
+"""
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Tuple, Union
+
+
+def _fold(text: str) -> str:
+    """Lowercase `text`, keeping its length so that offsets are preserved"""
+    folded = text.lower()
+    if len(folded) == len(text):
+        return folded
+    # e.g. "İ".lower() has 2 characters
+    return "".join(char.lower() if len(char.lower()) == 1 else char for char in text)
+
+
+class PatternMatcher:
+    """Aho-Corasick automaton over a set of patterns (e.g. the keys of a
+    dictionary of replacements).
+
+    Parameters:
+      - patterns: the patterns, or a mapping from the patterns to their
+        replacements
+    """
+
+    def __init__(self, patterns: Union[Mapping[str, Any], Iterable[str]]):
+        if isinstance(patterns, Mapping):
+            self.replacements: Dict[str, Any] = dict(patterns)
+        else:
+            self.replacements = {pattern: pattern for pattern in patterns}
+        # order of the patterns, e.g. the order of a dictionary
+        self.index = {
+            pattern: i for i, pattern in enumerate(self.replacements) if pattern
+        }
+
+        # the automaton is built on the folded patterns, so that it can also
+        # match them case-insensitively; nodes are integers, 0 is the root
+        self._goto = [{}]
+        self._depth = [0]
+        # patterns ending at each node (same folded form)
+        self._patterns = [[]]
+        for pattern in self.index:
+            node = 0
+            for char in _fold(pattern):
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._depth.append(self._depth[node] + 1)
+                    self._patterns.append([])
+                node = next_node
+            self._patterns[node].append(pattern)
+
+        # failure links, and links to the closest node ending a pattern in
+        # the chain of failure links (breadth-first, parents before children)
+        self._fail = [0] * len(self._goto)
+        self._output = [0] * len(self._goto)
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._output[child] = (
+                    self._fail[child]
+                    if self._patterns[self._fail[child]]
+                    else self._output[self._fail[child]]
+                )
+                queue.append(child)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, pattern: str) -> bool:
+        return pattern in self.index
+
+    def _candidates(self, folded: str) -> Iterator[Tuple[int, int]]:
+        """(start, node) of all the occurrences of the folded patterns"""
+        goto, fail, patterns, output, depth = (
+            self._goto,
+            self._fail,
+            self._patterns,
+            self._output,
+            self._depth,
+        )
+        node = 0
+        for end, char in enumerate(folded, 1):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            match = node if patterns[node] else output[node]
+            while match:
+                yield end - depth[match], match
+                match = output[match]
+
+    def finditer(
+        self, text: str, ignore_case: bool = False
+    ) -> Iterator[Tuple[int, int, str]]:
+        """
+        the leftmost-longest non-overlapping occurrences of the patterns in
+        `text`, as (start, end, pattern)
+        Parameter:
+          - ignore_case: whether the patterns also match with a different case,
+            a pattern with the exact case of the text is preferred
+        """
+        # longest match starting at each position
+        longest: Dict[int, Tuple[int, str]] = {}
+        for start, node in self._candidates(_fold(text)):
+            end = start + self._depth[node]
+            if start in longest and longest[start][0] >= end:
+                continue
+            matched = text[start:end]
+            if matched in self.index:
+                pattern = matched
+            elif ignore_case:
+                pattern = self._patterns[node][0]
+            else:
+                continue
+            longest[start] = (end, pattern)
+
+        position = 0
+        for start in sorted(longest):
+            if start >= position:
+                end, pattern = longest[start]
+                yield start, end, pattern
+                position = end
+
+    def replace(
+        self,
+        text: str,
+        replacement: Callable[[str], str] = None,
+        ignore_case: bool = False,
+    ) -> str:
+        """
+        replaces the occurrences of the patterns in `text`, in a single pass
+        Parameter:
+          - replacement: function returning the replacement of a pattern, by
+            default its replacement in the mapping the matcher was built from
+          - ignore_case: see `finditer`
+        """
+        if replacement is None:
+            replacement = self.replacements.__getitem__
+        chunks, position = [], 0
+        for start, end, pattern in self.finditer(text, ignore_case=ignore_case):
+            chunks.append(text[position:start])
+            chunks.append(replacement(pattern))
+            position = end
+        chunks.append(text[position:])
+        return "".join(chunks)
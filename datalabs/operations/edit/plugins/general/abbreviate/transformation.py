@@ -4,22 +4,18 @@ import os.path
 import random
 import sys
 
-import spacy
+from spacy.language import Language
 
 from datalabs.operations.edit.editing import editing
+from datalabs.operations.edit.pattern_matcher import PatternMatcher
+from datalabs.operations.resource_registry import SharedResource, spacy_model
 
 sys.path.append(
     os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../"))
 )
 
 
-@editing(
-    name="abbreviate",
-    contributor="xl_augmenter",
-    task="Any",
-    description="Replaces a word or phrase with its abbreviated counterpart",
-)
-def abbreviate(text, prob=0.5, seed=0, max_outputs=1):
+def load_abbreviations():
     scriptpath = os.path.dirname(__file__)
     with open(
         os.path.join(scriptpath, "../../../resources/phrase_abbrev_dict.json"), "r"
@@ -29,15 +25,50 @@ def abbreviate(text, prob=0.5, seed=0, max_outputs=1):
         os.path.join(scriptpath, "../../../resources/word_abbrev_dict.json"), "r"
     ) as file:
         word_abbrev_dict = json.loads(file.read())
+    return {
+        "phrase_matcher": PatternMatcher(phrase_abbrev_dict),
+        "word_abbrev_dict": word_abbrev_dict,
+    }
+
+
+@editing(
+    name="abbreviate",
+    contributor="xl_augmenter",
+    task="Any",
+    description="Replaces a word or phrase with its abbreviated counterpart",
+    resources={
+        "spacy_nlp": spacy_model("en_core_web_sm"),
+        "abbreviations": SharedResource("abbreviate/abbreviations", load_abbreviations),
+    },
+)
+def abbreviate(
+    text,
+    prob=0.5,
+    seed=0,
+    max_outputs=1,
+    spacy_nlp: Language = None,
+    abbreviations: dict = None,
+):
+    phrase_matcher = abbreviations["phrase_matcher"]
+    word_abbrev_dict = abbreviations["word_abbrev_dict"]
 
-    spacy_nlp = spacy.load("en_core_web_sm")
     random.seed(seed)
     transf = []
     for _ in range(max_outputs):
-        trans_text = text
-        for phrase in phrase_abbrev_dict:
-            if random.random() < prob:
-                trans_text = trans_text.replace(phrase, phrase_abbrev_dict[phrase])
+        # each phrase of the text is abbreviated (everywhere) with probability
+        # `prob`, drawn in the order of the dictionary
+        found = {phrase for _, _, phrase in phrase_matcher.finditer(text)}
+        abbreviated = {
+            phrase
+            for phrase in sorted(found, key=phrase_matcher.index.get)
+            if random.random() < prob
+        }
+        trans_text = phrase_matcher.replace(
+            text,
+            lambda phrase: phrase_matcher.replacements[phrase]
+            if phrase in abbreviated
+            else phrase,
+        )
         doc = spacy_nlp(trans_text).doc
         trans = []
         for token in doc:
@@ -3,29 +3,14 @@ import os.path
 import sys
 
 from datalabs.operations.edit.editing import editing
+from datalabs.operations.resource_registry import SharedResource
 
 sys.path.append(
     os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../"))
 )
 
 
-@editing(
-    name="britishize_americanize",
-    contributor="xl_augmenter",
-    task="Any",
-    description="This transformation takes a sentence and converts it "
-    "from british english to american english and vice-versa",
-)
-def britishize_americanize(text: str):
-    """
-    Parameters:
-        string(str): original string
-        final_dict(dict): dictionary with all the different possible words
-         in american and british english
-    Returns:
-        str: String after replacing the words
-    """
-
+def load_spellings():
     scriptpath = os.path.dirname(__file__)
     with open(
         os.path.join(scriptpath, "../../../resources/american_spellings.json"), "r"
@@ -100,7 +85,28 @@ def britishize_americanize(text: str):
     vocab_diff = dict((v, k) for k, v in difference_british_to_american.items())
     vocab_diff.update(difference_british_to_american)
 
-    final_dict = {**american_spellings_dict, **british_spellings_dict, **vocab_diff}
+    return {**american_spellings_dict, **british_spellings_dict, **vocab_diff}
+
+
+@editing(
+    name="britishize_americanize",
+    contributor="xl_augmenter",
+    task="Any",
+    description="This transformation takes a sentence and converts it "
+    "from british english to american english and vice-versa",
+    resources={
+        "final_dict": SharedResource("britishize_americanize/spellings", load_spellings)
+    },
+)
+def britishize_americanize(text: str, final_dict: dict = None):
+    """
+    Parameters:
+        string(str): original string
+        final_dict(dict): dictionary with all the different possible words
+         in american and british english
+    Returns:
+        str: String after replacing the words
+    """
 
     text = " ".join([final_dict.get(word, word) for word in text.split()])
 
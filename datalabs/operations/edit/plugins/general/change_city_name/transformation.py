@@ -3,9 +3,10 @@ import os
 import random
 import sys
 
-import spacy
+from spacy.language import Language
 
 from datalabs.operations.edit.editing import editing
+from datalabs.operations.resource_registry import spacy_model
 
 sys.path.append(
     os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../"))
@@ -78,10 +79,12 @@ def create_ents_dict(doc):
     description="replaces instances of populous and well-known cities in "
     "a sentence with instances of less populous and less"
     " well-known cities.",
+    resources={
+        "spacy_nlp": spacy_model("en_core_web_sm", disable=["parser", "lemmatizer"])
+    },
 )
-def change_city_name(text: str, seed=None):
+def change_city_name(text: str, seed=None, spacy_nlp: Language = None):
 
-    spacy_nlp = spacy.load("en_core_web_sm")
     doc = spacy_nlp(text)
 
     scriptpath = os.path.dirname(__file__)
@@ -1,10 +1,10 @@
 import os
 import sys
 
-from checklist.perturb import Perturb
-import spacy
+from spacy.language import Language
 
 from datalabs.operations.edit.editing import editing
+from datalabs.operations.resource_registry import spacy_model
 
 sys.path.append(
     os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../"))
@@ -16,10 +16,14 @@ sys.path.append(
     contributor="xl_augmenter",
     task="Any",
     description="Changes person named entities",
+    resources={
+        "spacy_nlp": spacy_model("en_core_web_sm", disable=["parser", "lemmatizer"])
+    },
 )
-def change_person_name(text: str, max_outputs=1):
+def change_person_name(text: str, max_outputs=1, spacy_nlp: Language = None):
+    # checklist loads wordnet when imported
+    from checklist.perturb import Perturb
 
-    spacy_nlp = spacy.load("en_core_web_sm")
     perturbed = Perturb.perturb([spacy_nlp(text)], Perturb.change_names, nsamples=1)
 
     # print(perturbed.data)
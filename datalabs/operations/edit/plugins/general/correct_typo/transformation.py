@@ -2,9 +2,10 @@ import json
 import os
 import sys
 
-import spacy
+from spacy.language import Language
 
 from datalabs.operations.edit.editing import editing
+from datalabs.operations.resource_registry import spacy_model
 
 sys.path.append(
     os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../"))
@@ -16,8 +17,21 @@ sys.path.append(
     contributor="xl_augmenter",
     task="Any",
     description="This transformation perturbs text to correct common misspellings",
+    resources={
+        "spacy_nlp": spacy_model(
+            "en_core_web_sm",
+            disable=[
+                "tok2vec",
+                "tagger",
+                "parser",
+                "attribute_ruler",
+                "lemmatizer",
+                "ner",
+            ],
+        )
+    },
 )
-def correct_typo(text: str):
+def correct_typo(text: str, spacy_nlp: Language = None):
 
     scriptpath = os.path.dirname(__file__)
     with open(
@@ -25,8 +39,6 @@ def correct_typo(text: str):
     ) as file:
         COMMON_MISSPELLINGS_DICT = json.loads(file.read())
 
-    spacy_nlp = spacy.load("en_core_web_sm")
-
     doc = spacy_nlp(text)
 
     perturbed_text = [
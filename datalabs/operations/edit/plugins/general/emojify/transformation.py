@@ -5,20 +5,54 @@ import sys
 from typing import List
 
 from datalabs.operations.edit.editing import editing
+from datalabs.operations.edit.pattern_matcher import PatternMatcher
+from datalabs.operations.resource_registry import SharedResource
 
 sys.path.append(
     os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../"))
 )
 
 
+def symbols_matcher(symbols: dict) -> PatternMatcher:
+    # e.g. ":)" -> "smiley", an emoji/icon of several types keeps the first one
+    types = {}
+    for k in symbols:
+        for s in symbols[k]:
+            types.setdefault(s, k)
+    return PatternMatcher(types)
+
+
 # Check if any emoji(icon) from dict1 in text and substitute them with
 # a random corresponding icon(emoji) from dict2
-def convert(perturbed_text: str, dict1: dict, dict2: dict) -> str:
-    for k in dict1:  # k is the emoji/icon type (e.g., ":)" is of type smiley
-        for s in dict1[k]:
-            if s in perturbed_text:
-                perturbed_text = perturbed_text.replace(s, random.choice(dict2[k]))
-    return perturbed_text
+def convert(
+    perturbed_text: str, dict1: dict, dict2: dict, matcher: PatternMatcher = None
+) -> str:
+    if matcher is None:
+        matcher = symbols_matcher(dict1)
+    found = {pattern for _, _, pattern in matcher.finditer(perturbed_text)}
+    # every occurrence of an emoji/icon gets the same substitute, drawn in
+    # the order of dict1
+    substitutes = {
+        s: random.choice(dict2[matcher.replacements[s]])
+        for s in sorted(found, key=matcher.index.get)
+    }
+    return matcher.replace(perturbed_text, substitutes.__getitem__)
+
+
+def load_symbols():
+    resources_path = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "../../../resources/"
+    )
+    with open(os.path.join(resources_path, "text2emoji.json"), "r") as file:
+        text2emoji = json.loads(file.read())
+    with open(os.path.join(resources_path, "text2icon.json"), "r") as file:
+        text2icon = json.loads(file.read())
+    return {
+        "text2emoji": text2emoji,
+        "text2icon": text2icon,
+        "emoji_matcher": symbols_matcher(text2emoji),
+        "icon_matcher": symbols_matcher(text2icon),
+    }
 
 
 # generate max_outputs different perturbed texts for each text, selecting
@@ -32,6 +66,8 @@ def emoji2icon(
     seed: int = 42,
     max_outputs: int = 1,
     emoji_to_icon: bool = True,
+    emoji_matcher: PatternMatcher = None,
+    icon_matcher: PatternMatcher = None,
 ) -> List[str]:
     random.seed(seed)
 
@@ -39,9 +75,13 @@ def emoji2icon(
     for _ in range(max_outputs):
         perturbed_text = text
         if emoji_to_icon:
-            perturbed_text = convert(perturbed_text, text2emoji, text2icon)
+            perturbed_text = convert(
+                perturbed_text, text2emoji, text2icon, emoji_matcher
+            )
         else:
-            perturbed_text = convert(perturbed_text, text2icon, text2emoji)
+            perturbed_text = convert(
+                perturbed_text, text2icon, text2emoji, icon_matcher
+            )
         perturbed_texts.append(perturbed_text)
     return perturbed_texts
 
@@ -52,31 +92,21 @@ def emoji2icon(
     task="Any",
     description="augments the input sentence by swapping words into"
     " emojis with similar meanings.",
+    resources={"symbols": SharedResource("emojify/symbols", load_symbols)},
 )
 def emojify(
-    text: str, seed: int = 42, max_outputs: int = 1, emoji_to_icon: bool = False
+    text: str,
+    seed: int = 42,
+    max_outputs: int = 1,
+    emoji_to_icon: bool = False,
+    symbols: dict = None,
 ):
-    text2emoji_path = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)), "../../../resources/text2emoji.json"
-    )
-
-    text2icon_path = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)), "../../../resources/text2icon.json"
-    )
-
-    with open(text2emoji_path, "r") as file:
-        text2emoji = json.loads(file.read())
-
-    with open(text2icon_path, "r") as file:
-        text2icon = json.loads(file.read())
-
     perturbed_texts = emoji2icon(
         text=text,
-        text2emoji=text2emoji,
-        text2icon=text2icon,
         seed=seed,
         max_outputs=max_outputs,
         emoji_to_icon=emoji_to_icon,
+        **symbols,
     )
 
     return {"text_emojify": perturbed_texts[0]}
@@ -9,7 +9,11 @@ Created on Wed Jul 21 10:40:14 2021
 @author: caroline.brun@naverlabs.com
 """
 
+import hashlib
+import os
+import pickle
 import re
+import tempfile
 
 # import tokenize
 # from io import BytesIO
@@ -459,6 +463,69 @@ def compilecapsules(lex, functions):
     return compiling(v, functions)
 
 
+# ------------------------------------------------------------------------------
+# Compiling rules takes much longer than parsing a sentence: compiled grammars
+# are cached by the hash of their rules, in memory and, if cachedir is given,
+# on disk, so that other processes load them instead of compiling them again.
+# Grammars with capsules are not cached (their functions may not be picklable)
+# ------------------------------------------------------------------------------
+# Changing the compiled format must change this version
+grammarversion = "1"
+grammars = {}
+
+
+def ruleshash(lex):
+    if isinstance(lex, list):
+        lex = "\n".join(lex)
+    h = hashlib.sha256((grammarversion + "\n" + lex).encode("utf-8"))
+    return h.hexdigest()
+
+
+def loadcompiled(filename):
+    try:
+        with open(filename, "rb") as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        # missing or corrupted file, or compiled by another version
+        return None
+
+
+def savecompiled(a, filename):
+    # written in a temporary file first, so that a process never loads a
+    # partially written grammar
+    directory = os.path.dirname(filename)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmpname = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(a, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmpname, filename)
+    except OSError:
+        if os.path.exists(tmpname):
+            os.remove(tmpname)
+
+
+def compilecached(lex, cachedir=None):
+    key = ruleshash(lex)
+    if key in grammars:
+        return grammars[key]
+    a = None
+    if cachedir:
+        filename = os.path.join(cachedir, key + ".pkl")
+        a = loadcompiled(filename)
+    if a is None:
+        a = compile(lex)
+        if cachedir:
+            savecompiled(a, filename)
+    grammars[key] = a
+    return a
+
+
+def compilefile(filename, cachedir=None):
+    with open(filename, encoding="utf8") as f:
+        return compilecached(f.read(), cachedir)
+
+
 # ------------------------------------------------------------------------------
 # Below are the different functions that are called from within rules
 # ------------------------------------------------------------------------------
@@ -806,9 +873,13 @@ punctuations = {
 
 spaces = {9, 10, 13, 32, 160, 0x202F, 0x3000}
 
+# the same sets as characters, to avoid calling ord on each character
+punctuationchars = frozenset(chr(c) for c in punctuations)
+spacechars = frozenset(chr(c) for c in spaces)
+
 
 def checknext(s, i, sz):
-    return i < sz and ord(s[i]) not in punctuations and ord(s[i]) not in spaces
+    return i < sz and s[i] not in punctuationchars and s[i] not in spacechars
 
 
 def tokenizing_sentence(s, offset=True):
@@ -819,13 +890,13 @@ def tokenizing_sentence(s, offset=True):
     atoken = False
     sz = len(s)
     # a hack to avoid taking into account the last token
-    if sz and ord(s[-1]) not in spaces:
+    if sz and s[-1] not in spacechars:
         s += " "
         sz += 1
     for i in range(sz):
         c = s[i]
         # if it is a space character
-        if ord(c) in spaces:
+        if c in spacechars:
             # there was a token construction pending
             if atoken:
                 token = s[begintoken:i]
@@ -834,7 +905,7 @@ def tokenizing_sentence(s, offset=True):
                 tokens_lower.append(token)
                 offsets.append([begintoken, i])
                 atoken = False
-        elif ord(c) in punctuations:
+        elif c in punctuationchars:
             if atoken:
                 # we accept some ponctuations as part of a string
                 if c in {".", "-", "+"} and checknext(s, i + 1, sz):
@@ -926,13 +997,26 @@ def checkrule(a, sz, ruleheads, tokens, i):
     return False
 
 
-# parsing function, which takes a text and compiled rules as input
-def parse(txt, a):
-    heads = a["_++_"]
-    regs = a["_**_"]
-    # We tokenizing our own in-house tokenizer version...
-    # The other version considers the text to be some kind of Python code
-    tokens, offsets, rawtokens = tokenizing_sentence(txt)
+# builds the result of a rule applied from token i
+def buildresult(txt, ret, i, offsets, rawtokens):
+    p = [offsets[i][0], offsets[ret[1] - 1][1]]
+    thehead = ret[0]
+    keeps = ret[-1]
+    if len(keeps):
+        # If we have some elements to keep
+        # We build offsets that skip them
+        nb = 1
+        for s in keeps:
+            beg = offsets[s[0]][0]
+            end = offsets[s[-1]][1]
+            thehead = thehead.replace("%" + str(nb), txt[beg:end])
+            nb += 1
+    if rawtokens[i][0].isupper():
+        thehead = thehead[0].upper() + thehead[1:]
+    return [thehead, p]
+
+
+def parsetokens(txt, a, heads, regs, tokens, offsets, rawtokens):
     sz = len(tokens)
     results = []
     i = 0
@@ -942,21 +1026,7 @@ def parse(txt, a):
             ruleheads = heads[token]
             ret = checkrule(a, sz, ruleheads, tokens, i)
             if ret:
-                p = [offsets[i][0], offsets[ret[1] - 1][1]]
-                thehead = ret[0]
-                keeps = ret[-1]
-                if len(keeps):
-                    # If we have some elements to keep
-                    # We build offsets that skip them
-                    nb = 1
-                    for s in keeps:
-                        beg = offsets[s[0]][0]
-                        end = offsets[s[-1]][1]
-                        thehead = thehead.replace("%" + str(nb), txt[beg:end])
-                        nb += 1
-                if rawtokens[i][0].isupper():
-                    thehead = thehead[0].upper() + thehead[1:]
-                results.append([thehead, p])
+                results.append(buildresult(txt, ret, i, offsets, rawtokens))
                 i = ret[1] - 1
         else:
             for reg in regs:
@@ -964,23 +1034,32 @@ def parse(txt, a):
                     ruleheads = regs[reg]
                     ret = checkrule(a, sz, ruleheads, tokens, i)
                     if ret:
-                        p = [offsets[i][0], offsets[ret[1] - 1][1]]
-                        thehead = ret[0]
-                        keeps = ret[-1]
-                        if len(keeps):
-                            # If we have some elements to keep
-                            # We build offsets that skip them
-                            nb = 1
-                            for s in keeps:
-                                beg = offsets[s[0]][0]
-                                end = offsets[s[-1]][1]
-                                thehead = thehead.replace("%" + str(nb), txt[beg:end])
-                                nb += 1
-                        if rawtokens[i][0].isupper():
-                            thehead = thehead[0].upper() + thehead[1:]
-                        results.append([thehead, p])
+                        results.append(buildresult(txt, ret, i, offsets, rawtokens))
                         i = ret[1] - 1
                         break
         i += 1
     results.reverse()
     return results
+
+
+# parsing function, which takes a text and compiled rules as input
+def parse(txt, a):
+    # We tokenizing our own in-house tokenizer version...
+    # The other version considers the text to be some kind of Python code
+    tokens, offsets, rawtokens = tokenizing_sentence(txt)
+    return parsetokens(txt, a, a["_++_"], a["_**_"], tokens, offsets, rawtokens)
+
+
+# parsing of a list of texts with the same compiled rules, the texts that
+# occur several times are tokenized and parsed once
+def parse_many(txts, a):
+    heads = a["_++_"]
+    regs = a["_**_"]
+    parsed = {}
+    results = []
+    for txt in txts:
+        if txt not in parsed:
+            tokens, offsets, rawtokens = tokenizing_sentence(txt)
+            parsed[txt] = parsetokens(txt, a, heads, regs, tokens, offsets, rawtokens)
+        results.append([[r[0], list(r[1])] for r in parsed[txt]])
+    return results
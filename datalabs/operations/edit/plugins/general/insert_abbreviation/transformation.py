@@ -1,49 +1,26 @@
 import os
 import sys
 
-import grammaire
-
+from datalabs import config
 from datalabs.operations.edit.editing import editing
+from datalabs.operations.edit.plugins.general.insert_abbreviation import grammaire
+from datalabs.operations.resource_registry import SharedResource
 
 sys.path.append(
     os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../"))
 )
 
 
-def readfile(file):
-    with open(file, encoding="utf8") as input:
-        lines = input.readlines()
-    return lines
-
-
-def load_rules(file):
-    with open(file, encoding="utf8") as input:
-        str_rules = input.read()
-    return str_rules
-
-
-@editing(
-    name="insert_abbreviation",
-    contributor="xl_augmenter",
-    task="Any",
-    description="This perturbation replaces in texts some well"
-    " known words or expressions with (one of) their abbreviations.",
-)
-def insert_abbreviation(
-    text: str,
-    max_outputs=1,
-    seed=0,
-):
-
+def load_grammar_en():
     current_path = os.path.realpath(__file__).replace(
         os.path.basename(__file__), "../../../resources/"
     )
     rulefile_en = f"{current_path}replacement_rules_en.txt"
-    rules_en = load_rules(rulefile_en)
-    # First we compile our rules...
-    grammar_en = grammaire.compile(rules_en)
+    # compiled once per version of the rules, then loaded from the cache
+    return grammaire.compilefile(rulefile_en, config.GRAMMAR_CACHE_DIR)
 
-    results = grammaire.parse(text, grammar_en)
+
+def replace_parsed(text, results):
     # We now replace the strings with their label
     perturbed_texts = text
     # Each list in results is an element such as: [label, [left,right]]
@@ -57,11 +34,39 @@ def insert_abbreviation(
         perturbed_texts = (
             perturbed_texts[:from_token] + v[0] + perturbed_texts[to_token:]
         )
+    return perturbed_texts
+
+
+@editing(
+    name="insert_abbreviation",
+    contributor="xl_augmenter",
+    task="Any",
+    description="This perturbation replaces in texts some well"
+    " known words or expressions with (one of) their abbreviations.",
+    resources={
+        "grammar_en": SharedResource("insert_abbreviation/grammar_en", load_grammar_en)
+    },
+)
+def insert_abbreviation(text: str, max_outputs=1, seed=0, grammar_en=None):
+
+    results = grammaire.parse(text, grammar_en)
+    perturbed_texts = replace_parsed(text, results)
     # return [perturbed_texts]
 
     return {"text_insert_abbreviation": perturbed_texts}
 
 
+@insert_abbreviation.batched
+def _batch_insert_abbreviation(texts, grammar_en=None):
+    texts = texts.to_pylist()
+    return {
+        "text_insert_abbreviation": [
+            replace_parsed(text, results)
+            for text, results in zip(texts, grammaire.parse_many(texts, grammar_en))
+        ]
+    }
+
+
 # sentence = "Make sure you've gone online to download one of
 # the vouchers - it's definitely not worth paying full price for!"
 # perturbed = insert_abbreviation(text=sentence)
@@ -2,6 +2,8 @@ import os
 import sys
 
 from datalabs.operations.edit.editing import editing
+from datalabs.operations.edit.pattern_matcher import PatternMatcher
+from datalabs.operations.resource_registry import SharedResource
 
 sys.path.append(
     os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../"))
@@ -9,31 +11,13 @@ sys.path.append(
 
 
 def transformation(sentence, lowercase, acronyms):
-    new_sentence = sentence
-    lower_sentece = sentence.lower()
-    for key in acronyms.keys():
-        lower_key = key.lower()
-        if key in new_sentence:
-            new_sentence = new_sentence.replace(key, acronyms[key])
-        elif lowercase and (lower_key in lower_sentece):
-            key_index = lower_sentece.index(lower_key)
-            key_end = key_index + len(key)
-            new_sentence = (
-                new_sentence[:key_index] + acronyms[key] + new_sentence[key_end:]
-            )
-
-    return new_sentence
+    # the keys are matched leftmost-longest in a single pass over the sentence
+    if not isinstance(acronyms, PatternMatcher):
+        acronyms = PatternMatcher(acronyms)
+    return acronyms.replace(sentence, ignore_case=lowercase)
 
 
-@editing(
-    name="replace_acronyms",
-    contributor="xl_augmenter",
-    task="Any",
-    description="This transformation changes abbreviations and acronyms"
-    " appearing in a text to their expanded form and respectively,",
-)
-def replace_acronyms(text: str, seed=0, max_outputs=1, lowercase=False):
-
+def load_acronyms():
     acronyms_file_path = os.path.join(
         os.path.dirname(os.path.abspath(__file__)), "../../../resources/acronyms.tsv"
     )
@@ -50,6 +34,26 @@ def replace_acronyms(text: str, seed=0, max_outputs=1, lowercase=False):
     acronyms = {}
     for k in sorted(temp_acronyms, key=len, reverse=True):
         acronyms[k] = temp_acronyms[k]
+    return acronyms
+
+
+def load_acronyms_matcher():
+    return PatternMatcher(load_acronyms())
+
+
+@editing(
+    name="replace_acronyms",
+    contributor="xl_augmenter",
+    task="Any",
+    description="This transformation changes abbreviations and acronyms"
+    " appearing in a text to their expanded form and respectively,",
+    resources={
+        "acronyms": SharedResource("replace_acronyms/acronyms", load_acronyms_matcher)
+    },
+)
+def replace_acronyms(
+    text: str, seed=0, max_outputs=1, lowercase=False, acronyms: PatternMatcher = None
+):
 
     # return [transformation(text, lowercase, acronyms)]
 
@@ -2,11 +2,11 @@ import os
 import random
 import sys
 
-from checklist.editor import Editor
 import numpy as np
-import spacy
+from spacy.language import Language
 
 from datalabs.operations.edit.editing import editing
+from datalabs.operations.resource_registry import spacy_model
 
 sys.path.append(
     os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../"))
@@ -19,9 +19,14 @@ sys.path.append(
     task="Any",
     description="This operation makes lexical substitutions using hyponyms "
     "of the common nouns in a sentence when possible",
+    resources={
+        "nlp": spacy_model("en_core_web_sm", disable=["parser", "ner", "lemmatizer"])
+    },
 )
-def replace_hyponyms(text: str, n=1, seed=0, max_outputs=1):
-    nlp = spacy.load("en_core_web_sm")
+def replace_hyponyms(text: str, n=1, seed=0, max_outputs=1, nlp: Language = None):
+    # checklist loads wordnet and ipywidgets when imported
+    from checklist.editor import Editor
+
     editor = Editor()
 
     np.random.seed(seed)
@@ -2,12 +2,12 @@ import os
 import re
 import sys
 
-import nltk
-from nltk.corpus import wordnet
+from nltk.corpus.reader.wordnet import WordNetCorpusReader
 import numpy as np
-import spacy
+from spacy.language import Language
 
 from datalabs.operations.edit.editing import editing
+from datalabs.operations.resource_registry import nltk_corpus, spacy_model
 
 sys.path.append(
     os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../"))
@@ -38,10 +38,19 @@ def untokenize(words):
     task="Any",
     description="Inserting synonyms of random words excluding"
     " punctuations and stopwords.",
+    resources={
+        "nlp": spacy_model("en_core_web_sm", disable=["parser", "ner", "lemmatizer"]),
+        "wordnet": nltk_corpus("wordnet"),
+    },
 )
-def replace_synonym(text, seed=42, prob=0.5, max_outputs=1):
-    nlp = spacy.load("en_core_web_sm")
-    nltk.download("wordnet")
+def replace_synonym(
+    text,
+    seed=42,
+    prob=0.5,
+    max_outputs=1,
+    nlp: Language = None,
+    wordnet: WordNetCorpusReader = None,
+):
     np.random.seed(seed)
     upos_wn_dict = {
         "VERB": "v",
@@ -3,9 +3,10 @@ import os
 import random
 import sys
 
-import spacy
+from spacy.language import Language
 
 from datalabs.operations.edit.editing import editing
+from datalabs.operations.resource_registry import SharedResource, spacy_model
 
 sys.path.append(
     os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../"))
@@ -13,11 +14,23 @@ sys.path.append(
 
 
 def slangifyPoS(
-    token, modified_toks, Dictionary, PoS, probReplace, isCap, ReplPot, ReplMade
+    token,
+    modified_toks,
+    Dictionary,
+    PoS,
+    probReplace,
+    isCap,
+    ReplPot,
+    ReplMade,
+    lemma_index=None,
 ):  # performs transformation similar to all three PoS
 
+    # positions of each word in the dictionary
+    if lemma_index is None:
+        lemma_index = index_lemmas(Dictionary)
+
     # Check if word is in the corresponding dictionary
-    if token.lemma_ in Dictionary[0]:
+    if token.lemma_ in lemma_index:
         ReplPot += 1  # increment potential replacements
 
         repDecision = (
@@ -29,9 +42,7 @@ def slangifyPoS(
 
             # Choose a new word for replacement
             # ind=Slang_Adverbs[0].index(token.lemma_)
-            indAllPosRepl = [
-                i for i, x in enumerate(Dictionary[0]) if x == token.lemma_
-            ]  # all possible replacements
+            indAllPosRepl = lemma_index[token.lemma_]  # all possible replacements
             indChosenRepl = random.randint(
                 0, len(indAllPosRepl) - 1
             )  # choose one of the replacements
@@ -64,6 +75,27 @@ def slangifyPoS(
         modified_toks.append(token.text + token.whitespace_)
 
 
+def index_lemmas(Dictionary):
+    # word -> all its positions in the dictionary
+    lemma_index = {}
+    for i, x in enumerate(Dictionary[0]):
+        lemma_index.setdefault(x, []).append(i)
+    return lemma_index
+
+
+def load_slang():
+    pathDic = os.path.dirname(os.path.abspath(__file__))
+    slang = {}
+    for PoS in ["Nouns", "Adverbs", "Adjectives"]:
+        with open(
+            os.path.join(pathDic, f"../../../resources/Slang_{PoS}.txt"), "r"
+        ) as fin:
+            Dictionary = [line.strip("\n\r").split(",") for line in fin]
+        Dictionary = list(map(list, zip(*Dictionary)))
+        slang[PoS] = (Dictionary, index_lemmas(Dictionary))
+    return slang
+
+
 @editing(
     name="slangificator",
     contributor="xl_augmenter",
@@ -71,6 +103,10 @@ def slangifyPoS(
     description="This transformation replaces some of the words (in particular,"
     " nouns, adjectives, and adverbs) of the original text with their"
     " corresponding slang. ",
+    resources={
+        "spacy_nlp": spacy_model("en_core_web_sm"),
+        "slang": SharedResource("slangificator/slang", load_slang),
+    },
 )
 def slangificator(
     text,
@@ -79,41 +115,23 @@ def slangificator(
     probReplaceAdverb=1.0,
     seed=0,
     max_outputs=1,
+    spacy_nlp: Language = None,
+    slang: dict = None,
 ):
-    pathDic = os.path.dirname(os.path.abspath(__file__))
-
-    nlp = spacy.load("en_core_web_sm")  # get an instance of the tokenizer
-
-    # Load dictionaries
-    fin = open(os.path.join(pathDic, "../../../resources/Slang_Nouns.txt"), "r")
-    Slang_Nouns = [line.strip("\n\r").split(",") for line in fin]
-    fin.close()
-
-    fin = open(os.path.join(pathDic, "../../../resources/Slang_Adverbs.txt"), "r")
-    Slang_Adverbs = [line.strip("\n\r").split(",") for line in fin]
-    fin.close()
-
-    fin = open(os.path.join(pathDic, "../../../resources/Slang_Adjectives.txt"), "r")
-    Slang_Adjectives = [line.strip("\n\r").split(",") for line in fin]
-    fin.close()
-
     random.seed(seed)
 
     perturbed_texts = []  # output for all perturbed texts
 
-    # Load dictionaries
-    Slang_Nouns = Slang_Nouns
-    Slang_Nouns = list(map(list, zip(*Slang_Nouns)))
-    Slang_Adverbs = Slang_Adverbs
-    Slang_Adverbs = list(map(list, zip(*Slang_Adverbs)))
-    Slang_Adjectives = Slang_Adjectives
-    Slang_Adjectives = list(map(list, zip(*Slang_Adjectives)))
+    # dictionaries, and positions of each word in them
+    Slang_Nouns, Nouns_Index = slang["Nouns"]
+    Slang_Adverbs, Adverbs_Index = slang["Adverbs"]
+    Slang_Adjectives, Adjectives_Index = slang["Adjectives"]
 
     # Tags for nouns
     noun_tag = ["NN", "NNS", "NNPS", "NNP"]
 
     # Tokenize text
-    doc = nlp(text)
+    doc = spacy_nlp(text)
 
     for _ in itertools.repeat(None, max_outputs):
 
@@ -138,6 +156,7 @@ def slangificator(
                     isCap,
                     ReplPot,
                     ReplMade,
+                    Nouns_Index,
                 )
 
             # Adverbs
@@ -151,6 +170,7 @@ def slangificator(
                     isCap,
                     ReplPot,
                     ReplMade,
+                    Adverbs_Index,
                 )
 
             # Adjectives
@@ -164,6 +184,7 @@ def slangificator(
                     isCap,
                     ReplPot,
                     ReplMade,
+                    Adjectives_Index,
                 )
 
             else:  # if there is no part of speech which might be replaced
@@ -1,4 +1,48 @@
-from datalabs.operations.featurize.general import *  # noqa
-from datalabs.operations.featurize.nlp_featurize import nlp_featurizing  # noqa
-from datalabs.operations.featurize.summarization import *  # noqa
-from datalabs.operations.featurize.text_classification import *  # noqa
+from datalabs.operations.featurize.featurizing import Featurizing, featurizing  # noqa
+from datalabs.operations.registry import lazy_package
+
+# the operations are imported on first access, with their dependencies
+__getattr__, __dir__, __all__ = lazy_package(
+    __name__,
+    {
+        "general": [
+            "get_basic_words",
+            "get_entities_spacy",
+            "get_features_sample_level",
+            "get_gender_bias",
+            "get_gender_bias_one_word",
+            "get_length",
+            "get_lexical_richness",
+            "get_minhash",
+            "get_postag_nltk",
+            "get_postag_spacy",
+        ],
+        "nlp_featurize": ["nlp_featurizing"],
+        "summarization": [
+            "SummarizationFeaturizing",
+            "get_all_features",
+            "get_compression",
+            "get_copy_len",
+            "get_coverage",
+            "get_density",
+            "get_features_sample_level",
+            "get_features_sample_level_asap",
+            "get_features_sample_level_general",
+            "get_lead_k_summary",
+            "get_novelty",
+            "get_oracle_summary",
+            "get_repetition",
+            "get_schema_of_sample_level_features",
+            "get_schema_of_sample_level_features_asap",
+            "summarization_featurizing",
+        ],
+        "text_classification": [
+            "TextClassificationFeaturizing",
+            "get_features_sample_level",
+            "get_features_sample_level_general",
+            "get_text_length",
+            "text_classification_featurizing",
+        ],
+    },
+)
+__all__ = ["Featurizing", "featurizing", *__all__]
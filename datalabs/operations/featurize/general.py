@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import List
 
 # pre_model_basic_words = load_pre_model(os.path.join(os.path.dirname(__file__),
@@ -7,9 +8,12 @@ from lexicalrichness import LexicalRichness
 
 # nltk package for featurizing
 import nltk
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 
 # spacy package for featurizing
-import spacy
+from spacy.language import Language
 
 from datalabs.operations.featurize.featurizing import featurizing
 
@@ -18,6 +22,8 @@ from datalabs.operations.featurize.utils.util_model import (
     BASIC_WORDS,
     load_gender_bias_data,
 )
+from datalabs.operations.resource_registry import spacy_model
+from datalabs.operations.tokenizer import consumes_tokens
 
 # from hatesonar import Sonar
 # sonar = Sonar()
@@ -30,28 +36,88 @@ from datalabs.operations.featurize.utils.util_model import (
     task="Any",
     description="This function is used to calculate the length of a text",
 )
-def get_length(text: str) -> str:
+@consumes_tokens("SingleSpaceTokenizer")
+def get_length(tokens: List[str]) -> str:
     """
     Package: python
     Input:
-        text:str
+        tokens:List[str]
     Output:
         integer
     """
     # text = sample["text"]
-    return {"length": len(text.split(" "))}
+    return {"length": len(tokens)}
     # return
 
 
+def _count_in_vocabulary(
+    tokens: pa.ListArray, vocabulary: pa.Array, lowercase: bool = False
+) -> np.ndarray:
+    """
+    Count, for each row of `tokens`, the tokens that belong to `vocabulary`
+    """
+    values = pc.list_flatten(tokens)
+    if lowercase:
+        values = pc.utf8_lower(values)
+    is_in = pc.is_in(values, value_set=vocabulary)
+    parents = pc.list_parent_indices(tokens).to_numpy()
+    return np.bincount(
+        parents[is_in.to_numpy(zero_copy_only=False)], minlength=len(tokens)
+    )
+
+
+@get_length.batched
+def _batch_get_length(tokens: pa.ListArray):
+    lengths = pc.list_value_length(tokens)
+    return {"length": lengths.cast(pa.int64())}
+
+
+@lru_cache(maxsize=1)
+def _minhasher():
+    # created on the first use of the MinHash features
+    from datalabs.utils.minhash import MinHasher
+
+    return MinHasher()
+
+
+@featurizing(
+    name="get_minhash",
+    contributor="datalab",
+    task="Any",
+    description="Calculate the MinHash signature of the word 3-grams of a text",
+)
+def get_minhash(text: str):
+    """
+    Package: python
+    Input:
+        text:str
+    Output:
+        List[int]
+    """
+    return {"minhash": _minhasher().signatures([text])[0].tolist()}
+
+
+@get_minhash.batched
+def _batch_get_minhash(texts: pa.Array):
+    minhasher = _minhasher()
+    signatures = minhasher.signatures(texts.to_pylist())
+    return {
+        "minhash": pa.ListArray.from_arrays(
+            pa.array(np.arange(0, signatures.size + 1, minhasher.num_perm, np.int32)),
+            pa.array(signatures.ravel()),
+        )
+    }
+
+
 @featurizing(
     name="get_entities_spacy",
     contributor="spacy",
     task="Any",
     description="Extract entities of a given text by using spacy library.",
+    resources={"nlp": spacy_model("en_core_web_sm", disable=["parser", "lemmatizer"])},
 )
-def get_entities_spacy(text: str) -> List[str]:
+def get_entities_spacy(text: str, nlp: Language = None) -> List[str]:
 
-    nlp = spacy.load("en_core_web_sm")  # this should be pre-reloaded
     doc = nlp(text)
     entities = [(ent.text, ent.label_) for ent in doc.ents]
     return {"entities": entities}
@@ -63,10 +129,12 @@ def get_entities_spacy(text: str) -> List[str]:
     contributor="spacy",
     task="Any",
     description="Part-of-speech tagging of a given text by using spacy library.",
+    resources={
+        "nlp": spacy_model("en_core_web_sm", disable=["parser", "ner", "lemmatizer"])
+    },
 )
-def get_postag_spacy(text: str) -> List[str]:
+def get_postag_spacy(text: str, nlp: Language = None) -> List[str]:
 
-    nlp = spacy.load("en_core_web_sm")  # this should be pre-reloaded
     doc = nlp(text)
     # token_postags = [(token.text, token.tag_) for token in doc]
     tokens = [token.text for token in doc]
@@ -109,16 +177,17 @@ def get_postag_nltk(text: str) -> List:
     task="Any",
     description="Calculate the ratio of basic words in a given text",
 )
-def get_basic_words(sentence: str):
+@consumes_tokens("SingleSpaceTokenizer")
+def get_basic_words(tokens: List[str]):
 
     # the sentence must written in english
     # sample level
-    # sentence : string  'XXX'
+    # tokens : the words of the sentence, ['XXX', 'XX']
 
     if BASIC_WORDS is None:
         raise ValueError("basic word dictionary is none")
 
-    value_list = sentence.split(" ")
+    value_list = tokens
     n_words = len(value_list)
     n_basic_words = 0
 
@@ -132,6 +201,17 @@ def get_basic_words(sentence: str):
     # return n_basic_words*1.0/n_words
 
 
+@get_basic_words.batched
+def _batch_get_basic_words(tokens: pa.ListArray):
+
+    if BASIC_WORDS is None:
+        raise ValueError("basic word dictionary is none")
+
+    n_words = pc.list_value_length(tokens).to_numpy()
+    n_basic_words = _count_in_vocabulary(tokens, pa.array(BASIC_WORDS), lowercase=True)
+    return {"basic_word_ratio": pa.array(n_basic_words * 1.0 / n_words)}
+
+
 @featurizing(
     name="get_lexical_richness",
     contributor="lexicalrichness",
@@ -160,7 +240,10 @@ def get_lexical_richness(sentence: str):
         return {"lexical_diversity": results}
 
 
-gendered_dic = load_gender_bias_data()
+@lru_cache(maxsize=1)
+def _gendered_dic():
+    # loaded on the first use of the gender bias features
+    return load_gender_bias_data()
 
 
 @featurizing(
@@ -169,17 +252,16 @@ gendered_dic = load_gender_bias_data()
     task="Any",
     description="Calculate the number of man/women tokens of a given text",
 )
-def get_gender_bias(sentence: str):
-
-    # if gendered_dic is None:
-    #     gendered_dic = load_gender_bias_data()
+@consumes_tokens("SingleSpaceTokenizer")
+def get_gender_bias(tokens: List[str]):
+    gendered_dic = _gendered_dic()
 
     one_words_results = get_gender_bias_one_word(
         gendered_dic["words"]["male"],
         gendered_dic["words"]["female"],
         gendered_dic["single_name"]["male"],
         gendered_dic["single_name"]["female"],
-        sentence,
+        tokens,
     )
 
     results = {
@@ -197,8 +279,44 @@ def get_gender_bias(sentence: str):
     return {"gender_bias_info": results}
 
 
+@get_gender_bias.batched
+def _batch_get_gender_bias(tokens: pa.ListArray):
+    gendered_dic = _gendered_dic()
+
+    counts = {
+        group: {
+            gender: pa.array(
+                _count_in_vocabulary(
+                    tokens, pa.array(gendered_dic[group][gender]), lowercase=True
+                )
+            )
+            for gender in ["male", "female"]
+        }
+        for group in ["words", "single_name"]
+    }
+
+    results = pa.StructArray.from_arrays(
+        [
+            pa.StructArray.from_arrays(
+                [counts["words"]["male"], counts["words"]["female"]],
+                ["male", "female"],
+            ),
+            pa.StructArray.from_arrays(
+                [counts["single_name"]["male"], counts["single_name"]["female"]],
+                ["male", "female"],
+            ),
+        ],
+        ["word", "single_name"],
+    )
+    return {"gender_bias_info": results}
+
+
 def get_gender_bias_one_word(words_m, words_f, single_name_m, single_name_f, sentence):
-    words_sentence = sentence.lower().split(" ")
+    # the text of a sentence, or its tokens
+    if isinstance(sentence, str):
+        words_sentence = sentence.lower().split(" ")
+    else:
+        words_sentence = [word.lower() for word in sentence]
 
     results = {
         "words_m": 0,
@@ -273,6 +391,7 @@ def get_features_sample_level(text: str):
     basic_words = n_basic_words * 1.0 / n_words if n_words != 0 else float(0)
 
     # Gender bias
+    gendered_dic = _gendered_dic()
     one_words_results = get_gender_bias_one_word(
         gendered_dic["words"]["male"],
         gendered_dic["words"]["female"],
@@ -2,9 +2,13 @@
 using compare_mt https://github.com/neulab/compare-mt for ROUGE
 """
 
+from collections import Counter
+from functools import lru_cache, partial
 from typing import List
 
+from compare_mt.rouge import scoring, tokenize
 from compare_mt.rouge.rouge_scorer import RougeScorer
+from multiprocess import Pool
 from nltk import sent_tokenize, word_tokenize
 import numpy as np
 
@@ -28,6 +32,85 @@ def _compute_rouge(cand, ref):
     return score["rouge1"].fmeasure
 
 
+class _CachedStemmer:
+    """The stemmer of the ROUGE scorers, stemming each word once"""
+
+    def __init__(self, stemmer):
+        self.stem = lru_cache(maxsize=2**16)(stemmer.stem)
+
+
+_stemmer = _CachedStemmer(_scorer._stemmer)
+
+
+class StringOracleSearch:
+    """
+    Scores of the candidate sentences of an extractive oracle, by calling
+    sim_fn on the concatenation of the current oracle and each candidate
+    """
+
+    def __init__(self, src: List[str], ref: str, sim_fn):
+        self.src = src
+        self.ref = ref
+        self.sim_fn = sim_fn
+        self.oracle = []
+
+    def score(self, index: int) -> float:
+        return self.sim_fn(" ".join(self.oracle + [self.src[index]]), self.ref)
+
+    def add(self, index: int):
+        self.oracle.append(self.src[index])
+
+
+class RougeOracleSearch:
+    """
+    Scores of the candidate sentences of an extractive oracle, as the ROUGE-1
+    f-measure of `_compute_rouge`, computed incrementally:
+    each sentence is tokenized and stemmed once, the unigram counts of the
+    current oracle are kept, and a candidate is scored by merging its counts
+    into them, in time linear in the length of the candidate.
+    """
+
+    def __init__(self, src: List[str], ref: str):
+        self.src_counts = [Counter(tokenize.tokenize(sent, _stemmer)) for sent in src]
+        self.src_lens = [sum(counts.values()) for counts in self.src_counts]
+        self.ref_counts = Counter(tokenize.tokenize(ref, _stemmer))
+        self.ref_len = sum(self.ref_counts.values())
+        # unigram counts of the current oracle, and their overlap with ref
+        self.counts = Counter()
+        self.len = 0
+        self.intersection = 0
+
+    def score(self, index: int) -> float:
+        intersection = self.intersection
+        for token, count in self.src_counts[index].items():
+            ref_count = self.ref_counts.get(token, 0)
+            current = self.counts.get(token, 0)
+            if current < ref_count:
+                intersection += min(count, ref_count - current)
+        precision = intersection / max(self.len + self.src_lens[index], 1)
+        recall = intersection / max(self.ref_len, 1)
+        return scoring.fmeasure(precision, recall)
+
+    def add(self, index: int):
+        for token, count in self.src_counts[index].items():
+            ref_count = self.ref_counts.get(token, 0)
+            current = self.counts.get(token, 0)
+            if current < ref_count:
+                self.intersection += min(count, ref_count - current)
+            self.counts[token] = current + count
+        self.len += self.src_lens[index]
+
+
+def oracle_search(src: List[str], ref: str, sim_fn):
+    """
+    The search engine of an extractive oracle: `_compute_rouge` is computed
+    incrementally, any other sim_fn is called on the candidate strings
+    """
+    if sim_fn is _compute_rouge:
+        return RougeOracleSearch(src, ref)
+    return StringOracleSearch(src, ref, sim_fn)
+
+
 def _ext_oracle(
     src: List[str],
     ref: str,
@@ -53,13 +136,15 @@ def _ext_oracle(
     if len(ref) == 0:
         ref = "#"
     labels = [0] * len(src)
+    search = oracle_search(src, ref, sim_fn)
     # add the first sentence
-    scores = [sim_fn(x, ref) for x in src]
+    scores = [search.score(i) for i in range(len(src))]
     max_id = np.argmax(scores)
     # updating
     max_score = scores[max_id]
     oracle = [src[max_id]]
     labels[max_id] = 1
+    search.add(max_id)
     # iterative search
     max_sent = len(src) if max_sent < 0 else min(max_sent, len(src))
     threshold = 0 if threshold < 0 else threshold
@@ -68,13 +153,14 @@ def _ext_oracle(
         cur_oracle = " ".join(oracle)
         if max_len > 0 and len(word_tokenize(cur_oracle)) > max_len:
             break
-        scores = [sim_fn(" ".join([cur_oracle, x[0]]), ref) for x in cands]
+        scores = [search.score(x[1]) for x in cands]
         max_id = np.argmax(scores)
         if scores[max_id] - max_score < threshold:
             break
         max_score = scores[max_id]
         oracle.append(cands[max_id][0])
         labels[cands[max_id][1]] = 1
+        search.add(cands[max_id][1])
         del cands[max_id]
     return {
         "source": src,
@@ -85,6 +171,39 @@ def _ext_oracle(
     }
 
 
+def _ext_oracle_wrapper(args, **kwargs):
+    return _ext_oracle(*args, **kwargs)
+
+
+def ext_oracle_batch(
+    srcs: List[List[str]],
+    refs: List[str],
+    sim_fn=_compute_rouge,
+    max_sent: int = 3,
+    max_len: int = -1,
+    threshold: int = -1,
+    num_proc: int = 1,
+    chunksize: int = 64,
+):
+    """
+    Extractive oracles of a batch of samples, computed by `num_proc` processes
+    srcs: source documents, each one being a list of sentences
+    refs: reference summaries
+    other arguments: see `_ext_oracle`
+    """
+    fn = partial(
+        _ext_oracle_wrapper,
+        sim_fn=sim_fn,
+        max_sent=max_sent,
+        max_len=max_len,
+        threshold=threshold,
+    )
+    if num_proc <= 1:
+        return [fn(args) for args in zip(srcs, refs)]
+    with Pool(num_proc) as pool:
+        return list(pool.imap(fn, zip(srcs, refs), chunksize=chunksize))
+
+
 def _lead_k(src: List[str], ref: str, sim_fn, k: int = 3):
     """
     A functionality of generating summaries using lead-k sentences
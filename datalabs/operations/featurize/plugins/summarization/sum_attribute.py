@@ -1,5 +1,6 @@
 # %%
-from collections import Counter, namedtuple
+from collections import Counter, defaultdict, namedtuple
+from functools import lru_cache
 
 import nltk
 from nltk import sent_tokenize, word_tokenize
@@ -48,17 +49,26 @@ class SUMAttribute:
             "attr_hypothesis_len": 0.0,
         }
 
+    def tokenize(self, doc):
+        """Tokenize a document once for all the attributes.
+        The result is cached, so that the attributes computed by different
+        operations on the same sample share the tokenization.
+        """
+        if isinstance(doc, TokenizedDocument):
+            return doc
+        return _tokenize(doc)
+
     def cal_attributes_each(self, text, summary):
 
         # Normalize text
-        tokenized_text = word_tokenize(text)
-        tokenized_summary = word_tokenize(summary)
-        normalized_text = [str(t).lower() for t in tokenized_text]
-        normalized_summary = [str(t).lower() for t in tokenized_summary]
+        text = self.tokenize(text)
+        summary = self.tokenize(summary)
+        normalized_text = text.normalized
+        normalized_summary = summary.normalized
 
         # Calculate matches
         matches = self.overlap(normalized_summary, normalized_text)
-        summary_len = len(tokenized_summary)
+        summary_len = len(summary.tokens)
 
         if summary_len == 0:
             density, coverage, compression = 0, 0, 0
@@ -68,7 +78,7 @@ class SUMAttribute:
             # Coverage
             coverage = sum(o.length for o in matches) / summary_len
             # Compression
-            compression = len(tokenized_text) / summary_len
+            compression = len(text.tokens) / summary_len
 
         # Repetition
         repetition = self.cal_repetition(summary)
@@ -93,11 +103,8 @@ class SUMAttribute:
         }
 
     def get_ngrams(self, doc, n):
-        doc = doc.lower()
-        doc_sents = sent_tokenize(doc)
         _ngrams = []
-        for sent in doc_sents:
-            sent = word_tokenize(sent)
+        for sent in self.tokenize(doc).sentences:
             _ngrams.extend(list(ngrams(sent, n=n)))
         return _ngrams
 
@@ -144,37 +151,70 @@ class SUMAttribute:
             - summary (int): the start index of the match in the summary
             - text (int): the start index of the match in the reference
             - length (int): the length of the extractive fragment
+
+        For each position of the summary, the text is scanned from left to
+        right and the first longest fragment is kept; a scan resumes after the
+        end of the fragment it has just matched. Only the positions of the text
+        holding the current summary token are visited, using an index from
+        tokens to their positions in the text.
         """
+        positions = defaultdict(list)
+        for i, token in enumerate(b):
+            positions[token].append(i)
+
         matches = []
+        a_len, b_len = len(a), len(b)
         a_start = 0
-        b_start = 0
-        while a_start < len(a):
+        while a_start < a_len:
             best_match = None
             best_match_length = 0
-            while b_start < len(b):
-                if a[a_start] == b[b_start]:
-                    a_end = a_start
-                    b_end = b_start
-                    while a_end < len(a) and b_end < len(b) and b[b_end] == a[a_end]:
-                        b_end += 1
-                        a_end += 1
-                    length = a_end - a_start
-                    if length > best_match_length:
-                        best_match = SUMAttribute.Match(a_start, b_start, length)
-                        best_match_length = length
-                    b_start = b_end
-                else:
-                    b_start += 1
-            b_start = 0
+            # no fragment can be longer than the rest of the summary
+            max_length = a_len - a_start
+            b_next = 0
+            for b_start in positions.get(a[a_start], ()):
+                if b_start < b_next:
+                    continue
+                a_end = a_start + 1
+                b_end = b_start + 1
+                while a_end < a_len and b_end < b_len and b[b_end] == a[a_end]:
+                    b_end += 1
+                    a_end += 1
+                length = a_end - a_start
+                if length > best_match_length:
+                    best_match = SUMAttribute.Match(a_start, b_start, length)
+                    best_match_length = length
+                    if length == max_length:
+                        break
+                b_next = b_end
             if best_match:
-                if best_match_length > 0:
-                    matches.append(best_match)
+                matches.append(best_match)
                 a_start += best_match_length
             else:
                 a_start += 1
         return matches
 
 
+TokenizedDocument = namedtuple(
+    "TokenizedDocument", ("tokens", "normalized", "sentences")
+)
+TokenizedDocument.__doc__ = """
+A document tokenized for `SUMAttribute`:
+    - tokens: the words of the document
+    - normalized: the lower-cased words of the document
+    - sentences: the words of each sentence of the lower-cased document
+"""
+
+
+@lru_cache(maxsize=1024)
+def _tokenize(doc):
+    tokens = word_tokenize(doc)
+    return TokenizedDocument(
+        tokens=tokens,
+        normalized=[str(t).lower() for t in tokens],
+        sentences=[word_tokenize(sent) for sent in sent_tokenize(doc.lower())],
+    )
+
+
 # if __name__ == "__main__":
 #     sum_class = SUMAttribute()
 #     summary = [
@@ -8,8 +8,12 @@ import json
 from multiprocessing import Pool
 from typing import List
 
-from nltk import word_tokenize
-import numpy as np
+from datalabs.operations.featurize.plugins.summarization.extractive_methods import (
+    _ext_oracle as _ext_oracle_search,
+)
+from datalabs.operations.featurize.plugins.summarization.extractive_methods import (
+    ext_oracle_batch,
+)
 
 
 def _ext_oracle(
@@ -30,37 +34,12 @@ def _ext_oracle(
     max_len: maximum length of the oracle summaries
     threshold: a predefined threshold for stoping creteria
     """
-    src = [x.strip() for x in src]
-    ref = ref.strip()
-    if len(src) == 0:
-        src = ["#"]
-    if len(ref) == 0:
-        ref = "#"
-    labels = [0] * len(src)
-    # add the first sentence
-    scores = [sim_fn(x, ref) for x in src]
-    max_id = np.argmax(scores)
-    # updating
-    max_score = scores[max_id]
-    oracle = [src[max_id]]
-    labels[max_id] = 1
-    # iterative search
-    max_sent = len(src) if max_sent < 0 else min(max_sent, len(src))
-    threshold = 0 if threshold < 0 else threshold
-    cands = [(x, i) for (i, x) in enumerate(src) if i != max_id]
-    while len(oracle) < max_sent:
-        cur_oracle = " ".join(oracle)
-        if max_len > 0 and len(word_tokenize(cur_oracle)) > max_len:
-            break
-        scores = [sim_fn(" ".join([cur_oracle, x[0]]), ref) for x in cands]
-        max_id = np.argmax(scores)
-        if scores[max_id] - max_score < threshold:
-            break
-        max_score = scores[max_id]
-        oracle.append(cands[max_id][0])
-        labels[cands[max_id][1]] = 1
-        del cands[max_id]
-    return " ".join(oracle), labels, max_score
+    oracle_info = _ext_oracle_search(src, ref, sim_fn, max_sent, max_len, threshold)
+    return (
+        " ".join(oracle_info["oracle_summary"]),
+        oracle_info["oracle_labels"],
+        oracle_info["oracle_score"],
+    )
 
 
 def thread_wrapper(x, fn):
@@ -102,37 +81,26 @@ def ext_oracle(
     cnt = 0
     if out_dir is not None:
         f = open(out_dir, "w")
-    if num_workers > 1:
-        fn = partial(
-            _ext_oracle,
-            sim_fn=sim_fn,
-            max_sent=max_sent,
-            max_len=max_len,
-            threshold=threshold,
-        )
-        fn = partial(thread_wrapper, fn=fn)
-        with Pool(processes=num_workers) as pool:
-            result = pool.imap(fn, zip(src, ref), chunksize=64)
-            for (o, l, s) in result:
-                if out_dir is not None:
-                    print(json.dumps({"label": l, "oracle": o, "score": s}), file=f)
-                else:
-                    oracles.append(o)
-                    labels.append(l)
-                    scores.append(s)
-                score += s
-                cnt += 1
-    else:
-        for (x, y) in zip(src, ref):
-            o, l, s = _ext_oracle(x, y, sim_fn, max_sent, max_len, threshold)
-            if out_dir is not None:
-                print(json.dumps({"label": l, "oracle": o, "score": s}), file=f)
-            else:
-                oracles.append(o)
-                labels.append(l)
-                scores.append(s)
-            score += s
-            cnt += 1
+    oracle_infos = ext_oracle_batch(
+        src,
+        ref,
+        sim_fn,
+        max_sent=max_sent,
+        max_len=max_len,
+        threshold=threshold,
+        num_proc=num_workers,
+    )
+    for oracle_info in oracle_infos:
+        o = " ".join(oracle_info["oracle_summary"])
+        l, s = oracle_info["oracle_labels"], oracle_info["oracle_score"]
+        if out_dir is not None:
+            print(json.dumps({"label": l, "oracle": o, "score": s}), file=f)
+        else:
+            oracles.append(o)
+            labels.append(l)
+            scores.append(s)
+        score += s
+        cnt += 1
     score = score / cnt
     if out_dir is not None:
         f.close()
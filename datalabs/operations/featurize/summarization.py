@@ -2,6 +2,7 @@
 from typing import Any, Callable, Dict, List, Mapping, Optional
 
 from nltk import sent_tokenize
+import pyarrow as pa
 
 from datalabs.operations.featurize.featurizing import Featurizing, featurizing
 from datalabs.operations.featurize.general import (
@@ -11,6 +12,7 @@ from datalabs.operations.featurize.plugins.summarization.extractive_methods impo
     _compute_rouge,
     _ext_oracle,
     _lead_k,
+    ext_oracle_batch,
 )
 from datalabs.operations.featurize.plugins.summarization.sum_attribute import (
     SUMAttribute,
@@ -203,6 +205,7 @@ def get_all_features(sample: dict):
     contributor="datalab",
     task="summarization",
     description="This function extract the oracle summaries for text summarization",
+    processed_fields=["text", "summary"],
 )
 def get_oracle_summary(sample: dict) -> Dict:
     """
@@ -221,6 +224,23 @@ def get_oracle_summary(sample: dict) -> Dict:
     return oracle_info
 
 
+@get_oracle_summary.batched
+def _batch_get_oracle_summary(samples: pa.StructArray) -> Dict:
+    documents = [sent_tokenize(text) for text in samples.field("text").to_pylist()]
+    summaries = samples.field("summary").to_pylist()
+    oracles = ext_oracle_batch(documents, summaries, _compute_rouge, max_sent=3)
+    return {
+        attr_name: [oracle_info[attr_name] for oracle_info in oracles]
+        for attr_name in [
+            "source",
+            "reference",
+            "oracle_summary",
+            "oracle_labels",
+            "oracle_score",
+        ]
+    }
+
+
 #
 #
 #
@@ -1,5 +1,15 @@
 import inspect
-from typing import Any, Callable, Mapping, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+import pyarrow as pa
+
+from datalabs.operations.catalog import register_operation
+from datalabs.operations.resource_registry import (
+    PipedLanguage,
+    SharedResource,
+    SpacyModel,
+)
+from datalabs.operations.tokenizer import get_tokenizer, token_column_name
 
 
 class OperationFunction:
@@ -30,10 +40,16 @@ class OperationFunction:
         self.generated_field = None
         self._data_type = self.__class__.__name__
         self.description = description
+        self.batch_func = None
+        # tokenizer of the processed field if `func` takes its tokens, see
+        # datalabs.operations.tokenizer.consumes_tokens
+        self.tokenizer_name = getattr(func, "tokenizer_name", None)
+        # recorded in the operation catalog, see datalabs.operations.catalog
+        register_operation(self)
 
     def set(self, processed_fields):
         # print(self._type)
-        return OperationFunction(
+        operation = OperationFunction(
             name=self.name,
             func=self.func,
             resources=self.resources,
@@ -41,6 +57,115 @@ class OperationFunction:
             description=self.description,
             processed_fields=processed_fields,
         )
+        operation.batch_func = self.batch_func
+        return operation
+
+    @property
+    def shared_resources(self) -> List[str]:
+        """
+        names of the resources of this operation provided by `resource_registry`
+        """
+        return [
+            resource.name
+            for resource in self.resources.values()
+            if isinstance(resource, SharedResource)
+        ]
+
+    def load_resources(self) -> Dict[str, Any]:
+        """
+        resources passed to `func`, with the shared resources loaded (once per
+        process) from `resource_registry`
+        """
+        return {
+            key: resource.load() if isinstance(resource, SharedResource) else resource
+            for key, resource in self.resources.items()
+        }
+
+    @property
+    def spacy_resource(self) -> Optional[str]:
+        """
+        key of the spacy model in the resources of this operation, if any
+        """
+        for key, resource in self.resources.items():
+            if isinstance(resource, SpacyModel):
+                return key
+        return None
+
+    def input_column(self, column_names: List[str]) -> str:
+        """
+        column read by this operation among `column_names`: the token column of
+        its processed field if it takes tokens and the field was tokenized,
+        its processed field otherwise
+        """
+        field = self.processed_fields[0]
+        if self.tokenizer_name is not None:
+            token_column = token_column_name(field, self.tokenizer_name)
+            if token_column in column_names:
+                return token_column
+        return field
+
+    def tokenize_batch(self, texts: pa.Array) -> pa.Array:
+        """
+        tokens of a batch of texts if this operation takes tokens, `texts` if
+        it takes texts or if they're already tokenized
+        """
+        if self.tokenizer_name is None or not (
+            pa.types.is_string(texts.type) or pa.types.is_large_string(texts.type)
+        ):
+            return texts
+        return get_tokenizer(self.tokenizer_name).batch(texts)
+
+    @property
+    def supports_batch(self) -> bool:
+        return self.batch_func is not None
+
+    def batched(self, batch_func: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Register a columnar implementation of this operation, used by
+        `Dataset.apply(..., batched=True)`.
+
+        The registered function receives the processed field of a whole
+        batch as a `pyarrow.Array` (plus the operation resources) and returns
+        a dict mapping each output name to a column (list or `pyarrow.Array`)
+        with one value per row, e.g.:
+
+            @get_length.batched
+            def _batch_get_length(texts):
+                return {"length": pc.list_value_length(pc.split_pattern(texts, " "))}
+        """
+        self.batch_func = batch_func
+        return batch_func
+
+    def apply_batch(self, texts: pa.Array) -> Dict[str, Any]:
+        """
+        Parameters
+        texts: values of the processed field for a batch of samples, or their
+        tokens if this operation takes tokens
+
+        Returns
+        Dict of output columns, one value per sample
+        """
+        texts = self.tokenize_batch(texts)
+        if self.batch_func is not None:
+            return self.batch_func(texts, **self.load_resources())
+
+        texts = texts.to_pylist()
+        spacy_resource = self.spacy_resource
+        if spacy_resource is not None:
+            # parse the whole batch at once with nlp.pipe
+            model = self.resources[spacy_resource]
+            docs = dict(zip(texts, model.pipe(texts)))
+            resources = self.load_resources()
+            resources[spacy_resource] = PipedLanguage(resources[spacy_resource], docs)
+            outputs = (self.func(text, **resources) for text in texts)
+        else:
+            outputs = (self(text) for text in texts)
+
+        columns = {}
+        for output in outputs:
+            for attr_name, value in output.items():
+                columns.setdefault(attr_name, []).append(value)
+        return columns
 
     def __call__(self, x: str) -> Any:  # str?
         """
@@ -52,12 +177,14 @@ class OperationFunction:
         """
         # return self.func(x, **self.resources)
         # print(inspect.getfullargspec(self.func))
+        if self.tokenizer_name is not None and isinstance(x, str):
+            x = get_tokenizer(self.tokenizer_name)(x)
         if "self" not in inspect.getfullargspec(self.func).args:
-            return self.func(x, **self.resources)
+            return self.func(x, **self.load_resources())
         else:
             cls_obj = self.resources["cls"]
             del self.resources["cls"]
-            return self.func(cls_obj, x, **self.resources)
+            return self.func(cls_obj, x, **self.load_resources())
 
 
 class operation_function:
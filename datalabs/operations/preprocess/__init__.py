@@ -1,5 +1,7 @@
-from datalabs.operations.preprocess.general import lower  # noqa; noqa
-from datalabs.operations.preprocess.general import stem  # noqa
-from datalabs.operations.preprocess.general import tokenize  # noqa
-from datalabs.operations.preprocess.general import tokenize_huggingface  # noqa
-from datalabs.operations.preprocess.general import tokenize_nltk  # noqa
+from datalabs.operations.registry import lazy_package
+
+# the operations are imported on first access, with their dependencies
+__getattr__, __dir__, __all__ = lazy_package(
+    __name__,
+    {"general": ["lower", "stem", "tokenize", "tokenize_huggingface", "tokenize_nltk"]},
+)
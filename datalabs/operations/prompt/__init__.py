@@ -1,4 +1,30 @@
-from datalabs.operations.prompt.natural_language_inference import *  # noqa
-from datalabs.operations.prompt.sentiment_classification import *  # noqa
-from datalabs.operations.prompt.summarization import *  # noqa
-from datalabs.operations.prompt.topic_classification import *  # noqa
+from datalabs.operations.prompt.prompting import Prompting, prompting  # noqa
+from datalabs.operations.registry import lazy_package
+
+# the operations are imported on first access, with their dependencies
+__getattr__, __dir__, __all__ = lazy_package(
+    __name__,
+    {
+        "natural_language_inference": [
+            "NLIPrompting",
+            "nli_prompting",
+            *[f"template_nli{i}" for i in range(1, 11)],
+        ],
+        "sentiment_classification": [
+            "SentimentClassificationPrompting",
+            "sentiment_classification_prompting",
+            *[f"template_sc{i}" for i in range(1, 7)],
+        ],
+        "summarization": [
+            "SummarizationPrompting",
+            "summarization_prompting",
+            *[f"template_summ{i}" for i in range(1, 9)],
+        ],
+        "topic_classification": [
+            "TopicClassificationPrompting",
+            "topic_classification_prompting",
+            *[f"template_tc{i}" for i in range(1, 9)],
+        ],
+    },
+)
+__all__ = ["Prompting", "prompting", *__all__]
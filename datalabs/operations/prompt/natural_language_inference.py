@@ -1,7 +1,15 @@
 from typing import Any, Callable, Dict, List, Mapping, Optional
 
+import pyarrow as pa
+
 from datalabs.operations.operation import dataset_operation, DatasetOperation
-from datalabs.operations.prompt.prompting import prompting, Prompting
+from datalabs.operations.prompt.prompting import (
+    label_prompt_columns,
+    prompting,
+    Prompting,
+    render_prompt_columns,
+)
+from datalabs.prompt import compile_template
 
 
 class NLIPrompting(Prompting, DatasetOperation):
@@ -43,7 +51,17 @@ class NLIPrompting(Prompting, DatasetOperation):
         Returns
         Transformed Text
         """
-        return self.func(sample, labels_to_answers, **self.resources)
+        return self.func(sample, labels_to_answers, **self.load_resources())
+
+    def apply_batch(self, samples: pa.StructArray, labels_to_answers) -> Dict[str, Any]:
+        """
+        Parameters
+        samples: processed fields of a batch of samples
+
+        Returns
+        Dict of output columns, one value per sample
+        """
+        return self.batch_func(samples, labels_to_answers, **self.load_resources())
 
 
 class nli_prompting(prompting, dataset_operation):
@@ -111,6 +129,16 @@ print(next(res))
 """
 
 
+# labels=('contradiction', 'entailment', 'neutral'))
+ANSWERS_TO_DESC_NLI1 = {
+    "contradiction": "No",
+    "entailment": "Yes",
+    "neutral": "Unknown",
+}
+
+TEMPLATE_NLI1 = 'Given that "{text1}" Can we infer that {text2}? Yes or No or Unknown?'
+
+
 @nli_prompting(
     name="template_nli1",
     contributor="datalab",
@@ -118,26 +146,39 @@ print(next(res))
     description='Prompt template: Given that "{text1}" Can we infer '
     'that "{text2}"? Yes or No or Unknown?',
     task="natural-language-inference",
+    processed_fields=["text1", "text2", "label"],
 )
 def template_nli1(sample: dict, labels_to_answers: Dict):
-    # labels=('contradiction', 'entailment', 'neutral'))
-    answers_to_desc = {"contradiction": "No", "entailment": "Yes", "neutral": "Unknown"}
-
-    tp1 = 'Given that "{text1}" Can we infer that {text2}? Yes or No or Unknown?'
-
     # prompting process
     answers = list(labels_to_answers.values())  # noqa
-    text1 = sample["text1"]  # noqa
-    text2 = sample["text2"]  # noqa
+    text1 = sample["text1"]
+    text2 = sample["text2"]
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp1))
+    text_prompt = compile_template(TEMPLATE_NLI1).render(
+        {"text1": text1, "text2": text2}
+    )
 
-    label_prompt = answers_to_desc[labels_to_answers[sample["label"]]]
+    label_prompt = ANSWERS_TO_DESC_NLI1[labels_to_answers[sample["label"]]]
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+@template_nli1.batched
+def _batch_template_nli1(samples: pa.StructArray, labels_to_answers: Dict):
+    text_prompt = render_prompt_columns(TEMPLATE_NLI1, samples)
+    label_prompt = label_prompt_columns(
+        samples.field("label"), labels_to_answers, ANSWERS_TO_DESC_NLI1
+    )
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
 
 
+TEMPLATE_NLI2 = (
+    "Given text: {text1} and text: {text2}, is their relationship {texture_choices}"
+)
+
+
 @nli_prompting(
     name="template_nli2",
     contributor="datalab",
@@ -149,24 +190,38 @@ def template_nli1(sample: dict, labels_to_answers: Dict):
     processed_fields=["text1", "text2", "label"],
 )
 def template_nli2(sample: dict, labels_to_answers: Dict):
-    tp = (
-        "Given text: {text1} and text: {text2}, is their relationship {texture_choices}"
-    )
-
     # prompting process
-    text1 = sample["text1"]  # noqa
-    text2 = sample["text2"]  # noqa
+    text1 = sample["text1"]
+    text2 = sample["text2"]
     answers = list(labels_to_answers.values())
-    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"  # noqa
+    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp))
+    text_prompt = compile_template(TEMPLATE_NLI2).render(
+        {"text1": text1, "text2": text2, "texture_choices": texture_choices}
+    )
 
     label_prompt = labels_to_answers[sample["label"]]
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
 
 
+@template_nli2.batched
+def _batch_template_nli2(samples: pa.StructArray, labels_to_answers: Dict):
+    answers = list(labels_to_answers.values())
+    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"
+
+    text_prompt = render_prompt_columns(
+        TEMPLATE_NLI2, samples, texture_choices=texture_choices
+    )
+    label_prompt = label_prompt_columns(samples.field("label"), labels_to_answers)
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+TEMPLATE_NLI3 = "The relationship of two texts {text1} and {text2} is [mask]"
+
+
 @nli_prompting(
     name="template_nli3",
     contributor="datalab",
@@ -179,21 +234,38 @@ def template_nli2(sample: dict, labels_to_answers: Dict):
 def template_nli3(sample: dict, labels_to_answers: Dict):
     # labels=('contradiction', 'entailment', 'neutral'))
 
-    tp1 = "The relationship of two texts {text1} and {text2} is [mask]"
-
     # prompting process
 
-    text1 = sample["text1"]  # noqa
-    text2 = sample["text2"]  # noqa
+    text1 = sample["text1"]
+    text2 = sample["text2"]
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp1))
+    text_prompt = compile_template(TEMPLATE_NLI3).render(
+        {"text1": text1, "text2": text2}
+    )
 
     label_prompt = labels_to_answers[sample["label"]]
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
 
 
+@template_nli3.batched
+def _batch_template_nli3(samples: pa.StructArray, labels_to_answers: Dict):
+    text_prompt = render_prompt_columns(TEMPLATE_NLI3, samples)
+    label_prompt = label_prompt_columns(samples.field("label"), labels_to_answers)
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+ANSWERS_TO_DESC_NLI4 = {
+    "contradiction": "False",
+    "entailment": "True",
+    "neutral": "Unknown",
+}
+
+TEMPLATE_NLI4 = "{text1} {text2} True or False or Unknown?"
+
+
 @nli_prompting(
     name="template_nli4",
     contributor="datalab",
@@ -203,22 +275,37 @@ def template_nli3(sample: dict, labels_to_answers: Dict):
     processed_fields=["text1", "text2", "label"],
 )
 def template_nli4(sample: dict, labels_to_answers: Dict):
-    answers_to_desc = {
-        "contradiction": "False",
-        "entailment": "True",
-        "neutral": "Unknown",
-    }
-    tp = "{text1} {text2} True or False or Unknown?"
-    text1 = sample["text1"]  # noqa
-    text2 = sample["text2"]  # noqa
+    text1 = sample["text1"]
+    text2 = sample["text2"]
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp))
-    label_prompt = answers_to_desc[labels_to_answers[sample["label"]]]
+    text_prompt = compile_template(TEMPLATE_NLI4).render(
+        {"text1": text1, "text2": text2}
+    )
+    label_prompt = ANSWERS_TO_DESC_NLI4[labels_to_answers[sample["label"]]]
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+@template_nli4.batched
+def _batch_template_nli4(samples: pa.StructArray, labels_to_answers: Dict):
+    text_prompt = render_prompt_columns(TEMPLATE_NLI4, samples)
+    label_prompt = label_prompt_columns(
+        samples.field("label"), labels_to_answers, ANSWERS_TO_DESC_NLI4
+    )
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
 
 
+ANSWERS_TO_DESC_NLI5 = {
+    "contradiction": "False",
+    "entailment": "True",
+    "neutral": "Unknown",
+}
+
+TEMPLATE_NLI5 = "{text1} Is the following statement True or False or Unknown: {text2}?"
+
+
 @nli_prompting(
     name="template_nli5",
     contributor="datalab",
@@ -229,22 +316,40 @@ def template_nli4(sample: dict, labels_to_answers: Dict):
     processed_fields=["text1", "text2", "label"],
 )
 def template_nli5(sample: dict, labels_to_answers: Dict):
-    answers_to_desc = {
-        "contradiction": "False",
-        "entailment": "True",
-        "neutral": "Unknown",
-    }
-    tp = "{text1} Is the following statement True or False or Unknown: {text2}?"
-    text1 = sample["text1"]  # noqa
-    text2 = sample["text2"]  # noqa
+    text1 = sample["text1"]
+    text2 = sample["text2"]
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp))
-    label_prompt = answers_to_desc[labels_to_answers[sample["label"]]]
+    text_prompt = compile_template(TEMPLATE_NLI5).render(
+        {"text1": text1, "text2": text2}
+    )
+    label_prompt = ANSWERS_TO_DESC_NLI5[labels_to_answers[sample["label"]]]
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
 
 
+@template_nli5.batched
+def _batch_template_nli5(samples: pa.StructArray, labels_to_answers: Dict):
+    text_prompt = render_prompt_columns(TEMPLATE_NLI5, samples)
+    label_prompt = label_prompt_columns(
+        samples.field("label"), labels_to_answers, ANSWERS_TO_DESC_NLI5
+    )
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+ANSWERS_TO_DESC_NLI6 = {
+    "contradiction": "false",
+    "entailment": "true",
+    "neutral": "undetermined",
+}
+
+TEMPLATE_NLI6 = (
+    "Premise: {text1} Hypothesis: {text2} Based on the premise, is"
+    " the hypothesis true or false or undetermined?"
+)
+
+
 @nli_prompting(
     name="template_nli6",
     contributor="datalab",
@@ -257,25 +362,34 @@ def template_nli5(sample: dict, labels_to_answers: Dict):
     processed_fields=["text1", "text2", "label"],
 )
 def template_nli6(sample: dict, labels_to_answers: Dict):
-    answers_to_desc = {
-        "contradiction": "false",
-        "entailment": "true",
-        "neutral": "undetermined",
-    }
-    tp = (
-        "Premise: {text1} Hypothesis: {text2} Based on the premise, is"
-        " the hypothesis true or false or undetermined?"
-    )
-    text1 = sample["text1"]  # noqa
-    text2 = sample["text2"]  # noqa
+    text1 = sample["text1"]
+    text2 = sample["text2"]
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp))
-    label_prompt = answers_to_desc[labels_to_answers[sample["label"]]]
+    text_prompt = compile_template(TEMPLATE_NLI6).render(
+        {"text1": text1, "text2": text2}
+    )
+    label_prompt = ANSWERS_TO_DESC_NLI6[labels_to_answers[sample["label"]]]
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+@template_nli6.batched
+def _batch_template_nli6(samples: pa.StructArray, labels_to_answers: Dict):
+    text_prompt = render_prompt_columns(TEMPLATE_NLI6, samples)
+    label_prompt = label_prompt_columns(
+        samples.field("label"), labels_to_answers, ANSWERS_TO_DESC_NLI6
+    )
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
 
 
+TEMPLATE_NLI7 = (
+    "Premise: {text1} Hypothesis: {text2} The relation between"
+    " the hypothesis and premise is [mask]"
+)
+
+
 @nli_prompting(
     name="template_nli7",
     contributor="datalab",
@@ -287,20 +401,38 @@ def template_nli6(sample: dict, labels_to_answers: Dict):
     processed_fields=["text1", "text2", "label"],
 )
 def template_nli7(sample: dict, labels_to_answers: Dict):
-    tp = (
-        "Premise: {text1} Hypothesis: {text2} The relation between"
-        " the hypothesis and premise is [mask]"
-    )
-    text1 = sample["text1"]  # noqa
-    text2 = sample["text2"]  # noqa
+    text1 = sample["text1"]
+    text2 = sample["text2"]
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp))
+    text_prompt = compile_template(TEMPLATE_NLI7).render(
+        {"text1": text1, "text2": text2}
+    )
     label_prompt = labels_to_answers[sample["label"]]
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
 
 
+@template_nli7.batched
+def _batch_template_nli7(samples: pa.StructArray, labels_to_answers: Dict):
+    text_prompt = render_prompt_columns(TEMPLATE_NLI7, samples)
+    label_prompt = label_prompt_columns(samples.field("label"), labels_to_answers)
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+ANSWERS_TO_DESC_NLI8 = {
+    "contradiction": "false",
+    "entailment": "true",
+    "neutral": "inconclusive",
+}
+
+TEMPLATE_NLI8 = (
+    '{text1} Based on that information, is the claim "{text2}" '
+    "true, false or inconclusive?"
+)
+
+
 @nli_prompting(
     name="template_nli8",
     contributor="datalab",
@@ -312,25 +444,33 @@ def template_nli7(sample: dict, labels_to_answers: Dict):
     processed_fields=["text1", "text2", "label"],
 )
 def template_nli8(sample: dict, labels_to_answers: Dict):
-    answers_to_desc = {
-        "contradiction": "false",
-        "entailment": "true",
-        "neutral": "inconclusive",
-    }
-    tp = (
-        '{text1} Based on that information, is the claim "{text2}" '
-        "true, false or inconclusive?"
-    )
-    text1 = sample["text1"]  # noqa
-    text2 = sample["text2"]  # noqa
+    text1 = sample["text1"]
+    text2 = sample["text2"]
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp))
-    label_prompt = answers_to_desc[labels_to_answers[sample["label"]]]
+    text_prompt = compile_template(TEMPLATE_NLI8).render(
+        {"text1": text1, "text2": text2}
+    )
+    label_prompt = ANSWERS_TO_DESC_NLI8[labels_to_answers[sample["label"]]]
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+@template_nli8.batched
+def _batch_template_nli8(samples: pa.StructArray, labels_to_answers: Dict):
+    text_prompt = render_prompt_columns(TEMPLATE_NLI8, samples)
+    label_prompt = label_prompt_columns(
+        samples.field("label"), labels_to_answers, ANSWERS_TO_DESC_NLI8
+    )
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
 
 
+ANSWERS_TO_DESC_NLI9 = {"contradiction": "No", "entailment": "Yes", "neutral": "Maybe"}
+
+TEMPLATE_NLI9 = '{text1} Does it imply that "{text2}"? Yes, No or Maybe?'
+
+
 @nli_prompting(
     name="template_nli9",
     contributor="datalab",
@@ -341,18 +481,40 @@ def template_nli8(sample: dict, labels_to_answers: Dict):
     processed_fields=["text1", "text2", "label"],
 )
 def template_nli9(sample: dict, labels_to_answers: Dict):
-    answers_to_desc = {"contradiction": "No", "entailment": "Yes", "neutral": "Maybe"}
-    tp = '{text1} Does it imply that "{text2}"? Yes, No or Maybe?'
-    text1 = sample["text1"]  # noqa
-    text2 = sample["text2"]  # noqa
+    text1 = sample["text1"]
+    text2 = sample["text2"]
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp))
-    label_prompt = answers_to_desc[labels_to_answers[sample["label"]]]
+    text_prompt = compile_template(TEMPLATE_NLI9).render(
+        {"text1": text1, "text2": text2}
+    )
+    label_prompt = ANSWERS_TO_DESC_NLI9[labels_to_answers[sample["label"]]]
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
 
 
+@template_nli9.batched
+def _batch_template_nli9(samples: pa.StructArray, labels_to_answers: Dict):
+    text_prompt = render_prompt_columns(TEMPLATE_NLI9, samples)
+    label_prompt = label_prompt_columns(
+        samples.field("label"), labels_to_answers, ANSWERS_TO_DESC_NLI9
+    )
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+ANSWERS_TO_DESC_NLI10 = {
+    "contradiction": "impossible",
+    "entailment": "guaranteed",
+    "neutral": "possible",
+}
+
+TEMPLATE_NLI10 = (
+    "Assume it is true that {text1}. Therefore, {text2} is "
+    "guaranteed, possible or impossible?"
+)
+
+
 @nli_prompting(
     name="template_nli10",
     contributor="datalab",
@@ -364,20 +526,23 @@ def template_nli9(sample: dict, labels_to_answers: Dict):
     processed_fields=["text1", "text2", "label"],
 )
 def template_nli10(sample: dict, labels_to_answers: Dict):
-    answers_to_desc = {
-        "contradiction": "impossible",
-        "entailment": "guaranteed",
-        "neutral": "possible",
-    }
-    tp = (
-        "Assume it is true that {text1}. Therefore, {text2} is "
-        "guaranteed, possible or impossible?"
-    )
-    text1 = sample["text1"]  # noqa
-    text2 = sample["text2"]  # noqa
+    text1 = sample["text1"]
+    text2 = sample["text2"]
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp))
-    label_prompt = answers_to_desc[labels_to_answers[sample["label"]]]
+    text_prompt = compile_template(TEMPLATE_NLI10).render(
+        {"text1": text1, "text2": text2}
+    )
+    label_prompt = ANSWERS_TO_DESC_NLI10[labels_to_answers[sample["label"]]]
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+@template_nli10.batched
+def _batch_template_nli10(samples: pa.StructArray, labels_to_answers: Dict):
+    text_prompt = render_prompt_columns(TEMPLATE_NLI10, samples)
+    label_prompt = label_prompt_columns(
+        samples.field("label"), labels_to_answers, ANSWERS_TO_DESC_NLI10
+    )
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
@@ -1,4 +1,10 @@
+from typing import Mapping, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
 from datalabs.operations.operation import text_operation, TextOperation
+from datalabs.prompt import compile_template
 
 
 class Prompting(TextOperation):
@@ -31,3 +37,40 @@ class prompting(text_operation):
                 description=self.description,
             )
             return tf_cls
+
+
+def render_prompt_columns(
+    template: str, samples: pa.StructArray, **values: str
+) -> pa.Array:
+    """
+    Render `template` for a batch of samples at once: its slots are filled
+    with the fields of `samples`, or with the strings of `values` shared by
+    all the samples (e.g. the choices of the answers)
+    """
+    template = compile_template(template)
+    columns = {
+        slot: values[slot] if slot in values else samples.field(slot)
+        for slot in template.slots
+    }
+    return template.render_columns(columns, len(samples))
+
+
+def label_prompt_columns(
+    labels: pa.Array,
+    labels_to_answers: Mapping[int, str],
+    answers_to_desc: Optional[Mapping[str, str]] = None,
+) -> pa.Array:
+    """
+    The answers of a batch of labels, or their description in `answers_to_desc`
+    """
+    if answers_to_desc is not None:
+        labels_to_answers = {
+            label: answers_to_desc[answer]
+            for label, answer in labels_to_answers.items()
+            if answer in answers_to_desc
+        }
+    indices = pc.index_in(labels, value_set=pa.array(list(labels_to_answers)))
+    if indices.null_count > labels.null_count:
+        missing = pc.filter(labels, pc.is_null(indices)).unique().to_pylist()
+        raise KeyError(f"No answer for the labels {missing}")
+    return pc.take(pa.array(list(labels_to_answers.values()), pa.string()), indices)
@@ -1,7 +1,15 @@
 from typing import Any, Callable, Dict, List, Mapping, Optional
 
+import pyarrow as pa
+
 from datalabs.operations.operation import dataset_operation, DatasetOperation
-from datalabs.operations.prompt.prompting import Prompting, prompting
+from datalabs.operations.prompt.prompting import (
+    label_prompt_columns,
+    Prompting,
+    prompting,
+    render_prompt_columns,
+)
+from datalabs.prompt import compile_template
 
 
 class SentimentClassificationPrompting(Prompting, DatasetOperation):
@@ -43,7 +51,17 @@ class SentimentClassificationPrompting(Prompting, DatasetOperation):
         Returns
         Transformed Text
         """
-        return self.func(sample, labels_to_answers, **self.resources)
+        return self.func(sample, labels_to_answers, **self.load_resources())
+
+    def apply_batch(self, samples: pa.StructArray, labels_to_answers) -> Dict[str, Any]:
+        """
+        Parameters
+        samples: processed fields of a batch of samples
+
+        Returns
+        Dict of output columns, one value per sample
+        """
+        return self.batch_func(samples, labels_to_answers, **self.load_resources())
 
 
 class sentiment_classification_prompting(prompting, dataset_operation):
@@ -114,6 +132,9 @@ print(next(res))
 """
 
 
+TEMPLATE_SC1 = "Given the text: {text}, is it {texture_choices}"
+
+
 @sentiment_classification_prompting(
     name="template_sc1",
     contributor="datalab",
@@ -125,21 +146,37 @@ print(next(res))
     processed_fields=["text", "label"],
 )
 def template_sc1(sample: dict, labels_to_answers: Dict):
-    tp1 = "Given the text: {text}, is it {texture_choices}"
-
     # prompting process
     answers = list(labels_to_answers.values())
-    text = sample["text"]  # noqa
-    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"  # noqa
+    text = sample["text"]
+    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp1))
+    text_prompt = compile_template(TEMPLATE_SC1).render(
+        {"text": text, "texture_choices": texture_choices}
+    )
 
     label_prompt = labels_to_answers[sample["label"]]
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
 
 
+@template_sc1.batched
+def _batch_template_sc1(samples: pa.StructArray, labels_to_answers: Dict):
+    answers = list(labels_to_answers.values())
+    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"
+
+    text_prompt = render_prompt_columns(
+        TEMPLATE_SC1, samples, texture_choices=texture_choices
+    )
+    label_prompt = label_prompt_columns(samples.field("label"), labels_to_answers)
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+TEMPLATE_SC2 = "Given the text: {text}, it is [mask]"
+
+
 @sentiment_classification_prompting(
     name="template_sc2",
     contributor="datalab",
@@ -149,19 +186,31 @@ def template_sc1(sample: dict, labels_to_answers: Dict):
     processed_fields=["text", "label"],
 )
 def template_sc2(sample: dict, labels_to_answers: Dict):
-    tp = "Given the text: {text}, it is [mask]"
-
     # prompting process
-    text = sample["text"]  # noqa
+    text = sample["text"]
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp))
+    text_prompt = compile_template(TEMPLATE_SC2).render({"text": text})
 
     label_prompt = labels_to_answers[sample["label"]]
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
 
 
+@template_sc2.batched
+def _batch_template_sc2(samples: pa.StructArray, labels_to_answers: Dict):
+    text_prompt = render_prompt_columns(TEMPLATE_SC2, samples)
+    label_prompt = label_prompt_columns(samples.field("label"), labels_to_answers)
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+TEMPLATE_SC3 = (
+    "Given the text: {text} Judge the sentiment of this text. "
+    "You may choose from {texture_choices}."
+)
+
+
 @sentiment_classification_prompting(
     name="template_sc3",
     contributor="datalab",
@@ -173,24 +222,39 @@ def template_sc2(sample: dict, labels_to_answers: Dict):
     processed_fields=["text", "label"],
 )
 def template_sc3(sample: dict, labels_to_answers: Dict):
-    tp = (
-        "Given the text: {text} Judge the sentiment of this text. "
-        "You may choose from {texture_choices}."
-    )
-
     # prompting process
-    text = sample["text"]  # noqa
+    text = sample["text"]
     answers = list(labels_to_answers.values())
-    texture_choices = ", ".join(answers)  # noqa
+    texture_choices = ", ".join(answers)
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp))
+    text_prompt = compile_template(TEMPLATE_SC3).render(
+        {"text": text, "texture_choices": texture_choices}
+    )
 
     label_prompt = labels_to_answers[sample["label"]]
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
 
 
+@template_sc3.batched
+def _batch_template_sc3(samples: pa.StructArray, labels_to_answers: Dict):
+    answers = list(labels_to_answers.values())
+    texture_choices = ", ".join(answers)
+
+    text_prompt = render_prompt_columns(
+        TEMPLATE_SC3, samples, texture_choices=texture_choices
+    )
+    label_prompt = label_prompt_columns(samples.field("label"), labels_to_answers)
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+TEMPLATE_SC4 = (
+    "Given the text: {text} What's the sentiment of this text? {texture_choices}"
+)
+
+
 @sentiment_classification_prompting(
     name="template_sc4",
     contributor="datalab",
@@ -202,21 +266,40 @@ def template_sc3(sample: dict, labels_to_answers: Dict):
     processed_fields=["text", "label"],
 )
 def template_sc4(sample: dict, labels_to_answers: Dict):
-    tp = "Given the text: {text} What\\'s the sentiment of this text? {texture_choices}"
-
     # prompting process
-    text = sample["text"]  # noqa
+    text = sample["text"]
     answers = list(labels_to_answers.values())
-    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"  # noqa
+    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp))
+    text_prompt = compile_template(TEMPLATE_SC4).render(
+        {"text": text, "texture_choices": texture_choices}
+    )
 
     label_prompt = labels_to_answers[sample["label"]]
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
 
 
+@template_sc4.batched
+def _batch_template_sc4(samples: pa.StructArray, labels_to_answers: Dict):
+    answers = list(labels_to_answers.values())
+    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"
+
+    text_prompt = render_prompt_columns(
+        TEMPLATE_SC4, samples, texture_choices=texture_choices
+    )
+    label_prompt = label_prompt_columns(samples.field("label"), labels_to_answers)
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+TEMPLATE_SC5 = (
+    "Given the text: {text} Can you tell the sentiment"
+    " of the text? {texture_choices}"
+)
+
+
 @sentiment_classification_prompting(
     name="template_sc5",
     contributor="datalab",
@@ -228,24 +311,37 @@ def template_sc4(sample: dict, labels_to_answers: Dict):
     processed_fields=["text", "label"],
 )
 def template_sc5(sample: dict, labels_to_answers: Dict):
-    tp = (
-        "Given the text: {text} Can you tell the sentiment"
-        " of the text? {texture_choices}"
-    )
-
     # prompting process
-    text = sample["text"]  # noqa
+    text = sample["text"]
     answers = list(labels_to_answers.values())
-    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"  # noqa
+    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp))
+    text_prompt = compile_template(TEMPLATE_SC5).render(
+        {"text": text, "texture_choices": texture_choices}
+    )
 
     label_prompt = labels_to_answers[sample["label"]]
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
 
 
+@template_sc5.batched
+def _batch_template_sc5(samples: pa.StructArray, labels_to_answers: Dict):
+    answers = list(labels_to_answers.values())
+    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"
+
+    text_prompt = render_prompt_columns(
+        TEMPLATE_SC5, samples, texture_choices=texture_choices
+    )
+    label_prompt = label_prompt_columns(samples.field("label"), labels_to_answers)
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+TEMPLATE_SC6 = "Given the text: {text} The sentiment of the text is [mask]"
+
+
 @sentiment_classification_prompting(
     name="template_sc6",
     contributor="datalab",
@@ -256,14 +352,20 @@ def template_sc5(sample: dict, labels_to_answers: Dict):
     processed_fields=["text", "label"],
 )
 def template_sc6(sample: dict, labels_to_answers: Dict):
-    tp = "Given the text: {text} The sentiment of the text is [mask]"
-
     # prompting process
-    text = sample["text"]  # noqa
+    text = sample["text"]
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp))
+    text_prompt = compile_template(TEMPLATE_SC6).render({"text": text})
 
     label_prompt = labels_to_answers[sample["label"]]
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+@template_sc6.batched
+def _batch_template_sc6(samples: pa.StructArray, labels_to_answers: Dict):
+    text_prompt = render_prompt_columns(TEMPLATE_SC6, samples)
+    label_prompt = label_prompt_columns(samples.field("label"), labels_to_answers)
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
@@ -1,7 +1,14 @@
 from typing import Any, Callable, List, Mapping, Optional
 
+import pyarrow as pa
+
 from datalabs.operations.operation import dataset_operation, DatasetOperation
-from datalabs.operations.prompt.prompting import Prompting, prompting
+from datalabs.operations.prompt.prompting import (
+    Prompting,
+    prompting,
+    render_prompt_columns,
+)
+from datalabs.prompt import compile_template
 
 
 class SummarizationPrompting(Prompting, DatasetOperation):
@@ -43,7 +50,7 @@ class SummarizationPrompting(Prompting, DatasetOperation):
         Returns
         Transformed Text
         """
-        return self.func(sample, **self.resources)
+        return self.func(sample, **self.load_resources())
 
 
 class summarization_prompting(prompting, dataset_operation):
@@ -100,6 +107,11 @@ print(next(res))
 """
 
 
+TEMPLATE_SUMM1 = (
+    "{text} Write a TLDR (Too Long Didn't Read) summary for the above text."
+)
+
+
 @summarization_prompting(
     name="template_summ1",
     contributor="datalab",
@@ -110,18 +122,26 @@ print(next(res))
     processed_fields=["text", "summary"],
 )
 def template_summ1(sample: dict):
-    tp1 = "{text} Write a TLDR (Too Long Didn\\'t Read) summary for the above text."
-
     # prompting process
-    text = sample["text"]  # noqa
+    text = sample["text"]
     summary = sample["summary"]
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp1))
+    text_prompt = compile_template(TEMPLATE_SUMM1).render({"text": text})
 
     return {"text_prompt": text_prompt, "summary_prompt": summary}
 
 
+@template_summ1.batched
+def _batch_template_summ1(samples: pa.StructArray):
+    text_prompt = render_prompt_columns(TEMPLATE_SUMM1, samples)
+
+    return {"text_prompt": text_prompt, "summary_prompt": samples.field("summary")}
+
+
+TEMPLATE_SUMM2 = "{text} Can you summarize the previous text?"
+
+
 @summarization_prompting(
     name="template_summ2",
     contributor="datalab",
@@ -131,18 +151,26 @@ def template_summ1(sample: dict):
     processed_fields=["text", "summary"],
 )
 def template_summ2(sample: dict):
-    tp1 = "{text} Can you summarize the previous text?"
-
     # prompting process
-    text = sample["text"]  # noqa
+    text = sample["text"]
     summary = sample["summary"]
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp1))
+    text_prompt = compile_template(TEMPLATE_SUMM2).render({"text": text})
 
     return {"text_prompt": text_prompt, "summary_prompt": summary}
 
 
+@template_summ2.batched
+def _batch_template_summ2(samples: pa.StructArray):
+    text_prompt = render_prompt_columns(TEMPLATE_SUMM2, samples)
+
+    return {"text_prompt": text_prompt, "summary_prompt": samples.field("summary")}
+
+
+TEMPLATE_SUMM3 = "{text} what are the main points one should remember from this text?"
+
+
 @summarization_prompting(
     name="template_summ3",
     contributor="datalab",
@@ -153,18 +181,26 @@ def template_summ2(sample: dict):
     processed_fields=["text", "summary"],
 )
 def template_summ3(sample: dict):
-    tp1 = "{text} what are the main points one should remember from this text?"
-
     # prompting process
-    text = sample["text"]  # noqa
+    text = sample["text"]
     summary = sample["summary"]
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp1))
+    text_prompt = compile_template(TEMPLATE_SUMM3).render({"text": text})
 
     return {"text_prompt": text_prompt, "summary_prompt": summary}
 
 
+@template_summ3.batched
+def _batch_template_summ3(samples: pa.StructArray):
+    text_prompt = render_prompt_columns(TEMPLATE_SUMM3, samples)
+
+    return {"text_prompt": text_prompt, "summary_prompt": samples.field("summary")}
+
+
+TEMPLATE_SUMM4 = "{text} In a few sentences, what does the previous paragraph say?"
+
+
 @summarization_prompting(
     name="template_summ4",
     contributor="datalab",
@@ -175,18 +211,26 @@ def template_summ3(sample: dict):
     processed_fields=["text", "summary"],
 )
 def template_summ4(sample: dict):
-    tp1 = "{text} In a few sentences, what does the previous paragraph say?"
-
     # prompting process
-    text = sample["text"]  # noqa
+    text = sample["text"]
     summary = sample["summary"]
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp1))
+    text_prompt = compile_template(TEMPLATE_SUMM4).render({"text": text})
 
     return {"text_prompt": text_prompt, "summary_prompt": summary}
 
 
+@template_summ4.batched
+def _batch_template_summ4(samples: pa.StructArray):
+    text_prompt = render_prompt_columns(TEMPLATE_SUMM4, samples)
+
+    return {"text_prompt": text_prompt, "summary_prompt": samples.field("summary")}
+
+
+TEMPLATE_SUMM5 = "{text} Condense the text down to the essentials."
+
+
 @summarization_prompting(
     name="template_summ5",
     contributor="datalab",
@@ -196,18 +240,26 @@ def template_summ4(sample: dict):
     processed_fields=["text", "summary"],
 )
 def template_summ5(sample: dict):
-    tp1 = "{text} Condense the text down to the essentials."
-
     # prompting process
-    text = sample["text"]  # noqa
+    text = sample["text"]
     summary = sample["summary"]
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp1))
+    text_prompt = compile_template(TEMPLATE_SUMM5).render({"text": text})
 
     return {"text_prompt": text_prompt, "summary_prompt": summary}
 
 
+@template_summ5.batched
+def _batch_template_summ5(samples: pa.StructArray):
+    text_prompt = render_prompt_columns(TEMPLATE_SUMM5, samples)
+
+    return {"text_prompt": text_prompt, "summary_prompt": samples.field("summary")}
+
+
+TEMPLATE_SUMM6 = "{text} What can be a short description of the text?"
+
+
 @summarization_prompting(
     name="template_summ6",
     contributor="datalab",
@@ -217,18 +269,26 @@ def template_summ5(sample: dict):
     processed_fields=["text", "summary"],
 )
 def template_summ6(sample: dict):
-    tp1 = "{text} What can be a short description of the text?"
-
     # prompting process
-    text = sample["text"]  # noqa
+    text = sample["text"]
     summary = sample["summary"]
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp1))
+    text_prompt = compile_template(TEMPLATE_SUMM6).render({"text": text})
 
     return {"text_prompt": text_prompt, "summary_prompt": summary}
 
 
+@template_summ6.batched
+def _batch_template_summ6(samples: pa.StructArray):
+    text_prompt = render_prompt_columns(TEMPLATE_SUMM6, samples)
+
+    return {"text_prompt": text_prompt, "summary_prompt": samples.field("summary")}
+
+
+TEMPLATE_SUMM7 = "{text} How would you summarize the key points of the text?"
+
+
 @summarization_prompting(
     name="template_summ7",
     contributor="datalab",
@@ -239,18 +299,26 @@ def template_summ6(sample: dict):
     processed_fields=["text", "summary"],
 )
 def template_summ7(sample: dict):
-    tp1 = "{text} How would you summarize the key points of the text?"
-
     # prompting process
-    text = sample["text"]  # noqa
+    text = sample["text"]
     summary = sample["summary"]
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp1))
+    text_prompt = compile_template(TEMPLATE_SUMM7).render({"text": text})
 
     return {"text_prompt": text_prompt, "summary_prompt": summary}
 
 
+@template_summ7.batched
+def _batch_template_summ7(samples: pa.StructArray):
+    text_prompt = render_prompt_columns(TEMPLATE_SUMM7, samples)
+
+    return {"text_prompt": text_prompt, "summary_prompt": samples.field("summary")}
+
+
+TEMPLATE_SUMM8 = "{text} Can you express the main content of the text?"
+
+
 @summarization_prompting(
     name="template_summ8",
     contributor="datalab",
@@ -260,13 +328,18 @@ def template_summ7(sample: dict):
     processed_fields=["text", "summary"],
 )
 def template_summ8(sample: dict):
-    tp1 = "{text} Can you express the main content of the text?"
-
     # prompting process
-    text = sample["text"]  # noqa
+    text = sample["text"]
     summary = sample["summary"]
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp1))
+    text_prompt = compile_template(TEMPLATE_SUMM8).render({"text": text})
 
     return {"text_prompt": text_prompt, "summary_prompt": summary}
+
+
+@template_summ8.batched
+def _batch_template_summ8(samples: pa.StructArray):
+    text_prompt = render_prompt_columns(TEMPLATE_SUMM8, samples)
+
+    return {"text_prompt": text_prompt, "summary_prompt": samples.field("summary")}
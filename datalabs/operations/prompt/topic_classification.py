@@ -1,7 +1,15 @@
 from typing import Any, Callable, Dict, List, Mapping, Optional
 
+import pyarrow as pa
+
 from datalabs.operations.operation import dataset_operation, DatasetOperation
-from datalabs.operations.prompt.prompting import prompting, Prompting
+from datalabs.operations.prompt.prompting import (
+    label_prompt_columns,
+    prompting,
+    Prompting,
+    render_prompt_columns,
+)
+from datalabs.prompt import compile_template
 
 
 class TopicClassificationPrompting(Prompting, DatasetOperation):
@@ -43,7 +51,17 @@ class TopicClassificationPrompting(Prompting, DatasetOperation):
         Returns
         Transformed Text
         """
-        return self.func(sample, labels_to_answers, **self.resources)
+        return self.func(sample, labels_to_answers, **self.load_resources())
+
+    def apply_batch(self, samples: pa.StructArray, labels_to_answers) -> Dict[str, Any]:
+        """
+        Parameters
+        samples: processed fields of a batch of samples
+
+        Returns
+        Dict of output columns, one value per sample
+        """
+        return self.batch_func(samples, labels_to_answers, **self.load_resources())
 
 
 class topic_classification_prompting(prompting, dataset_operation):
@@ -113,6 +131,9 @@ print(next(res))
 """
 
 
+TEMPLATE_TC1 = "Given the text: {text}, is it about {texture_choices}"
+
+
 @topic_classification_prompting(
     name="template_tc1",
     contributor="datalab",
@@ -123,21 +144,37 @@ print(next(res))
     processed_fields=["text", "label"],
 )
 def template_tc1(sample: dict, labels_to_answers: Dict):
-    tp1 = "Given the text: {text}, is it about {texture_choices}"
-
     # prompting process
     answers = list(labels_to_answers.values())
-    text = sample["text"]  # noqa
-    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"  # noqa
+    text = sample["text"]
+    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp1))
+    text_prompt = compile_template(TEMPLATE_TC1).render(
+        {"text": text, "texture_choices": texture_choices}
+    )
 
     label_prompt = labels_to_answers[sample["label"]]
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
 
 
+@template_tc1.batched
+def _batch_template_tc1(samples: pa.StructArray, labels_to_answers: Dict):
+    answers = list(labels_to_answers.values())
+    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"
+
+    text_prompt = render_prompt_columns(
+        TEMPLATE_TC1, samples, texture_choices=texture_choices
+    )
+    label_prompt = label_prompt_columns(samples.field("label"), labels_to_answers)
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+TEMPLATE_TC2 = "Given the text: {text}, it is about [mask]"
+
+
 @topic_classification_prompting(
     name="template_tc2",
     contributor="datalab",
@@ -147,19 +184,31 @@ def template_tc1(sample: dict, labels_to_answers: Dict):
     processed_fields=["text", "label"],
 )
 def template_tc2(sample: dict, labels_to_answers: Dict):
-    tp = "Given the text: {text}, it is about [mask]"
-
     # prompting process
-    text = sample["text"]  # noqa
+    text = sample["text"]
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp))
+    text_prompt = compile_template(TEMPLATE_TC2).render({"text": text})
 
     label_prompt = labels_to_answers[sample["label"]]
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
 
 
+@template_tc2.batched
+def _batch_template_tc2(samples: pa.StructArray, labels_to_answers: Dict):
+    text_prompt = render_prompt_columns(TEMPLATE_TC2, samples)
+    label_prompt = label_prompt_columns(samples.field("label"), labels_to_answers)
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+TEMPLATE_TC3 = (
+    "Given the text: {text} Classify this text. You may "
+    "choose from {texture_choices}."
+)
+
+
 @topic_classification_prompting(
     name="template_tc3",
     contributor="datalab",
@@ -171,24 +220,40 @@ def template_tc2(sample: dict, labels_to_answers: Dict):
     processed_fields=["text", "label"],
 )
 def template_tc3(sample: dict, labels_to_answers: Dict):
-    tp = (
-        "Given the text: {text} Classify this text. You may "
-        "choose from {texture_choices}."
-    )
-
     # prompting process
-    text = sample["text"]  # noqa
+    text = sample["text"]
     answers = list(labels_to_answers.values())
-    texture_choices = ", ".join(answers)  # noqa
+    texture_choices = ", ".join(answers)
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp))
+    text_prompt = compile_template(TEMPLATE_TC3).render(
+        {"text": text, "texture_choices": texture_choices}
+    )
 
     label_prompt = labels_to_answers[sample["label"]]
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
 
 
+@template_tc3.batched
+def _batch_template_tc3(samples: pa.StructArray, labels_to_answers: Dict):
+    answers = list(labels_to_answers.values())
+    texture_choices = ", ".join(answers)
+
+    text_prompt = render_prompt_columns(
+        TEMPLATE_TC3, samples, texture_choices=texture_choices
+    )
+    label_prompt = label_prompt_columns(samples.field("label"), labels_to_answers)
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+TEMPLATE_TC4 = (
+    "Given the text: {text} Given a list of categories: "
+    "{texture_choices}, what category does the paragraph belong to?"
+)
+
+
 @topic_classification_prompting(
     name="template_tc4",
     contributor="datalab",
@@ -201,24 +266,40 @@ def template_tc3(sample: dict, labels_to_answers: Dict):
     processed_fields=["text", "label"],
 )
 def template_tc4(sample: dict, labels_to_answers: Dict):
-    tp = (
-        "Given the text: {text} Given a list of categories: "
-        "{texture_choices}, what category does the paragraph belong to?"
-    )
-
     # prompting process
-    text = sample["text"]  # noqa
+    text = sample["text"]
     answers = list(labels_to_answers.values())
-    texture_choices = ", ".join(answers)  # noqa
+    texture_choices = ", ".join(answers)
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp))
+    text_prompt = compile_template(TEMPLATE_TC4).render(
+        {"text": text, "texture_choices": texture_choices}
+    )
 
     label_prompt = labels_to_answers[sample["label"]]
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
 
 
+@template_tc4.batched
+def _batch_template_tc4(samples: pa.StructArray, labels_to_answers: Dict):
+    answers = list(labels_to_answers.values())
+    texture_choices = ", ".join(answers)
+
+    text_prompt = render_prompt_columns(
+        TEMPLATE_TC4, samples, texture_choices=texture_choices
+    )
+    label_prompt = label_prompt_columns(samples.field("label"), labels_to_answers)
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+TEMPLATE_TC5 = (
+    "Given the text: {text} Pick one category for the previous "
+    "text. The options are {texture_choices}."
+)
+
+
 @topic_classification_prompting(
     name="template_tc5",
     contributor="datalab",
@@ -230,24 +311,40 @@ def template_tc4(sample: dict, labels_to_answers: Dict):
     processed_fields=["text", "label"],
 )
 def template_tc5(sample: dict, labels_to_answers: Dict):
-    tp = (
-        "Given the text: {text} Pick one category for the previous "
-        "text. The options are {texture_choices}."
-    )
-
     # prompting process
-    text = sample["text"]  # noqa
+    text = sample["text"]
     answers = list(labels_to_answers.values())
-    texture_choices = ", ".join(answers)  # noqa
+    texture_choices = ", ".join(answers)
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp))
+    text_prompt = compile_template(TEMPLATE_TC5).render(
+        {"text": text, "texture_choices": texture_choices}
+    )
 
     label_prompt = labels_to_answers[sample["label"]]
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
 
 
+@template_tc5.batched
+def _batch_template_tc5(samples: pa.StructArray, labels_to_answers: Dict):
+    answers = list(labels_to_answers.values())
+    texture_choices = ", ".join(answers)
+
+    text_prompt = render_prompt_columns(
+        TEMPLATE_TC5, samples, texture_choices=texture_choices
+    )
+    label_prompt = label_prompt_columns(samples.field("label"), labels_to_answers)
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+TEMPLATE_TC6 = (
+    "Given the text: {text} Can you identify the category of"
+    " this text? {texture_choices}"
+)
+
+
 @topic_classification_prompting(
     name="template_tc6",
     contributor="datalab",
@@ -259,24 +356,40 @@ def template_tc5(sample: dict, labels_to_answers: Dict):
     processed_fields=["text", "label"],
 )
 def template_tc6(sample: dict, labels_to_answers: Dict):
-    tp = (
-        "Given the text: {text} Can you identify the category of"
-        " this text? {texture_choices}"
-    )
-
     # prompting process
-    text = sample["text"]  # noqa
+    text = sample["text"]
     answers = list(labels_to_answers.values())
-    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"  # noqa
+    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp))
+    text_prompt = compile_template(TEMPLATE_TC6).render(
+        {"text": text, "texture_choices": texture_choices}
+    )
 
     label_prompt = labels_to_answers[sample["label"]]
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
 
 
+@template_tc6.batched
+def _batch_template_tc6(samples: pa.StructArray, labels_to_answers: Dict):
+    answers = list(labels_to_answers.values())
+    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"
+
+    text_prompt = render_prompt_columns(
+        TEMPLATE_TC6, samples, texture_choices=texture_choices
+    )
+    label_prompt = label_prompt_columns(samples.field("label"), labels_to_answers)
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+TEMPLATE_TC7 = (
+    "Given the text: {text} What's the main topic of this"
+    " paragraph? {texture_choices}"
+)
+
+
 @topic_classification_prompting(
     name="template_tc7",
     contributor="datalab",
@@ -288,24 +401,39 @@ def template_tc6(sample: dict, labels_to_answers: Dict):
     processed_fields=["text", "label"],
 )
 def template_tc7(sample: dict, labels_to_answers: Dict):
-    tp = (
-        "Given the text: {text} What\\'s the main topic of this"
-        " paragraph? {texture_choices}"
-    )
-
     # prompting process
-    text = sample["text"]  # noqa
+    text = sample["text"]
     answers = list(labels_to_answers.values())
-    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"  # noqa
+    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp))
+    text_prompt = compile_template(TEMPLATE_TC7).render(
+        {"text": text, "texture_choices": texture_choices}
+    )
 
     label_prompt = labels_to_answers[sample["label"]]
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
 
 
+@template_tc7.batched
+def _batch_template_tc7(samples: pa.StructArray, labels_to_answers: Dict):
+    answers = list(labels_to_answers.values())
+    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"
+
+    text_prompt = render_prompt_columns(
+        TEMPLATE_TC7, samples, texture_choices=texture_choices
+    )
+    label_prompt = label_prompt_columns(samples.field("label"), labels_to_answers)
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+TEMPLATE_TC8 = (
+    "Given the text: {text} Is this a piece of text regarding {texture_choices}"
+)
+
+
 @topic_classification_prompting(
     name="template_tc8",
     contributor="datalab",
@@ -317,16 +445,29 @@ def template_tc7(sample: dict, labels_to_answers: Dict):
     processed_fields=["text", "label"],
 )
 def template_tc8(sample: dict, labels_to_answers: Dict):
-    tp = "Given the text: {text} Is this a piece of text regarding {texture_choices}"
-
     # prompting process
-    text = sample["text"]  # noqa
+    text = sample["text"]
     answers = list(labels_to_answers.values())
-    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"  # noqa
+    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"
 
     # instantiation
-    text_prompt = eval("f'{}'".format(tp))
+    text_prompt = compile_template(TEMPLATE_TC8).render(
+        {"text": text, "texture_choices": texture_choices}
+    )
 
     label_prompt = labels_to_answers[sample["label"]]
 
     return {"text_prompt": text_prompt, "label_prompt": label_prompt}
+
+
+@template_tc8.batched
+def _batch_template_tc8(samples: pa.StructArray, labels_to_answers: Dict):
+    answers = list(labels_to_answers.values())
+    texture_choices = ", ".join(answers[:-1]) + " or " + answers[-1] + "?"
+
+    text_prompt = render_prompt_columns(
+        TEMPLATE_TC8, samples, texture_choices=texture_choices
+    )
+    label_prompt = label_prompt_columns(samples.field("label"), labels_to_answers)
+
+    return {"text_prompt": text_prompt, "label_prompt": label_prompt}
@@ -0,0 +1,85 @@
+"""Lazy registry of the operations of the operation packages.
+
+The operation packages (``featurize``, ``edit``, ``prompt``, ...) depend on
+heavy libraries (spacy, nltk, checklist, sklearn, ...) and load resources when
+their modules are imported. Instead of importing all their modules, a package
+declares which module defines each of its operations:
+
+    __getattr__, __dir__, __all__ = lazy_package(
+        __name__, {"general": ["get_length", "get_basic_words"]}
+    )
+
+and an operation, with the dependencies of its module, is only imported the
+first time it's accessed, e.g. with ``from datalabs.operations.featurize
+import get_length``.
+"""
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple
+
+# package name -> {operation name -> module name}
+_PACKAGES: Dict[str, Dict[str, str]] = {}
+
+
+def _import_module(package_name: str, module_name: str):
+    return importlib.import_module(f"{package_name}.{module_name}")
+
+
+def lazy_package(
+    package_name: str, import_structure: Dict[str, List[str]]
+) -> Tuple[Callable[[str], object], Callable[[], List[str]], List[str]]:
+    """
+    The module-level ``__getattr__``, ``__dir__`` and ``__all__`` of a package
+    exporting the names of `import_structure` (module name -> names) lazily.
+
+    If several modules export the same name, the last one wins, as with
+    successive ``from .module import *``. Other public names of the modules
+    are still resolved, by importing the modules in reverse order.
+    """
+    names = {
+        name: module_name
+        for module_name, module_names in import_structure.items()
+        for name in module_names
+    }
+    _PACKAGES[package_name] = names
+    submodules = {module_name.split(".")[0] for module_name in import_structure}
+
+    def __getattr__(name: str):
+        if name.startswith("_"):
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        if name in names:
+            value = getattr(_import_module(package_name, names[name]), name)
+        elif name in submodules:
+            return _import_module(package_name, name)
+        else:
+            for module_name in reversed(list(import_structure)):
+                module = _import_module(package_name, module_name)
+                if hasattr(module, name):
+                    value = getattr(module, name)
+                    break
+            else:
+                raise AttributeError(
+                    f"module {package_name!r} has no attribute {name!r}"
+                )
+        # the next accesses don't go through __getattr__
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package_name])) | set(names))
+
+    return __getattr__, __dir__, sorted(names)
+
+
+def get_operation(name: str, package_name: str = None):
+    """The operation `name` of a package, or of the first imported package
+    exporting it, or of the operation catalog, importing its module on demand"""
+    if package_name is not None:
+        return getattr(importlib.import_module(package_name), name)
+    for package_name, names in _PACKAGES.items():
+        if name in names:
+            return getattr(sys.modules[package_name], name)
+    # operations not exported by their package, e.g. the edit plugins
+    from datalabs.operations.catalog import find_operation, load_operation
+
+    return load_operation(find_operation(name))
@@ -0,0 +1,266 @@
+from collections import OrderedDict
+from functools import partial
+import os
+import time
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional
+
+from datalabs import config
+from datalabs.utils import logging
+
+logger = logging.get_logger(__name__)
+
+
+def _current_rss() -> int:
+    """
+    Resident set size of the current process in bytes, 0 if it can't be read
+    """
+    try:
+        with open("/proc/self/statm", "r") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+class ResourceRegistry:
+    """Process-wide registry of the heavy resources (spacy models, nltk
+    corpora, dictionaries read from resource files, ...) used by operations.
+
+    A resource is registered by name together with a loader, and is only
+    loaded the first time it is requested. It is then shared by all the
+    operations (and all the calls) that use it in the process. The registry
+    also keeps track of the memory each resource took when it was loaded.
+
+    This should be used in a singleton fashion, through `resource_registry`.
+    """
+
+    _loaders: Dict[str, Callable[[], Any]] = {}
+    _resources: Dict[str, Any] = {}
+    _nbytes: Dict[str, int] = {}
+
+    def register(self, name: str, loader: Callable[[], Any]):
+        """
+        registers the loader of a resource, the resource itself is loaded lazily
+        Parameter:
+          - name: name of the resource, e.g. spacy/en_core_web_sm
+          - loader: function without arguments returning the resource
+        """
+        self._loaders[name] = loader
+
+    def is_registered(self, name: str) -> bool:
+        return name in self._loaders
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._resources
+
+    def get(self, name: str) -> Any:
+        """
+        loads a resource if it's not in memory and returns it
+        """
+        if name not in self._resources:
+            if name not in self._loaders:
+                raise KeyError(f"resource {name} is not registered")
+            rss_before = _current_rss()
+            start = time.time()
+            self._resources[name] = self._loaders[name]()
+            self._nbytes[name] = max(_current_rss() - rss_before, 0)
+            logger.info(
+                f"Loaded resource {name} in {time.time() - start:.2f}s "
+                f"({self._nbytes[name] / 2 ** 20:.1f} MiB)"
+            )
+        return self._resources[name]
+
+    def warm_up(self, names: Iterable[str]):
+        """
+        loads a set of resources in advance, e.g. in the initializer of the
+        worker processes of a pool
+        """
+        for name in names:
+            self.get(name)
+
+    def unload(self, name: str):
+        self._resources.pop(name, None)
+        self._nbytes.pop(name, None)
+
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        returns the number of bytes (increase of the resident memory of the
+        process) each loaded resource took when it was loaded
+        """
+        return dict(self._nbytes)
+
+
+# singleton registry to keep one copy of each resource per process
+resource_registry = ResourceRegistry()
+
+
+class SharedResource:
+    """Declares, in the `resources` of an operation, a resource that is
+    provided by `resource_registry`. It is replaced by the loaded resource
+    when the operation is called, so only its name (and loader) is pickled
+    when the operation is sent to another process."""
+
+    def __init__(self, name: str, loader: Optional[Callable[[], Any]] = None):
+        self.name = name
+        self.loader = loader
+        if loader is not None and not resource_registry.is_registered(name):
+            resource_registry.register(name, loader)
+
+    def load(self) -> Any:
+        if self.loader is not None and not resource_registry.is_registered(self.name):
+            # e.g. in a spawned worker process
+            resource_registry.register(self.name, self.loader)
+        return resource_registry.get(self.name)
+
+    def __eq__(self, other):
+        return isinstance(other, SharedResource) and other.name == self.name
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __repr__(self):
+        return f"SharedResource({self.name!r})"
+
+
+def _load_spacy_model(name: str):
+    from datalabs.utils.spacy_loader import spacy_loader
+
+    return spacy_loader.get_model(name)
+
+
+def _load_nltk_corpus(name: str):
+    import nltk
+
+    try:
+        nltk.data.find(f"corpora/{name}")
+    except LookupError:
+        nltk.download(name)
+    return getattr(nltk.corpus, name)
+
+
+class SpacyDocCache:
+    """LRU cache of the documents parsed by `SpacyModel.pipe`, so that chained
+    spacy-based operations over the same texts reuse the parse results.
+
+    A document is stored with the set of pipeline components that were enabled
+    when it was parsed, and is only reused by operations that don't need
+    other components.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._docs: OrderedDict = OrderedDict()
+
+    def get(self, model_name: str, text: str, components: FrozenSet[str]):
+        key = (model_name, text)
+        if key not in self._docs:
+            return None
+        enabled, doc = self._docs[key]
+        if not components <= enabled:
+            return None
+        self._docs.move_to_end(key)
+        return doc
+
+    def put(self, model_name: str, text: str, components: FrozenSet[str], doc):
+        key = (model_name, text)
+        if key in self._docs and not self._docs[key][0] <= components:
+            return
+        self._docs[key] = (components, doc)
+        self._docs.move_to_end(key)
+        while len(self._docs) > self.max_size:
+            self._docs.popitem(last=False)
+
+    def clear(self):
+        self._docs.clear()
+
+
+spacy_doc_cache = SpacyDocCache(config.SPACY_DOC_CACHE_SIZE)
+
+
+class SpacyModel(SharedResource):
+    """Shared resource of a spacy model.
+
+    Operations declaring it are run in a streaming fashion by
+    `Dataset.apply`: the texts of a whole batch are parsed with
+    `nlp.pipe(texts, batch_size=..., n_process=...)`, with the pipeline
+    components the operation doesn't need disabled, and the operation then
+    receives a `PipedLanguage` returning these documents.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        disable: Iterable[str] = (),
+        batch_size: int = 256,
+        n_process: int = 1,
+    ):
+        super().__init__(f"spacy/{name}", partial(_load_spacy_model, name))
+        self.disable = list(disable)
+        self.batch_size = batch_size
+        self.n_process = n_process
+
+    def pipe(self, texts: List[str]) -> List[Any]:
+        """
+        parses `texts`, reusing the documents of `spacy_doc_cache` when possible
+        """
+        nlp = self.load()
+        disable = [name for name in self.disable if name in nlp.pipe_names]
+        components = frozenset(nlp.pipe_names) - frozenset(disable)
+
+        docs = [spacy_doc_cache.get(self.name, text, components) for text in texts]
+        missing = [index for index, doc in enumerate(docs) if doc is None]
+        parsed_docs = nlp.pipe(
+            [texts[index] for index in missing],
+            batch_size=self.batch_size,
+            n_process=self.n_process,
+            disable=disable,
+        )
+        for index, doc in zip(missing, parsed_docs):
+            docs[index] = doc
+            spacy_doc_cache.put(self.name, texts[index], components, doc)
+        return docs
+
+    def __repr__(self):
+        return f"SpacyModel({self.name!r}, disable={self.disable!r})"
+
+
+class PipedLanguage:
+    """Stands for the spacy `Language` of an operation whose input texts were
+    parsed in advance with `SpacyModel.pipe`: calling it on one of these texts
+    returns its parsed document, other texts are parsed by the model."""
+
+    def __init__(self, nlp, docs: Dict[str, Any]):
+        self.nlp = nlp
+        self.docs = docs
+
+    def __call__(self, text: str, *args, **kwargs):
+        if text in self.docs and not args and not kwargs:
+            return self.docs[text]
+        return self.nlp(text, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.nlp, name)
+
+
+def spacy_model(
+    name: str = "en_core_web_sm",
+    disable: Iterable[str] = (),
+    batch_size: int = 256,
+    n_process: int = 1,
+) -> SpacyModel:
+    """
+    shared resource of a spacy model, loaded once per process
+    Parameter:
+      - name: any valid identifier for `spacy.load()`, e.g. en_core_web_sm
+      - disable: pipeline components the operation doesn't need, e.g. ["ner"]
+      - batch_size, n_process: parameters of `nlp.pipe` when the operation is
+        applied to a dataset
+    """
+    return SpacyModel(name, disable=disable, batch_size=batch_size, n_process=n_process)
+
+
+def nltk_corpus(name: str) -> SharedResource:
+    """
+    shared resource of a nltk corpus reader (e.g. wordnet), the corpus is only
+    downloaded if it can't be found locally
+    """
+    return SharedResource(f"nltk/{name}", partial(_load_nltk_corpus, name))
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import abc
-from functools import lru_cache
-from typing import List, Optional
+from typing import Callable, List, Optional
 
-import jieba
+import pyarrow as pa
+import pyarrow.compute as pc
 
 tokenizer_registry = {}
 
@@ -53,6 +53,15 @@ class Tokenizer:
         """
         ...
 
+    def batch(self, texts: pa.Array) -> pa.ListArray:
+        """
+        tokenizes a batch of texts into a `list<string>` array
+        """
+        return pa.array(
+            [None if text is None else self(text) for text in texts.to_pylist()],
+            pa.list_(pa.string()),
+        )
+
 
 @register_tokenizer("SingleSpaceTokenizer")
 class SingleSpaceTokenizer(Tokenizer):
@@ -60,10 +69,13 @@ class SingleSpaceTokenizer(Tokenizer):
     Tokenize a string based on the space
     """
 
-    @lru_cache(maxsize=20)
     def __call__(self, text: str) -> List[str]:
         return text.split(" ")
 
+    def batch(self, texts: pa.Array) -> pa.ListArray:
+        # columnar equivalent of `text.split(" ")`
+        return pc.split_pattern(texts, pattern=" ")
+
 
 @register_tokenizer("JiebaTokenizer")
 class JiebaTokenizer(Tokenizer):
@@ -71,7 +83,69 @@ class JiebaTokenizer(Tokenizer):
     Tokenizer a string using Jieba segmentor
     """
 
-    @lru_cache(maxsize=20)
     def __call__(self, text: str) -> List[str]:
+        import jieba
+
         # TODO(Pengfei): this should be optimized
         return [w for w in jieba.cut(text, cut_all=False)]
+
+
+def token_column_name(field: str, tokenizer_name: str) -> str:
+    """
+    name of the column of the tokens of `field`, see `Dataset.tokenize`
+    """
+    return f"{field}_{tokenizer_name}_tokens"
+
+
+def consumes_tokens(
+    tokenizer_name: str = "SingleSpaceTokenizer",
+) -> Callable[[Callable], Callable]:
+    """
+    Declares that the function of an operation takes the tokens of its
+    processed field instead of its text, e.g.:
+
+        @featurizing(name="get_length", ...)
+        @consumes_tokens("SingleSpaceTokenizer")
+        def get_length(tokens: List[str]):
+            return {"length": len(tokens)}
+
+    The tokens are read from the token column of the dataset if it was
+    tokenized (see `Dataset.tokenize`), or computed once per batch otherwise.
+    The batched function of the operation gets a `list<string>` array.
+    Calling the operation on a text still works, the text is tokenized first.
+    """
+    if tokenizer_name not in tokenizer_registry:
+        raise ValueError(f"{tokenizer_name} is not supported")
+
+    def mark(func: Callable) -> Callable:
+        func.tokenizer_name = tokenizer_name
+        return func
+
+    return mark
+
+
+def _tokenize(text: str, tokenizer_name: str):
+    return {"tokens": get_tokenizer(tokenizer_name)(text)}
+
+
+def _batch_tokenize(texts: pa.Array, tokenizer_name: str):
+    return {"tokens": get_tokenizer(tokenizer_name).batch(texts)}
+
+
+def tokenization(field: str = "text", tokenizer_name: str = "SingleSpaceTokenizer"):
+    """
+    operation generating the tokens of `field`, named `tokens`
+    """
+    from datalabs.operations.operation import OperationFunction
+
+    if tokenizer_name not in tokenizer_registry:
+        raise ValueError(f"{tokenizer_name} is not supported")
+    operation = OperationFunction(
+        name="tokenize",
+        func=_tokenize,
+        resources={"tokenizer_name": tokenizer_name},
+        processed_fields=[field],
+        description=f"Tokenize a text with {tokenizer_name}",
+    )
+    operation.batched(_batch_tokenize)
+    return operation
@@ -1,8 +1,12 @@
 from dataclasses import dataclass
+from functools import lru_cache
 import hashlib  # for mdb ids of prompts
 import json
-from typing import List, Optional
+import re
+from typing import Any, List, Mapping, Optional, Union
 
+import pyarrow as pa
+import pyarrow.compute as pc
 import requests
 
 
@@ -93,3 +97,96 @@ class Prompts:
         # for dic in dics:
         #     prompts.append(Prompt(**dic))
         return prompts
+
+
+# slots of the templates, e.g. "Given the text: {text}" (format syntax) or
+# "{{text}} ||| {{answers[label]}}" (the syntax of the prompts of dataset infos)
+SLOT_PATTERNS = {
+    "format": re.compile(r"\{(\w+)\}"),
+    "jinja": re.compile(r"\{\{(.*?)\}\}"),
+}
+
+
+class PromptTemplate:
+    """A prompt template parsed once into a plan of literal and slot segments.
+
+    Rendering a template only concatenates the literals with the values of the
+    slots: nothing is evaluated, and the template is never searched again. A
+    template can be rendered for a single sample with :meth:`render`, or for
+    whole columns at once with :meth:`render_columns`.
+
+    Example:
+
+        >>> template = PromptTemplate("Given the text: {text}, is it {choices}")
+        >>> template.slots
+        ['text', 'choices']
+        >>> template.render({"text": "I love it", "choices": "good or bad?"})
+        'Given the text: I love it, is it good or bad?'
+    """
+
+    def __init__(self, template: str, syntax: str = "format"):
+        if syntax not in SLOT_PATTERNS:
+            raise ValueError(
+                f"Unknown template syntax {syntax}, "
+                f"expected one of {list(SLOT_PATTERNS)}"
+            )
+        self.template = template
+        self.syntax = syntax
+        # (is_slot, literal or slot name)
+        self.segments = []
+        start = 0
+        for match in SLOT_PATTERNS[syntax].finditer(template):
+            if match.start() > start:
+                self.segments.append((False, template[start : match.start()]))
+            self.segments.append((True, match.group(1).strip()))
+            start = match.end()
+        if start < len(template):
+            self.segments.append((False, template[start:]))
+        self.slots = list(
+            dict.fromkeys(value for is_slot, value in self.segments if is_slot)
+        )
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        """Instantiate the template with the values of its slots."""
+        return "".join(
+            str(values[value]) if is_slot else value for is_slot, value in self.segments
+        )
+
+    def render_columns(
+        self,
+        columns: Mapping[str, Union[pa.Array, pa.ChunkedArray, str]],
+        num_rows: int,
+    ) -> pa.Array:
+        """Instantiate the template for ``num_rows`` samples at once.
+
+        Args:
+            columns: the value of each slot, either an Arrow array with one
+                value per sample or a string shared by all the samples
+            num_rows: the number of samples
+
+        Returns:
+            :obj:`pyarrow.Array`: the rendered prompts
+        """
+        parts = []
+        for is_slot, value in self.segments:
+            if not is_slot:
+                parts.append(pa.scalar(value, pa.string()))
+                continue
+            column = columns[value]
+            if isinstance(column, str):
+                parts.append(pa.scalar(column, pa.string()))
+                continue
+            if isinstance(column, pa.ChunkedArray):
+                column = column.combine_chunks()
+            if not pa.types.is_string(column.type):
+                column = pc.cast(column, pa.string())
+            parts.append(column)
+        # scalars are broadcast along the arrays, there must be one of them
+        parts.append(pa.array([""] * num_rows, pa.string()))
+        return pc.binary_join_element_wise(*parts, "")
+
+
+@lru_cache(maxsize=1024)
+def compile_template(template: str, syntax: str = "format") -> PromptTemplate:
+    """Parse ``template`` into a :class:`PromptTemplate`, once per template."""
+    return PromptTemplate(template, syntax=syntax)
@@ -11,16 +11,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import Counter
 import importlib.util
+import json
 import os
 from pathlib import PurePath
+import re
 import tempfile
-from typing import Dict, List, NamedTuple, Optional, TYPE_CHECKING, Union
+from typing import Callable, Dict, List, NamedTuple, Optional, TYPE_CHECKING, Union
 
 import numpy as np
 
 from datalabs import utils
 from datalabs.utils import logging
+from datalabs.utils.minhash import (
+    band_keys,
+    connected_components,
+    lsh_params,
+    MinHasher,
+)
 
 if TYPE_CHECKING:
     from datalabs.arrow_dataset import Dataset  # noqa: F401
@@ -469,6 +478,382 @@ class FaissIndex(BaseIndex):
         return faiss_index
 
 
+def bm25_tokenize(text: str) -> List[str]:
+    """Default tokenizer of `BM25Index`: lower-cased alphanumeric words"""
+    return re.findall(r"\w+", text.lower())
+
+
+class BM25Index(BaseIndex):
+    """
+    Sparse index scoring documents with BM25, in-process and without any
+    external service (see `ElasticSearchIndex` for an index using an
+    Elasticsearch cluster).
+
+    The index is an inverted index stored as a CSR matrix of shape
+    (vocabulary size, number of documents), holding for each term the BM25
+    weight of the term in each document containing it. Scoring queries is then
+    a sparse matrix product between the term counts of the queries and this
+    matrix. The weights are the ones of Lucene/Elasticsearch:
+    `idf * tf / (tf + k1 * (1 - b + b * doc_len / avg_doc_len))` with
+    `idf = log(1 + (N - df + 0.5) / (df + 0.5))`.
+    """
+
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        tokenizer: Optional[Callable[[str], List[str]]] = None,
+    ):
+        """
+        Create a BM25 index. `tokenizer` splits a document or a query into
+        terms, by default into lower-cased alphanumeric words.
+        """
+        self.k1 = k1
+        self.b = b
+        self.tokenizer = tokenizer if tokenizer is not None else bm25_tokenize
+        self.vocab: Dict[str, int] = {}
+        self.matrix = None
+
+    def add_documents(
+        self,
+        documents: Union[List[str], "Dataset"],
+        column: Optional[str] = None,
+        batch_size: int = 1000,
+    ):
+        """
+        Build the index from documents.
+        If the documents are inside a certain column, you can specify
+        it using the `column` argument.
+        """
+        from scipy import sparse
+
+        vocab = {}
+        term_ids, doc_ids, term_counts = [], [], []
+        logger.info(f"Adding {len(documents)} documents to the BM25 index")
+        for i in utils.tqdm(
+            range(0, len(documents), batch_size),
+            disable=bool(logging.get_verbosity() >= logging.WARNING),
+        ):
+            texts = (
+                documents[i : i + batch_size]
+                if column is None
+                else documents[i : i + batch_size][column]
+            )
+            for doc_id, text in enumerate(texts, start=i):
+                counts = Counter(self.tokenizer(text or ""))
+                for term, count in counts.items():
+                    term_ids.append(vocab.setdefault(term, len(vocab)))
+                    term_counts.append(count)
+                doc_ids.extend([doc_id] * len(counts))
+
+        n_docs = len(documents)
+        term_ids = np.array(term_ids, dtype=np.int64)
+        doc_ids = np.array(doc_ids, dtype=np.int64)
+        term_counts = np.array(term_counts, dtype=np.float32)
+        doc_lens = np.bincount(doc_ids, weights=term_counts, minlength=n_docs)
+        avg_doc_len = max(doc_lens.mean(), 1e-9) if n_docs > 0 else 1.0
+        doc_freqs = np.bincount(term_ids, minlength=len(vocab))
+        idf = np.log1p((n_docs - doc_freqs + 0.5) / (doc_freqs + 0.5))
+        weights = (
+            idf[term_ids]
+            * term_counts
+            / (
+                term_counts
+                + self.k1 * (1 - self.b + self.b * doc_lens[doc_ids] / avg_doc_len)
+            )
+        ).astype(np.float32)
+        self.vocab = vocab
+        self.matrix = sparse.csr_matrix(
+            (weights, (term_ids, doc_ids)), shape=(len(vocab), n_docs)
+        )
+        logger.info(f"Indexed {n_docs:d} documents, {len(vocab)} terms")
+
+    def _queries_matrix(self, queries: List[str]):
+        from scipy import sparse
+
+        term_ids, query_ids = [], []
+        for query_id, query in enumerate(queries):
+            for term in self.tokenizer(query):
+                if term in self.vocab:
+                    term_ids.append(self.vocab[term])
+                    query_ids.append(query_id)
+        return sparse.csr_matrix(
+            (np.ones(len(term_ids), dtype=np.float32), (query_ids, term_ids)),
+            shape=(len(queries), len(self.vocab)),
+        )
+
+    def search(self, query: str, k=10) -> SearchResults:
+        """Find the nearest examples indices to the query.
+
+        Args:
+            query (`str`): The query as a string.
+            k (`int`): The number of examples to retrieve.
+
+        Ouput:
+            scores (`List[List[float]`): The retrieval scores of the retrieved examples.
+            indices (`List[List[int]]`): The indices of the retrieved examples.
+        """
+        total_scores, total_indices = self.search_batch([query], k)
+        return SearchResults(total_scores[0], total_indices[0])
+
+    def search_batch(
+        self, queries: List[str], k: int = 10, batch_size: int = 1000
+    ) -> BatchedSearchResults:
+        """Find the nearest examples indices to the queries.
+
+        The queries are scored `batch_size` at a time, with a sparse matrix
+        product. Only the documents sharing at least one term with a query are
+        retrieved, so that there may be less than `k` of them.
+
+        Args:
+            queries (`List[str]`): The queries as a list of strings.
+            k (`int`): The number of examples to retrieve per query.
+            batch_size (`int`): The number of queries scored at once.
+
+        Ouput:
+            total_scores (`List[List[float]`): The retrieval scores of the
+            retrieved examples per query.
+            total_indices (`List[List[int]]`): The indices of the retrieved
+            examples per query.
+        """
+        total_scores, total_indices = [], []
+        for i in range(0, len(queries), batch_size):
+            scores = self._queries_matrix(queries[i : i + batch_size]) @ self.matrix
+            for row in range(scores.shape[0]):
+                start, end = scores.indptr[row], scores.indptr[row + 1]
+                row_scores, row_indices = (
+                    scores.data[start:end],
+                    scores.indices[start:end],
+                )
+                if len(row_scores) > k:
+                    # the k-th best score, all the documents tied with it are
+                    # kept so that the lowest indices win the ties
+                    kth_score = -np.partition(-row_scores, k - 1)[k - 1]
+                    top = np.flatnonzero(row_scores >= kth_score)
+                    row_scores, row_indices = row_scores[top], row_indices[top]
+                # by decreasing score, then increasing index
+                order = np.lexsort((row_indices, -row_scores))[:k]
+                total_scores.append(row_scores[order].tolist())
+                total_indices.append(row_indices[order].astype(int).tolist())
+        return BatchedSearchResults(total_scores, total_indices)
+
+    def save(self, file: Union[str, PurePath]):
+        """Serialize the BM25Index on disk, as a directory of .npy files"""
+        os.makedirs(file, exist_ok=True)
+        for name in ["data", "indices", "indptr"]:
+            np.save(os.path.join(file, f"{name}.npy"), getattr(self.matrix, name))
+        with open(os.path.join(file, "bm25_index.json"), "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "k1": self.k1,
+                    "b": self.b,
+                    "num_documents": self.matrix.shape[1],
+                    "vocab": list(self.vocab),
+                },
+                f,
+            )
+
+    @classmethod
+    def load(
+        cls,
+        file: Union[str, PurePath],
+        tokenizer: Optional[Callable[[str], List[str]]] = None,
+    ) -> "BM25Index":
+        """Deserialize the BM25Index from disk. The arrays of the index are
+        memory-mapped. `tokenizer` must be the one used to build the index."""
+        from scipy import sparse
+
+        with open(os.path.join(file, "bm25_index.json"), encoding="utf-8") as f:
+            config = json.load(f)
+        bm25_index = cls(k1=config["k1"], b=config["b"], tokenizer=tokenizer)
+        bm25_index.vocab = {term: i for i, term in enumerate(config["vocab"])}
+        arrays = [
+            np.load(os.path.join(file, f"{name}.npy"), mmap_mode="r")
+            for name in ["data", "indices", "indptr"]
+        ]
+        bm25_index.matrix = sparse.csr_matrix(
+            tuple(arrays),
+            shape=(len(bm25_index.vocab), config["num_documents"]),
+            copy=False,
+        )
+        return bm25_index
+
+
+class MinHashLSHIndex(BaseIndex):
+    """
+    Near-duplicate index of texts using MinHash signatures and LSH banding
+    (see `datalabs.utils.minhash`). Two texts are candidate near-duplicates
+    when their signatures share a band, which happens with high probability
+    when the Jaccard similarity of their word n-grams is above `threshold`.
+
+    The index only keeps the band keys of the documents, as a (number of
+    documents, bands) matrix of uint64, and is built in a streaming pass over
+    batches of documents. The signatures can be read from a column computed
+    beforehand (e.g. with the `get_minhash` operation) instead of recomputed.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 128,
+        threshold: float = 0.8,
+        ngram_size: int = 3,
+        seed: int = 1,
+    ):
+        self.minhasher = MinHasher(num_perm=num_perm, ngram_size=ngram_size, seed=seed)
+        self.threshold = threshold
+        self.bands, self.rows = lsh_params(num_perm, threshold)
+        self.keys = None
+        self._sorted = None
+
+    def _batch_keys(self, documents, column, signature_column, batch_size):
+        for i in range(0, len(documents), batch_size):
+            if signature_column is not None:
+                signatures = np.asarray(
+                    documents[i : i + batch_size][signature_column], dtype=np.uint32
+                )
+            else:
+                texts = (
+                    documents[i : i + batch_size]
+                    if column is None
+                    else documents[i : i + batch_size][column]
+                )
+                signatures = self.minhasher.signatures(texts)
+            yield band_keys(signatures, self.bands, self.rows)
+
+    def add_documents(
+        self,
+        documents: Union[List[str], "Dataset"],
+        column: Optional[str] = None,
+        signature_column: Optional[str] = None,
+        batch_size: int = 1000,
+    ):
+        """
+        Build the index from documents.
+        If the documents are inside a certain column, you can specify
+        it using the `column` argument, or give the column of their MinHash
+        signatures with `signature_column`.
+        """
+        logger.info(f"Adding {len(documents)} documents to the MinHash LSH index")
+        self.keys = np.concatenate(
+            [
+                keys
+                for keys in utils.tqdm(
+                    self._batch_keys(documents, column, signature_column, batch_size),
+                    total=-(-len(documents) // batch_size),
+                    disable=bool(logging.get_verbosity() >= logging.WARNING),
+                )
+            ]
+            or [np.zeros((0, self.bands), dtype=np.uint64)]
+        )
+        self._sorted = None
+
+    @property
+    def sorted_keys(self):
+        """For each band, the order of the documents by key and the sorted keys"""
+        if self._sorted is None:
+            orders = np.argsort(self.keys, axis=0, kind="stable")
+            self._sorted = (orders, np.take_along_axis(self.keys, orders, axis=0))
+        return self._sorted
+
+    def _matching_bands(self, keys: np.ndarray) -> np.ndarray:
+        """For keys of shape (n, bands), whether each band matches a document"""
+        _, sorted_keys = self.sorted_keys
+        matches = np.zeros(keys.shape, dtype=bool)
+        if len(sorted_keys) == 0:
+            return matches
+        for band in range(self.bands):
+            positions = np.searchsorted(sorted_keys[:, band], keys[:, band])
+            positions = np.minimum(positions, len(sorted_keys) - 1)
+            matches[:, band] = sorted_keys[positions, band] == keys[:, band]
+        return matches
+
+    def search(self, query: str, k=10) -> SearchResults:
+        """Find the candidate near-duplicates of the query.
+
+        Args:
+            query (`str`): The query as a string.
+            k (`int`): The number of examples to retrieve.
+
+        Ouput:
+            scores (`List[List[float]`): The fraction of the bands shared with
+             the query, for each retrieved example.
+            indices (`List[List[int]]`): The indices of the retrieved examples.
+        """
+        orders, sorted_keys = self.sorted_keys
+        keys = band_keys(self.minhasher.signatures([query]), self.bands, self.rows)[0]
+        candidates = []
+        for band in range(self.bands):
+            start = np.searchsorted(sorted_keys[:, band], keys[band], side="left")
+            end = np.searchsorted(sorted_keys[:, band], keys[band], side="right")
+            candidates.append(orders[start:end, band])
+        indices, counts = np.unique(np.concatenate(candidates), return_counts=True)
+        top = np.lexsort((indices, -counts))[:k]
+        return SearchResults(
+            (counts[top] / self.bands).tolist(), indices[top].astype(int).tolist()
+        )
+
+    def duplicate_clusters(self) -> List[List[int]]:
+        """The clusters of candidate near-duplicate documents, as lists of
+        indices. Documents without any near-duplicate are left out."""
+        orders, sorted_keys = self.sorted_keys
+        edges = []
+        for band in range(self.bands):
+            same = np.flatnonzero(sorted_keys[1:, band] == sorted_keys[:-1, band])
+            edges.append(np.stack([orders[same, band], orders[same + 1, band]], axis=1))
+        edges = np.concatenate(edges) if len(edges) > 0 else np.zeros((0, 2), int)
+        return connected_components(len(self.keys), edges)
+
+    def leakage(
+        self,
+        documents: Union[List[str], "Dataset"],
+        column: Optional[str] = None,
+        signature_column: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> Dict:
+        """Find the documents (e.g. of a test split) having a candidate
+        near-duplicate in the index (e.g. built on a train split).
+
+        Ouput:
+            leakage_rate (`float`): The fraction of leaked documents.
+            leaked_indices (`List[int]`): The indices of the leaked documents.
+        """
+        leaked = [
+            self._matching_bands(keys).any(axis=1)
+            for keys in self._batch_keys(
+                documents, column, signature_column, batch_size
+            )
+        ]
+        leaked = np.concatenate(leaked) if len(leaked) > 0 else np.zeros(0, bool)
+        return {
+            "leakage_rate": float(leaked.mean()) if len(leaked) > 0 else 0.0,
+            "leaked_indices": np.flatnonzero(leaked).tolist(),
+        }
+
+    def save(self, file: Union[str, PurePath]):
+        """Serialize the MinHashLSHIndex on disk, as a directory of .npy files"""
+        os.makedirs(file, exist_ok=True)
+        np.save(os.path.join(file, "keys.npy"), self.keys)
+        with open(os.path.join(file, "minhash_index.json"), "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "num_perm": self.minhasher.num_perm,
+                    "threshold": self.threshold,
+                    "ngram_size": self.minhasher.ngram_size,
+                    "seed": self.minhasher.seed,
+                },
+                f,
+            )
+
+    @classmethod
+    def load(cls, file: Union[str, PurePath]) -> "MinHashLSHIndex":
+        """Deserialize the MinHashLSHIndex from disk. The band keys are
+        memory-mapped."""
+        with open(os.path.join(file, "minhash_index.json"), encoding="utf-8") as f:
+            minhash_index = cls(**json.load(f))
+        minhash_index.keys = np.load(os.path.join(file, "keys.npy"), mmap_mode="r")
+        return minhash_index
+
+
 class IndexableMixin:
     """Add indexing features to `datalab.Dataset`"""
 
@@ -488,8 +873,9 @@ class IndexableMixin:
         if not self.is_index_initialized(index_name):
             raise MissingIndex(
                 f"Index with index_name '{index_name}' not initialized yet."
-                f" Please make sure that you call `add_faiss_index` or"
-                f" `add_elasticsearch_index` first."
+                f" Please make sure that you call `add_faiss_index`,"
+                f" `add_elasticsearch_index`, `add_bm25_index` or"
+                f" `add_minhash_index` first."
             )
 
     def list_indexes(self) -> List[str]:
@@ -768,6 +1154,165 @@ class IndexableMixin:
             es_index_config=es_index_config,
         )
 
+    def add_bm25_index(
+        self,
+        column: str,
+        index_name: Optional[str] = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+        tokenizer: Optional[Callable[[str], List[str]]] = None,
+        batch_size: int = 1000,
+    ):
+        """Add a text index scoring documents with BM25, without requiring an
+        external service (see `add_elasticsearch_index`).
+
+        Args:
+            column (:obj:`str`): The column of the documents to add to the index.
+            index_name (Optional :obj:`str`): The index_name/identifier of the index.
+             This is the index name that is used to call `.get_nearest` or `.search`.
+                By defaul it corresponds to `column`.
+            k1 (:obj:`float`, defaults to 1.2): term frequency saturation of BM25
+            b (:obj:`float`, defaults to 0.75): document length normalization
+             of BM25
+            tokenizer (Optional :obj:`Callable`): function splitting a text into
+             terms, by default into lower-cased alphanumeric words
+            batch_size (:obj:`int`): number of documents read at once
+        """
+        index_name = index_name if index_name is not None else column
+        bm25_index = BM25Index(k1=k1, b=b, tokenizer=tokenizer)
+        bm25_index.add_documents(self, column=column, batch_size=batch_size)
+        self._indexes[index_name] = bm25_index
+
+    def save_bm25_index(self, index_name: str, file: Union[str, PurePath]):
+        """Save a BM25Index on disk.
+
+        Args:
+            index_name (:obj:`str`): The index_name/identifier of the index. This
+             is the index_name that is used to call `.get_nearest` or `.search`.
+            file (:obj:`str`): The path to the directory of the serialized index.
+        """
+        index = self.get_index(index_name)
+        if not isinstance(index, BM25Index):
+            raise ValueError(
+                f"Index '{index_name}' is not a BM25Index but a '{type(index)}'"
+            )
+        index.save(file)
+        logger.info(f"Saved BM25Index {index_name} at {file}")
+
+    def load_bm25_index(
+        self,
+        index_name: str,
+        file: Union[str, PurePath],
+        tokenizer: Optional[Callable[[str], List[str]]] = None,
+    ):
+        """Load a BM25Index from disk, memory-mapping its arrays.
+
+        Args:
+            index_name (:obj:`str`): The index_name/identifier of the index. This
+             is the index_name that is used to call `.get_nearest` or `.search`.
+            file (:obj:`str`): The path to the directory of the serialized index.
+            tokenizer (Optional :obj:`Callable`): the tokenizer used to build the
+             index, if it isn't the default one
+        """
+        index = BM25Index.load(file, tokenizer=tokenizer)
+        if index.matrix.shape[1] != len(self):
+            raise ValueError(
+                f"Index size should match Dataset size, but Index '{index_name}' "
+                f"at {file} has {index.matrix.shape[1]} elements while the "
+                f"dataset has {len(self)} examples."
+            )
+        self._indexes[index_name] = index
+        logger.info(f"Loaded BM25Index {index_name} from {file}")
+
+    def add_minhash_index(
+        self,
+        column: str,
+        index_name: Optional[str] = None,
+        num_perm: int = 128,
+        threshold: float = 0.8,
+        ngram_size: int = 3,
+        seed: int = 1,
+        signature_column: Optional[str] = None,
+        batch_size: int = 1000,
+    ):
+        """Add a near-duplicate index of texts using MinHash LSH. Use it to
+        find the clusters of near-duplicates of the dataset with
+        `get_duplicate_clusters`, or the near-duplicates of another dataset
+        (e.g. test split vs train split) with `get_leakage`.
+
+        Args:
+            column (:obj:`str`): The column of the documents to add to the index.
+            index_name (Optional :obj:`str`): The index_name/identifier of the index.
+             This is the index name that is used to call `.get_nearest` or `.search`.
+                By defaul it corresponds to `column`.
+            num_perm (:obj:`int`): The number of permutations of the signatures.
+            threshold (:obj:`float`): The Jaccard similarity of the word n-grams
+             above which texts are near-duplicates.
+            ngram_size (:obj:`int`): The number of words of the n-grams.
+            seed (:obj:`int`): The seed of the permutations.
+            signature_column (Optional :obj:`str`): A column holding the MinHash
+             signatures of the documents (e.g. computed with the `get_minhash`
+             operation), computed with the same parameters.
+            batch_size (:obj:`int`): The number of documents read at once.
+        """
+        index_name = index_name if index_name is not None else column
+        minhash_index = MinHashLSHIndex(
+            num_perm=num_perm, threshold=threshold, ngram_size=ngram_size, seed=seed
+        )
+        minhash_index.add_documents(
+            self,
+            column=column,
+            signature_column=signature_column,
+            batch_size=batch_size,
+        )
+        self._indexes[index_name] = minhash_index
+
+    def _get_minhash_index(self, index_name: str) -> "MinHashLSHIndex":
+        index = self.get_index(index_name)
+        if not isinstance(index, MinHashLSHIndex):
+            raise ValueError(
+                f"Index '{index_name}' is not a MinHashLSHIndex but a '{type(index)}'"
+            )
+        return index
+
+    def get_duplicate_clusters(self, index_name: str) -> List[List[int]]:
+        """Find the clusters of near-duplicate examples of the dataset.
+
+        Args:
+            index_name (:obj:`str`): The index_name/identifier of a MinHash index.
+
+        Returns:
+            :obj:`List[List[int]]`: The indices of the examples of each cluster.
+        """
+        return self._get_minhash_index(index_name).duplicate_clusters()
+
+    def get_leakage(
+        self,
+        index_name: str,
+        dataset: "Dataset",
+        column: Optional[str] = None,
+        signature_column: Optional[str] = None,
+    ) -> Dict:
+        """Find the examples of another dataset (e.g. the test split) that are
+        near-duplicates of examples of this dataset (e.g. the train split).
+
+        Args:
+            index_name (:obj:`str`): The index_name/identifier of a MinHash index.
+            dataset (:class:`Dataset`): The other dataset.
+            column (Optional :obj:`str`): The column of the other dataset to
+             compare, by default the name of the index.
+            signature_column (Optional :obj:`str`): A column of the other dataset
+             holding the MinHash signatures of the examples.
+
+        Returns:
+            leakage_rate (:obj:`float`): The fraction of leaked examples.
+            leaked_indices (:obj:`List[int]`): The indices of the leaked examples.
+        """
+        column = column if column is not None else index_name
+        return self._get_minhash_index(index_name).leakage(
+            dataset, column=column, signature_column=signature_column
+        )
+
     def drop_index(self, index_name: str):
         """Drop the index with the specified column.
 
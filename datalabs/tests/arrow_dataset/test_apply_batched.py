@@ -0,0 +1,48 @@
+import unittest
+
+from datalabs import Dataset
+from datalabs.operations.featurize.general import (
+    get_basic_words,
+    get_gender_bias,
+    get_length,
+    get_lexical_richness,
+)
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dataset = Dataset.from_dict(
+            {
+                "text": [
+                    "I love this movie , he said",
+                    "she and Mary went to the zoo",
+                    "apple is looking at buying U.K. startup for $1 billion.",
+                ]
+            }
+        )
+
+    def test_batched_matches_per_sample(self):
+        for func in [get_length, get_basic_words, get_gender_bias]:
+            self.assertTrue(func.supports_batch)
+            per_sample = list(self.dataset.apply(func))
+            batched = list(self.dataset.apply(func, batched=True, batch_size=2))
+            self.assertEqual(per_sample, batched)
+
+    def test_batched_memory(self):
+        new_dataset = self.dataset.apply(
+            get_length, mode="memory", prefix="test", batched=True, batch_size=2
+        )
+        self.assertEqual(new_dataset["test_length"], [7, 7, 10])
+        self.assertEqual(new_dataset.features["test_length"].dtype, "int64")
+
+    def test_batched_fallback(self):
+        # operations without a columnar implementation are called per value
+        self.assertFalse(get_lexical_richness.supports_batch)
+        new_dataset = self.dataset.apply(
+            get_lexical_richness, mode="memory", batched=True
+        )
+        self.assertEqual(len(new_dataset["lexical_diversity"]), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from datalabs import config, Dataset, Features, Split, Value
+from datalabs.arrow_writer import ArrowWriter
+from datalabs.operations.featurize.general import get_basic_words, get_length
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        filename = os.path.join(self.tmp_dir.name, "test.arrow")
+        writer = ArrowWriter(
+            path=filename, features=Features({"text": Value("string")})
+        )
+        writer.write_batch({"text": ["I love this movie", "the apple", "a b c"]})
+        writer.finalize()
+        self.dataset = Dataset.from_file(filename, split=Split.TEST)
+
+    def tearDown(self):
+        del self.dataset
+        self.tmp_dir.cleanup()
+
+    def apply_cache_files(self):
+        return [
+            f_name
+            for f_name in os.listdir(self.tmp_dir.name)
+            if f_name.startswith("cache-apply-")
+        ]
+
+    def test_apply_cache(self):
+        res = self.dataset.apply(get_length, mode="memory", prefix="p")
+        self.assertEqual(len(self.apply_cache_files()), 1)
+
+        with mock.patch.object(
+            Dataset, "_apply_columns", wraps=self.dataset._apply_columns
+        ) as apply_columns:
+            cached = self.dataset.apply(get_length, mode="memory", prefix="p")
+            self.assertEqual(apply_columns.call_count, 0)
+            self.assertEqual(cached["p_length"], res["p_length"])
+
+            # other prefixes and operations aren't loaded from the cache
+            self.dataset.apply(get_length, mode="memory", prefix="q")
+            self.dataset.apply(get_basic_words, mode="memory", prefix="p")
+            self.assertEqual(apply_columns.call_count, 2)
+
+            self.dataset.apply(
+                get_length, mode="memory", prefix="p", load_from_cache_file=False
+            )
+            self.assertEqual(apply_columns.call_count, 3)
+        self.assertEqual(len(self.apply_cache_files()), 3)
+
+    def test_apply_cache_eviction(self):
+        with mock.patch.object(config, "APPLY_CACHE_MAX_SIZE", 0):
+            self.dataset.apply(get_length, mode="memory")
+            self.dataset.apply(get_basic_words, mode="memory")
+        # only the most recent cache file is kept
+        self.assertEqual(len(self.apply_cache_files()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
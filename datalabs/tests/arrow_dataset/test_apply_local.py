@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+
+from datalabs import Dataset, Features, load_from_disk, Split, Value
+from datalabs.arrow_writer import ArrowWriter
+from datalabs.operations.featurize.general import get_basic_words, get_length
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, "test.arrow")
+        writer = ArrowWriter(
+            path=self.filename, features=Features({"text": Value("string")})
+        )
+        writer.write_batch({"text": ["I love this movie", "the apple", "a b c"]})
+        writer.finalize()
+        self.dataset = Dataset.from_file(self.filename, split=Split.TEST)
+
+    def tearDown(self):
+        del self.dataset
+        self.tmp_dir.cleanup()
+
+    def test_apply_local_sidecar(self):
+        size = os.path.getsize(self.filename)
+        res = self.dataset.apply(get_length, mode="local")
+        self.assertEqual(res["length"], [4, 2, 3])
+        # the Arrow file of the dataset isn't rewritten
+        self.assertEqual(os.path.getsize(self.filename), size)
+        self.assertEqual(self.dataset.column_names, ["text"])
+
+        # the new column is joined when the dataset is loaded again
+        reloaded = Dataset.from_file(self.filename, split=Split.TEST)
+        self.assertEqual(reloaded["length"], [4, 2, 3])
+        self.assertEqual(reloaded.features["length"].dtype, "int64")
+
+    def test_apply_local_replace_column(self):
+        self.dataset.apply(get_basic_words, mode="local", prefix="p")
+        shuffled = Dataset.from_file(self.filename, split=Split.TEST).shuffle(seed=1)
+        res = shuffled.apply(get_basic_words, mode="local", prefix="p")
+        self.assertEqual(res.column_names, ["text", "p_basic_word_ratio"])
+        self.assertEqual(len(res["p_basic_word_ratio"]), 3)
+
+        reloaded = Dataset.from_file(self.filename, split=Split.TEST)
+        self.assertEqual(reloaded.column_names, ["text", "p_basic_word_ratio"])
+        # the replaced sidecar file is removed
+        self.assertEqual(
+            len([f for f in os.listdir(self.tmp_dir.name) if f.startswith("test-")]),
+            2,
+        )
+
+    def test_apply_local_twice(self):
+        self.dataset.apply(get_length, mode="local")
+        res = self.dataset.apply(get_length, mode="local")
+        self.assertEqual(res["length"], [4, 2, 3])
+
+        reloaded = Dataset.from_file(self.filename, split=Split.TEST)
+        self.assertEqual(reloaded["length"], [4, 2, 3])
+        res = reloaded.apply(get_length, mode="local")
+        self.assertEqual(res["length"], [4, 2, 3])
+        self.assertEqual(
+            Dataset.from_file(self.filename, split=Split.TEST)["length"], [4, 2, 3]
+        )
+        # only the sidecar file of the last column is kept
+        sidecar_files = [
+            f
+            for f in os.listdir(self.tmp_dir.name)
+            if f.startswith("test-") and f.endswith(".arrow")
+        ]
+        self.assertEqual(len(sidecar_files), 1)
+
+    def test_apply_local_load_from_disk(self):
+        dataset_path = os.path.join(self.tmp_dir.name, "saved")
+        self.dataset.save_to_disk(dataset_path)
+        loaded = load_from_disk(dataset_path)
+        res = loaded.apply(get_length, mode="local")
+        self.assertEqual(res["length"], [4, 2, 3])
+
+        for keep_in_memory in [False, True]:
+            reloaded = load_from_disk(dataset_path, keep_in_memory=keep_in_memory)
+            self.assertEqual(reloaded.column_names, ["text", "length"])
+            self.assertEqual(reloaded["length"], [4, 2, 3])
+            self.assertEqual(reloaded.features["length"].dtype, "int64")
+
+
+if __name__ == "__main__":
+    unittest.main()
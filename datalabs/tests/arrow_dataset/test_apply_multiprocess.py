@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+
+from datalabs import Dataset, Features, Split, Value
+from datalabs.arrow_writer import ArrowWriter
+from datalabs.fingerprint import get_temporary_cache_files_directory
+from datalabs.operations.featurize.general import get_basic_words, get_length
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        filename = os.path.join(self.tmp_dir.name, "test.arrow")
+        writer = ArrowWriter(
+            path=filename, features=Features({"text": Value("string")})
+        )
+        writer.write_batch(
+            {"text": ["I love this movie", "the apple", "a b c d e"] * 5}
+        )
+        writer.finalize()
+        self.dataset = Dataset.from_file(filename, split=Split.TEST)
+
+    def tearDown(self):
+        del self.dataset
+        self.tmp_dir.cleanup()
+
+    def test_apply_memory_num_proc(self):
+        expected = self.dataset.apply(get_length, mode="memory")
+        for batched in [False, True]:
+            res = self.dataset.apply(
+                get_length,
+                mode="memory",
+                num_proc=3,
+                batched=batched,
+                load_from_cache_file=False,
+            )
+            self.assertEqual(res["length"], expected["length"])
+            # the outputs are memory-mapped from the apply cache file
+            self.assertGreater(len(res.cache_files), 1)
+        # the shard files of the workers are removed once the outputs are cached
+        arrow_files = [
+            f_name
+            for f_name in os.listdir(self.tmp_dir.name)
+            if f_name.endswith(".arrow")
+        ]
+        self.assertIn("test.arrow", arrow_files)
+        self.assertEqual([f_name for f_name in arrow_files if "_of_" in f_name], [])
+
+    def test_apply_memory_num_proc_in_memory(self):
+        dataset = Dataset.from_dict({"text": ["a b", "c", "d e f", "g"]})
+        res = dataset.apply(get_length, mode="memory", num_proc=2, batched=True)
+        self.assertEqual(res["length"], [2, 1, 3, 1])
+        # the shard outputs are memory-mapped from the temporary cache directory
+        self.assertEqual(len(res.cache_files), 2)
+        for cache_file in res.cache_files:
+            self.assertEqual(
+                os.path.dirname(cache_file["filename"]),
+                get_temporary_cache_files_directory(),
+            )
+
+    def test_apply_memory_num_proc_with_indices(self):
+        shuffled = self.dataset.shuffle(seed=42)
+        res = shuffled.apply(get_basic_words, mode="memory", num_proc=2, prefix="p")
+        self.assertEqual(res["text"], shuffled["text"])
+        self.assertEqual(
+            res["p_basic_word_ratio"],
+            [item["basic_word_ratio"] for item in shuffled.apply(get_basic_words)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
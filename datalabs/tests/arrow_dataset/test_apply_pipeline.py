@@ -0,0 +1,60 @@
+import unittest
+
+from datalabs import Dataset
+from datalabs.operations.aggregate.text_classification import get_label_distribution
+from datalabs.operations.featurize.general import get_basic_words, get_length
+from datalabs.operations.featurize.text_classification import (
+    text_classification_featurizing,
+)
+
+
+@text_classification_featurizing(
+    name="get_double_length",
+    contributor="datalab",
+    task="text-classification",
+)
+def get_double_length(sample: dict):
+    # reads a column generated by a previous operation of the pipeline
+    return {"double_length": sample["p_length"] * 2}
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dataset = Dataset.from_dict(
+            {
+                "text": ["I love this movie", "the apple", "a b c d e"] * 3,
+                "label": [0, 1, 1] * 3,
+            }
+        ).shuffle(seed=0)
+
+    def test_matches_sequential_apply(self):
+        operations = [get_length, get_basic_words, get_double_length]
+        prefixes = ["p", "p", ""]
+
+        expected = self.dataset
+        for func, prefix in zip(operations, prefixes):
+            expected = expected.apply(func, mode="memory", prefix=prefix)
+
+        for batched in [False, True]:
+            res = self.dataset.apply_pipeline(
+                operations, prefix=prefixes, batched=batched, batch_size=4
+            )
+            self.assertEqual(res.column_names, expected.column_names)
+            self.assertEqual(res.to_dict(), expected.to_dict())
+
+    def test_unfusable_operations(self):
+        res = self.dataset.apply_pipeline(
+            [
+                get_length,
+                get_label_distribution,
+                get_basic_words,
+                get_label_distribution,
+            ]
+        )
+        self.assertEqual(res["length"], [len(t.split(" ")) for t in res["text"]])
+        self.assertEqual(len(res["basic_word_ratio"]), 9)
+        self.assertEqual(res._stat["label_distribution"], {1: 6, 0: 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
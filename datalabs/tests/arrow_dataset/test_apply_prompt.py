@@ -0,0 +1,104 @@
+import unittest
+
+from datalabs import Dataset, DatasetInfo
+from datalabs.operations.prompt import (
+    natural_language_inference,
+    sentiment_classification,
+    summarization,
+    topic_classification,
+)
+from datalabs.tasks.text_classification import TextClassification
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        info = DatasetInfo(
+            task_templates=[TextClassification(labels=["World", "Sports"])],
+            prompts={
+                "section": {
+                    "template": "{{text}} \n\nWhich section of a newspaper would "
+                    "this article likely appear in? ||| \n{{answers[label] }}",
+                    "answers": {"World": ["World News"], "Sports": ["Sports"]},
+                }
+            },
+        )
+        self.dataset = Dataset.from_dict(
+            {
+                "text": ["Rain in Paris", "A new record", "Elections"],
+                "label": [0, 1, 0],
+            },
+            info=info,
+        )
+
+    def test_apply_prompt(self):
+        res = self.dataset.apply("section", mode="memory")
+        for sample in res:
+            self.assertEqual(
+                sample["prompted_text"],
+                sample["text"] + " \n\nWhich section of a newspaper would this "
+                "article likely appear in? ",
+            )
+            self.assertEqual(
+                sample["prompted_answer"],
+                " \n" + ["World News", "Sports"][sample["label"]],
+            )
+        realtime = list(self.dataset.apply("section"))
+        self.assertEqual(
+            [sample["prompted_text"] for sample in realtime], res["prompted_text"]
+        )
+        self.assertEqual(
+            [sample["prompted_answer"] for sample in realtime], res["prompted_answer"]
+        )
+
+    def _check_templates(self, dataset, module, *args):
+        templates = [
+            getattr(module, name)
+            for name in dir(module)
+            if name.startswith("template_")
+        ]
+        self.assertTrue(templates)
+        for template in templates:
+            self.assertTrue(template.supports_batch, template.name)
+            expected = [template(sample, *args) for sample in dataset]
+            self.assertEqual(list(dataset.apply(template)), expected, template.name)
+            res = dataset.apply(template, mode="memory")
+            for name in expected[0]:
+                self.assertEqual(
+                    res[name], [outputs[name] for outputs in expected], template.name
+                )
+
+    def test_apply_template_batched(self):
+        labels_to_answers = {0: "World", 1: "Sports"}
+        self._check_templates(self.dataset, sentiment_classification, labels_to_answers)
+        self._check_templates(self.dataset, topic_classification, labels_to_answers)
+
+        info = DatasetInfo(
+            task_templates=[
+                TextClassification(labels=["contradiction", "entailment", "neutral"])
+            ]
+        )
+        dataset = Dataset.from_dict(
+            {
+                "text1": ["It rains", "A man sleeps", "A dog runs"],
+                "text2": ["It is wet", "A man runs", "The dog is brown"],
+                "label": [1, 0, 2],
+            },
+            info=info,
+        )
+        self._check_templates(
+            dataset,
+            natural_language_inference,
+            {0: "contradiction", 1: "entailment", 2: "neutral"},
+        )
+
+        dataset = Dataset.from_dict(
+            {
+                "text": ["Rain in Paris all week", "A new world record"],
+                "summary": ["Rain", "Record"],
+            }
+        )
+        self._check_templates(dataset, summarization)
+
+
+if __name__ == "__main__":
+    unittest.main()
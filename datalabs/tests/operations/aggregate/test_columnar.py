@@ -0,0 +1,34 @@
+import unittest
+
+from datalabs import Dataset
+from datalabs.operations.aggregate.general import get_average_length, get_vocabulary
+from datalabs.operations.aggregate.text_classification import get_label_distribution
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dataset = Dataset.from_dict(
+            {
+                "text": ["I love this movie", "the movie", "I  love it"],
+                "label": [1, 0, 1],
+            }
+        ).shuffle(seed=0)
+
+    def test_matches_python_path(self):
+        samples = list(self.dataset)
+        for func in [get_average_length, get_vocabulary, get_label_distribution]:
+            self.assertEqual(func.func(self.dataset), func.func(samples))
+
+    def test_vocabulary_order(self):
+        vocabulary = get_vocabulary.func(self.dataset)["vocabulary"]
+        self.assertEqual(list(vocabulary.items())[:2], [("I", 2), ("love", 2)])
+        self.assertEqual(vocabulary[""], 1)
+
+    def test_apply(self):
+        res = self.dataset.apply(get_label_distribution)
+        self.assertEqual(res._stat["label_distribution"], {1: 2, 0: 1})
+        self.assertEqual(res._stat["imbalance_ratio"], 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
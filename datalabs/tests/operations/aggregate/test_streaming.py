@@ -0,0 +1,79 @@
+import random
+import unittest
+
+import numpy as np
+
+from datalabs import Dataset
+from datalabs.operations.aggregate.streaming import (
+    aggregate,
+    AggregatorDict,
+    CountMap,
+    Head,
+    Moments,
+    Quantiles,
+)
+from datalabs.operations.aggregate.summarization import get_statistics
+
+
+def init_state():
+    return AggregatorDict(lengths=Moments(), words=CountMap(), head=Head(2))
+
+
+def update_state(state, sample):
+    state["lengths"].update(len(sample["text"].split(" ")))
+    state["words"].update_many(sample["text"].split(" "))
+    state["head"].update(sample["text"])
+
+
+class MyTestCase(unittest.TestCase):
+    def test_moments_merge(self):
+        values = [random.Random(0).random() * i for i in range(100)]
+        left, right = Moments(), Moments()
+        for value in values[:30]:
+            left.update(value)
+        for value in values[30:]:
+            right.update(value)
+        res = left.merge(right).finalize()
+        self.assertEqual(res["count"], 100)
+        self.assertAlmostEqual(res["mean"], np.mean(values))
+        self.assertAlmostEqual(res["variance"], np.var(values))
+        self.assertEqual(res["max"], max(values))
+
+    def test_quantiles(self):
+        values = list(range(10000))
+        random.Random(0).shuffle(values)
+        sketches = [Quantiles([0.1, 0.5, 0.9], capacity=128) for _ in range(2)]
+        for i, value in enumerate(values):
+            sketches[i % 2].update(value)
+        res = sketches[0].merge(sketches[1]).finalize()
+        for quantile, value in res.items():
+            self.assertLess(abs(value - quantile * 10000), 300)
+        # the memory is bounded
+        self.assertLess(sum(len(items) for items in sketches[0].compactors), 1500)
+
+    def test_aggregate_num_proc(self):
+        dataset = Dataset.from_dict({"text": ["a b", "a", "c d e"] * 5})
+        expected = aggregate(dataset, init_state, update_state).finalize()
+        res = aggregate(dataset, init_state, update_state, num_proc=2).finalize()
+        self.assertEqual(res, expected)
+        self.assertEqual(res["words"], {"a": 10, "b": 5, "c": 5, "d": 5, "e": 5})
+        self.assertEqual(res["head"], ["a b", "a"])
+
+    def test_get_statistics(self):
+        dataset = Dataset.from_dict(
+            {"text": ["a b c", "d e"], "summary": ["a", "d e f g"]}
+        )
+        res = dataset.apply(get_statistics)._stat["dataset-level"]
+        self.assertEqual(res["length_info"]["max_text_length"], 3)
+        self.assertEqual(res["average_summary_length"], 2.5)
+        self.assertEqual(res["number_of_tokens"], 10)
+
+        dataset = Dataset.from_dict(
+            {"text": ["a b c", "d e", "f"] * 4, "summary": ["a", "d e f g", ""] * 4}
+        )
+        expected = dict(dataset.apply(get_statistics)._stat)
+        self.assertEqual(dataset.apply(get_statistics, num_proc=2)._stat, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+
+import pyarrow as pa
+
+from datalabs.operations.edit.plugins.general.insert_abbreviation import (
+    grammaire,
+    transformation,
+)
+
+RULES = """
+USA = united states of america
+pls = please
+"""
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        grammaire.grammars.clear()
+
+    def test_compilecached(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            grammar = grammaire.compilecached(RULES, cache_dir)
+            self.assertIs(grammaire.compilecached(RULES, cache_dir), grammar)
+            self.assertEqual(
+                os.listdir(cache_dir), [grammaire.ruleshash(RULES) + ".pkl"]
+            )
+
+            # another process loads the grammar from the cache directory
+            grammaire.grammars.clear()
+            loaded = grammaire.compilecached(RULES, cache_dir)
+            self.assertIsNot(loaded, grammar)
+            text = "Visit the United States of America, please"
+            self.assertEqual(
+                grammaire.parse(text, loaded), grammaire.parse(text, grammar)
+            )
+            self.assertEqual(
+                grammaire.parse(text, loaded),
+                [["pls", [36, 42]], ["USA", [10, 34]]],
+            )
+
+            # other rules, other grammar
+            other = grammaire.compilecached(RULES + "thx = thanks\n", cache_dir)
+            self.assertIsNot(other, loaded)
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+    def test_parse_many(self):
+        grammar = grammaire.compilecached(RULES)
+        texts = ["the united states of america", "", "nothing", "Please"]
+        self.assertEqual(
+            grammaire.parse_many(texts + texts, grammar),
+            [grammaire.parse(text, grammar) for text in texts + texts],
+        )
+
+    def test_insert_abbreviation(self):
+        texts = ["I live in the United States of America, please.", "Hello"]
+        self.assertEqual(
+            transformation.insert_abbreviation(texts[0]),
+            {"text_insert_abbreviation": "I live in da USA, pls."},
+        )
+        self.assertEqual(
+            transformation.insert_abbreviation.apply_batch(pa.array(texts)),
+            {"text_insert_abbreviation": ["I live in da USA, pls.", "Hello"]},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import random
+import unittest
+
+from datalabs.operations.edit.pattern_matcher import PatternMatcher
+from datalabs.operations.edit.plugins.general.emojify.transformation import emojify
+from datalabs.operations.edit.plugins.general.replace_acronyms.transformation import (
+    replace_acronyms,
+    transformation,
+)
+
+
+def naive_finditer(text, patterns):
+    # leftmost-longest matches, one position at a time
+    matches, start = [], 0
+    while start < len(text):
+        longest = max(
+            (pattern for pattern in patterns if text.startswith(pattern, start)),
+            key=len,
+            default=None,
+        )
+        if longest is None:
+            start += 1
+        else:
+            matches.append((start, start + len(longest), longest))
+            start += len(longest)
+    return matches
+
+
+class MyTestCase(unittest.TestCase):
+    def test_finditer(self):
+        matcher = PatternMatcher(["he", "she", "his", "hers"])
+        self.assertEqual(list(matcher.finditer("ushers")), [(1, 4, "she")])
+        self.assertEqual(
+            list(matcher.finditer("hishers")), [(0, 3, "his"), (3, 7, "hers")]
+        )
+
+        random.seed(0)
+        for _ in range(500):
+            patterns = [
+                "".join(random.choices("ab", k=random.randint(1, 4)))
+                for _ in range(random.randint(1, 6))
+            ]
+            text = "".join(random.choices("abc", k=random.randint(0, 20)))
+            self.assertEqual(
+                list(PatternMatcher(patterns).finditer(text)),
+                naive_finditer(text, patterns),
+            )
+
+    def test_replace(self):
+        matcher = PatternMatcher({"European Union": "EU", "Union": "U", "EU": "E"})
+        # single pass: replacements aren't matched again
+        self.assertEqual(matcher.replace("the European Union"), "the EU")
+        self.assertEqual(matcher.replace("the european union"), "the european union")
+        self.assertEqual(
+            matcher.replace("the european union", ignore_case=True), "the EU"
+        )
+        self.assertEqual(matcher.replace("Union", str.upper), "UNION")
+
+    def test_replace_acronyms(self):
+        acronyms = {"European Union": "EU", "World Health Organization": "WHO"}
+        self.assertEqual(
+            transformation("The European Union and the WHO", False, acronyms),
+            "The EU and the WHO",
+        )
+        self.assertEqual(
+            replace_acronyms("Ask the World Health Organization")[
+                "text_replace_acronyms"
+            ],
+            "Ask the WHO",
+        )
+
+    def test_emojify(self):
+        self.assertEqual(
+            emojify("I am happy :) :)")["text_emojify"], "I am happy ☺️ ☺️"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
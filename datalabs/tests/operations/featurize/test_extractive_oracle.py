@@ -0,0 +1,87 @@
+import random
+import unittest
+
+import nltk
+
+from datalabs import Dataset
+from datalabs.operations.featurize.plugins.summarization import summ_func
+from datalabs.operations.featurize.plugins.summarization.extractive_methods import (
+    _compute_rouge,
+    _ext_oracle,
+    ext_oracle_batch,
+    scorer,
+)
+from datalabs.operations.featurize.summarization import get_oracle_summary
+
+
+def has_punkt():
+    try:
+        nltk.data.find("tokenizers/punkt")
+        return True
+    except LookupError:
+        return False
+
+
+def rouge1(cand, ref):
+    # _compute_rouge without the sentence splitting
+    return scorer.score(ref, cand)["rouge1"].fmeasure
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(0)
+        words = "the cats running ran dog dogs house quickly a is runs happy".split()
+        self.srcs = [
+            [
+                " ".join(rng.choice(words) for _ in range(rng.randint(0, 10))) + "."
+                for _ in range(rng.randint(0, 6))
+            ]
+            for _ in range(50)
+        ]
+        self.refs = [
+            " ".join(rng.choice(words) for _ in range(rng.randint(0, 12)))
+            for _ in range(50)
+        ]
+
+    def test_incremental_rouge(self):
+        for src, ref in zip(self.srcs, self.refs):
+            for max_sent, threshold in [(3, -1), (-1, 0.01)]:
+                self.assertEqual(
+                    _ext_oracle(src, ref, _compute_rouge, max_sent, -1, threshold),
+                    _ext_oracle(src, ref, rouge1, max_sent, -1, threshold),
+                )
+
+    def test_ext_oracle_batch(self):
+        expected = [
+            _ext_oracle(src, ref, _compute_rouge)
+            for src, ref in zip(self.srcs, self.refs)
+        ]
+        res = ext_oracle_batch(self.srcs, self.refs, num_proc=2, chunksize=8)
+        self.assertEqual(res, expected)
+
+    def test_summ_func_ext_oracle(self):
+        oracles, labels, scores, score = summ_func.ext_oracle(
+            self.srcs, self.refs, _compute_rouge, max_sent=3, num_workers=2
+        )
+        for i, (src, ref) in enumerate(zip(self.srcs, self.refs)):
+            expected = _ext_oracle(src, ref, _compute_rouge, max_sent=3)
+            self.assertEqual(oracles[i], " ".join(expected["oracle_summary"]))
+            self.assertEqual(labels[i], expected["oracle_labels"])
+            self.assertEqual(scores[i], expected["oracle_score"])
+        self.assertAlmostEqual(score, sum(scores) / len(scores))
+
+    @unittest.skipUnless(has_punkt(), "nltk punkt data is required")
+    def test_get_oracle_summary_batched(self):
+        dataset = Dataset.from_dict(
+            {
+                "text": [" ".join(src) for src in self.srcs],
+                "summary": self.refs,
+            }
+        )
+        expected = list(dataset.apply(get_oracle_summary))
+        res = dataset.apply(get_oracle_summary, batched=True, batch_size=8)
+        self.assertEqual(list(res), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import random
+import unittest
+
+from datalabs.operations.featurize.plugins.summarization.sum_attribute import (
+    SUMAttribute,
+    TokenizedDocument,
+)
+
+
+def greedy_overlap(a, b):
+    # reference quadratic implementation of the greedy fragment matching
+    matches = []
+    a_start = 0
+    while a_start < len(a):
+        best_match, best_match_length = None, 0
+        b_start = 0
+        while b_start < len(b):
+            if a[a_start] == b[b_start]:
+                a_end, b_end = a_start, b_start
+                while a_end < len(a) and b_end < len(b) and b[b_end] == a[a_end]:
+                    b_end += 1
+                    a_end += 1
+                if a_end - a_start > best_match_length:
+                    best_match_length = a_end - a_start
+                    best_match = SUMAttribute.Match(a_start, b_start, best_match_length)
+                b_start = b_end
+            else:
+                b_start += 1
+        a_start += best_match_length if best_match else 1
+        if best_match:
+            matches.append(best_match)
+    return matches
+
+
+def tokenized(sentences):
+    tokens = [token for sentence in sentences for token in sentence]
+    return TokenizedDocument(tokens, [t.lower() for t in tokens], sentences)
+
+
+class MyTestCase(unittest.TestCase):
+    def test_overlap(self):
+        rng = random.Random(0)
+        sum_attribute = SUMAttribute()
+        for _ in range(200):
+            text = [rng.choice("abcd") for _ in range(rng.randint(0, 60))]
+            summary = [rng.choice("abcde") for _ in range(rng.randint(0, 20))]
+            if text and rng.random() < 0.5:
+                start = rng.randrange(len(text))
+                summary += text[start : start + rng.randint(1, 10)]
+            self.assertEqual(
+                sum_attribute.overlap(summary, text), greedy_overlap(summary, text)
+            )
+
+    def test_overlap_skips_matched_positions(self):
+        matches = SUMAttribute().overlap(["x", "x", "y"], ["x", "x", "x", "y"])
+        self.assertEqual(matches, [(0, 0, 2), (2, 3, 1)])
+
+    def test_attributes(self):
+        text = tokenized([["the", "cat", "sat", "."], ["it", "was", "happy", "."]])
+        summary = tokenized([["the", "cat", "was", "happy", "the", "cat", "was"]])
+        res = SUMAttribute()([text], [summary])[0]
+        self.assertEqual(res["attr_coverage"], 1.0)
+        self.assertEqual(res["attr_density"], (4 + 4 + 4 + 1) / 7)
+        self.assertEqual(res["attr_copy_len"], 7 / 4)
+        self.assertEqual(res["attr_novelty"], 3 / 6)
+        self.assertEqual(res["attr_repetition"], 1 / 5)
+        self.assertEqual(res["attr_source_len"], 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
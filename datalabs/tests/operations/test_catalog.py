@@ -0,0 +1,82 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from datalabs.operations.catalog import (
+    build_catalog,
+    CATALOG_PATH,
+    describe_operation,
+    find_operation,
+    list_operations,
+    load_catalog,
+    load_operation,
+    save_catalog,
+)
+from datalabs.operations.featurize import featurizing
+
+
+@featurizing(name="get_catalog_test_length", contributor="test", task="test-task")
+def get_catalog_test_length(text):
+    return {"length": len(text)}
+
+
+class MyTestCase(unittest.TestCase):
+    def test_shipped_catalog(self):
+        self.assertTrue(os.path.exists(CATALOG_PATH))
+        entry = find_operation("get_length")
+        self.assertEqual(entry["module"], "datalabs.operations.featurize.general")
+        self.assertEqual(entry["type"], "Featurizing")
+        self.assertEqual(entry["task"], "Any")
+        self.assertEqual(entry["processed_fields"], ["text"])
+        self.assertEqual(load_operation(entry).name, "get_length")
+
+        summarization = list_operations(task="summarization")
+        self.assertIn("get_oracle_summary", [entry["name"] for entry in summarization])
+        # operations of any task
+        self.assertIn("get_length", [entry["name"] for entry in summarization])
+        types = {entry["type"] for entry in list_operations(type="Preprocessing")}
+        self.assertEqual(types, {"Preprocessing"})
+        with self.assertRaises(KeyError):
+            find_operation("get_unknown_operation")
+
+    def test_shipped_catalog_is_complete(self):
+        catalog, errors = build_catalog()
+        self.assertEqual(errors, {})
+        self.assertEqual(catalog, load_catalog())
+
+    def test_listing_does_not_import(self):
+        code = (
+            "import sys; from datalabs.operations.catalog import list_operations;"
+            "modules = set(sys.modules); list_operations(task='summarization');"
+            "print(sorted(set(sys.modules) - modules))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), "[]")
+
+    def test_registration(self):
+        entry = describe_operation(get_catalog_test_length)
+        self.assertEqual(entry["name"], "get_catalog_test_length")
+        self.assertEqual(entry["module"], __name__)
+        self.assertEqual(entry["contributor"], "test")
+        self.assertEqual(entry["task"], "test-task")
+
+        catalog, _ = build_catalog(packages=["datalabs.operations.preprocess"])
+        self.assertIn("lower", [entry["name"] for entry in catalog])
+        self.assertNotIn(
+            "get_catalog_test_length", [entry["name"] for entry in catalog]
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "catalog.json")
+            save_catalog(catalog, path)
+            self.assertEqual(load_catalog(path), catalog)
+            self.assertEqual(
+                find_operation("lower", path=path)["type"], "Preprocessing"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import subprocess
+import sys
+import unittest
+
+from datalabs.operations.operation import OperationFunction
+from datalabs.operations.registry import get_operation
+
+
+class MyTestCase(unittest.TestCase):
+    def test_import_is_lazy(self):
+        code = (
+            "import sys, datalabs, datalabs.operations.featurize;"
+            "print(sorted(m for m in ['spacy', 'nltk', 'sklearn', 'lexicalrichness',"
+            " 'datalabs.operations.featurize.general'] if m in sys.modules))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), "[]")
+
+    def test_access(self):
+        from datalabs.operations import aggregate, featurize
+        from datalabs.operations.featurize import get_length
+
+        self.assertIsInstance(get_length, OperationFunction)
+        self.assertIs(featurize.get_length, get_length)
+        self.assertIn("get_length", dir(featurize))
+        self.assertIn("get_length", featurize.__all__)
+        # the last module exporting a name wins, as with star imports
+        self.assertEqual(
+            featurize.get_features_sample_level.func.__module__,
+            "datalabs.operations.featurize.text_classification",
+        )
+        # decorators and submodules
+        self.assertTrue(isinstance(aggregate.aggregating, type))
+        self.assertEqual(
+            featurize.general.__name__, "datalabs.operations.featurize.general"
+        )
+        with self.assertRaises(AttributeError):
+            featurize.get_unknown_operation
+
+    def test_get_operation(self):
+        import datalabs.operations.aggregate  # noqa
+
+        self.assertEqual(get_operation("get_vocabulary").name, "get_vocabulary")
+        self.assertEqual(
+            get_operation("get_length", "datalabs.operations.featurize").name,
+            "get_length",
+        )
+        with self.assertRaises(KeyError):
+            get_operation("get_unknown_operation")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+from datalabs import Dataset
+from datalabs.operations.featurize.featurizing import featurizing
+from datalabs.operations.resource_registry import resource_registry, SharedResource
+
+n_loads = 0
+
+
+def load_vocabulary():
+    global n_loads
+    n_loads += 1
+    return {"movie", "love"}
+
+
+@featurizing(
+    name="get_n_known_words",
+    contributor="datalab",
+    task="Any",
+    resources={"vocabulary": SharedResource("test/vocabulary", load_vocabulary)},
+)
+def get_n_known_words(text: str, vocabulary: set = None):
+    return {"n_known_words": len([w for w in text.split(" ") if w in vocabulary])}
+
+
+class MyTestCase(unittest.TestCase):
+    def test_shared_resource(self):
+        self.assertEqual(get_n_known_words.shared_resources, ["test/vocabulary"])
+        self.assertFalse(resource_registry.is_loaded("test/vocabulary"))
+
+        dataset = Dataset.from_dict({"text": ["I love this movie", "me too"] * 10})
+        res = dataset.apply(get_n_known_words, mode="memory")
+
+        self.assertEqual(res["n_known_words"], [2, 0] * 10)
+        # the resource is loaded once and shared by all the calls
+        self.assertEqual(n_loads, 1)
+        self.assertTrue(resource_registry.is_loaded("test/vocabulary"))
+        self.assertIn("test/vocabulary", resource_registry.memory_usage())
+
+        resource_registry.unload("test/vocabulary")
+        self.assertFalse(resource_registry.is_loaded("test/vocabulary"))
+
+
+if __name__ == "__main__":
+    unittest.main()
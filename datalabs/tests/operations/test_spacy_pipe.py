@@ -0,0 +1,56 @@
+import unittest
+
+from spacy.language import Language
+
+from datalabs import Dataset
+from datalabs.operations.featurize.featurizing import featurizing
+from datalabs.operations.resource_registry import (
+    PipedLanguage,
+    spacy_doc_cache,
+    spacy_model,
+)
+
+n_calls = {"piped": 0}
+
+
+@featurizing(
+    name="get_n_tokens_spacy",
+    contributor="datalab",
+    task="Any",
+    resources={"nlp": spacy_model("blank:en", batch_size=2)},
+)
+def get_n_tokens_spacy(text: str, nlp: Language = None):
+    if isinstance(nlp, PipedLanguage):
+        n_calls["piped"] += 1
+    return {"n_tokens": len(nlp(text))}
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        spacy_doc_cache.clear()
+        n_calls["piped"] = 0
+
+    def test_apply_pipes_texts(self):
+        texts = ["I love this movie", "me too", "the apple , the pear"]
+        dataset = Dataset.from_dict({"text": texts})
+
+        res = dataset.apply(get_n_tokens_spacy, mode="memory")
+        self.assertEqual(res["n_tokens"], [4, 2, 5])
+        # the operation received the documents parsed by nlp.pipe
+        self.assertEqual(n_calls["piped"], 3)
+        self.assertEqual(list(dataset.apply(get_n_tokens_spacy))[1], {"n_tokens": 2})
+
+    def test_doc_cache(self):
+        model = spacy_model("blank:en")
+        docs = model.pipe(["a b", "c"])
+        # the parsed documents are reused
+        self.assertIs(model.pipe(["c"])[0], docs[1])
+        # documents parsed with disabled components aren't reused by operations
+        # needing these components
+        self.assertEqual(
+            spacy_doc_cache.get("spacy/blank:en", "c", frozenset(["ner"])), None
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import random
+import time
+import unittest
+
+import numpy as np
+
+from datalabs.metric import Accuracy, F1score, Hits
+from datalabs.utils.bootstrap import bootstrap_indices, bootstrap_mean, bootstrap_metric
+from datalabs.utils.eval_basic import compute_confidence_interval_acc
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(0)
+        self.true_labels = [rng.randint(0, 2) for _ in range(1000)]
+        self.predicted_labels = [
+            label if rng.random() < 0.7 else rng.randint(0, 2)
+            for label in self.true_labels
+        ]
+
+    def test_bootstrap_indices(self):
+        chunks = list(bootstrap_indices(10, 4, 7, seed=0, max_chunk_elements=12))
+        self.assertEqual([chunk.shape for chunk in chunks], [(3, 4), (3, 4), (1, 4)])
+        self.assertTrue(all(((chunk >= 0) & (chunk < 10)).all() for chunk in chunks))
+
+    def test_bootstrap_mean(self):
+        scores = np.random.default_rng(0).random(100)
+        means = bootstrap_mean(scores, 80, 1000, seed=0)
+        self.assertEqual(means.shape, (1000,))
+        self.assertAlmostEqual(means.mean(), scores.mean(), delta=0.01)
+        np.testing.assert_array_equal(means, bootstrap_mean(scores, 80, 1000, seed=0))
+
+    def test_metrics(self):
+        accuracy = np.mean(np.array(self.true_labels) == self.predicted_labels)
+        for metric in [
+            Accuracy(self.true_labels, self.predicted_labels, True, seed=0),
+            F1score(self.true_labels, self.predicted_labels, True, seed=0, num_proc=2),
+        ]:
+            res = metric.evaluate()
+            self.assertAlmostEqual(res["value"], accuracy)
+            self.assertLess(res["confidence_score_low"], res["value"])
+            self.assertGreater(res["confidence_score_up"], res["value"])
+
+        hits = Hits([1, 2, 3, 4], [[1, 2], [1], [3], [0]], True, seed=0).evaluate()
+        self.assertEqual(hits["value"], 0.5)
+        self.assertLessEqual(hits["confidence_score_low"], 0.5)
+
+    def test_bootstrap_metric(self):
+        res = bootstrap_metric(
+            lambda true, pred: np.mean(true == pred),
+            [self.true_labels, self.predicted_labels],
+            800,
+            10,
+            seed=0,
+            num_proc=2,
+        )
+        self.assertEqual(res.shape, (10,))
+
+    def test_large_evaluation(self):
+        true_labels = np.zeros(1_000_000, dtype=int)
+        predicted_labels = np.random.default_rng(0).integers(0, 2, 1_000_000)
+        start = time.time()
+        low, up = compute_confidence_interval_acc(true_labels, predicted_labels, seed=0)
+        self.assertLess(time.time() - start, 1)
+        self.assertLess(low, 50.5)
+        self.assertGreater(up, 49.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import random
+import unittest
+
+import numpy as np
+
+from datalabs.utils.analysis import (
+    bucket_attribute_discrete_value,
+    bucket_attribute_specified_bucket_interval,
+    bucket_attribute_specified_bucket_value,
+    find_key,
+)
+from datalabs.utils.bucketing import (
+    bucket_accuracy,
+    bucket_discrete,
+    bucket_interval,
+    bucket_quantile,
+    bucket_specified_value,
+    bucket_values,
+    group_indices,
+)
+from datalabs.utils.eval_bucket import f1_score_seqeval_bucket, f1_score_seqeval_buckets
+
+
+def to_lists(buckets):
+    return {key: indices.tolist() for key, indices in buckets.items()}
+
+
+class MyTestCase(unittest.TestCase):
+    def test_group_indices(self):
+        groups = group_indices(np.array([1, -1, 0, 1, 2, 0]), 4)
+        self.assertEqual([g.tolist() for g in groups], [[2, 5], [0, 3], [4], []])
+
+    def test_bucket_interval(self):
+        values = [0, 0.2, 0.5, 0.7, 1, 1.5]
+        buckets = bucket_interval(values, [(0,), (0, 0.5), (0.5, 1)])
+        self.assertEqual(
+            to_lists(buckets), {(0,): [0], (0, 0.5): [1, 2], (0.5, 1): [3, 4]}
+        )
+
+        # same buckets as the linear scan of the intervals
+        rng = random.Random(0)
+        values = [round(rng.random() * 10, 1) for _ in range(500)]
+        intervals = [(0,), (0, 2.5), (2.5, 5), (5, 7.5)]
+        buckets = bucket_interval(values, intervals)
+        expected = {key: [] for key in intervals}
+        for i, value in enumerate(values):
+            key = find_key(expected, value)
+            if key is not None:
+                expected[key].append(i)
+        self.assertEqual(to_lists(buckets), expected)
+
+    def test_bucket_discrete(self):
+        values = ["b", "a", "b", "c", "a", "b"]
+        self.assertEqual(
+            to_lists(bucket_discrete(values, n_buckets=2)),
+            {("b",): [0, 2, 5], ("a",): [1, 4]},
+        )
+        self.assertEqual(
+            to_lists(bucket_discrete(values, min_count=2)),
+            {("b",): [0, 2, 5], ("a",): [1, 4]},
+        )
+        self.assertEqual(
+            to_lists(bucket_values(values, [("c",), ("d",)])),
+            {("c",): [3], ("d",): []},
+        )
+
+    def test_bucket_specified_value(self):
+        values = [0, 1, 2, 2, 3, 4, 5, 6, 0]
+        self.assertEqual(
+            to_lists(bucket_specified_value(values, 3, [0])),
+            {(0,): [0, 8], (1.0, 3.0): [1, 2, 3, 4], (4.0, 1000000): [5, 6, 7]},
+        )
+
+    def test_bucket_quantile(self):
+        values = np.arange(100)
+        buckets = bucket_quantile(values, 4)
+        self.assertEqual([len(indices) for indices in buckets.values()], [25] * 4)
+        self.assertEqual(list(buckets)[0], (0.0, 24.75))
+        self.assertEqual(len(bucket_quantile([1, 1, 1], 4)), 1)
+
+    def test_legacy_functions(self):
+        dict_obj = {"a": 3, "b": 1, "c": 2, "d": 1, "e": 0, "f": 5}
+        self.assertEqual(
+            bucket_attribute_specified_bucket_value(dict_obj, 3, [0]),
+            {(0,): ["e"], (1.0, 2.0): ["b", "d", "c"], (3.0, 1000000): ["a", "f"]},
+        )
+        self.assertEqual(
+            bucket_attribute_specified_bucket_interval(
+                dict_obj, None, [(0,), (0, 2), (2, 4)]
+            ),
+            {(0,): ["e"], (0, 2): ["b", "d", "c"], (2, 4): ["a"]},
+        )
+        self.assertEqual(
+            bucket_attribute_discrete_value(dict_obj, 2, 1),
+            {(1,): ["b", "d"], (3,): ["a"]},
+        )
+        tags = {"x": "PER", "y": "LOC", "z": "LOC"}
+        self.assertEqual(
+            bucket_attribute_specified_bucket_interval(
+                tags, None, [("PER",), ("ORG",), ("LOC",)]
+            ),
+            {("LOC",): ["y", "z"], ("PER",): ["x"], ("ORG",): []},
+        )
+
+    def test_metrics(self):
+        lengths = np.array([1, 2, 3, 1, 2, 3])
+        buckets = bucket_interval(lengths, [(1,), (2, 3)])
+        self.assertEqual(
+            bucket_accuracy(buckets, [0, 1, 1, 0, 1, 0], [0, 1, 0, 1, 1, 0]),
+            {(1,): 50.0, (2, 3): 75.0},
+        )
+
+        true_chunks = [("PER", 0, 1), ("LOC", 2, 4), ("PER", 5, 8), ("ORG", 9, 10)]
+        pred_chunks = [("PER", 0, 1), ("LOC", 2, 3), ("PER", 5, 8)]
+        true_buckets = bucket_interval([1, 2, 3, 1], [(1,), (2, 3)])
+        pred_buckets = bucket_interval([1, 1, 3], [(1,), (2, 3)])
+        pred_correct = [chunk in true_chunks for chunk in pred_chunks]
+        scores = f1_score_seqeval_buckets(true_buckets, pred_buckets, pred_correct)
+        for key in true_buckets:
+            expected = f1_score_seqeval_bucket(
+                [pred_chunks[i] for i in pred_buckets[key]],
+                [true_chunks[i] for i in true_buckets[key]],
+            )
+            for score, expected_score in zip(scores[key], expected):
+                self.assertAlmostEqual(score, expected_score)
+
+
+if __name__ == "__main__":
+    unittest.main()
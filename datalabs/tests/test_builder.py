@@ -0,0 +1,174 @@
+from dataclasses import dataclass, field
+import os
+import tempfile
+from typing import List
+import unittest
+from unittest import mock
+
+import datalabs
+from datalabs import Dataset
+from datalabs.builder import GeneratorBasedBuilder
+from datalabs.keyhash import DuplicatedKeysError
+from datalabs.operations.featurize.general import get_length
+from datalabs.utils.sharding import _split_gen_kwargs
+
+
+@dataclass
+class DummyShardedConfig(datalabs.BuilderConfig):
+    files: List[int] = field(default_factory=list)
+    duplicate_keys: bool = False
+
+
+class DummyShardedBuilder(GeneratorBasedBuilder):
+    BUILDER_CONFIG_CLASS = DummyShardedConfig
+
+    def _info(self):
+        return datalabs.DatasetInfo(
+            features=datalabs.Features(
+                {"text": datalabs.Value("string"), "length": datalabs.Value("int64")}
+            )
+        )
+
+    def _split_generators(self, dl_manager):
+        return [
+            datalabs.SplitGenerator(
+                name=datalabs.Split.TRAIN,
+                gen_kwargs={"files": self.config.files, "prefix": "text"},
+            )
+        ]
+
+    def _generate_examples(self, files, prefix):
+        for file in files:
+            for i in range(file):
+                key = i if self.config.duplicate_keys else f"{file}_{i}"
+                text = f"{prefix} {file} {i}"
+                yield key, {"text": text, "length": len(text)}
+
+
+class DummyExpandingBuilder(DummyShardedBuilder):
+    def _info(self):
+        return datalabs.DatasetInfo(
+            features=datalabs.Features({"text": datalabs.Value("string")})
+        )
+
+    def _generate_examples(self, files, prefix):
+        for file in files:
+            for i in range(file):
+                yield f"{file}_{i}", {"text": f"{prefix} {file} {i}"}
+
+    def _feature_expanding_operation(self):
+        return get_length
+
+
+class DummyUnshardableBuilder(DummyShardedBuilder):
+    def _split_generators(self, dl_manager):
+        # the list of columns isn't a list of shards
+        return [
+            datalabs.SplitGenerator(
+                name=datalabs.Split.TRAIN,
+                gen_kwargs={
+                    "files": self.config.files,
+                    "prefix": "text",
+                    "columns": ["text", "length"],
+                },
+            )
+        ]
+
+    def _generate_examples(self, files, prefix, columns):
+        yield from super()._generate_examples(files, prefix)
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def build(self, num_proc, files, duplicate_keys=False):
+        builder = DummyShardedBuilder(
+            cache_dir=os.path.join(self.tmp_dir.name, str(num_proc)),
+            num_proc=num_proc,
+            files=files,
+            duplicate_keys=duplicate_keys,
+        )
+        builder.download_and_prepare(
+            try_from_hf_gcs=False, download_mode="force_redownload"
+        )
+        return builder
+
+    def test_feature_expanding(self):
+        cache_dir = os.path.join(self.tmp_dir.name, "expanding")
+        builder = DummyExpandingBuilder(cache_dir=cache_dir, files=[2, 3])
+        builder.download_and_prepare(try_from_hf_gcs=False)
+        raw = builder.as_dataset(split="train")
+        self.assertEqual(raw.column_names, ["text"])
+
+        for _ in range(2):
+            builder = DummyExpandingBuilder(
+                cache_dir=cache_dir, files=[2, 3], feature_expanding=True, num_proc=2
+            )
+            # the prepared split is reused
+            with mock.patch.object(
+                DummyExpandingBuilder, "_prepare_split"
+            ) as prepare_split:
+                builder.download_and_prepare(try_from_hf_gcs=False)
+                self.assertEqual(prepare_split.call_count, 0)
+            expanded = builder.as_dataset(split="train")
+            self.assertEqual(expanded.column_names, ["text", "length"])
+            self.assertEqual(expanded["length"], [3] * 5)
+        # the features are computed once, then loaded from the cache
+        cache_files = [
+            f for f in os.listdir(builder.cache_dir) if f.startswith("cache-apply-")
+        ]
+        self.assertEqual(len(cache_files), 1)
+
+    def test_split_gen_kwargs(self):
+        shards = _split_gen_kwargs({"files": [1, 2, 3, 4, 5], "prefix": "a"}, 2)
+        self.assertEqual(
+            shards,
+            [{"files": [1, 2], "prefix": "a"}, {"files": [3, 4, 5], "prefix": "a"}],
+        )
+        self.assertEqual(_split_gen_kwargs({"prefix": "a"}, 4), [{"prefix": "a"}])
+        with self.assertRaises(RuntimeError):
+            _split_gen_kwargs({"a": [1, 2], "b": [1]}, 2)
+
+    def test_sharded_matches_serial(self):
+        files = [3, 5, 0, 7, 2]
+        serial = self.build(1, files)
+        sharded = self.build(3, files)
+        train = sharded.info.splits["train"]
+        self.assertEqual(train.num_examples, sum(files))
+        self.assertEqual(train.num_bytes, serial.info.splits["train"].num_bytes)
+        self.assertEqual(
+            sharded.as_dataset(split="train").to_dict(),
+            serial.as_dataset(split="train").to_dict(),
+        )
+        self.assertIsInstance(sharded.as_dataset(split="train"), Dataset)
+        self.assertEqual(
+            [f for f in os.listdir(sharded.cache_dir) if "-of-" in f],
+            [],
+        )
+
+    def test_unshardable_gen_kwargs(self):
+        files = [3, 5, 2]
+        builder = DummyUnshardableBuilder(
+            cache_dir=os.path.join(self.tmp_dir.name, "unshardable"),
+            num_proc=2,
+            files=files,
+        )
+        with self.assertLogs("datalabs.builder", level="WARNING") as logs:
+            builder.download_and_prepare(try_from_hf_gcs=False)
+        self.assertIn("in a single process", logs.output[0])
+        self.assertEqual(
+            builder.as_dataset(split="train").to_dict(),
+            self.build(1, files).as_dataset(split="train").to_dict(),
+        )
+
+    def test_duplicate_keys_across_shards(self):
+        with self.assertRaises(DuplicatedKeysError):
+            self.build(2, [3, 3], duplicate_keys=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import gc
+import unittest
+
+import pyarrow as pa
+
+from datalabs import Array2D, Dataset, Features
+from datalabs.fingerprint import _CHUNK_DIGESTS, Hasher
+
+
+class MyTestCase(unittest.TestCase):
+    def test_hash_table(self):
+        values = list(range(1000))
+        table = pa.table({"x": values, "text": [str(v) for v in values]})
+        same = pa.table({"x": values, "text": [str(v) for v in values]})
+        self.assertEqual(Hasher.hash(table), Hasher.hash(same))
+
+        # a value in the middle of a chunk
+        changed = values.copy()
+        changed[500] = -1
+        other = pa.table({"x": changed, "text": [str(v) for v in values]})
+        self.assertNotEqual(Hasher.hash(table), Hasher.hash(other))
+
+        # slices only depend on their values
+        self.assertEqual(
+            Hasher.hash(table.slice(10, 5)), Hasher.hash(same.slice(10, 5))
+        )
+        self.assertNotEqual(
+            Hasher.hash(table.slice(10, 5)), Hasher.hash(table.slice(11, 5))
+        )
+
+    def test_nested_types(self):
+        def make_table(labels):
+            return pa.table(
+                {
+                    "tokens": [["a", "b"], [], None],
+                    "label": pa.array(labels).dictionary_encode(),
+                }
+            )
+
+        table = make_table(["x", "y", "x"])
+        self.assertEqual(Hasher.hash(table), Hasher.hash(make_table(["x", "y", "x"])))
+        self.assertNotEqual(
+            Hasher.hash(table), Hasher.hash(make_table(["x", "y", "y"]))
+        )
+
+        features = Features({"matrix": Array2D(shape=(2, 2), dtype="int32")})
+        dataset = Dataset.from_dict({"matrix": [[[1, 2], [3, 4]]]}, features=features)
+        other = Dataset.from_dict({"matrix": [[[1, 2], [3, 5]]]}, features=features)
+        self.assertNotEqual(Hasher.hash(dataset.data), Hasher.hash(other.data))
+
+    def test_chunk_digests_are_reused(self):
+        _CHUNK_DIGESTS.clear()
+        table = pa.table({"text": ["a", "b", "c"], "label": [0, 1, 0]})
+        dataset = Dataset(table)
+        self.assertEqual(len(_CHUNK_DIGESTS), 2)
+        derived = Dataset(table.append_column("length", pa.array([1, 1, 1])))
+        # only the chunks of the new column are hashed
+        self.assertEqual(len(_CHUNK_DIGESTS), 3)
+        self.assertNotEqual(dataset._fingerprint, derived._fingerprint)
+
+    def test_freed_dataset_releases_memory(self):
+        small_table = pa.table({"id": [0]})
+        gc.collect()
+        Hasher.hash(small_table)
+        allocated = pa.total_allocated_bytes()
+        num_digests = len(_CHUNK_DIGESTS)
+
+        table = pa.table({"text": ["x" * 100] * 100000, "id": range(100000)})
+        dataset = Dataset(table)
+        self.assertGreater(pa.total_allocated_bytes(), allocated + 10000000)
+        self.assertEqual(len(_CHUNK_DIGESTS), num_digests + 2)
+
+        del table, dataset
+        gc.collect()
+        self.assertEqual(pa.total_allocated_bytes(), allocated)
+        # the digests of the freed chunks are dropped on the next hash
+        Hasher.hash(small_table)
+        self.assertEqual(len(_CHUNK_DIGESTS), num_digests)
+
+
+if __name__ == "__main__":
+    unittest.main()
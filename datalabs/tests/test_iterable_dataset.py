@@ -0,0 +1,103 @@
+import time
+import unittest
+
+import pyarrow as pa
+
+from datalabs.iterable_dataset import (
+    _generate_examples_from_tables_wrapper,
+    ArrowExamplesIterable,
+    ExamplesIterable,
+    IterableDataset,
+)
+
+
+def generate_tables(files):
+    for file in files:
+        for i in range(3):
+            n_rows = 4 + 3 * i
+            yield f"{file}_{i}", pa.table(
+                {
+                    "text": [f"{file} {i} {j}" for j in range(n_rows)],
+                    "id": range(n_rows),
+                }
+            )
+
+
+def get_length(batch):
+    return {"text": batch["text"], "length": [len(text) for text in batch["text"]]}
+
+
+def to_upper(example):
+    return {**example, "text": example["text"].upper()}
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        kwargs = {"files": ["a", "b"]}
+        self.arrow_dataset = IterableDataset(
+            ArrowExamplesIterable(generate_tables, kwargs)
+        )
+        self.dataset = IterableDataset(
+            ExamplesIterable(
+                _generate_examples_from_tables_wrapper(generate_tables), kwargs
+            )
+        )
+
+    def test_arrow_batches(self):
+        expected = list(
+            self.dataset.map(get_length, batched=True, batch_size=5)._iter()
+        )
+        self.assertEqual(len(expected), 2 * (4 + 7 + 10))
+        self.assertEqual(expected[0][0], "a_0_0_a_0_1_a_0_2_a_0_3_a_1_0")
+        self.assertEqual(
+            list(
+                self.arrow_dataset.map(get_length, batched=True, batch_size=5)._iter()
+            ),
+            expected,
+        )
+        self.assertEqual(list(self.arrow_dataset), list(self.dataset))
+
+    def test_workers(self):
+        expected = list(
+            self.dataset.map(get_length, batched=True, batch_size=5)._iter()
+        )
+        for dataset in [self.dataset, self.arrow_dataset]:
+            for worker_type in ["thread", "process"]:
+                mapped = dataset.map(
+                    get_length,
+                    batched=True,
+                    batch_size=5,
+                    num_workers=2,
+                    prefetch=3,
+                    worker_type=worker_type,
+                )
+                self.assertEqual(list(mapped._iter()), expected)
+
+        expected = list(self.dataset.map(to_upper)._iter())
+        mapped = self.arrow_dataset.map(to_upper, batch_size=3, num_workers=2)
+        self.assertEqual(list(mapped._iter()), expected)
+
+        with self.assertRaises(ValueError):
+            self.dataset.map(to_upper, num_workers=2, worker_type="fiber")
+
+    def test_prefetch(self):
+        def slow_length(batch):
+            time.sleep(0.05)
+            return get_length(batch)
+
+        start = time.perf_counter()
+        mapped = self.arrow_dataset.map(
+            slow_length, batched=True, batch_size=2, num_workers=4
+        )
+        # 21 batches mapped 4 at a time
+        self.assertEqual(len(list(mapped)), 42)
+        self.assertLess(time.perf_counter() - start, 21 * 0.05)
+
+        # interrupted iteration
+        iterator = iter(mapped)
+        next(iterator)
+        iterator.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
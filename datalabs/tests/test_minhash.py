@@ -0,0 +1,139 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+from datalabs import Dataset
+from datalabs.operations.aggregate.general import get_duplicate_clusters
+from datalabs.operations.featurize.general import get_minhash
+from datalabs.search import MinHashLSHIndex
+from datalabs.utils.minhash import band_keys, lsh_params, MinHasher, shingles
+
+
+def jaccard(a, b):
+    a, b = set(shingles(a)), set(shingles(b))
+    return len(a & b) / len(a | b)
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        base = "the quick brown fox jumps over the lazy dog near the river bank today"
+        self.train = Dataset.from_dict(
+            {
+                "text": [
+                    base,
+                    "a completely different sentence about machine learning models",
+                    base + " again",
+                    "yet another unrelated text on the weather in spring",
+                    base.upper(),
+                ]
+            }
+        )
+        self.test = Dataset.from_dict(
+            {
+                "text": [
+                    "nothing in common with the training data at all here",
+                    base + " again",
+                ]
+            }
+        )
+
+    def test_signatures(self):
+        minhasher = MinHasher(num_perm=256)
+        texts = [
+            "one two three four five six seven eight nine ten",
+            "one two three four five six seven eight nine eleven",
+            "",
+        ]
+        signatures = minhasher.signatures(texts)
+        self.assertEqual(signatures.shape, (3, 256))
+        self.assertEqual(signatures.dtype, np.uint32)
+        # the agreement of signatures estimates the Jaccard similarity
+        agreement = np.mean(signatures[0] == signatures[1])
+        self.assertAlmostEqual(agreement, jaccard(texts[0], texts[1]), delta=0.1)
+        self.assertTrue((signatures[2] == 2**32 - 1).all())
+        # signatures don't depend on the batch
+        np.testing.assert_array_equal(
+            minhasher.signatures(texts[1:2])[0], signatures[1]
+        )
+
+    def test_band_keys(self):
+        bands, rows = lsh_params(128, 0.8)
+        self.assertLessEqual(bands * rows, 128)
+        signatures = MinHasher().signatures(["a b c d", "a b c d", "e f g h"])
+        keys = band_keys(signatures, bands, rows)
+        self.assertEqual(keys.shape, (3, bands))
+        np.testing.assert_array_equal(keys[0], keys[1])
+        self.assertFalse((keys[0] == keys[2]).any())
+
+    def test_duplicate_clusters(self):
+        self.train.add_minhash_index("text")
+        self.assertEqual(self.train.get_duplicate_clusters("text"), [[0, 2, 4]])
+
+        res = self.train.apply(get_duplicate_clusters)
+        self.assertEqual(res._stat["duplicate_clusters"], [[0, 2, 4]])
+        self.assertEqual(res._stat["duplicate_ratio"], 2 / 5)
+
+    def test_search(self):
+        self.train.add_minhash_index("text")
+        scores, indices = self.train.search("text", self.test["text"][1], k=2)
+        self.assertEqual(sorted(indices), [0, 2])
+        self.assertEqual(scores[0], 1.0)
+
+    def test_leakage(self):
+        self.train.add_minhash_index("text")
+        leakage = self.train.get_leakage("text", self.test)
+        self.assertEqual(leakage, {"leakage_rate": 0.5, "leaked_indices": [1]})
+
+    def test_signature_column(self):
+        for batched in [False, True]:
+            train = self.train.apply(get_minhash, mode="memory", batched=batched)
+            self.assertEqual(len(train["minhash"][0]), 128)
+            train.add_minhash_index(
+                "text", index_name="minhash", signature_column="minhash"
+            )
+            self.assertEqual(train.get_duplicate_clusters("minhash"), [[0, 2, 4]])
+
+    def test_minhasher_created_on_first_use(self):
+        code = (
+            "from datalabs.operations.featurize.general import _minhasher, get_minhash;"
+            "print(_minhasher.cache_info().currsize);"
+            "get_minhash('a b c');"
+            "print(_minhasher.cache_info().currsize)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.split(), ["0", "1"])
+
+    def test_empty_index(self):
+        minhash_index = MinHashLSHIndex()
+        minhash_index.add_documents([])
+        self.assertEqual(
+            minhash_index.leakage(self.test["text"]),
+            {"leakage_rate": 0.0, "leaked_indices": []},
+        )
+        self.assertEqual(minhash_index.duplicate_clusters(), [])
+
+    def test_save_load(self):
+        minhash_index = MinHashLSHIndex(threshold=0.5)
+        minhash_index.add_documents(self.train["text"], batch_size=2)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "index")
+            minhash_index.save(path)
+            loaded = MinHashLSHIndex.load(path)
+            np.testing.assert_array_equal(loaded.keys, minhash_index.keys)
+            self.assertEqual(
+                loaded.duplicate_clusters(), minhash_index.duplicate_clusters()
+            )
+            self.assertEqual(
+                loaded.leakage(self.test["text"]),
+                minhash_index.leakage(self.test, column="text"),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+from collections import Counter
+import math
+import tempfile
+import unittest
+
+from datalabs import Dataset
+from datalabs.search import bm25_tokenize, BM25Index
+
+
+def bm25_scores(documents, query, k1=1.2, b=0.75):
+    # reference implementation scoring each document separately
+    documents = [Counter(bm25_tokenize(document)) for document in documents]
+    avg_doc_len = sum(sum(doc.values()) for doc in documents) / len(documents)
+    scores = []
+    for doc in documents:
+        score = 0.0
+        for term in bm25_tokenize(query):
+            df = sum(term in other for other in documents)
+            idf = math.log(1 + (len(documents) - df + 0.5) / (df + 0.5))
+            tf = doc[term]
+            norm = k1 * (1 - b + b * sum(doc.values()) / avg_doc_len)
+            score += idf * tf / (tf + norm)
+        scores.append(score)
+    return scores
+
+
+class MyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.documents = [
+            "The cat sat on the mat.",
+            "Dogs and cats are friends",
+            "A dog barked at the mailman, the dog ran",
+            "Nothing relevant here",
+            "cat cat cat",
+        ]
+        self.dataset = Dataset.from_dict({"text": self.documents})
+
+    def test_search(self):
+        self.dataset.add_bm25_index("text")
+        for query in ["cat", "the dog", "cats and dogs", "unknown words"]:
+            expected = bm25_scores(self.documents, query)
+            scores, indices = self.dataset.search("text", query, k=3)
+            top = sorted(
+                (i for i, score in enumerate(expected) if score > 0),
+                key=lambda i: (-expected[i], i),
+            )[:3]
+            self.assertEqual(indices, top)
+            for score, i in zip(scores, indices):
+                self.assertAlmostEqual(score, expected[i], places=5)
+
+        total_scores, total_indices = self.dataset.search_batch(
+            "text", ["cat", "dog"], k=2
+        )
+        self.assertEqual(total_indices[0], self.dataset.search("text", "cat", k=2)[1])
+        self.assertEqual(
+            self.dataset.get_nearest_examples("text", "mailman", k=1).examples,
+            {"text": [self.documents[2]]},
+        )
+
+    def test_ties(self):
+        index = BM25Index()
+        index.add_documents(["a b c", "b c d", ""])
+        self.assertEqual(index.search_batch(["b"], k=1).total_indices, [[0]])
+
+        index = BM25Index()
+        index.add_documents(["x y"] * 50)
+        scores, indices = index.search_batch(["x"], k=3)
+        self.assertEqual(indices, [[0, 1, 2]])
+        self.assertEqual(len(set(scores[0])), 1)
+
+    def test_save_load(self):
+        self.dataset.add_bm25_index("text")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.dataset.save_bm25_index("text", tmp_dir)
+            dataset = Dataset.from_dict({"text": self.documents})
+            dataset.load_bm25_index("text", tmp_dir)
+            self.assertEqual(
+                dataset.search_batch("text", ["cat", "the dog"]),
+                self.dataset.search_batch("text", ["cat", "the dog"]),
+            )
+            self.assertIsInstance(dataset.get_index("text"), BM25Index)
+            with self.assertRaises(ValueError):
+                Dataset.from_dict({"text": ["a"]}).load_bm25_index("text", tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,27 @@
 import unittest
 
-from datalabs import load_dataset
+import pyarrow as pa
+
+from datalabs import Dataset, load_dataset
+from datalabs.operations.featurize import featurizing, get_basic_words, get_length
 from datalabs.operations.preprocess.general import tokenize
 from datalabs.operations.tokenizer import (
+    consumes_tokens,
     get_default_tokenizer,
     get_tokenizer,
+    token_column_name,
     tokenizer_registry,
 )
 
+calls = []
+
+
+@featurizing(name="get_num_tokens", contributor="test", task="Any")
+@consumes_tokens("SingleSpaceTokenizer")
+def get_num_tokens(tokens):
+    calls.append(tokens)
+    return {"num_tokens": len(tokens)}
+
 
 class MyTestCase(unittest.TestCase):
     def test_tokenizer_registry(self):
@@ -31,3 +45,56 @@ class MyTestCase(unittest.TestCase):
         dataset_tokenizer = dataset["train"].apply(tokenize, mode="memory")
 
         print(dataset_tokenizer[0:10])
+
+    def test_batch_tokenization(self):
+        texts = pa.array(["I love this movie", "", None])
+        tokenizer = get_tokenizer("SingleSpaceTokenizer")
+        self.assertEqual(
+            tokenizer.batch(texts).to_pylist(),
+            [["I", "love", "this", "movie"], [""], None],
+        )
+
+    def test_token_column(self):
+        dataset = Dataset.from_dict({"text": ["I love this movie", "so bad"]})
+        tokenized = dataset.tokenize("text", "SingleSpaceTokenizer")
+        column = token_column_name("text", "SingleSpaceTokenizer")
+        self.assertEqual(
+            tokenized[column], [["I", "love", "this", "movie"], ["so", "bad"]]
+        )
+        self.assertIs(tokenized.tokenize("text", "SingleSpaceTokenizer"), tokenized)
+
+        # the operations taking tokens read the token column
+        tokens = pa.array([["a"], ["b", "c", "d"]], pa.list_(pa.string()))
+        dataset = Dataset.from_dict({"text": ["x y", "x y"]}).add_column(
+            column, tokens.to_pylist()
+        )
+        for batched in [False, True]:
+            self.assertEqual(
+                dataset.apply(get_length, mode="memory", batched=batched)["length"],
+                [1, 3],
+            )
+        self.assertEqual(
+            list(dataset.apply(get_length)), [{"length": 1}, {"length": 3}]
+        )
+
+    def test_tokens_are_shared(self):
+        dataset = Dataset.from_dict({"text": ["I love this movie", "so bad"]})
+        self.assertEqual(get_length("I love this movie"), {"length": 4})
+
+        outputs = dataset.apply_pipeline([get_length, get_basic_words, get_num_tokens])
+        self.assertEqual(outputs["length"], [4, 2])
+        self.assertEqual(outputs["num_tokens"], [4, 2])
+        self.assertEqual(
+            outputs["basic_word_ratio"],
+            dataset.apply(get_basic_words, mode="memory", batched=True)[
+                "basic_word_ratio"
+            ],
+        )
+        self.assertEqual(calls[-2:], [["I", "love", "this", "movie"], ["so", "bad"]])
+        self.assertNotIn(
+            token_column_name("text", "SingleSpaceTokenizer"), outputs.column_names
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
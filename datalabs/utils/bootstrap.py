@@ -0,0 +1,138 @@
+"""Bootstrap confidence intervals of evaluation metrics.
+
+A confidence interval is estimated from the performances of ``n_times``
+resamples (with replacement) of ``n_sampling`` examples of the evaluated data.
+The indices of all the resamples are drawn at once, as a
+``(n_times, n_sampling)`` integer matrix generated chunk by chunk to bound the
+memory, from a seeded random generator.
+
+Metrics that are the mean of per-example scores (accuracy, hits, ...) are
+computed as vectorized reductions over the resampled scores; other metrics
+(e.g. F1) are evaluated on each resample, optionally by a pool of processes.
+"""
+from typing import Any, Callable, Iterator, Optional, Sequence, Tuple
+
+from multiprocess import Pool
+import numpy as np
+
+# maximum number of resampled indices held in memory at once
+MAX_CHUNK_ELEMENTS = 2**24
+
+
+def mean_confidence_interval(data, confidence=0.95):
+    import scipy.stats
+
+    a = 1.0 * np.array(data)
+    n = len(a)
+    m, se = np.mean(a), scipy.stats.sem(a)
+    h = se * scipy.stats.t.ppf((1 + confidence) / 2.0, n - 1)
+    return m - h, m + h
+
+
+def confidence_interval(performances: Sequence[float]) -> Tuple[float, float]:
+    """
+    The 95% confidence interval of the bootstrap performances: the 2.5th and
+    97.5th percentiles of 1000 resamples, or a t-distribution interval around
+    their mean otherwise
+    """
+    if len(performances) != 1000:
+        return mean_confidence_interval(performances)
+    performances = np.sort(performances)
+    return float(performances[24]), float(performances[974])
+
+
+def bootstrap_indices(
+    n_samples: int,
+    n_sampling: int,
+    n_times: int,
+    seed: Optional[int] = None,
+    max_chunk_elements: int = MAX_CHUNK_ELEMENTS,
+) -> Iterator[np.ndarray]:
+    """
+    The indices of `n_times` resamples of `n_sampling` examples out of
+    `n_samples`, as consecutive row chunks of a (n_times, n_sampling) matrix
+    """
+    rng = np.random.default_rng(seed)
+    dtype = np.int32 if n_samples < 2**31 else np.int64
+    chunk_size = max(1, max_chunk_elements // max(n_sampling, 1))
+    for start in range(0, n_times, chunk_size):
+        yield rng.integers(
+            0,
+            n_samples,
+            size=(min(chunk_size, n_times - start), n_sampling),
+            dtype=dtype,
+        )
+
+
+def bootstrap_mean(
+    scores: Sequence[float],
+    n_sampling: int,
+    n_times: int,
+    seed: Optional[int] = None,
+) -> np.ndarray:
+    """
+    The mean of the per-example `scores` over each of `n_times` resamples of
+    `n_sampling` examples.
+
+    When the scores are all 0 or 1 (e.g. the correctness of each prediction),
+    the number of ones of a resample follows a binomial distribution, which is
+    sampled directly instead of drawing the indices.
+    """
+    scores = np.asarray(scores)
+    if scores.dtype == bool or np.isin(scores, (0, 1)).all():
+        rng = np.random.default_rng(seed)
+        mean = np.mean(scores) if len(scores) > 0 else 0.0
+        return rng.binomial(n_sampling, mean, size=n_times) / n_sampling
+    return np.concatenate(
+        [
+            np.take(scores, indices).mean(axis=1)
+            for indices in bootstrap_indices(len(scores), n_sampling, n_times, seed)
+        ]
+    )
+
+
+def _evaluate_resamples(
+    eval_function: Callable[..., Any], arrays: Sequence[np.ndarray], indices, kwargs
+):
+    return [
+        eval_function(*[array[row] for array in arrays], **kwargs) for row in indices
+    ]
+
+
+def bootstrap_metric(
+    eval_function: Callable[..., Any],
+    arrays: Sequence[Sequence[Any]],
+    n_sampling: int,
+    n_times: int,
+    seed: Optional[int] = None,
+    num_proc: int = 1,
+    **kwargs,
+) -> np.ndarray:
+    """
+    The performance `eval_function(*resampled_arrays, **kwargs)` of each of
+    `n_times` resamples of `n_sampling` examples of `arrays` (e.g. the true and
+    predicted labels), computed by `num_proc` processes.
+    """
+    arrays = [np.asarray(array) for array in arrays]
+    n_samples = len(arrays[0])
+    max_chunk_elements = MAX_CHUNK_ELEMENTS
+    if num_proc > 1:
+        # at least one chunk per process
+        max_chunk_elements = min(
+            max_chunk_elements, max(1, -(-n_times // num_proc)) * max(n_sampling, 1)
+        )
+    chunks = bootstrap_indices(
+        n_samples, n_sampling, n_times, seed, max_chunk_elements=max_chunk_elements
+    )
+    if num_proc <= 1:
+        performances = [
+            _evaluate_resamples(eval_function, arrays, indices, kwargs)
+            for indices in chunks
+        ]
+    else:
+        with Pool(num_proc) as pool:
+            performances = pool.starmap(
+                _evaluate_resamples,
+                [(eval_function, arrays, indices, kwargs) for indices in chunks],
+            )
+    return np.array([value for chunk in performances for value in chunk])
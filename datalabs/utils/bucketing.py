@@ -0,0 +1,245 @@
+"""Bucketing of feature columns.
+
+A feature column (e.g. the length of each sample, or the tag of each entity)
+is split into buckets, each bucket being identified by a key, as in
+``datalabs.utils.analysis``:
+
+    - ``(value,)``: the samples whose feature is `value`
+    - ``(low, high)``: the samples whose feature is in [low, high]
+
+and holding the indices (in the column) of its samples, as an integer array.
+The buckets are computed on the whole column with NumPy: ``np.searchsorted``
+assigns the values to intervals, ``np.unique`` groups the discrete values, and
+the indices of all the buckets are obtained from a single stable sort of the
+bucket of each sample, see `group_indices`.
+
+Per-bucket metrics are then grouped reductions over the buckets (e.g.
+`bucket_accuracy`, or `f1_score_seqeval_buckets` in
+``datalabs.utils.eval_bucket``), without going through the samples in Python.
+"""
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# bounds of the last bucket of `bucket_specified_value` when there's a single
+# one, as in datalabs.utils.analysis
+P_INFINITY = 1000000
+N_INFINITY = -1000000
+
+
+def group_indices(bucket_ids: np.ndarray, n_buckets: int) -> List[np.ndarray]:
+    """
+    The indices of the samples of each bucket, in increasing order, given the
+    bucket of each sample (from 0 to `n_buckets` - 1, or -1 for none)
+    """
+    # the stable sort of 16-bit integers is a radix sort, linear
+    dtype = np.int16 if n_buckets < 2**15 else np.int64
+    bucket_ids = np.asarray(bucket_ids).astype(dtype, copy=False)
+    order = np.argsort(bucket_ids, kind="stable")
+    counts = np.bincount(bucket_ids[bucket_ids >= 0], minlength=n_buckets)
+    # the samples without bucket are sorted first
+    start = len(bucket_ids) - counts.sum()
+    return np.split(order[start:], np.cumsum(counts)[:-1])
+
+
+def bucket_ids(
+    buckets: Dict[Tuple, np.ndarray], n_samples: int
+) -> Tuple[List[Tuple], np.ndarray]:
+    """
+    The keys of the buckets, and the position of the bucket of each sample in
+    those keys (-1 for the samples of no bucket)
+    """
+    ids = np.full(n_samples, -1, dtype=np.int64)
+    for i, indices in enumerate(buckets.values()):
+        ids[indices] = i
+    return list(buckets), ids
+
+
+def _interval_bounds(intervals: Sequence[Tuple]) -> Tuple[np.ndarray, np.ndarray]:
+    bounds = np.array(
+        [(k[0], k[0]) if len(k) == 1 else (k[0], k[1]) for k in intervals],
+        dtype=np.float64,
+    ).reshape(-1, 2)
+    return bounds[:, 0], bounds[:, 1]
+
+
+def bucket_interval(
+    values: Iterable, intervals: Sequence[Tuple]
+) -> Dict[Tuple, np.ndarray]:
+    """
+    Buckets of given intervals, ``(value,)`` or ``(low, high)`` with both
+    bounds included. The intervals shouldn't overlap except at their bounds: a
+    value on the bound of two intervals is in the lowest one. The values of no
+    interval aren't in any bucket.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    intervals = [tuple(k) for k in intervals]
+    lows, highs = _interval_bounds(intervals)
+    # by increasing upper bound, then lower bound
+    order = np.lexsort((lows, highs))
+    # the first interval whose upper bound is >= each value
+    positions = np.searchsorted(highs[order], values, side="left")
+    found = positions < len(intervals)
+    positions[~found] = 0
+    ids = np.where(found & (lows[order][positions] <= values), order[positions], -1)
+    return dict(zip(intervals, group_indices(ids, len(intervals))))
+
+
+def _unique(values: Iterable) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    The distinct values, in the order of their first occurrence, the position
+    of each value in them, and their number of occurrences
+    """
+    values = np.asarray(values)
+    uniques, first, inverse, counts = np.unique(
+        values, return_index=True, return_inverse=True, return_counts=True
+    )
+    order = np.argsort(first, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return uniques[order], rank[inverse.reshape(-1)], counts[order]
+
+
+def bucket_discrete(
+    values: Iterable, n_buckets: int = 100000000, min_count: int = 1
+) -> Dict[Tuple, np.ndarray]:
+    """
+    One bucket ``(value,)`` per distinct value, from the most to the least
+    frequent one (in the order of their first occurrence for equal numbers of
+    occurrences): at most `n_buckets` values occurring `min_count` times or more
+    """
+    uniques, ids, counts = _unique(values)
+    # the most frequent values first
+    order = np.argsort(-counts, kind="stable")
+    n_frequent = int(np.sum(counts >= min_count))
+    selected = order[: min(n_frequent, n_buckets)]
+    position = np.full(len(uniques), -1, dtype=np.int64)
+    position[selected] = np.arange(len(selected))
+    indices = group_indices(position[ids], len(selected))
+    return {(uniques[i].item(),): indices[j] for j, i in enumerate(selected)}
+
+
+def bucket_values(
+    values: Iterable, bucket_values: Sequence[Tuple]
+) -> Dict[Tuple, np.ndarray]:
+    """
+    Buckets ``(value,)`` of given discrete values (e.g. entity tags), empty for
+    the values that don't occur
+    """
+    uniques, ids, _ = _unique(values)
+    keys = [tuple(k) for k in bucket_values]
+    key_ids = {k[0]: i for i, k in reversed(list(enumerate(keys)))}
+    position = np.array(
+        [key_ids.get(value.item(), -1) for value in uniques], dtype=np.int64
+    )
+    return dict(zip(keys, group_indices(position[ids], len(keys))))
+
+
+def bucket_specified_value(
+    values: Iterable, n_buckets: int = 4, specified_values: Sequence = ()
+) -> Dict[Tuple, np.ndarray]:
+    """
+    A bucket ``(value,)`` for each of `specified_values` that occurs, and the
+    other values split into consecutive intervals of about the same number of
+    samples: the values are added to an interval, by increasing order, until it
+    has more than its share of the samples
+    """
+    uniques, inverse, counts = np.unique(
+        np.asarray(values, dtype=np.float64), return_inverse=True, return_counts=True
+    )
+    inverse = inverse.reshape(-1)
+    position = np.full(len(uniques), -1, dtype=np.int64)
+    keys = []
+    n_samples = int(counts.sum())
+    for value in specified_values:
+        i = np.searchsorted(uniques, value)
+        if i < len(uniques) and uniques[i] == value and position[i] == -1:
+            position[i] = len(keys)
+            keys.append((value,))
+            n_samples -= int(counts[i])
+            n_buckets -= 1
+
+    avg_samples = n_samples * 1.0 / n_buckets
+    # an interval ends at the first value for which the number of samples
+    # since its start is > avg_samples, found by a binary search of the
+    # cumulative number of samples, once per interval
+    threshold = math.floor(avg_samples) + 1
+    free = np.flatnonzero(position == -1)
+    cumulative = np.cumsum(counts[free])
+    start = 0
+    while start < len(free):
+        base = cumulative[start - 1] if start else 0
+        end = max(
+            start, int(np.searchsorted(cumulative, base + threshold, side="left"))
+        )
+        low = uniques[free[start]].item()
+        position[free[start : end + 1]] = len(keys)
+        if end >= len(free):
+            # the last values, with fewer samples
+            if n_buckets == 1:
+                keys.append((N_INFINITY, P_INFINITY))
+            else:
+                keys.append((low, 1.0 if low <= 1 else P_INFINITY))
+        elif end == start:
+            keys.append((low,))
+        else:
+            keys.append((low, uniques[free[end]].item()))
+        start = end + 1
+
+    return dict(zip(keys, group_indices(position[inverse], len(keys))))
+
+
+def bucket_quantile(values: Iterable, n_buckets: int = 4) -> Dict[Tuple, np.ndarray]:
+    """
+    Equal-frequency buckets: `n_buckets` intervals ``(low, high)`` bounded by
+    the quantiles of the values (fewer when quantiles are equal). A value on
+    the bound of two intervals is in the highest one, except for the maximum.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) == 0:
+        return {}
+    edges = np.unique(np.quantile(values, np.linspace(0, 1, n_buckets + 1)))
+    if len(edges) == 1:
+        return {(edges[0].item(), edges[0].item()): np.arange(len(values))}
+    ids = np.searchsorted(edges[1:-1], values, side="right")
+    keys = [(low.item(), high.item()) for low, high in zip(edges[:-1], edges[1:])]
+    return dict(zip(keys, group_indices(ids, len(keys))))
+
+
+def bucket_sizes(buckets: Dict[Tuple, np.ndarray]) -> Dict[Tuple, int]:
+    return {key: len(indices) for key, indices in buckets.items()}
+
+
+def bucket_sum(
+    buckets: Dict[Tuple, np.ndarray], scores: Iterable[float]
+) -> Dict[Tuple, float]:
+    """The sum of per-sample `scores` over each bucket, as a grouped reduction"""
+    scores = np.asarray(scores, dtype=np.float64)
+    keys, ids = bucket_ids(buckets, len(scores))
+    selected = ids >= 0
+    sums = np.bincount(ids[selected], weights=scores[selected], minlength=len(keys))
+    return dict(zip(keys, sums.tolist()))
+
+
+def bucket_mean(
+    buckets: Dict[Tuple, np.ndarray],
+    scores: Iterable[float],
+    default: Optional[Any] = 0.0,
+) -> Dict[Tuple, float]:
+    """
+    The mean of per-sample `scores` over each bucket (`default` for the empty
+    buckets), as a grouped reduction
+    """
+    return {
+        key: total / len(buckets[key]) if len(buckets[key]) else default
+        for key, total in bucket_sum(buckets, scores).items()
+    }
+
+
+def bucket_accuracy(
+    buckets: Dict[Tuple, np.ndarray], labels: Iterable, predictions: Iterable
+) -> Dict[Tuple, float]:
+    """The accuracy (in %) of the predictions of each bucket"""
+    correct = np.asarray(labels) == np.asarray(predictions)
+    return {key: value * 100 for key, value in bucket_mean(buckets, correct).items()}
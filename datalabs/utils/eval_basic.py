@@ -1,10 +1,14 @@
-from random import choices
 from typing import List
 
 import numpy as np
-import scipy
 from seqeval.metrics import f1_score, precision_score, recall_score
 
+from datalabs.utils.bootstrap import (  # noqa
+    bootstrap_mean,
+    confidence_interval,
+    mean_confidence_interval,
+)
+
 """
 Sequence Labeling
 """
@@ -79,15 +83,9 @@ def accuracy(labels: List[str], predictions: List[str], language=None):
     return accuracy_value * 100
 
 
-def mean_confidence_interval(data, confidence=0.95):
-    a = 1.0 * np.array(data)
-    n = len(a)
-    m, se = np.mean(a), scipy.stats.sem(a)
-    h = se * scipy.stats.t.ppf((1 + confidence) / 2.0, n - 1)
-    return m - h, m + h
-
-
-def compute_confidence_interval_acc(true_label_list, pred_label_list, n_times=1000):
+def compute_confidence_interval_acc(
+    true_label_list, pred_label_list, n_times=1000, seed=None
+):
     def get_sample_rate(n_data):
         res = 0.8
         if n_data > 300000:
@@ -102,30 +100,7 @@ def compute_confidence_interval_acc(true_label_list, pred_label_list, n_times=10
     n_sampling = int(n_data * sample_rate)
     if n_sampling == 0:
         n_sampling = 1
-    # print("n_data:\t", n_data)
-    # print("sample_rate:\t", sample_rate)
-    # print("n_sampling:\t", n_sampling)
-
-    performance_list = []
-    confidence_low, confidence_up = 0, 0
-    for i in range(n_times):
-        sample_index_list = choices(range(n_data), k=n_sampling)
-
-        performance = accuracy(
-            list(np.array(true_label_list)[sample_index_list]),
-            list(np.array(pred_label_list)[sample_index_list]),
-        )
-        performance_list.append(performance)
-
-    if n_times != 1000:
-        confidence_low, confidence_up = mean_confidence_interval(performance_list)
-    else:
-        performance_list.sort()
-        confidence_low = performance_list[24]
-        confidence_up = performance_list[974]
-
-    # print("\n")
-    # print("confidence_low:\t", confidence_low)
-    # print("confidence_up:\t", confidence_up)
-
-    return confidence_low, confidence_up
+
+    correct = np.asarray(pred_label_list) == np.asarray(true_label_list)
+    performances = bootstrap_mean(correct, n_sampling, n_times, seed=seed) * 100
+    return confidence_interval(performances)
@@ -1,3 +1,8 @@
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+from datalabs.utils import bucketing
 from datalabs.utils.eval_basic import *  # noqa
 from datalabs.utils.py_utils import *  # noqa
 
@@ -14,3 +19,29 @@ def f1_score_seqeval_bucket(pred_chunks, true_chunks):
     f1 = 2 * p * r / (p + r) if correct_preds > 0 else 0
     # acc = np.mean(accs)
     return f1, p, r
+
+
+def f1_score_seqeval_buckets(
+    true_buckets: Dict[Tuple, np.ndarray],
+    pred_buckets: Dict[Tuple, np.ndarray],
+    pred_correct: Iterable[bool],
+) -> Dict[Tuple, Tuple[float, float, float]]:
+    """
+    `f1_score_seqeval_bucket` of all the buckets at once (see
+    datalabs.utils.bucketing), from the buckets of the true chunks, the buckets
+    of the predicted chunks, and whether each predicted chunk is a true one.
+    A correct chunk has the same attribute value, hence the same bucket, as
+    the true chunk, and the chunks are distinct: the number of correct chunks
+    of a bucket is the sum of `pred_correct` over its predicted chunks.
+    """
+    keys = list(true_buckets)
+    correct = bucketing.bucket_sum(pred_buckets, pred_correct)
+    correct_preds = np.array([correct.get(key, 0.0) for key in keys])
+    total_preds = np.array([len(pred_buckets.get(key, ())) for key in keys])
+    total_correct = np.array([len(true_buckets[key]) for key in keys])
+
+    found = correct_preds > 0
+    p = np.where(found, correct_preds / np.maximum(total_preds, 1), 0)
+    r = np.where(found, correct_preds / np.maximum(total_correct, 1), 0)
+    f1 = np.where(found, 2 * p * r / np.where(found, p + r, 1), 0)
+    return {key: (float(f1[i]), float(p[i]), float(r[i])) for i, key in enumerate(keys)}
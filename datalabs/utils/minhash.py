@@ -0,0 +1,131 @@
+"""MinHash signatures and locality-sensitive hashing of texts.
+
+The MinHash signature of a text is computed over its word n-grams (shingles):
+the probability that two signatures agree on a permutation is the Jaccard
+similarity of the shingle sets of the two texts. Signatures are then cut into
+``bands`` of ``rows`` permutations, and two texts are candidate near-duplicates
+when they share all the rows of at least one band (LSH banding).
+"""
+import re
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import xxhash
+
+# maximum number of (shingle, permutation) hashes held in memory at once
+MAX_CHUNK_ELEMENTS = 2**22
+
+_MAX_HASH = np.uint32(2**32 - 1)
+# multiplier folding the rows of a band into a single key
+_BAND_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+def shingles(text: str, ngram_size: int = 3) -> List[str]:
+    """The word n-grams of a lower-cased text. Texts shorter than `ngram_size`
+    words have a single shingle."""
+    words = re.findall(r"\w+", text.lower())
+    if len(words) <= ngram_size:
+        return [" ".join(words)] if len(words) > 0 else []
+    return list(
+        {
+            " ".join(words[i : i + ngram_size])
+            for i in range(len(words) - ngram_size + 1)
+        }
+    )
+
+
+def lsh_params(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """
+    The number of bands and rows per band whose LSH threshold
+    `(1 / bands) ** (1 / rows)` is the closest to the Jaccard `threshold`
+    """
+    best = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+class MinHasher:
+    """
+    Computes MinHash signatures of `num_perm` permutations, the permutations
+    being multiply-shift hash functions drawn from `seed`.
+    """
+
+    def __init__(self, num_perm: int = 128, ngram_size: int = 3, seed: int = 1):
+        self.num_perm = num_perm
+        self.ngram_size = ngram_size
+        self.seed = seed
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self.b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+
+    def signatures(self, texts: Sequence[str]) -> np.ndarray:
+        """The signatures of a batch of texts, as a (len(texts), num_perm) matrix
+        of uint32. Texts without any word have all their values set to the
+        maximum hash."""
+        hashes, doc_ids = [], []
+        for doc_id, text in enumerate(texts):
+            text_hashes = [
+                xxhash.xxh64_intdigest(shingle.encode("utf-8"))
+                for shingle in shingles(text or "", self.ngram_size)
+            ]
+            hashes.extend(text_hashes)
+            doc_ids.extend([doc_id] * len(text_hashes))
+        hashes = np.array(hashes, dtype=np.uint64)
+        doc_ids = np.array(doc_ids, dtype=np.int64)
+
+        signatures = np.full((len(texts), self.num_perm), _MAX_HASH, dtype=np.uint32)
+        chunk_size = max(1, MAX_CHUNK_ELEMENTS // self.num_perm)
+        for start in range(0, len(hashes), chunk_size):
+            chunk = hashes[start : start + chunk_size]
+            chunk_doc_ids = doc_ids[start : start + chunk_size]
+            # multiply-shift hashing, overflows wrap around
+            with np.errstate(over="ignore"):
+                permuted = (
+                    (chunk[:, None] * self.a[None, :] + self.b[None, :])
+                    >> np.uint64(32)
+                ).astype(np.uint32)
+            # the shingles of a text are contiguous
+            starts = np.flatnonzero(
+                np.r_[True, chunk_doc_ids[1:] != chunk_doc_ids[:-1]]
+            )
+            rows = chunk_doc_ids[starts]
+            signatures[rows] = np.minimum(
+                signatures[rows], np.minimum.reduceat(permuted, starts, axis=0)
+            )
+        return signatures
+
+
+def band_keys(signatures: np.ndarray, bands: int, rows: int) -> np.ndarray:
+    """The LSH keys of the signatures, as a (len(signatures), bands) matrix of
+    uint64: the key of a band is a hash of its `rows` values."""
+    signatures = np.asarray(signatures, dtype=np.uint64)
+    keys = np.zeros((len(signatures), bands), dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for row in range(rows):
+            keys = keys * _BAND_MULTIPLIER + signatures[:, row : bands * rows : rows]
+            keys ^= keys >> np.uint64(29)
+    return keys
+
+
+def connected_components(num_nodes: int, edges: np.ndarray) -> List[List[int]]:
+    """The connected components of more than one node of an undirected graph
+    given as a (num_edges, 2) array, by increasing first node."""
+    from scipy import sparse
+    from scipy.sparse.csgraph import connected_components as _connected_components
+
+    if len(edges) == 0:
+        return []
+    graph = sparse.coo_matrix(
+        (np.ones(len(edges), dtype=np.int8), (edges[:, 0], edges[:, 1])),
+        shape=(num_nodes, num_nodes),
+    )
+    _, labels = _connected_components(graph, directed=False)
+    sizes = np.bincount(labels)
+    nodes = np.flatnonzero(sizes[labels] > 1)
+    nodes = nodes[np.argsort(labels[nodes], kind="stable")]
+    clusters = np.split(nodes, np.flatnonzero(np.diff(labels[nodes])) + 1)
+    return sorted((cluster.tolist() for cluster in clusters), key=lambda c: c[0])
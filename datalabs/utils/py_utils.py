@@ -546,6 +546,11 @@ def _save_code(pickler, obj):
         else os.path.basename(obj.co_filename)
     )
     co_firstlineno = 1
+    if not hasattr(dill._dill, "PY3"):
+        # dill>=0.3.5 dropped python 2 and handles the code objects of all
+        # python 3 versions
+        obj = obj.replace(co_filename=co_filename, co_firstlineno=co_firstlineno)
+        return dill._dill.save_code(pickler, obj)
     # The rest is the same as in the original dill implementation
     if dill._dill.PY3:
         if hasattr(obj, "co_posonlyargcount"):
@@ -607,6 +612,21 @@ def _save_code(pickler, obj):
     return
 
 
+@contextlib.contextmanager
+def _sorted_globalvars():
+    globalvars = dill.detect.globalvars
+
+    def sorted_globalvars(*args, **kwargs):
+        globs = globalvars(*args, **kwargs)
+        return {k: globs[k] for k in sorted(globs.keys())}
+
+    dill.detect.globalvars = sorted_globalvars
+    try:
+        yield
+    finally:
+        dill.detect.globalvars = globalvars
+
+
 @pklregister(FunctionType)
 def save_function(pickler, obj):
     """
@@ -614,6 +634,11 @@ def save_function(pickler, obj):
     This is a modified version that make globs deterministic since the order of
     the keys in the output dictionary of globalvars can change.
     """
+    if not hasattr(dill._dill, "stack"):
+        # dill>=0.3.5 reworked save_function, we only make the order of the
+        # globals it collects deterministic
+        with _sorted_globalvars():
+            return dill._dill.save_function(pickler, obj)
     if not dill._dill._locate_function(obj):
         dill._dill.log.info(f"F1: {obj}")
         if getattr(pickler, "_recurse", False):
@@ -0,0 +1,46 @@
+"""Sharding of the generation of a split across processes.
+
+The shards of a split are declared by the lists of its ``gen_kwargs`` (e.g.
+the list of the files to read): every list must have the same length, the
+number of shards, and the other arguments are shared by all the shards.
+"""
+from typing import List
+
+import numpy as np
+
+
+def _number_of_shards_in_gen_kwargs(gen_kwargs: dict) -> int:
+    """The number of shards of the lists of `gen_kwargs`, 1 if there is none"""
+    lists_lengths = {
+        key: len(value) for key, value in gen_kwargs.items() if isinstance(value, list)
+    }
+    if len(set(lists_lengths.values())) > 1:
+        raise RuntimeError(
+            "Sharding is ambiguous for this split: the lists of gen_kwargs must "
+            f"have the same length to be used as shards, got {lists_lengths}"
+        )
+    return max(lists_lengths.values(), default=1)
+
+
+def _distribute_shards(num_shards: int, max_num_jobs: int) -> List[range]:
+    """Contiguous ranges of shards of (nearly) equal sizes for each job"""
+    num_jobs = max(1, min(num_shards, max_num_jobs))
+    bounds = np.linspace(0, num_shards, num_jobs + 1).round().astype(int)
+    return [range(start, end) for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+def _split_gen_kwargs(gen_kwargs: dict, max_num_jobs: int) -> List[dict]:
+    """
+    Split the lists of `gen_kwargs` into at most `max_num_jobs` groups of
+    contiguous shards, keeping the order of the shards
+    """
+    num_shards = _number_of_shards_in_gen_kwargs(gen_kwargs)
+    if num_shards == 1:
+        return [dict(gen_kwargs)]
+    return [
+        {
+            key: [value[i] for i in shards] if isinstance(value, list) else value
+            for key, value in gen_kwargs.items()
+        }
+        for shards in _distribute_shards(num_shards, max_num_jobs)
+    ]
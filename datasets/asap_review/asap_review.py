@@ -66,8 +66,8 @@ class ASAPReviewDataset(datalabs.GeneratorBasedBuilder):
         )
 
         if self.feature_expanding:
-            features_sample, features_dataset = get_feature_schemas(
-                features_sample, get_schema_of_sample_level_features_asap
+            _, features_dataset = get_feature_schemas(
+                features_sample.copy(), get_schema_of_sample_level_features_asap
             )
 
         return datalabs.DatasetInfo(
@@ -85,6 +85,10 @@ class ASAPReviewDataset(datalabs.GeneratorBasedBuilder):
             ],
         )
 
+    def _feature_expanding_operation(self):
+        # applied to the prepared splits when feature_expanding is set
+        return get_features_sample_level_asap
+
     def _split_generators(self, dl_manager):
         train_path = dl_manager.download_and_extract(_TRAIN_DOWNLOAD_URL)
         val_path = dl_manager.download_and_extract(_VALIDATION_DOWNLOAD_URL)
@@ -126,13 +130,4 @@ class ASAPReviewDataset(datalabs.GeneratorBasedBuilder):
                     "text": text,
                 }
 
-                if not self.feature_expanding:
-                    yield id_, raw_feature_info
-
-                else:
-                    additional_feature_info = get_features_sample_level_asap(
-                        raw_feature_info
-                    )
-                    raw_feature_info.update(additional_feature_info)
-                    # print(additional_feature_info)
-                    yield id_, raw_feature_info
+                yield id_, raw_feature_info
@@ -91,8 +91,8 @@ class CRD3Dataset(datalabs.GeneratorBasedBuilder):
                 }
             )
             if self.feature_expanding:
-                features_sample, features_dataset = get_feature_schemas(
-                    features_sample, get_schema_of_sample_level_features
+                _, features_dataset = get_feature_schemas(
+                    features_sample.copy(), get_schema_of_sample_level_features
                 )
 
         else:
@@ -119,6 +119,10 @@ class CRD3Dataset(datalabs.GeneratorBasedBuilder):
             task_templates=self.config.task_templates,
         )
 
+    def _feature_expanding_operation(self):
+        # applied to the prepared splits when feature_expanding is set
+        return get_features_sample_level if "document" in self.config.name else None
+
     def _split_generators(self, dl_manager):
         test_file_id = dl_manager.download(os.path.join(_BASE_URL, "test_files"))
         train_file_id = dl_manager.download(os.path.join(_BASE_URL, "train_files"))
@@ -285,14 +289,7 @@ class CRD3Dataset(datalabs.GeneratorBasedBuilder):
                             )
                         raw_feature_info = {_ARTICLE: text, _ABSTRACT: summary}
 
-                        if not self.feature_expanding:
-                            yield cnt, raw_feature_info
-                        else:
-                            additional_feature_info = get_features_sample_level(
-                                raw_feature_info
-                            )
-                            raw_feature_info.update(additional_feature_info)
-                            yield cnt, raw_feature_info
+                        yield cnt, raw_feature_info
                         cnt += 1
 
                     else:
@@ -91,8 +91,8 @@ class DialogSumDataset(datalabs.GeneratorBasedBuilder):
                 }
             )
             if self.feature_expanding:
-                features_sample, features_dataset = get_feature_schemas(
-                    features_sample, get_schema_of_sample_level_features
+                _, features_dataset = get_feature_schemas(
+                    features_sample.copy(), get_schema_of_sample_level_features
                 )
 
         else:
@@ -119,6 +119,10 @@ class DialogSumDataset(datalabs.GeneratorBasedBuilder):
             task_templates=self.config.task_templates,
         )
 
+    def _feature_expanding_operation(self):
+        # applied to the prepared splits when feature_expanding is set
+        return get_features_sample_level if "document" in self.config.name else None
+
     def _split_generators(self, dl_manager):
         train_path = dl_manager.download(self._TRAIN_URL)
         val_path = dl_manager.download(self._VAL_URL)
@@ -161,15 +165,7 @@ class DialogSumDataset(datalabs.GeneratorBasedBuilder):
                         _ABSTRACT: summary,
                     }
 
-                    if not self.feature_expanding:
-                        yield id_, raw_feature_info
-                    else:
-                        additional_feature_info = get_features_sample_level(
-                            raw_feature_info
-                        )
-                        raw_feature_info.update(additional_feature_info)
-                        # print(additional_feature_info)
-                        yield id_, raw_feature_info
+                    yield id_, raw_feature_info
 
                 else:
                     dialogue = []
@@ -118,8 +118,8 @@ class GovReportDataset(datalabs.GeneratorBasedBuilder):
             }
         )
         if self.feature_expanding:
-            features_sample, features_dataset = get_feature_schemas(
-                features_sample, get_schema_of_sample_level_features
+            _, features_dataset = get_feature_schemas(
+                features_sample.copy(), get_schema_of_sample_level_features
             )
 
         # Should return a datalab.DatasetInfo object
@@ -137,6 +137,10 @@ class GovReportDataset(datalabs.GeneratorBasedBuilder):
             ],
         )
 
+    def _feature_expanding_operation(self):
+        # applied to the prepared splits when feature_expanding is set
+        return get_features_sample_level
+
     def _split_generators(self, dl_manager):
         f_path = dl_manager.download_custom(self._FILE, custom_download)
         f_path = dl_manager.extract(f_path)
@@ -177,12 +181,4 @@ class GovReportDataset(datalabs.GeneratorBasedBuilder):
 
                 raw_feature_info = {"text": row_src, "summary": row_tgt}
 
-                if not self.feature_expanding:
-                    yield id_, raw_feature_info
-                else:
-                    additional_feature_info = get_features_sample_level(
-                        raw_feature_info
-                    )
-                    raw_feature_info.update(additional_feature_info)
-                    # print(additional_feature_info)
-                    yield id_, raw_feature_info
+                yield id_, raw_feature_info
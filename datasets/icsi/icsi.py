@@ -100,8 +100,8 @@ class ICSIDataset(datalabs.GeneratorBasedBuilder):
                 }
             )
             if self.feature_expanding:
-                features_sample, features_dataset = get_feature_schemas(
-                    features_sample, get_schema_of_sample_level_features
+                _, features_dataset = get_feature_schemas(
+                    features_sample.copy(), get_schema_of_sample_level_features
                 )
 
         else:
@@ -130,6 +130,10 @@ class ICSIDataset(datalabs.GeneratorBasedBuilder):
             task_templates=self.config.task_templates,
         )
 
+    def _feature_expanding_operation(self):
+        # applied to the prepared splits when feature_expanding is set
+        return get_features_sample_level if "document" in self.config.name else None
+
     def _split_generators(self, dl_manager):
 
         train_urls = get_article_summary_urls("train")
@@ -198,14 +202,7 @@ class ICSIDataset(datalabs.GeneratorBasedBuilder):
 
                 raw_feature_info = {_ARTICLE: text, _ABSTRACT: data["summary"]}
 
-                if not self.feature_expanding:
-                    yield id_, raw_feature_info
-                else:
-                    additional_feature_info = get_features_sample_level(
-                        raw_feature_info
-                    )
-                    raw_feature_info.update(additional_feature_info)
-                    yield id_, raw_feature_info
+                yield id_, raw_feature_info
 
             else:
                 yield id_, {
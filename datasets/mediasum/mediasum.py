@@ -88,8 +88,9 @@ class MediaSumConfigDataset(datalabs.GeneratorBasedBuilder):
                 }
             )
             if self.feature_expanding:
-                features_sample, features_dataset = get_feature_schemas(features_sample,
-                                                                        get_schema_of_sample_level_features)
+                _, features_dataset = get_feature_schemas(
+                    features_sample.copy(), get_schema_of_sample_level_features
+                )
 
 
         else:
@@ -111,6 +112,10 @@ class MediaSumConfigDataset(datalabs.GeneratorBasedBuilder):
             task_templates=self.config.task_templates
         )
 
+    def _feature_expanding_operation(self):
+        # applied to the prepared splits when feature_expanding is set
+        return get_features_sample_level if "document" in self.config.name else None
+
     def _split_generators(self, dl_manager):
         train_url = "https://huggingface.co/datasets/ccdv/mediasum/resolve/main/train_data.zip"
         valid_url = "https://huggingface.co/datasets/ccdv/mediasum/resolve/main/val_data.zip"
@@ -159,12 +164,7 @@ class MediaSumConfigDataset(datalabs.GeneratorBasedBuilder):
                     _ABSTRACT: data["summary"],
                 }
 
-                if not self.feature_expanding:
-                    yield id_, raw_feature_info
-                else:
-                    additional_feature_info = get_features_sample_level(raw_feature_info)
-                    raw_feature_info.update(additional_feature_info)
-                    yield id_, raw_feature_info
+                yield id_, raw_feature_info
             else:
                 dialogue = []
                 for speaker, utterance in zip(data["speakers"], data["utterances"]):
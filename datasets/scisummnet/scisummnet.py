@@ -90,8 +90,9 @@ class ScisummNetDataset(datalabs.GeneratorBasedBuilder):
                 }
             )
             if self.feature_expanding:
-                features_sample, features_dataset = get_feature_schemas(features_sample,
-                                                                        get_schema_of_sample_level_features)
+                _, features_dataset = get_feature_schemas(
+                    features_sample.copy(), get_schema_of_sample_level_features
+                )
         elif self.config.name == "multidoc":
             features_sample = datalabs.Features(
                 {
@@ -112,6 +113,10 @@ class ScisummNetDataset(datalabs.GeneratorBasedBuilder):
             task_templates=self.config.task_templates,
         )
 
+    def _feature_expanding_operation(self):
+        # applied to the prepared splits when feature_expanding is set
+        return get_features_sample_level if self.config.name == "document" else None
+
     def _split_generators(self, dl_manager):
 
         f_path = dl_manager.download_and_extract(self._FILE_ID)
@@ -174,12 +179,7 @@ class ScisummNetDataset(datalabs.GeneratorBasedBuilder):
                     _ARTICLE: " ".join(texts),
                     _ABSTRACT: summary
                 }
-                if not self.feature_expanding:
-                    yield id_, raw_feature_info
-                else:
-                    additional_feature_info = get_features_sample_level(raw_feature_info)
-                    raw_feature_info.update(additional_feature_info)
-                    yield id_, raw_feature_info
+                yield id_, raw_feature_info
         elif "multidoc" in self.config.name:
             for id_, (texts, summary) in enumerate(datas):
                 raw_feature_info = {
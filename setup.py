@@ -80,6 +80,7 @@ setup(
     package_data={
         "datalabs": ["py.typed", "scripts/templates/*"],
         "datalabs.utils.resources": ["*.json", "*.yaml"],
+        "datalabs.operations": ["*.json"],
         "datalabs.operations.featurize.pre_models": ["*.pkl", "*.json"],
         "datalabs.operations.featurize.resources.gender_data": ["*.json"],
         "datalabs.operations.edit.resources": ["*.json", "*.txt", "*.names", "*.tsv"],
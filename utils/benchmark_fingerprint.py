@@ -0,0 +1,104 @@
+"""Benchmark of the fingerprinting of in-memory tables.
+
+Compares the hashing of a table rendered as text (`to_string()` of each
+chunk, the previous method) with the hashing of its raw arrow buffers
+(`datalabs.fingerprint._hash_pa_table`), for a new table and for a table
+derived from it with an additional column, whose other chunks are already
+hashed. `to_string()` only renders the first and last values of a chunk, so
+it's also measured with all the values rendered. For example:
+
+    python utils/benchmark_fingerprint.py --num-rows 1000000 --runs 3
+"""
+import argparse
+import random
+import statistics
+import string
+import time
+from typing import Callable
+
+import pyarrow as pa
+
+from datalabs.fingerprint import _CHUNK_DIGESTS, Hasher
+
+
+def hash_table_as_string(value: pa.Table, full: bool = False) -> str:
+    # `to_string()` only renders the first and last values of each chunk,
+    # `full` renders all of them
+    def _hash_pa_array(value):
+        return Hasher.hash_bytes(
+            c.to_string(window=len(c) if full else 10).encode("utf-8")
+            for c in value.chunks
+        )
+
+    value = "-".join(
+        col + "-" + _hash_pa_array(value[col]) for col in sorted(value.column_names)
+    )
+    return Hasher.hash_bytes(value.encode("utf-8"))
+
+
+def make_table(num_rows: int, chunk_size: int) -> pa.Table:
+    rng = random.Random(0)
+    words = ["".join(rng.choices(string.ascii_lowercase, k=6)) for _ in range(5000)]
+    texts = [" ".join(rng.choices(words, k=30)) for _ in range(num_rows)]
+    table = pa.table(
+        {
+            "text": texts,
+            "label": [rng.randrange(10) for _ in range(num_rows)],
+            "score": [rng.random() for _ in range(num_rows)],
+        }
+    )
+    return pa.Table.from_batches(table.to_batches(max_chunksize=chunk_size))
+
+
+def timeit(func: Callable[[], object], runs: int, clear_cache: bool) -> float:
+    times = []
+    for _ in range(runs):
+        if clear_cache:
+            _CHUNK_DIGESTS.clear()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num-rows", type=int, default=200_000)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    table = make_table(args.num_rows, args.chunk_size)
+    # a new column for each run, so that only its chunks aren't cached
+    derived = iter(
+        [
+            table.append_column("length", pa.array([i] * len(table)))
+            for i in range(args.runs)
+        ]
+    )
+    print(
+        f"table: {args.num_rows} rows, {table.num_columns} columns, "
+        f"{table.nbytes / 2 ** 20:.1f} MiB"
+    )
+
+    results = {
+        "to_string": timeit(lambda: hash_table_as_string(table), args.runs, True),
+        "to_string, all values": timeit(
+            lambda: hash_table_as_string(table, full=True), args.runs, True
+        ),
+        "buffers": timeit(lambda: Hasher.hash(table), args.runs, True),
+    }
+    # the chunks of `table` are in the cache
+    Hasher.hash(table)
+    results["buffers, derived table"] = timeit(
+        lambda: Hasher.hash(next(derived)), args.runs, False
+    )
+    for name, seconds in results.items():
+        print(
+            f"  {name:<25} {seconds:.4f}s "
+            f"({results['to_string, all values'] / max(seconds, 1e-9):.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark of the cold start of `import datalabs`.
+
+Runs `python -X importtime -c "import datalabs"` in fresh interpreters and
+reports the total import time and the slowest top-level dependencies, e.g.
+
+    python utils/benchmark_import_time.py --runs 5 --max-seconds 2
+
+exits with an error when the median import time is above `--max-seconds`, so
+that it can track regressions (e.g. an operation module imported eagerly).
+"""
+import argparse
+from collections import defaultdict
+import statistics
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+# heavy dependencies that `import datalabs` shouldn't load, see
+# datalabs.operations.registry
+LAZY_MODULES = [
+    "checklist",
+    "compare_mt",
+    "jieba",
+    "lexicalrichness",
+    "nltk",
+    "sklearn",
+    "spacy",
+]
+
+
+def import_time(module: str) -> Tuple[float, Dict[str, float]]:
+    """The import time of `module` in a fresh interpreter, in seconds, and the
+    import time of each other top-level package it loads"""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total, packages = 0.0, defaultdict(float)
+    for line in process.stderr.splitlines():
+        fields = line.split("|")
+        if not line.startswith("import time:") or not fields[1].strip().isdigit():
+            continue
+        name, seconds = fields[2].strip(), int(fields[1]) / 1e6
+        if name == module:
+            total = seconds
+        elif name.split(".")[0] != module.split(".")[0]:
+            # the outermost module of a package has the largest cumulative time
+            package = name.split(".")[0]
+            packages[package] = max(packages[package], seconds)
+    return total, dict(packages)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="datalabs")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--max-seconds", type=float, default=None)
+    args = parser.parse_args()
+
+    runs = [import_time(args.module) for _ in range(args.runs)]
+    median = statistics.median(total for total, _ in runs)
+    print(f"import {args.module}: median {median:.3f}s over {args.runs} runs")
+
+    packages = runs[-1][1]
+    for name, seconds in sorted(packages.items(), key=lambda item: -item[1])[
+        : args.top
+    ]:
+        print(f"  {name:<30} {seconds:.3f}s")
+    loaded = [name for name in LAZY_MODULES if name in packages]
+    if loaded:
+        print(f"heavy dependencies imported eagerly: {', '.join(loaded)}")
+
+    if args.max_seconds is not None and median > args.max_seconds:
+        sys.exit(f"import {args.module} took {median:.3f}s > {args.max_seconds}s")
+
+
+if __name__ == "__main__":
+    main()